@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import pathway._engine_finder  # noqa: F401  # isort: split
 
+from typing import TYPE_CHECKING
+
+import pathway.acceptors as acceptors
 import pathway.reducers as reducers
 import pathway.universes as universes
-from pathway import asynchronous, debug, demo, io, udfs
+from pathway import asynchronous, udfs
 from pathway.internals import (
     UDF,
     ColumnExpression,
@@ -41,6 +44,7 @@ from pathway.internals import (
     column_definition,
     declare_type,
     enable_interactive_mode,
+    explain,
     fill_error,
     global_error_log,
     groupby,
@@ -75,23 +79,47 @@ from pathway.internals import (
 )
 from pathway.internals.api import PathwayType as Type, PersistenceMode
 from pathway.internals.custom_reducers import BaseCustomAccumulator
+from pathway.internals.helpers import LazyAttribute, import_lazy_attribute
 from pathway.schema import schema_builder
-from pathway.stdlib import (
-    graphs,
-    indexing,
-    ml,
-    ordered,
-    stateful,
-    statistical,
-    temporal,
-    utils,
-    viz,
-)
-from pathway.stdlib.utils.async_transformer import AsyncTransformer
-from pathway.stdlib.utils.pandas_transformer import pandas_transformer
 
 import pathway.persistence as persistence  # isort: skip
 
+if TYPE_CHECKING:
+    from pathway import debug, demo, io
+    from pathway.stdlib import (  # noqa: F401
+        graphs,
+        indexing,
+        ml,
+        ordered,
+        stateful,
+        statistical,
+        temporal,
+        utils,
+        viz,
+    )
+    from pathway.stdlib.utils.async_transformer import AsyncTransformer
+    from pathway.stdlib.utils.pandas_transformer import pandas_transformer
+
+# Connectors and the standard library are imported on first access, together with
+# their dependencies, so that `import pathway` stays fast.
+_lazy_attributes = {
+    "debug": "pathway.debug",
+    "demo": "pathway.demo",
+    "io": "pathway.io",
+    "stdlib": "pathway.stdlib",
+    "graphs": "pathway.stdlib.graphs",
+    "indexing": "pathway.stdlib.indexing",
+    "ml": "pathway.stdlib.ml",
+    "ordered": "pathway.stdlib.ordered",
+    "stateful": "pathway.stdlib.stateful",
+    "statistical": "pathway.stdlib.statistical",
+    "temporal": "pathway.stdlib.temporal",
+    "utils": "pathway.stdlib.utils",
+    "viz": "pathway.stdlib.viz",
+    "AsyncTransformer": "pathway.stdlib.utils.async_transformer:AsyncTransformer",
+    "pandas_transformer": "pathway.stdlib.utils.pandas_transformer:pandas_transformer",
+}
+
 __all__ = [
     "asynchronous",
     "udfs",
@@ -118,6 +146,7 @@ __all__ = [
     "pandas_transformer",
     "AsyncTransformer",
     "reducers",
+    "acceptors",
     "schema_from_types",
     "Table",
     "TableLike",
@@ -139,6 +168,7 @@ __all__ = [
     "sql",
     "run",
     "run_all",
+    "explain",
     "if_else",
     "make_tuple",
     "Type",
@@ -190,6 +220,9 @@ __all__ = [
 def __getattr__(name: str):
     from warnings import warn
 
+    if name in _lazy_attributes:
+        return import_lazy_attribute(globals(), _lazy_attributes, name)
+
     old_io_names = [
         "csv",
         "debezium",
@@ -227,7 +260,7 @@ def __getattr__(name: str):
             DeprecationWarning,
             stacklevel=2,
         )
-        return getattr(io, name)
+        return getattr(__getattr__("io"), name)
 
     error = f"module {__name__!r} has no attribute {name!r}"
     warning = None
@@ -240,31 +273,36 @@ def __getattr__(name: str):
     raise AttributeError(error)
 
 
-Table.asof_join = temporal.asof_join
-Table.asof_join_left = temporal.asof_join_left
-Table.asof_join_right = temporal.asof_join_right
-Table.asof_join_outer = temporal.asof_join_outer
-
-Table.asof_now_join = temporal.asof_now_join
-Table.asof_now_join_inner = temporal.asof_now_join_inner
-Table.asof_now_join_left = temporal.asof_now_join_left
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_lazy_attributes])
 
-Table.window_join = temporal.window_join
-Table.window_join_inner = temporal.window_join_inner
-Table.window_join_left = temporal.window_join_left
-Table.window_join_right = temporal.window_join_right
-Table.window_join_outer = temporal.window_join_outer
 
-Table.interval_join = temporal.interval_join
-Table.interval_join_inner = temporal.interval_join_inner
-Table.interval_join_left = temporal.interval_join_left
-Table.interval_join_right = temporal.interval_join_right
-Table.interval_join_outer = temporal.interval_join_outer
+def _lazy_table_methods(module: str, *names: str) -> None:
+    for name in names:
+        setattr(Table, name, LazyAttribute(module, name))
 
-Table.interpolate = statistical.interpolate
-Table.windowby = temporal.windowby
-Table.diff = ordered.diff
 
-Table.plot = viz.plot
-Table.show = viz.show
-Table._repr_mimebundle_ = viz._repr_mimebundle_
+_lazy_table_methods(
+    "pathway.stdlib.temporal",
+    "asof_join",
+    "asof_join_left",
+    "asof_join_right",
+    "asof_join_outer",
+    "asof_now_join",
+    "asof_now_join_inner",
+    "asof_now_join_left",
+    "window_join",
+    "window_join_inner",
+    "window_join_left",
+    "window_join_right",
+    "window_join_outer",
+    "interval_join",
+    "interval_join_inner",
+    "interval_join_left",
+    "interval_join_right",
+    "interval_join_outer",
+    "windowby",
+)
+_lazy_table_methods("pathway.stdlib.statistical", "interpolate")
+_lazy_table_methods("pathway.stdlib.ordered", "diff")
+_lazy_table_methods("pathway.stdlib.viz", "plot", "show", "_repr_mimebundle_")
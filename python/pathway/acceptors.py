@@ -0,0 +1,40 @@
+# Copyright © 2024 Pathway
+"""Built-in acceptors of `deduplicate`. They are evaluated by the engine, without calling
+Python for every row.
+
+Typical use:
+
+>>> import pathway as pw
+>>> readings = pw.debug.table_from_markdown('''
+... sensor | temperature | __time__
+... a      | 20.0        | 2
+... a      | 20.1        | 4
+... a      | 21.0        | 6
+... ''')
+>>> result = readings.deduplicate(
+...     value=pw.this.temperature,
+...     instance=pw.this.sensor,
+...     acceptor=pw.acceptors.absolute_change(0.5),
+... )
+>>> pw.debug.compute_and_print(result, include_id=False)
+sensor | temperature
+a      | 21.0
+"""
+
+from pathway.internals.acceptors import (
+    Acceptor,
+    absolute_change,
+    changed,
+    increasing,
+    min_interval,
+    relative_change,
+)
+
+__all__ = [
+    "Acceptor",
+    "absolute_change",
+    "changed",
+    "increasing",
+    "min_interval",
+    "relative_change",
+]
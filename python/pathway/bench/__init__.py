@@ -0,0 +1,134 @@
+# Copyright © 2024 Pathway
+
+"""Benchmark suite run by ``pathway bench``.
+
+Each workload is run in a separate Python process (``python -m pathway.bench``), so
+that the peak RSS of one run is not affected by the others. The results are
+returned as a JSON-serializable dictionary, to be compared across versions.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import platform
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from pathway.bench.workloads import WORKLOADS, BenchmarkConfig
+from pathway.internals.utils.memory import peak_memory
+from pathway.internals.version import __version__
+
+PERCENTILES = (50, 90, 99)
+
+
+def _percentile(values: list[int], percentile: int) -> int:
+    # nearest-rank percentile of sorted values
+    rank = max((len(values) * percentile + 99) // 100, 1)
+    return values[rank - 1]
+
+
+def _latency_summary(latencies_ns: list[int] | None) -> dict[str, float] | None:
+    if not latencies_ns:
+        return None
+    latencies_ns = sorted(latencies_ns)
+    summary = {
+        f"p{percentile}": _percentile(latencies_ns, percentile) / 1e6
+        for percentile in PERCENTILES
+    }
+    summary["max"] = latencies_ns[-1] / 1e6
+    return summary
+
+
+def run_workload(name: str, *, rows: int, seed: int, batch_size: int) -> dict:
+    """Runs the workload ``name`` in the current process and returns its results.
+
+    The computation graph of the process is extended with the workload's tables,
+    so it is meant to be called in a fresh process.
+    """
+    workload = WORKLOADS[name]
+    with tempfile.TemporaryDirectory() as workdir:
+        config = BenchmarkConfig(
+            rows=rows,
+            seed=seed,
+            batch_size=batch_size,
+            workdir=pathlib.Path(workdir),
+        )
+        result = workload.run(config)
+    return {
+        "workload": name,
+        "rows": result.rows,
+        "elapsed_s": result.elapsed,
+        "throughput_rows_per_s": result.rows / result.elapsed,
+        "latency_ms": _latency_summary(result.latencies_ns),
+        "peak_rss_bytes": peak_memory(),
+        **result.extra,
+    }
+
+
+def run_benchmarks(
+    workloads: Iterable[str] | None = None,
+    *,
+    rows: int = 100_000,
+    seed: int = 0,
+    batch_size: int = 1000,
+    threads: int = 1,
+    repeat: int = 1,
+    on_result: Callable[[dict], None] | None = None,
+) -> dict[str, Any]:
+    """Runs the workloads, each ``repeat`` times in a separate process with
+    ``threads`` worker threads, and returns the report.
+
+    ``on_result`` is called with the results of every run as soon as it finishes.
+    """
+    names = list(WORKLOADS) if workloads is None else list(workloads)
+    for name in names:
+        if name not in WORKLOADS:
+            raise ValueError(
+                f"unknown workload {name!r}, available workloads: "
+                + ", ".join(WORKLOADS)
+            )
+    env = os.environ.copy()
+    env["PATHWAY_THREADS"] = str(threads)
+    env["PATHWAY_PROCESSES"] = "1"
+    results = []
+    for name in names:
+        for run in range(repeat):
+            process = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "pathway.bench",
+                    name,
+                    f"--rows={rows}",
+                    f"--seed={seed}",
+                    f"--batch-size={batch_size}",
+                ],
+                env=env,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            if process.returncode != 0:
+                raise RuntimeError(
+                    f"workload {name!r} failed with exit code {process.returncode}"
+                )
+            # the results are the last line of the output, workloads may print logs
+            result = {**json.loads(process.stdout.splitlines()[-1]), "run": run}
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+    return {
+        "pathway_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "threads": threads,
+        "rows": rows,
+        "seed": seed,
+        "batch_size": batch_size,
+        "results": results,
+    }
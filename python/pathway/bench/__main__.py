@@ -0,0 +1,21 @@
+# Copyright © 2024 Pathway
+
+# Runs a single workload and prints its results as JSON, used by `pathway bench`
+# to run every workload in a separate process.
+
+import argparse
+import json
+
+from pathway.bench import WORKLOADS, run_workload
+
+parser = argparse.ArgumentParser(prog="python -m pathway.bench")
+parser.add_argument("workload", choices=list(WORKLOADS))
+parser.add_argument("--rows", type=int, required=True)
+parser.add_argument("--seed", type=int, required=True)
+parser.add_argument("--batch-size", type=int, required=True)
+args = parser.parse_args()
+
+result = run_workload(
+    args.workload, rows=args.rows, seed=args.seed, batch_size=args.batch_size
+)
+print(json.dumps(result), flush=True)
@@ -0,0 +1,485 @@
+# Copyright © 2024 Pathway
+
+"""Workloads of ``pathway bench``.
+
+Every workload generates its input data from a seeded random number generator, so
+that runs with the same parameters process exactly the same data. Streaming
+workloads read their inputs with the python connector in batches of
+``batch_size`` rows. Every input row carries the time at which its batch was sent
+(``emitted_at``), which is propagated to the output rows (as the maximum over the
+input rows they depend on), so that the latency of each output update can be
+measured in the ``subscribe`` callback.
+
+The ``startup`` workload measures the time from the start of a program to the end
+of its run instead, its ``rows`` are the stages of the program, and the times of
+importing ``pathway`` in a fresh interpreter (``import_s``), of defining the tables
+(``program_s``) and of planning the computation (``plan_s``) are reported separately.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import pathlib
+import random
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+
+import pathway as pw
+from pathway.internals import parse_graph
+
+_WORDS = [f"w{i}" for i in range(1000)]
+_SYMBOLS = [f"S{i}" for i in range(50)]
+_EMBEDDING_DIMENSIONS = 16
+
+
+@dataclass(frozen=True)
+class BenchmarkConfig:
+    rows: int
+    seed: int
+    batch_size: int
+    workdir: pathlib.Path
+
+
+@dataclass
+class WorkloadResult:
+    rows: int
+    elapsed: float
+    latencies_ns: list[int] | None = None
+    extra: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Workload:
+    name: str
+    description: str
+    run: Callable[[BenchmarkConfig], WorkloadResult]
+
+
+WORKLOADS: dict[str, Workload] = {}
+
+
+def _workload(description: str):
+    def wrapper(
+        run: Callable[[BenchmarkConfig], WorkloadResult],
+    ) -> Callable[[BenchmarkConfig], WorkloadResult]:
+        name = run.__name__
+        WORKLOADS[name] = Workload(name=name, description=description, run=run)
+        return run
+
+    return wrapper
+
+
+class _GeneratedSubject(pw.io.python.ConnectorSubject):
+    def __init__(self, rows: Iterable[dict], batch_size: int) -> None:
+        super().__init__()
+        self._rows = iter(rows)
+        self._batch_size = batch_size
+
+    def run(self) -> None:
+        while batch := list(islice(self._rows, self._batch_size)):
+            emitted_at = time.monotonic_ns()
+            for row in batch:
+                self.next(**row, emitted_at=emitted_at)
+            self.commit()
+
+    @property
+    def _deletions_enabled(self) -> bool:
+        return False
+
+
+def _stream(
+    config: BenchmarkConfig, schema: type[pw.Schema], rows: Iterable[dict]
+) -> pw.Table:
+    return pw.io.python.read(
+        _GeneratedSubject(rows, config.batch_size),
+        schema=schema | pw.schema_from_types(emitted_at=int),
+        autocommit_duration_ms=None,
+    )
+
+
+def _measure_latency(table: pw.Table) -> list[int]:
+    latencies: list[int] = []
+    monotonic_ns = time.monotonic_ns
+
+    def on_change(key, row, time, is_addition):
+        if is_addition:
+            latencies.append(monotonic_ns() - row["emitted_at"])
+
+    pw.io.subscribe(table, on_change)
+    return latencies
+
+
+def _run(rows: int, latencies: list[int] | None = None) -> WorkloadResult:
+    start = time.monotonic()
+    pw.run(monitoring_level=pw.MonitoringLevel.NONE)
+    return WorkloadResult(
+        rows=rows, elapsed=time.monotonic() - start, latencies_ns=latencies
+    )
+
+
+def _later(left: pw.ColumnExpression, right: pw.ColumnExpression):
+    return pw.if_else(left > right, left, right)
+
+
+def _events(seed: int, count: int, keys: int) -> Iterator[dict]:
+    rng = random.Random(seed)
+    for i in range(count):
+        yield {
+            "key": rng.randrange(keys),
+            "t": i // 10,
+            "value": rng.random() * 100,
+            "label": rng.choice(_WORDS),
+        }
+
+
+class _EventSchema(pw.Schema):
+    key: int
+    t: int
+    value: float
+    label: str
+
+
+def _write_events(config: BenchmarkConfig, path: pathlib.Path, format: str) -> None:
+    with open(path, "w", newline="") as f:
+        if format == "csv":
+            writer = csv.DictWriter(f, fieldnames=["key", "t", "value", "label"])
+            writer.writeheader()
+            writer.writerows(_events(config.seed, config.rows, 1000))
+        else:
+            for event in _events(config.seed, config.rows, 1000):
+                f.write(json.dumps(event) + "\n")
+
+
+def _count_rows(table: pw.Table) -> None:
+    pw.io.subscribe(
+        table.reduce(count=pw.reducers.count()),
+        lambda key, row, time, is_addition: None,
+    )
+
+
+@_workload("read a generated CSV file with the filesystem connector (static mode)")
+def ingest_csv(config: BenchmarkConfig) -> WorkloadResult:
+    path = config.workdir / "events.csv"
+    _write_events(config, path, "csv")
+    _count_rows(pw.io.csv.read(path, schema=_EventSchema, mode="static"))
+    return _run(config.rows)
+
+
+@_workload("read a generated JSON Lines file with the filesystem connector")
+def ingest_jsonl(config: BenchmarkConfig) -> WorkloadResult:
+    path = config.workdir / "events.jsonl"
+    _write_events(config, path, "jsonl")
+    _count_rows(pw.io.jsonlines.read(path, schema=_EventSchema, mode="static"))
+    return _run(config.rows)
+
+
+@_workload("stream generated rows with the python connector")
+def ingest_python(config: BenchmarkConfig) -> WorkloadResult:
+    events = _stream(config, _EventSchema, _events(config.seed, config.rows, 1000))
+    latencies = _measure_latency(
+        events.reduce(
+            count=pw.reducers.count(), emitted_at=pw.reducers.max(pw.this.emitted_at)
+        )
+    )
+    return _run(config.rows, latencies)
+
+
+@_workload("select with arithmetic and string expressions, followed by a filter")
+def select_filter(config: BenchmarkConfig) -> WorkloadResult:
+    events = _stream(config, _EventSchema, _events(config.seed, config.rows, 1000))
+    result = events.select(
+        pw.this.key,
+        pw.this.emitted_at,
+        scaled=pw.this.value * 2.5 + pw.this.key,
+        tag=pw.this.label.str.upper(),
+    ).filter(pw.this.scaled > 100)
+    latencies = _measure_latency(result)
+    return _run(config.rows, latencies)
+
+
+@_workload("groupby over 1000 keys with count, sum and avg reducers")
+def groupby_reduce(config: BenchmarkConfig) -> WorkloadResult:
+    events = _stream(config, _EventSchema, _events(config.seed, config.rows, 1000))
+    result = events.groupby(pw.this.key).reduce(
+        pw.this.key,
+        count=pw.reducers.count(),
+        total=pw.reducers.sum(pw.this.value),
+        average=pw.reducers.avg(pw.this.value),
+        emitted_at=pw.reducers.max(pw.this.emitted_at),
+    )
+    latencies = _measure_latency(result)
+    return _run(config.rows, latencies)
+
+
+@_workload("inner join of a stream of orders with a ten times smaller customers table")
+def join(config: BenchmarkConfig) -> WorkloadResult:
+    customer_count = max(config.rows // 10, 1)
+
+    class CustomerSchema(pw.Schema):
+        customer_id: int
+        country: str
+
+    class OrderSchema(pw.Schema):
+        customer_id: int
+        amount: float
+
+    def customer_rows() -> Iterator[dict]:
+        rng = random.Random(config.seed)
+        for i in range(customer_count):
+            yield {"customer_id": i, "country": rng.choice(_SYMBOLS)}
+
+    def order_rows() -> Iterator[dict]:
+        rng = random.Random(config.seed + 1)
+        for _ in range(config.rows):
+            yield {"customer_id": rng.randrange(customer_count), "amount": rng.random()}
+
+    customers = _stream(config, CustomerSchema, customer_rows())
+    orders = _stream(config, OrderSchema, order_rows())
+    result = orders.join(customers, orders.customer_id == customers.customer_id).select(
+        orders.amount,
+        customers.country,
+        emitted_at=_later(orders.emitted_at, customers.emitted_at),
+    )
+    latencies = _measure_latency(result)
+    return _run(config.rows + customer_count, latencies)
+
+
+@_workload("sliding windows (hop 10, duration 60) per key")
+def sliding_window(config: BenchmarkConfig) -> WorkloadResult:
+    events = _stream(config, _EventSchema, _events(config.seed, config.rows, 100))
+    result = events.windowby(
+        pw.this.t,
+        window=pw.temporal.sliding(hop=10, duration=60),
+        instance=pw.this.key,
+    ).reduce(
+        pw.this._pw_window_start,
+        pw.this._pw_instance,
+        count=pw.reducers.count(),
+        total=pw.reducers.sum(pw.this.value),
+        emitted_at=pw.reducers.max(pw.this.emitted_at),
+    )
+    latencies = _measure_latency(result)
+    return _run(config.rows, latencies)
+
+
+@_workload("session windows (maximal gap 5) per key")
+def session_window(config: BenchmarkConfig) -> WorkloadResult:
+    events = _stream(config, _EventSchema, _events(config.seed, config.rows, 1000))
+    result = events.windowby(
+        pw.this.t,
+        window=pw.temporal.session(max_gap=5),
+        instance=pw.this.key,
+    ).reduce(
+        pw.this._pw_window_start,
+        pw.this._pw_instance,
+        count=pw.reducers.count(),
+        emitted_at=pw.reducers.max(pw.this.emitted_at),
+    )
+    latencies = _measure_latency(result)
+    return _run(config.rows, latencies)
+
+
+class _TradeSchema(pw.Schema):
+    symbol: str
+    t: int
+    price: float
+
+
+def _trades(seed: int, count: int) -> Iterator[dict]:
+    rng = random.Random(seed)
+    for i in range(count):
+        yield {"symbol": rng.choice(_SYMBOLS), "t": i, "price": rng.random() * 100}
+
+
+@_workload("as-of join of trades with the latest quote of the same symbol")
+def asof_join(config: BenchmarkConfig) -> WorkloadResult:
+    trades = _stream(config, _TradeSchema, _trades(config.seed, config.rows))
+    quotes = _stream(config, _TradeSchema, _trades(config.seed + 1, config.rows))
+    result = trades.asof_join(
+        quotes,
+        trades.t,
+        quotes.t,
+        trades.symbol == quotes.symbol,
+        how=pw.JoinMode.LEFT,
+    ).select(
+        trades.symbol,
+        trades.price,
+        quote=quotes.price,
+        emitted_at=trades.emitted_at,
+    )
+    latencies = _measure_latency(result)
+    return _run(2 * config.rows, latencies)
+
+
+@_workload("interval join (-5, 5) of two streams of events on the same key")
+def interval_join(config: BenchmarkConfig) -> WorkloadResult:
+    left = _stream(config, _EventSchema, _events(config.seed, config.rows, 1000))
+    right = _stream(config, _EventSchema, _events(config.seed + 1, config.rows, 1000))
+    result = left.interval_join(
+        right,
+        left.t,
+        right.t,
+        pw.temporal.interval(-5, 5),
+        left.key == right.key,
+    ).select(
+        left.key,
+        difference=left.value - right.value,
+        emitted_at=_later(left.emitted_at, right.emitted_at),
+    )
+    latencies = _measure_latency(result)
+    return _run(2 * config.rows, latencies)
+
+
+@_workload("brute force KNN queries (5 nearest of 16-dimensional vectors)")
+def knn_index(config: BenchmarkConfig) -> WorkloadResult:
+    from pathway.stdlib.indexing import BruteForceKnnFactory
+
+    document_count = max(config.rows // 10, 1)
+    query_count = max(config.rows // 100, 1)
+
+    def vectors(seed: int, count: int) -> Iterator[dict]:
+        rng = random.Random(seed)
+        for i in range(count):
+            yield {
+                "number": i,
+                "vector": [rng.gauss(0, 1) for _ in range(_EMBEDDING_DIMENSIONS)],
+            }
+
+    schema = pw.schema_from_types(number=int, vector=list[float])
+    documents = _stream(config, schema, vectors(config.seed, document_count))
+    queries = _stream(config, schema, vectors(config.seed + 1, query_count))
+    index = BruteForceKnnFactory(
+        dimensions=_EMBEDDING_DIMENSIONS, reserved_space=document_count
+    ).build_index(documents.vector, documents)
+    result = index.query_as_of_now(queries.vector, number_of_matches=5).select(
+        pw.left.number, matches=pw.right.number, emitted_at=pw.left.emitted_at
+    )
+    latencies = _measure_latency(result)
+    return _run(document_count + query_count, latencies)
+
+
+@_workload("BM25 full text queries (5 best matches of 3-word queries)")
+def bm25_index(config: BenchmarkConfig) -> WorkloadResult:
+    from pathway.stdlib.indexing import TantivyBM25Factory
+
+    document_count = max(config.rows // 10, 1)
+    query_count = max(config.rows // 100, 1)
+
+    def texts(seed: int, count: int, length: int) -> Iterator[dict]:
+        rng = random.Random(seed)
+        for i in range(count):
+            yield {"number": i, "text": " ".join(rng.choices(_WORDS, k=length))}
+
+    schema = pw.schema_from_types(number=int, text=str)
+    documents = _stream(config, schema, texts(config.seed, document_count, 20))
+    queries = _stream(config, schema, texts(config.seed + 1, query_count, 3))
+    index = TantivyBM25Factory().build_index(documents.text, documents)
+    result = index.query_as_of_now(queries.text, number_of_matches=5).select(
+        pw.left.number, matches=pw.right.number, emitted_at=pw.left.emitted_at
+    )
+    latencies = _measure_latency(result)
+    return _run(document_count + query_count, latencies)
+
+
+@_workload(
+    "restart of a persisted groupby over a CSV file after a tenth of new rows arrived"
+)
+def persistence_restart(config: BenchmarkConfig) -> WorkloadResult:
+    input_path = config.workdir / "input"
+    input_path.mkdir()
+    _write_events(config, input_path / "1.csv", "csv")
+    persistence_config = pw.persistence.Config(
+        pw.persistence.Backend.filesystem(config.workdir / "storage")
+    )
+
+    def run() -> float:
+        parse_graph.G.clear()
+        events = pw.io.csv.read(
+            input_path, schema=_EventSchema, mode="static", persistent_id="events"
+        )
+        result = events.groupby(pw.this.key).reduce(
+            pw.this.key, count=pw.reducers.count()
+        )
+        pw.io.subscribe(result, lambda key, row, time, is_addition: None)
+        start = time.monotonic()
+        pw.run(
+            monitoring_level=pw.MonitoringLevel.NONE,
+            persistence_config=persistence_config,
+        )
+        return time.monotonic() - start
+
+    first_run = run()
+    new_rows = max(config.rows // 10, 1)
+    _write_events(
+        BenchmarkConfig(
+            rows=new_rows,
+            seed=config.seed + 1,
+            batch_size=config.batch_size,
+            workdir=config.workdir,
+        ),
+        input_path / "2.csv",
+        "csv",
+    )
+    return WorkloadResult(
+        rows=new_rows, elapsed=run(), extra={"first_run_s": first_run}
+    )
+
+
+@_workload(
+    "startup of a program with a chain of a hundredth as many selects, filters,"
+    + " groupbys and joins as rows, over a single input row"
+)
+def startup(config: BenchmarkConfig) -> WorkloadResult:
+    from pathway.internals.graph_runner import GraphRunner
+
+    # pathway is already imported here, the import is measured in a new interpreter
+    import_time = float(
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import time; start = time.monotonic(); import pathway;"
+                + " print(time.monotonic() - start)",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    )
+
+    stages = max(config.rows // 100, 10)
+    start = time.monotonic()
+    table = pw.debug.table_from_rows(
+        _EventSchema, [tuple(event.values()) for event in _events(config.seed, 1, 1)]
+    )
+    for i in range(stages):
+        table = table.select(
+            pw.this.key, pw.this.t, pw.this.label, value=pw.this.value * 1.5 + i
+        ).filter(pw.this.value > -1)
+        if i % 10 == 9:
+            totals = table.groupby(pw.this.key).reduce(
+                pw.this.key, total=pw.reducers.sum(pw.this.value)
+            )
+            table = table.join(totals, pw.left.key == pw.right.key).select(
+                pw.left.key,
+                pw.left.t,
+                pw.left.label,
+                value=pw.left.value - pw.right.total,
+            )
+    pw.io.subscribe(table, lambda key, row, time, is_addition: None)
+    program = time.monotonic() - start
+
+    runner = GraphRunner(parse_graph.G, monitoring_level=pw.MonitoringLevel.NONE)
+    start = time.monotonic()
+    scope = parse_graph.G.global_scope
+    runner._build_plan(runner._tree_shake(scope, scope.output_nodes), (), run_all=False)
+    plan = time.monotonic() - start
+
+    result = _run(stages)
+    result.extra = {"import_s": import_time, "program_s": program, "plan_s": plan}
+    return result
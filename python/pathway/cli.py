@@ -1,5 +1,6 @@
 # Copyright © 2024 Pathway
 
+import json
 import logging
 import os
 import pathlib
@@ -13,6 +14,7 @@ from typing import NoReturn, Tuple
 import click
 
 import pathway as pw
+from pathway.internals.affinity import available_cores, numa_nodes, plan_placement
 from pathway.optional_import import optional_imports
 
 
@@ -60,6 +62,8 @@ def spawn_program(
     program,
     arguments,
     env_base,
+    pin_cores=False,
+    numa=False,
 ):
     temp_root_directory = checkout_repository(repository_url, branch)
     if temp_root_directory is not None:
@@ -89,6 +93,16 @@ def spawn_program(
     processes_str = plural(processes, "process", "processes")
     workers_str = plural(processes * threads, "total worker", "total workers")
     click.echo(f"Preparing {processes_str} ({workers_str})", err=True)
+    placements = None
+    if pin_cores or numa:
+        placements = plan_placement(
+            processes=processes,
+            threads=threads,
+            cores=available_cores(),
+            nodes=numa_nodes() if numa else None,
+        )
+        for process_id, placement in enumerate(placements):
+            click.echo(f"Process {process_id}: {placement.describe()}", err=True)
     run_id = uuid.uuid4()
     process_handles = []
     try:
@@ -99,6 +113,8 @@ def spawn_program(
             env["PATHWAY_FIRST_PORT"] = str(first_port)
             env["PATHWAY_PROCESS_ID"] = str(process_id)
             env["PATHWAY_RUN_ID"] = str(run_id)
+            if placements is not None:
+                env.update(placements[process_id].env())
             handle = subprocess.Popen([program] + list(arguments), env=env)
             process_handles.append(handle)
         for handle in process_handles:
@@ -127,7 +143,8 @@ def cli() -> None:
     metavar="N",
     type=int,
     default=1,
-    help="number of threads per process",
+    help="number of threads per process "
+    "(can differ from the runs that wrote the persisted state)",
 )
 @click.option(
     "-n",
@@ -135,7 +152,8 @@ def cli() -> None:
     metavar="N",
     type=int,
     default=1,
-    help="number of processes",
+    help="number of processes "
+    "(can differ from the runs that wrote the persisted state)",
 )
 @click.option(
     "--first-port",
@@ -144,6 +162,16 @@ def cli() -> None:
     default=10000,
     help="first port to use for communication",
 )
+@click.option(
+    "--pin-cores",
+    is_flag=True,
+    help="pin the threads of each process to a disjoint set of CPU cores",
+)
+@click.option(
+    "--numa",
+    is_flag=True,
+    help="like --pin-cores, but keep the cores of each process on one NUMA node",
+)
 @click.option("--record", is_flag=True, help="record data in the input connectors")
 @click.option(
     "--record-path",
@@ -167,6 +195,8 @@ def spawn(
     threads,
     processes,
     first_port,
+    pin_cores,
+    numa,
     record,
     record_path,
     repository_url,
@@ -188,6 +218,8 @@ def spawn(
         program=program,
         arguments=arguments,
         env_base=env,
+        pin_cores=pin_cores,
+        numa=numa,
     )
 
 
@@ -280,6 +312,104 @@ def replay(
     )
 
 
+@cli.command(
+    context_settings={
+        "allow_interspersed_args": False,
+        "show_default": True,
+    }
+)
+@click.option(
+    "--analyze",
+    is_flag=True,
+    help="run the computation and annotate the plan with statistics of operators "
+    "(requires all inputs to be bounded)",
+)
+@click.argument("program")
+@click.argument("arguments", nargs=-1)
+def explain(analyze, program, arguments):
+    """Print the physical plan of the computation run by the program."""
+    env = os.environ.copy()
+    env["PATHWAY_EXPLAIN"] = "analyze" if analyze else "plan"
+    spawn_program(
+        threads=1,
+        processes=1,
+        first_port=10000,
+        repository_url=None,
+        branch=None,
+        program=program,
+        arguments=arguments,
+        env_base=env,
+    )
+
+
+@cli.command(context_settings={"show_default": True})
+@click.option(
+    "-w",
+    "--workload",
+    "workloads",
+    multiple=True,
+    metavar="NAME",
+    help="workload to run, can be repeated (all workloads are run by default)",
+)
+@click.option("--list", "list_workloads", is_flag=True, help="list the workloads")
+@click.option(
+    "--rows",
+    type=int,
+    default=100_000,
+    help="number of generated input rows of each workload",
+)
+@click.option("--seed", type=int, default=0, help="seed of the generated data")
+@click.option(
+    "--batch-size",
+    type=int,
+    default=1000,
+    help="number of rows committed at once by the streaming inputs",
+)
+@click.option(
+    "-t", "--threads", metavar="N", type=int, default=1, help="number of threads"
+)
+@click.option("--repeat", type=int, default=1, help="number of runs of each workload")
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="file to write the JSON report to, instead of the standard output",
+)
+def bench(workloads, list_workloads, rows, seed, batch_size, threads, repeat, output):
+    """Run the benchmark workloads on generated data and report their throughput,
+    latency percentiles and peak memory as JSON."""
+    from pathway.bench import WORKLOADS, run_benchmarks
+
+    if list_workloads:
+        for workload in WORKLOADS.values():
+            click.echo(f"{workload.name}: {workload.description}")
+        return
+
+    def on_result(result):
+        click.echo(
+            f"{result['workload']}: {result['throughput_rows_per_s']:.0f} rows/s",
+            err=True,
+        )
+
+    try:
+        report = run_benchmarks(
+            workloads or None,
+            rows=rows,
+            seed=seed,
+            batch_size=batch_size,
+            threads=threads,
+            repeat=repeat,
+            on_result=on_result,
+        )
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--workload")
+    report_json = json.dumps(report, indent=2)
+    if output is None:
+        click.echo(report_json)
+    else:
+        pathlib.Path(output).write_text(report_json + "\n")
+
+
 @cli.command()
 def spawn_from_env():
     cli_spawn_arguments = os.environ.get("PATHWAY_SPAWN_ARGS")
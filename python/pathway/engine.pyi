@@ -78,6 +78,19 @@ class Trace:
     line: str
     function: str
 
+class OperatorMetrics:
+    rows_in: int
+    rows_out: int
+    processing_time_ns: int
+    arranged_records: int
+    arranged_batches: int
+    arrangements: int
+    exchanged_bytes: int
+    hot_keys: int
+    spilled_bytes: int
+    spill_read_bytes: int
+    spill_compacted_bytes: int
+
 @dataclasses.dataclass(frozen=True)
 class ColumnProperties:
     dtype: PathwayType | None = None
@@ -97,6 +110,7 @@ class ConnectorProperties:
     commit_duration_ms: int | None = None
     unsafe_trusted_ids: bool | None = False
     column_properties: list[ColumnProperties] = []
+    single_logical_time: bool = False
 
 class Column:
     """A Column holds data and conceptually is a Dict[Universe elems, dt]
@@ -183,6 +197,18 @@ class ReducerData:
     column_paths: list[ColumnPath]
     trace: Trace | None
 
+class DeduplicateAcceptor:
+    @staticmethod
+    def changed() -> DeduplicateAcceptor: ...
+    @staticmethod
+    def absolute_change(threshold: float) -> DeduplicateAcceptor: ...
+    @staticmethod
+    def relative_change(threshold: float) -> DeduplicateAcceptor: ...
+    @staticmethod
+    def min_interval(interval: Value) -> DeduplicateAcceptor: ...
+    @staticmethod
+    def increasing() -> DeduplicateAcceptor: ...
+
 class UnaryOperator:
     INV: UnaryOperator
     NEG: UnaryOperator
@@ -474,6 +500,7 @@ class Scope:
         column_paths: list[ColumnPath],
         expressions: list[tuple[Expression, TableProperties]],
         deterministic: bool,
+        shared_expressions: list[tuple[int, Expression, TableProperties]] = [],
     ) -> Table: ...
     def table_properties(self, table: Table, path: ColumnPath) -> TableProperties: ...
     def columns_to_table(self, universe: Universe, columns: list[Column]) -> Table: ...
@@ -580,13 +607,14 @@ class Scope:
         reducers: list[ReducerData],
         by_id: bool,
         table_properties: TableProperties,
+        skew_split: int = 1,
     ) -> Table: ...
     def deduplicate(
         self,
         table: Table,
         grouping_columns: list[ColumnPath],
         reduced_columns: list[ColumnPath],
-        combine: Callable[[Any, Any], Any],
+        combine: Callable[[Any, Any], Any] | DeduplicateAcceptor,
         persistent_id: str | None,
         table_properties: TableProperties,
     ) -> Table: ...
@@ -611,6 +639,16 @@ class Scope:
         assign_id: bool = False,
         left_ear: bool = False,
         right_ear: bool = False,
+        skew_split: int = 1,
+    ) -> Table: ...
+    def join_many(
+        self,
+        base_storage: Table,
+        base_paths: list[list[ColumnPath]],
+        dimension_storages: list[Table],
+        dimension_paths: list[list[ColumnPath]],
+        *,
+        table_properties: TableProperties,
     ) -> Table: ...
     def use_external_index_as_of_now(
         self,
@@ -652,6 +690,22 @@ class Scope:
         instance_column_path: ColumnPath,
         table_properties: TableProperties,
     ) -> Table: ...
+    def rank_table(
+        self,
+        table: Table,
+        key_column_path: ColumnPath,
+        instance_column_path: ColumnPath,
+        table_properties: TableProperties,
+    ) -> Table: ...
+    def limit_table(
+        self,
+        table: Table,
+        key_column_path: ColumnPath,
+        instance_column_path: ColumnPath,
+        offset: int,
+        limit: int,
+        table_properties: TableProperties,
+    ) -> Table: ...
     def probe_table(self, table: Table, operator_id: int): ...
     def subscribe_table(
         self,
@@ -676,7 +730,13 @@ class Scope:
     def import_table(self, table: ExportedTable) -> Table: ...
     def error_log(self, properties: ConnectorProperties) -> tuple[Table, ErrorLog]: ...
     def set_error_log(self, error_log: ErrorLog | None) -> None: ...
-    def set_operator_properties(self, id: int, depends_on_error_log: bool) -> None: ...
+    def set_operator_properties(
+        self,
+        id: int,
+        depends_on_error_log: bool,
+        name: str,
+        location: str | None = None,
+    ) -> None: ...
     def remove_errors_from_table(
         self,
         table: Table,
@@ -722,6 +782,7 @@ def run_with_new_graph(
     trace_parent: str | None = None,
     run_id: str | None = None,
     terminate_on_error: bool = True,
+    on_operator_metrics: Callable[[dict[int, OperatorMetrics]], None] | None = None,
 ) -> list[CapturedStream]: ...
 def unsafe_make_pointer(arg) -> Pointer: ...
 
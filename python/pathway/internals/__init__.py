@@ -53,7 +53,7 @@ from pathway.internals.json import Json
 from pathway.internals.monitoring import MonitoringLevel
 from pathway.internals.operator import iterate_universe
 from pathway.internals.row_transformer import ClassArg
-from pathway.internals.run import run, run_all
+from pathway.internals.run import explain, run, run_all
 from pathway.internals.schema import (
     ColumnDefinition,
     Schema,
@@ -122,6 +122,7 @@ __all__ = [
     "sql",
     "run",
     "run_all",
+    "explain",
     "__version__",
     "universes",
     "udfs",
@@ -0,0 +1,204 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+from pathway.internals import api
+
+
+class Acceptor(ABC):
+    """Acceptor of ``pw.Table.deduplicate`` evaluated by the engine.
+
+    It can also be called like a regular acceptor, with the current and the previous
+    value.
+    """
+
+    @abstractmethod
+    def __call__(self, new_value: Any, old_value: Any) -> bool: ...
+
+    @abstractmethod
+    def _to_engine(self) -> api.DeduplicateAcceptor: ...
+
+
+@dataclass(frozen=True)
+class _Changed(Acceptor):
+    def __call__(self, new_value: Any, old_value: Any) -> bool:
+        return new_value != old_value
+
+    def _to_engine(self) -> api.DeduplicateAcceptor:
+        return api.DeduplicateAcceptor.changed()
+
+
+@dataclass(frozen=True)
+class _AbsoluteChange(Acceptor):
+    threshold: float
+
+    def __call__(self, new_value: Any, old_value: Any) -> bool:
+        return abs(new_value - old_value) > self.threshold
+
+    def _to_engine(self) -> api.DeduplicateAcceptor:
+        return api.DeduplicateAcceptor.absolute_change(self.threshold)
+
+
+@dataclass(frozen=True)
+class _RelativeChange(Acceptor):
+    threshold: float
+
+    def __call__(self, new_value: Any, old_value: Any) -> bool:
+        return abs(new_value - old_value) > self.threshold * abs(old_value)
+
+    def _to_engine(self) -> api.DeduplicateAcceptor:
+        return api.DeduplicateAcceptor.relative_change(self.threshold)
+
+
+@dataclass(frozen=True)
+class _MinInterval(Acceptor):
+    interval: Any
+
+    def __call__(self, new_value: Any, old_value: Any) -> bool:
+        return new_value >= old_value + self.interval
+
+    def _to_engine(self) -> api.DeduplicateAcceptor:
+        return api.DeduplicateAcceptor.min_interval(self.interval)
+
+
+@dataclass(frozen=True)
+class _Increasing(Acceptor):
+    def __call__(self, new_value: Any, old_value: Any) -> bool:
+        return new_value > old_value
+
+    def _to_engine(self) -> api.DeduplicateAcceptor:
+        return api.DeduplicateAcceptor.increasing()
+
+
+def changed() -> Acceptor:
+    """Accepts a value different from the previously accepted one.
+
+    Example:
+
+    >>> import pathway as pw
+    >>> table = pw.debug.table_from_markdown(
+    ...     '''
+    ...     val | __time__
+    ...      1  |     2
+    ...      1  |     4
+    ...      2  |     6
+    ... '''
+    ... )
+    >>> result = table.deduplicate(value=pw.this.val, acceptor=pw.acceptors.changed())
+    >>> pw.debug.compute_and_print_update_stream(result, include_id=False)
+    val | __time__ | __diff__
+    1   | 2        | 1
+    1   | 6        | -1
+    2   | 6        | 1
+    """
+    return _Changed()
+
+
+def absolute_change(threshold: float) -> Acceptor:
+    """Accepts a number differing from the previously accepted one by more than
+    ``threshold``.
+
+    Example:
+
+    >>> import pathway as pw
+    >>> table = pw.debug.table_from_markdown(
+    ...     '''
+    ...     val | __time__
+    ...     1.0 |     2
+    ...     1.4 |     4
+    ...     1.6 |     6
+    ... '''
+    ... )
+    >>> result = table.deduplicate(
+    ...     value=pw.this.val, acceptor=pw.acceptors.absolute_change(0.5)
+    ... )
+    >>> pw.debug.compute_and_print_update_stream(result, include_id=False)
+    val | __time__ | __diff__
+    1.0 | 2        | 1
+    1.0 | 6        | -1
+    1.6 | 6        | 1
+    """
+    return _AbsoluteChange(float(threshold))
+
+
+def relative_change(threshold: float) -> Acceptor:
+    """Accepts a number differing from the previously accepted one by more than
+    ``threshold`` times its absolute value.
+
+    Example:
+
+    >>> import pathway as pw
+    >>> table = pw.debug.table_from_markdown(
+    ...     '''
+    ...     val | __time__
+    ...     100 |     2
+    ...     105 |     4
+    ...     120 |     6
+    ... '''
+    ... )
+    >>> result = table.deduplicate(
+    ...     value=pw.this.val, acceptor=pw.acceptors.relative_change(0.1)
+    ... )
+    >>> pw.debug.compute_and_print_update_stream(result, include_id=False)
+    val | __time__ | __diff__
+    100 | 2        | 1
+    100 | 6        | -1
+    120 | 6        | 1
+    """
+    return _RelativeChange(float(threshold))
+
+
+def min_interval(interval: Any) -> Acceptor:
+    """Accepts a value at least ``interval`` after the previously accepted one.
+    Deduplicating a time column with it keeps at most one row per ``interval``.
+
+    Args:
+        interval: a number, or a duration when deduplicating datetimes or durations.
+
+    Example:
+
+    >>> import pathway as pw
+    >>> table = pw.debug.table_from_markdown(
+    ...     '''
+    ...     t  | __time__
+    ...     0  |     2
+    ...     3  |     4
+    ...     10 |     6
+    ... '''
+    ... )
+    >>> result = table.deduplicate(value=pw.this.t, acceptor=pw.acceptors.min_interval(5))
+    >>> pw.debug.compute_and_print_update_stream(result, include_id=False)
+    t  | __time__ | __diff__
+    0  | 2        | 1
+    0  | 6        | -1
+    10 | 6        | 1
+    """
+    return _MinInterval(interval)
+
+
+def increasing() -> Acceptor:
+    """Accepts a value greater than the previously accepted one.
+
+    Example:
+
+    >>> import pathway as pw
+    >>> table = pw.debug.table_from_markdown(
+    ...     '''
+    ...     val | __time__
+    ...      2  |     2
+    ...      1  |     4
+    ...      3  |     6
+    ... '''
+    ... )
+    >>> result = table.deduplicate(value=pw.this.val, acceptor=pw.acceptors.increasing())
+    >>> pw.debug.compute_and_print_update_stream(result, include_id=False)
+    val | __time__ | __diff__
+    2   | 2        | 1
+    2   | 6        | -1
+    3   | 6        | 1
+    """
+    return _Increasing()
@@ -0,0 +1,138 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+from dataclasses import dataclass
+
+NUMA_NODES_PATH = pathlib.Path("/sys/devices/system/node")
+
+
+def parse_core_list(core_list: str) -> list[int]:
+    """Parses a list of cores in the ``cpuset`` format, e.g. ``0-3,8,10-11``."""
+    cores: set[int] = set()
+    for core_range in core_list.split(","):
+        core_range = core_range.strip()
+        if not core_range:
+            continue
+        start, _, end = core_range.partition("-")
+        cores.update(range(int(start), int(end or start) + 1))
+    return sorted(cores)
+
+
+def format_core_list(cores: list[int]) -> str:
+    ranges: list[str] = []
+    cores = sorted(set(cores))
+    start = 0
+    for i, core in enumerate(cores):
+        if i + 1 == len(cores) or cores[i + 1] != core + 1:
+            first = cores[start]
+            ranges.append(str(first) if first == core else f"{first}-{core}")
+            start = i + 1
+    return ",".join(ranges)
+
+
+def available_cores() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def numa_nodes() -> list[list[int]]:
+    """Cores of the NUMA nodes of the machine, a single node if it is unknown."""
+    nodes = []
+    for node_path in sorted(NUMA_NODES_PATH.glob("node[0-9]*")):
+        try:
+            nodes.append(parse_core_list((node_path / "cpulist").read_text()))
+        except (OSError, ValueError):
+            continue
+    return nodes
+
+
+@dataclass(frozen=True)
+class ProcessPlacement:
+    worker_cores: list[int]
+    auxiliary_cores: list[int]
+    numa_node: int | None = None
+
+    def env(self) -> dict[str, str]:
+        return {
+            "PATHWAY_WORKER_CORES": format_core_list(self.worker_cores),
+            "PATHWAY_AUXILIARY_CORES": format_core_list(self.auxiliary_cores),
+        }
+
+    def describe(self) -> str:
+        description = (
+            f"workers on cores {format_core_list(self.worker_cores)}, "
+            f"other threads on cores {format_core_list(self.auxiliary_cores)}"
+        )
+        if self.numa_node is not None:
+            description += f" (NUMA node {self.numa_node})"
+        return description
+
+
+def plan_placement(
+    *,
+    processes: int,
+    threads: int,
+    cores: list[int],
+    nodes: list[list[int]] | None = None,
+) -> list[ProcessPlacement]:
+    """Splits ``cores`` into disjoint sets, one per process.
+
+    With ``nodes`` given, processes are assigned to NUMA nodes round-robin and the
+    processes sharing a node split its cores. Within the set of a process, each
+    worker thread gets a core of its own and the remaining cores are shared by the
+    other threads (connector readers, Python UDFs). If there are not enough cores,
+    workers share them and the other threads use all cores of the process.
+    """
+    if nodes:
+        groups = [[core for core in node if core in cores] for node in nodes]
+        node_ids: list[int | None] = [
+            node_id for node_id, group in enumerate(groups) if group
+        ]
+        groups = [group for group in groups if group]
+    else:
+        groups = []
+        node_ids = []
+    if not groups:
+        groups = [cores]
+        node_ids = [None]
+
+    placements = []
+    for process_id in range(processes):
+        group_id = process_id % len(groups)
+        group = groups[group_id]
+        sharing = len(range(group_id, processes, len(groups)))
+        position = process_id // len(groups)
+        chunk_size = max(len(group) // sharing, 1)
+        start = (position * chunk_size) % len(group)
+        process_cores = group[start : start + chunk_size]
+        if len(process_cores) > threads:
+            worker_cores = process_cores[:threads]
+            auxiliary_cores = process_cores[threads:]
+        else:
+            worker_cores = process_cores
+            auxiliary_cores = process_cores
+        placements.append(
+            ProcessPlacement(worker_cores, auxiliary_cores, node_ids[group_id])
+        )
+    return placements
+
+
+def pin_to_auxiliary_cores() -> None:
+    """Pins the calling thread to the cores that are not reserved for workers.
+
+    Invalid core lists and cores that are not available are logged and the thread is
+    left unpinned, as done by the engine for its threads."""
+    core_list = os.environ.get("PATHWAY_AUXILIARY_CORES") or os.environ.get(
+        "PATHWAY_WORKER_CORES"
+    )
+    if not core_list or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, parse_core_list(core_list))
+    except (ValueError, OSError) as error:
+        logging.warning(f"Can't pin a thread to cores {core_list!r}: {error}")
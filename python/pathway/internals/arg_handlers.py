@@ -33,6 +33,7 @@ def groupby_handler(
     instance=None,
     _skip_errors=True,
     _is_window=False,
+    skew_split=1,
     **kwargs,
 ):
     if kwargs:
@@ -47,6 +48,7 @@ def groupby_handler(
         "instance": instance,
         "_skip_errors": _skip_errors,
         "_is_window": _is_window,
+        "skew_split": skew_split,
     }
 
 
@@ -187,6 +189,9 @@ def join_kwargs_handler(*, allow_how: bool, allow_id: bool):
                     "The behavior argument of join should be of type pathway.temporal.CommonBehavior."
                 )
 
+        if "skew_split" in kwargs:
+            processed_kwargs["skew_split"] = kwargs.pop("skew_split")
+
         if "interval" in kwargs:
             from pathway.stdlib.temporal import Interval
 
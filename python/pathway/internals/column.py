@@ -19,6 +19,7 @@ from pathway.internals.parse_graph import G
 from pathway.internals.universe import Universe
 
 if TYPE_CHECKING:
+    from pathway.internals.acceptors import Acceptor
     from pathway.internals.expression import InternalColRef
     from pathway.internals.operator import OutputHandle
     from pathway.internals.table import Table
@@ -507,6 +508,8 @@ class GroupedContext(Context):
     """Original context of grouped table."""
     skip_errors: bool
     sort_by: InternalColRef | None = None
+    skew_split: int = 1
+    """Number of parts each group is split into before being reduced."""
 
     def _get_type_interpreter(self):
         from pathway.internals.type_interpreter import ReducerInterprerer
@@ -542,7 +545,7 @@ class GroupedContext(Context):
 class DeduplicateContext(Context):
     value: ColumnWithExpression
     instance: tuple[ColumnWithExpression, ...]
-    acceptor: Callable[[Any, Any], bool]
+    acceptor: Callable[[Any, Any], bool] | Acceptor
     orig_id_column: IdColumn
     persistent_id: str | None
 
@@ -943,6 +946,7 @@ class JoinContext(Context, column_properties_evaluator=cp.JoinPropsEvaluator):
     left_ear: bool
     right_ear: bool
     exact_match: bool
+    skew_split: int = 1
 
     def column_dependencies_external(self) -> Iterable[Column]:
         return (self.left_table._id_column, self.right_table._id_column)
@@ -983,6 +987,54 @@ class JoinContext(Context, column_properties_evaluator=cp.JoinPropsEvaluator):
             return dt.ANY_POINTER  # Pointer(Pointer,Pointer), but that might change
 
 
+@dataclass(eq=True, frozen=True)
+class JoinManyContext(
+    Context, column_properties_evaluator=cp.PreserveDependenciesPropsEvaluator
+):
+    """Context for building inner table of an inner join of a base table with multiple
+    dimension tables, each joined with the base table on its own condition."""
+
+    _universe: Universe
+    base_table: pw.Table
+    dimension_tables: tuple[pw.Table, ...]
+    on_base: tuple[ContextTable, ...]
+    on_dimensions: tuple[ContextTable, ...]
+
+    def input_tables(self) -> tuple[pw.Table, ...]:
+        return (self.base_table, *self.dimension_tables)
+
+    def column_dependencies_external(self) -> Iterable[Column]:
+        return tuple(table._id_column for table in self.input_tables())
+
+    def column_dependencies_internal(self) -> Iterable[Column]:
+        return chain(
+            *(on.columns for on in self.on_base),
+            *(on.columns for on in self.on_dimensions),
+        )
+
+    def intermediate_tables(self) -> Iterable[Table]:
+        return [
+            _create_internal_table(
+                chain(*(on.columns for on in self.on_base)),
+                self.base_table._table_restricted_context,
+            ),
+            *(
+                _create_internal_table(
+                    on.columns,
+                    table._table_restricted_context,
+                )
+                for table, on in zip(self.dimension_tables, self.on_dimensions)
+            ),
+        ]
+
+    @cached_property
+    def universe(self) -> Universe:
+        return self._universe
+
+    def id_column_type(self) -> dt.DType:
+        return dt.ANY_POINTER
+
+
 @dataclass(eq=False, frozen=True)
 class JoinRowwiseContext(
     RowwiseContext, column_properties_evaluator=cp.PreserveDependenciesPropsEvaluator
@@ -1102,6 +1154,62 @@ class SortingContext(Context):
         return self.original_id_column_dtype
 
 
+@dataclass(eq=False, frozen=True)
+class RankContext(Context):
+    """Context of table.rank() operation."""
+
+    key_column: ColumnWithExpression
+    instance_column: ColumnWithExpression
+    original_id_column_dtype: dt.DType
+
+    def column_dependencies_internal(self) -> Iterable[Column]:
+        return [self.key_column, self.instance_column]
+
+    @cached_property
+    def universe(self) -> Universe:
+        return self.key_column.universe
+
+    @cached_property
+    def rank_column(self) -> Column:
+        return MaterializedColumn(self.universe, cp.ColumnProperties(dtype=dt.INT))
+
+    @cached_property
+    def percent_rank_column(self) -> Column:
+        return MaterializedColumn(self.universe, cp.ColumnProperties(dtype=dt.FLOAT))
+
+    def id_column_type(self) -> dt.DType:
+        return self.original_id_column_dtype
+
+
+@dataclass(eq=False, frozen=True)
+class LimitContext(
+    Context, column_properties_evaluator=cp.PreserveDependenciesPropsEvaluator
+):
+    """Context of table.limit() operation."""
+
+    key_column: ColumnWithExpression
+    instance_column: ColumnWithExpression
+    id_column_to_filter: IdColumn
+    offset: int
+    limit: int
+
+    def column_dependencies_internal(self) -> Iterable[Column]:
+        return [self.key_column, self.instance_column]
+
+    def column_dependencies_external(self) -> Iterable[Column]:
+        return [self.id_column_to_filter]
+
+    def input_universe(self) -> Universe:
+        return self.id_column_to_filter.universe
+
+    def id_column_type(self) -> dt.DType:
+        return self.id_column_to_filter.dtype
+
+    @cached_property
+    def universe(self) -> Universe:
+        return self.id_column_to_filter.universe.subset()
+
+
 @dataclass(eq=False, frozen=True)
 class RemoveErrorsContext(
     Context, column_properties_evaluator=cp.PreserveDependenciesPropsEvaluator
@@ -48,6 +48,11 @@ def iterate(
     either a single Table, a tuple of Tables, or a dict of Tables, respectively.
     Initial arguments to function are passed through kwargs.
 
+    Rounds are evaluated incrementally, i.e. a round processes only the rows that changed
+    in the previous one. ``iteration_limit`` bounds the number of rounds. The number of
+    rounds of the latest fixed point computation, the number of rows changed in each
+    round and the time it took are shown in the monitoring dashboard.
+
     Example:
 
     >>> import pathway as pw
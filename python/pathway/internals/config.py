@@ -70,6 +70,13 @@ class PathwayConfig:
         "PATHWAY_TERMINATE_ON_ERROR", default="true"
     )
     process_id: str = _env_field("PATHWAY_PROCESS_ID", default="0")
+    fuse_rowwise_operators: bool = _env_bool_field(
+        "PATHWAY_FUSE_ROWWISE_OPERATORS", default="true"
+    )
+    push_down_filters: bool = _env_bool_field(
+        "PATHWAY_PUSH_DOWN_FILTERS", default="true"
+    )
+    explain: str | None = _env_field("PATHWAY_EXPLAIN", default_if_empty=True)
 
     @property
     def replay_config(
@@ -4,19 +4,26 @@ from __future__ import annotations
 
 import json
 import os
+import time
 import uuid
 import warnings
 from collections.abc import Callable, Collection, Iterable
+from contextlib import nullcontext
 from itertools import chain
+from typing import Literal
 
 import pathway.internals.graph_runner.telemetry as telemetry
 from pathway.internals import api, parse_graph as graph, table, trace
 from pathway.internals.column_path import ColumnPath
 from pathway.internals.config import get_pathway_config
 from pathway.internals.graph_runner.async_utils import new_event_loop
+from pathway.internals.graph_runner.explain import PlanAnalysis, PlanFormatter
+from pathway.internals.graph_runner.filter_pushdown import push_down_filters
+from pathway.internals.graph_runner.profiler import Profiler
 from pathway.internals.graph_runner.row_transformer_operator_handler import (  # noqa: registers handler for RowTransformerOperator
     RowTransformerOperatorHandler,
 )
+from pathway.internals.graph_runner.rowwise_fusion import fuse_rowwise_columns
 from pathway.internals.graph_runner.scope_context import ScopeContext
 from pathway.internals.graph_runner.state import ScopeState
 from pathway.internals.graph_runner.storage_graph import OperatorStorageGraph
@@ -27,6 +34,7 @@ from pathway.internals.operator import (
     InputOperator,
     Operator,
 )
+from pathway.internals.utils.memory import peak_memory
 from pathway.persistence import (
     Config as PersistenceConfig,
     get_persistence_engine_config,
@@ -41,6 +49,7 @@ class GraphRunner:
     ignore_asserts: bool
     runtime_typechecking: bool
     terminate_on_error: bool
+    mode: Literal["streaming", "batch"]
 
     def __init__(
         self,
@@ -55,6 +64,8 @@ class GraphRunner:
         runtime_typechecking: bool | None = None,
         license_key: str | None = None,
         terminate_on_error: bool | None = None,
+        mode: Literal["streaming", "batch"] = "streaming",
+        profile: str | os.PathLike | None = None,
         _stacklevel: int = 1,
     ) -> None:
         pathway_config = get_pathway_config()
@@ -82,6 +93,12 @@ class GraphRunner:
                 "terminate_on_error=False mode is experimental",
                 stacklevel=_stacklevel + 1,
             )
+        if mode not in ("streaming", "batch"):
+            raise ValueError(
+                f"mode has to be either 'streaming' or 'batch', got {mode!r}"
+            )
+        self.mode = mode
+        self.profile = profile
 
     def run_nodes(
         self,
@@ -117,6 +134,21 @@ class GraphRunner:
     ) -> None:
         self.run_nodes(self._graph.global_scope.output_nodes, after_build=after_build)
 
+    def explain_tables(self, *tables: table.Table, analyze: bool = False) -> str:
+        nodes = self.tree_shake_tables(self._graph.global_scope, tables)
+        return self._explain(nodes, output_tables=tables, analyze=analyze)
+
+    def explain_all(self, *, analyze: bool = False) -> str:
+        return self._explain(
+            self._graph.global_scope.normal_nodes, run_all=True, analyze=analyze
+        )
+
+    def explain_outputs(self, *, analyze: bool = False) -> str:
+        nodes = self._tree_shake(
+            self._graph.global_scope, self._graph.global_scope.output_nodes
+        )
+        return self._explain(nodes, analyze=analyze)
+
     def has_bounded_input(self, table: table.Table) -> bool:
         nodes = self.tree_shake_tables(self._graph.global_scope, [table])
 
@@ -126,6 +158,68 @@ class GraphRunner:
 
         return True
 
+    def _check_bounded_input(self, nodes: Iterable[Operator]) -> None:
+        for node in nodes:
+            if isinstance(node, InputOperator) and not node.datasource.is_bounded():
+                raise ValueError(
+                    f"batch mode requires all inputs to be bounded, but {node.label()}"
+                    + " reads a stream. Use static mode of the connector or"
+                    + " run the computation in the streaming mode."
+                )
+
+    def _explain(
+        self,
+        nodes: Iterable[Operator],
+        /,
+        *,
+        output_tables: Collection[table.Table] = (),
+        run_all: bool = False,
+        analyze: bool = False,
+    ) -> str:
+        if not analyze:
+            storage_graph = self._build_plan(nodes, output_tables, run_all=run_all)
+            return PlanFormatter().format(storage_graph)
+
+        nodes = list(nodes)
+        for node in nodes:
+            if isinstance(node, InputOperator) and not node.datasource.is_bounded():
+                raise ValueError(
+                    "explain with analyze=True runs the computation and requires all"
+                    + f" inputs to be bounded, but {node.label()} reads a stream."
+                    + " Use static mode of the connector."
+                )
+        analysis = PlanAnalysis()
+        start = time.monotonic()
+        self._run(
+            nodes, output_tables=output_tables, run_all=run_all, analysis=analysis
+        )
+        analysis.elapsed = time.monotonic() - start
+        analysis.peak_memory = peak_memory()
+        assert analysis.storage_graph is not None
+        return PlanFormatter(analysis).format(analysis.storage_graph)
+
+    def _build_plan(
+        self,
+        nodes: Iterable[Operator],
+        output_tables: Collection[table.Table],
+        *,
+        run_all: bool,
+        profiler: Profiler | None = None,
+    ) -> OperatorStorageGraph:
+        context = ScopeContext(
+            nodes=StableSet(nodes),
+            runtime_typechecking=self.runtime_typechecking,
+            run_all=run_all,
+            profiler=profiler,
+        )
+        if get_pathway_config().fuse_rowwise_operators:
+            fuse_rowwise_columns(context, output_tables)
+        # with terminate_on_error=False the moved conditions could log errors
+        # for rows that were previously dropped
+        if get_pathway_config().push_down_filters and self.terminate_on_error:
+            push_down_filters(context, output_tables)
+        return OperatorStorageGraph.from_scope_context(context, self, output_tables)
+
     def _run(
         self,
         nodes: Iterable[Operator],
@@ -134,7 +228,11 @@ class GraphRunner:
         output_tables: Collection[table.Table] = (),
         after_build: Callable[[ScopeState, OperatorStorageGraph], None] | None = None,
         run_all: bool = False,
+        analysis: PlanAnalysis | None = None,
     ) -> list[api.CapturedStream]:
+        if self.mode == "batch":
+            nodes = list(nodes)
+            self._check_bounded_input(nodes)
         self._graph.mark_all_operators_as_used()
         run_id = self._get_run_id()
         pathway_config = get_pathway_config()
@@ -146,15 +244,28 @@ class GraphRunner:
         with otel.tracer.start_as_current_span("graph_runner.run"):
             trace_context, trace_parent = telemetry.get_current_context()
 
-            context = ScopeContext(
-                nodes=StableSet(nodes),
-                runtime_typechecking=self.runtime_typechecking,
-                run_all=run_all,
-            )
+            profiler = None
+            if self.profile is not None:
+                profile_path = os.fspath(self.profile)
+                if pathway_config.process_id != "0":
+                    profile_path += f".{pathway_config.process_id}"
+                profiler = Profiler(profile_path)
+            with otel.tracer.start_as_current_span("graph_runner.plan") as plan_span:
+                storage_graph = self._build_plan(
+                    nodes, output_tables, run_all=run_all, profiler=profiler
+                )
+                context = storage_graph.scope_context
+                plan_span.set_attribute("operator_count", len(context.nodes))
+            metrics_callbacks = []
+            if analysis is not None:
+                analysis.storage_graph = storage_graph
+                metrics_callbacks.append(analysis.set_operator_metrics)
+            if profiler is not None:
+                metrics_callbacks.append(profiler.set_operator_metrics)
 
-            storage_graph = OperatorStorageGraph.from_scope_context(
-                context, self, output_tables
-            )
+            def on_operator_metrics(metrics: dict[int, api.OperatorMetrics]) -> None:
+                for callback in metrics_callbacks:
+                    callback(metrics)
 
             def logic(
                 scope: api.Scope,
@@ -198,6 +309,7 @@ class GraphRunner:
                 get_persistence_engine_config(
                     self.persistence_config
                 ) as persistence_engine_config,
+                profiler if profiler is not None else nullcontext(),
             ):
                 try:
                     return api.run_with_new_graph(
@@ -213,6 +325,9 @@ class GraphRunner:
                         trace_parent=trace_parent,
                         run_id=run_id,
                         terminate_on_error=self.terminate_on_error,
+                        on_operator_metrics=(
+                            on_operator_metrics if metrics_callbacks else None
+                        ),
                     )
                 except api.EngineErrorWithTrace as e:
                     error, frame = e.args
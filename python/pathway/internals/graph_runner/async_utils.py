@@ -6,12 +6,16 @@ import asyncio
 import contextlib
 import threading
 
+from pathway.internals.affinity import pin_to_auxiliary_cores
+
 
 @contextlib.contextmanager
 def new_event_loop():
     event_loop = asyncio.new_event_loop()
 
     def target(event_loop: asyncio.AbstractEventLoop):
+        # threads of the default executor inherit the affinity of this thread
+        pin_to_auxiliary_cores()
         try:
             event_loop.run_forever()
         finally:
@@ -0,0 +1,134 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Hashable, Iterable, Iterator
+
+from pathway.internals import expression as expr
+
+# never evaluated once for several occurrences: trivial to evaluate,
+# evaluated outside of the rowwise operator or not allowed there at all
+_NOT_SHARED = (
+    expr.ColumnReference,
+    expr.ColumnConstExpression,
+    expr.AsyncApplyExpression,
+    expr.ReducerExpression,
+    expr.ColumnCallExpression,
+)
+
+
+def _is_pure(expression: expr.ColumnExpression) -> bool:
+    if isinstance(expression, (expr.AsyncApplyExpression, expr.ReducerExpression)):
+        return False
+    if isinstance(expression, expr.ApplyExpression) and not expression._deterministic:
+        return False
+    return True
+
+
+def _eagerly_evaluated_deps(
+    expression: expr.ColumnExpression,
+) -> tuple[expr.ColumnExpression, ...]:
+    """Arguments evaluated whenever ``expression`` is evaluated.
+
+    The remaining arguments, like branches of ``if_else`` or the expression in
+    ``fill_error``, are evaluated only for some rows and evaluating them for every row
+    could raise errors that don't happen otherwise.
+    """
+    if isinstance(expression, expr.IfElseExpression):
+        return (expression._if,)
+    if isinstance(expression, expr.CoalesceExpression):
+        return expression._args[:1]
+    if isinstance(expression, expr.RequireExpression):
+        return expression._args[:1] if expression._args else (expression._val,)
+    if isinstance(expression, expr.GetExpression):
+        return (expression._object, expression._index)
+    if isinstance(expression, expr.MethodCallExpression):
+        return expression._args[:1]
+    if isinstance(expression, expr.ColumnBinaryOpExpression):
+        if expression._operator in (operator.and_, operator.or_):
+            return (expression._left,)
+        return expression._deps
+    if isinstance(
+        expression,
+        (
+            expr.ColumnUnaryOpExpression,
+            expr.ApplyExpression,
+            expr.CastExpression,
+            expr.ConvertExpression,
+            expr.DeclareTypeExpression,
+            expr.IsNoneExpression,
+            expr.IsNotNoneExpression,
+            expr.MakeTupleExpression,
+            expr.PointerExpression,
+            expr.UnwrapExpression,
+        ),
+    ) and not isinstance(expression, expr.AsyncApplyExpression):
+        return expression._deps
+    return ()
+
+
+def _preorder(expression: expr.ColumnExpression) -> Iterator[expr.ColumnExpression]:
+    yield expression
+    for dep in expression._deps:
+        yield from _preorder(dep)
+
+
+def _subexpression_key(expression: expr.ColumnExpression) -> Hashable | None:
+    # types are part of the key, as constants like 1, 1.0 and True are equal
+    key = (
+        expression._to_internal(),
+        tuple(getattr(dep, "_dtype", None) for dep in _preorder(expression)),
+    )
+    try:
+        hash(key)
+    except TypeError:  # e.g. constants that are lists
+        return None
+    return key
+
+
+def find_common_subexpressions(
+    expressions: Iterable[expr.ColumnExpression],
+) -> dict[int, Hashable]:
+    """Finds subexpressions occurring more than once in ``expressions``.
+
+    Returns a mapping from ``id`` of each occurrence to a key shared by all occurrences
+    of the same subexpression. Only deterministic subexpressions evaluated for every
+    row (in at least one of the occurrences) are returned, so that evaluating them
+    once per row, before the expressions using them, neither changes the results nor
+    raises errors that wouldn't be raised otherwise.
+    """
+    occurrences: dict[Hashable, list[expr.ColumnExpression]] = {}
+    eager: set[Hashable] = set()
+
+    def visit(expression: expr.ColumnExpression, is_eager: bool) -> bool:
+        # returns whether the expression is pure
+        key = None
+        if not isinstance(expression, _NOT_SHARED):
+            key = _subexpression_key(expression)
+        if key is not None and key in occurrences:
+            # the same subexpression was visited, including its arguments
+            occurrences[key].append(expression)
+            if is_eager:
+                eager.add(key)
+            return True
+        eager_deps = _eagerly_evaluated_deps(expression)
+        pure = _is_pure(expression)
+        for dep in expression._deps:
+            if not visit(dep, is_eager and any(dep is arg for arg in eager_deps)):
+                pure = False
+        if key is not None and pure:
+            occurrences[key] = [expression]
+            if is_eager:
+                eager.add(key)
+        return pure
+
+    for expression in expressions:
+        visit(expression, True)
+
+    return {
+        id(occurrence): key
+        for key, key_occurrences in occurrences.items()
+        if len(key_occurrences) > 1 and key in eager
+        for occurrence in key_occurrences
+    }
@@ -0,0 +1,380 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from pathway.internals import api, column as clmn, expression as expr
+from pathway.internals.acceptors import Acceptor
+from pathway.internals.expression_printer import ExpressionFormatter
+from pathway.internals.graph_runner.common_subexpressions import (
+    find_common_subexpressions,
+)
+from pathway.internals.graph_runner.path_evaluator import join_input_keys
+from pathway.internals.graph_runner.path_storage import Storage
+from pathway.internals.graph_runner.storage_graph import OperatorStorageGraph
+from pathway.internals.operator import (
+    ContextualizedIntermediateOperator,
+    InputOperator,
+    IterateOperator,
+    Operator,
+    OutputOperator,
+)
+from pathway.internals.reducers import StatefulManyReducer
+from pathway.internals.table import Table
+
+INDENT = "    "
+
+# engine operators evaluating each context, contexts that aren't listed are
+# evaluated by the operator of their base class
+_ENGINE_OPERATORS: dict[type[clmn.Context], str] = {
+    clmn.RowwiseContext: "expression_table",
+    clmn.FilterContext: "filter_table",
+    clmn.JoinContext: "join_tables",
+    clmn.JoinManyContext: "join_many",
+    clmn.GroupedContext: "group_by_table",
+    clmn.DeduplicateContext: "deduplicate",
+    clmn.IxContext: "ix_table",
+    clmn.HavingContext: "ix_table",
+    clmn.ReindexContext: "reindex_table",
+    clmn.IntersectContext: "intersect_tables",
+    clmn.RestrictContext: "restrict_table",
+    clmn.DifferenceContext: "subtract_table",
+    clmn.UpdateRowsContext: "update_rows_table",
+    clmn.UpdateCellsContext: "update_cells_table",
+    clmn.ConcatUnsafeContext: "concat_tables",
+    clmn.FlattenContext: "flatten_table",
+    clmn.SortingContext: "sort_table",
+    clmn.RankContext: "rank_table",
+    clmn.LimitContext: "limit_table",
+    clmn.ForgetContext: "forget",
+    clmn.ForgetImmediatelyContext: "forget_immediately",
+    clmn.FilterOutForgettingContext: "filter_out_results_of_forgetting",
+    clmn.FreezeContext: "freeze",
+    clmn.BufferContext: "buffer",
+    clmn.GradualBroadcastContext: "gradual_broadcast",
+    clmn.ExternalIndexAsOfNowContext: "use_external_index_as_of_now",
+    clmn.PromiseSameUniverseContext: "override_table_universe",
+    clmn.RemoveErrorsContext: "remove_errors_from_table",
+    clmn.RemoveRetractionsContext: "remove_retractions_from_table",
+}
+
+
+@dataclass
+class PlanAnalysis:
+    """Statistics of a run of the plan, printed by ``explain(analyze=True)``."""
+
+    operator_metrics: dict[int, api.OperatorMetrics] = field(default_factory=dict)
+    elapsed: float = 0.0
+    peak_memory: int | None = None
+    storage_graph: OperatorStorageGraph | None = None
+
+    def set_operator_metrics(self, metrics: dict[int, api.OperatorMetrics]) -> None:
+        self.operator_metrics = metrics
+
+
+def _format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024:
+            break
+        value /= 1024
+    else:
+        unit = "TiB"
+    return f"{value:.1f} {unit}"
+
+
+def _preorder(expression: expr.ColumnExpression) -> Iterator[expr.ColumnExpression]:
+    yield expression
+    for dep in expression._deps:
+        yield from _preorder(dep)
+
+
+def _evaluation(expression: expr.ColumnExpression) -> str:
+    """Where the expression is evaluated: natively in the engine or in Python."""
+    evaluation = "native"
+    for subexpression in _preorder(expression):
+        if isinstance(subexpression, expr.AsyncApplyExpression):
+            return "async python"
+        if isinstance(
+            subexpression, (expr.ApplyExpression, expr.ColumnCallExpression)
+        ) or (
+            isinstance(subexpression, expr.ReducerExpression)
+            and isinstance(subexpression._reducer, StatefulManyReducer)
+        ):
+            evaluation = "python"
+    return evaluation
+
+
+def _engine_operator(context: clmn.Context) -> str:
+    for context_type in type(context).__mro__:
+        if context_type in _ENGINE_OPERATORS:
+            return _ENGINE_OPERATORS[context_type]
+    return type(context).__name__
+
+
+class PlanFormatter:
+    """Formats the physical plan of a computation: the engine operators evaluating
+    every Pathway operator, their keys, exchanges of rows between workers,
+    arrangements (indexed state kept by the operators) and the expressions they
+    evaluate, natively or in Python.
+    """
+
+    def __init__(self, analysis: PlanAnalysis | None = None) -> None:
+        self.analysis = analysis
+        self.printer = ExpressionFormatter()
+        self.lines: list[str] = []
+
+    def format(self, storage_graph: OperatorStorageGraph) -> str:
+        self.lines.append("Physical plan:")
+        self._format_graph(storage_graph, depth=1)
+        if self.analysis is not None:
+            summary = f"Total time: {self.analysis.elapsed:.3f} s"
+            if self.analysis.peak_memory is not None:
+                peak_memory = _format_bytes(self.analysis.peak_memory)
+                summary += f", peak memory of the process: {peak_memory}"
+            self.lines.append(summary)
+        table_infos = list(self.printer.table_infos())
+        if table_infos:
+            self.lines.append("Tables:")
+        for name, frame in table_infos:
+            if frame is None:
+                self._line(1, name)
+            else:
+                self._line(1, f"{name} created in {frame.filename}:{frame.line_number}")
+        return "\n".join(self.lines)
+
+    def _line(self, depth: int, text: str) -> None:
+        self.lines.append(INDENT * depth + text)
+
+    def _table(self, table: Table) -> str:
+        return f"<table{self.printer.table_numbers[table]}>"
+
+    def _column(self, column: clmn.Column) -> str:
+        if isinstance(column, clmn.ColumnWithExpression):
+            return self.printer.eval_expression(column.expression)
+        if hasattr(column, "lineage"):
+            return f"{self._table(column.lineage.table)}.{column.lineage.name}"
+        return "<column>"
+
+    def _columns(self, columns: Iterable[clmn.Column]) -> str:
+        return ", ".join(self._column(column) for column in columns)
+
+    def _format_graph(self, storage_graph: OperatorStorageGraph, depth: int) -> None:
+        for operator in storage_graph.scope_context.nodes:
+            self._format_operator(storage_graph, operator, depth)
+
+    def _format_operator(
+        self, storage_graph: OperatorStorageGraph, operator: Operator, depth: int
+    ) -> None:
+        header = f"{operator.id} [{operator.label()}]"
+        frame = operator.trace.user_frame
+        if frame is not None:
+            header += f" at {frame.filename}:{frame.line_number}"
+        self._line(depth, header)
+        self._format_metrics(operator, depth + 1)
+
+        output_storages = storage_graph.output_storages.get(operator, {})
+        if isinstance(operator, InputOperator):
+            for table in operator.output_tables:
+                self._line(depth + 1, f"{self._table(table)} = input connector")
+        elif isinstance(operator, OutputOperator):
+            tables = ", ".join(self._table(table) for table in operator.input_tables)
+            self._line(depth + 1, f"output of {tables}")
+        elif isinstance(operator, IterateOperator):
+            self._line(depth + 1, "iterate until fixed point:")
+            self._format_graph(storage_graph.get_iterate_subgraph(operator), depth + 2)
+        elif isinstance(operator, ContextualizedIntermediateOperator):
+            for table in operator.intermediate_and_output_tables:
+                storage = output_storages.get(table)
+                if storage is not None:
+                    self._format_table(storage_graph, table, storage, depth + 1)
+
+    def _format_metrics(self, operator: Operator, depth: int) -> None:
+        if self.analysis is None:
+            return
+        metrics = self.analysis.operator_metrics.get(operator.id)
+        if metrics is None:
+            return
+        line = (
+            f"rows in: {metrics.rows_in}, rows out: {metrics.rows_out}, "
+            + f"time: {metrics.processing_time_ns / 1e6:.3f} ms, "
+            + f"arrangements: {metrics.arrangements}, "
+            + f"arranged records: {metrics.arranged_records}"
+        )
+        if metrics.hot_keys:
+            line += f", hot keys: {metrics.hot_keys}"
+        if metrics.exchanged_bytes:
+            # only sent to other processes
+            line += f", exchanged: {_format_bytes(metrics.exchanged_bytes)}"
+        if metrics.spilled_bytes:
+            line += f", spilled: {_format_bytes(metrics.spilled_bytes)}"
+            if metrics.spill_read_bytes:
+                # bytes read from disk per byte of the values looked up
+                amplification = (
+                    metrics.spill_read_bytes + metrics.spill_compacted_bytes
+                ) / metrics.spill_read_bytes
+                line += f", spill read amplification: {amplification:.2f}"
+        self._line(depth, line)
+
+    def _format_table(
+        self,
+        storage_graph: OperatorStorageGraph,
+        table: Table,
+        storage: Storage,
+        depth: int,
+    ) -> None:
+        context = table._id_column.context
+        if isinstance(context, clmn.RowwiseContext) and storage.has_only_references:
+            self._line(
+                depth,
+                f"{self._table(table)} = no engine operator, reuses input columns",
+            )
+            return
+        self._line(depth, f"{self._table(table)} = {_engine_operator(context)}")
+        for name, value in self._physical_properties(storage_graph, context):
+            self._line(depth + 1, f"{name}: {value}")
+        conditions = storage_graph.scope_context.pushed_filters.get(context, ())
+        for i, condition in enumerate(conditions):
+            if condition is not None:
+                if isinstance(context, clmn.JoinContext):
+                    side = ("left", "right")[i]
+                else:
+                    side = f"input {i}"
+                expression_repr = self.printer.eval_expression(condition.expression)
+                self._line(depth + 1, f"filter on {side}: {expression_repr}")
+
+        names = {column: name for name, column in table._columns.items()}
+        computed = [
+            column
+            for column in storage.get_columns()
+            if isinstance(column, clmn.ColumnWithExpression)
+            and not isinstance(column, clmn.ColumnWithReference)
+            and column.context is context
+        ]
+        if not computed:
+            return
+        self._line(depth + 1, "columns:")
+        expressions = [
+            storage_graph.scope_context.expression(column) for column in computed
+        ]
+        for column, expression in zip(computed, expressions):
+            name = names.get(column)
+            if name is None and hasattr(column, "lineage"):
+                name = column.lineage.name
+            evaluation = _evaluation(expression)
+            expression_repr = self.printer.eval_expression(expression)
+            self._line(depth + 2, f"{name or '_'} = {expression_repr}  [{evaluation}]")
+        if isinstance(context, clmn.RowwiseContext):
+            common = find_common_subexpressions(
+                context.expression_with_type(expression) for expression in expressions
+            )
+            if common:
+                self._line(
+                    depth + 1,
+                    "shared subexpressions evaluated once per row: "
+                    + f"{len(set(common.values()))}",
+                )
+
+    def _physical_properties(
+        self, storage_graph: OperatorStorageGraph, context: clmn.Context
+    ) -> list[tuple[str, str]]:
+        """Key, exchange and arrangements of the engine operator evaluating
+        ``context``. Properties that are the same as in the input are skipped."""
+        if isinstance(context, clmn.JoinContext):
+            on_left = self._columns(context.on_left.columns)
+            on_right = self._columns(context.on_right.columns)
+            arrangements = []
+            # skew-split joins build their own, salted arrangements
+            for side, on, key in zip(
+                ("left", "right"), (on_left, on_right), join_input_keys(context)
+            ):
+                arrangement = f"{side} side by ({on})"
+                if context.skew_split == 1 and key in storage_graph.shared_join_inputs:
+                    arrangement += " shared with other joins"
+                arrangements.append(arrangement)
+            properties = [
+                ("key", "from the ids of joined rows"),
+                ("exchange", f"both sides by join key ({on_left}) == ({on_right})"),
+                ("arrangements", ", ".join(arrangements)),
+            ]
+            if context.skew_split > 1:
+                properties.append(
+                    ("skew", f"hot keys split into {context.skew_split} parts")
+                )
+            return properties
+        if isinstance(context, clmn.JoinManyContext):
+            return [
+                ("key", "from the ids of joined rows"),
+                ("exchange", "every input by its join key"),
+                ("arrangements", "every dimension table by its join key"),
+            ]
+        if isinstance(context, clmn.GroupedContext):
+            grouping = ", ".join(
+                self.printer.eval_expression(ref.to_column_expression())
+                for ref in context.grouping_columns
+            )
+            properties = [
+                ("key", f"from grouping columns ({grouping})"),
+                ("exchange", f"by grouping columns ({grouping})"),
+                ("arrangements", "input rows by group, one per reducer"),
+            ]
+            if context.sort_by is not None:
+                sort_by = self.printer.eval_expression(
+                    context.sort_by.to_column_expression()
+                )
+                properties.append(("order", f"rows sorted by {sort_by} in groups"))
+            if context.skew_split > 1:
+                properties.append(
+                    (
+                        "skew",
+                        f"partial reduction on {context.skew_split} parts of a group",
+                    )
+                )
+            return properties
+        if isinstance(context, clmn.DeduplicateContext):
+            instance = self._columns(context.instance) or "none"
+            acceptor = "native" if isinstance(context.acceptor, Acceptor) else "python"
+            return [
+                ("exchange", f"by instance ({instance})"),
+                ("arrangements", "accepted row per instance"),
+                ("acceptor", acceptor),
+            ]
+        if isinstance(context, (clmn.IxContext, clmn.HavingContext)):
+            key_column = self._column(context.key_column)
+            return [
+                ("exchange", f"pointers in {key_column} by their target"),
+                ("arrangements", "indexed table by id, pointers by target"),
+            ]
+        if isinstance(context, clmn.ReindexContext):
+            return [("key", f"from {self._column(context.reindex_column)}")]
+        if isinstance(context, clmn.FlattenContext):
+            flatten_column = self._column(context.flatten_column)
+            return [("key", f"from the id and position in {flatten_column}")]
+        if isinstance(
+            context,
+            (
+                clmn.IntersectContext,
+                clmn.RestrictContext,
+                clmn.DifferenceContext,
+                clmn.UpdateRowsContext,
+                clmn.UpdateCellsContext,
+            ),
+        ):
+            return [
+                ("exchange", "all inputs by id"),
+                ("arrangements", "all inputs by id"),
+            ]
+        if isinstance(
+            context, (clmn.SortingContext, clmn.RankContext, clmn.LimitContext)
+        ):
+            instance = self._column(context.instance_column)
+            key = self._column(context.key_column)
+            return [
+                ("exchange", f"by instance ({instance})"),
+                ("arrangements", f"rows by instance and {key}"),
+            ]
+        if isinstance(context, clmn.GradualBroadcastContext):
+            return [("exchange", "broadcast to all workers")]
+        return []
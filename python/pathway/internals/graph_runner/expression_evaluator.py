@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Hashable, Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar
 
@@ -15,10 +15,14 @@ from pathway.internals import (
     expression as expr,
     universe as univ,
 )
+from pathway.internals.acceptors import Acceptor
 from pathway.internals.column_path import ColumnPath
 from pathway.internals.column_properties import ColumnProperties
 from pathway.internals.expression_printer import get_expression_info
 from pathway.internals.expression_visitor import ExpressionVisitor, IdentityTransform
+from pathway.internals.graph_runner.common_subexpressions import (
+    find_common_subexpressions,
+)
 from pathway.internals.graph_runner.path_storage import Storage
 from pathway.internals.graph_runner.scope_context import ScopeContext
 from pathway.internals.operator_mapping import (
@@ -29,6 +33,7 @@ from pathway.internals.operator_mapping import (
     get_convert_operators_mapping,
     get_unary_expression,
 )
+from pathway.internals.reducers import StatefulManyReducer
 from pathway.internals.udfs import udf
 
 if TYPE_CHECKING:
@@ -113,6 +118,38 @@ class ExpressionEvaluator(ABC):
             engine_input_tables.append(flattened_engine_storage)
         return tuple(engine_input_tables)
 
+    def maybe_flatten_filtered_table(
+        self,
+        output_storage: Storage,
+        condition: clmn.ColumnWithExpression | None,
+    ) -> api.Table:
+        """Like ``maybe_flatten_table`` but drops the rows not satisfying ``condition``
+        first. The condition is a part of a filter moved below the operator."""
+        input_storage = self.state.get_storage(output_storage._universe)
+        if condition is None or not all(
+            input_storage.has_column(column)
+            for column in condition.column_dependencies()
+        ):
+            # the filter after the operator is still applied
+            return self.maybe_flatten_table(output_storage)
+        assert output_storage.is_flat
+        table = RowwiseEvaluator(
+            condition.context, self.scope, self.state, self.scope_context
+        ).run(
+            Storage.new(output_storage._universe, {condition: ColumnPath((1,))}),
+            disable_runtime_typechecking=True,
+        )
+        filtered_table = self.scope.filter_table(
+            table,
+            ColumnPath((1,)),
+            self.scope.table_properties(table, ColumnPath.EMPTY),
+        )
+        paths = []
+        for column in output_storage.get_columns():
+            path = input_storage.get_path(column)
+            paths.append(path if path.is_key else (0,) + path)
+        return self.scope.flatten_table_storage(filtered_table, paths)
+
     def _table_properties(self, storage: Storage) -> api.TableProperties:
         properties = []
         for column in storage.get_columns():
@@ -127,19 +164,72 @@ class RowwiseEvalState:
     _dependencies: dict[clmn.Column, int]
     _storages: dict[Storage, api.Table]
     _deterministic: bool
+    _common_subexpressions: dict[int, Hashable]
+    _shared_arguments: dict[Hashable, api.Expression]
+    _shared_expressions: list[tuple[int, api.Expression, api.TableProperties]]
+    _current_properties: api.TableProperties | None
 
     def __init__(self) -> None:
         self._dependencies = {}
         self._storages = {}
         self._deterministic = True
+        self._common_subexpressions = {}
+        self._shared_arguments = {}
+        self._shared_expressions = []
+        self._current_properties = None
+
+    def _next_argument(self) -> int:
+        return len(self._dependencies) + len(self._shared_expressions)
 
     def dependency(self, column: clmn.Column) -> int:
-        return self._dependencies.setdefault(column, len(self._dependencies))
+        if column not in self._dependencies:
+            self._dependencies[column] = self._next_argument()
+        return self._dependencies[column]
 
     @property
     def columns(self) -> list[clmn.Column]:
         return list(self._dependencies.keys())
 
+    def set_common_subexpressions(
+        self, common_subexpressions: dict[int, Hashable]
+    ) -> None:
+        self._common_subexpressions = common_subexpressions
+
+    def set_current_properties(self, properties: api.TableProperties) -> None:
+        # properties (used for error traces) of the column being evaluated
+        self._current_properties = properties
+
+    def shared_argument(
+        self, expression: expr.ColumnExpression
+    ) -> api.Expression | None:
+        key = self._common_subexpressions.get(id(expression))
+        if key is None:
+            return None
+        return self._shared_arguments.get(key)
+
+    def share(
+        self, expression: expr.ColumnExpression, engine_expression: api.Expression
+    ) -> api.Expression:
+        """Evaluates ``expression`` once per row if it is a common subexpression,
+        its value is then used as an argument by all its occurrences."""
+        key = self._common_subexpressions.get(id(expression))
+        if key is None:
+            return engine_expression
+        assert self._current_properties is not None
+        index = self._next_argument()
+        self._shared_expressions.append(
+            (index, engine_expression, self._current_properties)
+        )
+        argument = api.Expression.argument(index)
+        self._shared_arguments[key] = argument
+        return argument
+
+    @property
+    def shared_expressions(
+        self,
+    ) -> list[tuple[int, api.Expression, api.TableProperties]]:
+        return self._shared_expressions
+
     def get_temporary_table(self, storage: Storage) -> api.Table:
         return self._storages[storage]
 
@@ -231,18 +321,28 @@ class RowwiseEvaluator(
                 {placeholder_column: old_path}
             )
 
+        typed_expressions = []
         for column in output_storage.get_columns():
             if input_storage.has_column(column):
                 continue
             assert isinstance(column, clmn.ColumnWithExpression)
-            expression = column.expression
+            expression = self.scope_context.expression(column)
             expression = self.context.expression_with_type(expression)
             if (
                 self.scope_context.runtime_typechecking
                 and not disable_runtime_typechecking
             ):
                 expression = TypeVerifier().eval_expression(expression)
+            typed_expressions.append((column, expression))
+
+        eval_state.set_common_subexpressions(
+            find_common_subexpressions(
+                expression for _column, expression in typed_expressions
+            )
+        )
+        for column, expression in typed_expressions:
             properties = api.TableProperties.column(self.column_properties(column))
+            eval_state.set_current_properties(properties)
 
             engine_expression = self.eval_expression(expression, eval_state=eval_state)
             assert ColumnPath((len(expressions),)) == output_storage.get_path(column)
@@ -265,7 +365,11 @@ class RowwiseEvaluator(
         paths = [input_storage.get_path(dep) for dep in eval_state.columns]
 
         return self.scope.expression_table(
-            engine_input_table, paths, expressions, eval_state.deterministic
+            engine_input_table,
+            paths,
+            expressions,
+            eval_state.deterministic,
+            eval_state.shared_expressions,
         )
 
     def run_subexpressions(
@@ -295,7 +399,12 @@ class RowwiseEvaluator(
     ) -> api.Expression:
         assert eval_state is not None
         assert not kwargs
-        return super().eval_expression(expression, eval_state=eval_state, **kwargs)
+        if (shared_argument := eval_state.shared_argument(expression)) is not None:
+            return shared_argument
+        engine_expression = super().eval_expression(
+            expression, eval_state=eval_state, **kwargs
+        )
+        return eval_state.share(expression, engine_expression)
 
     def eval_dependency(
         self,
@@ -428,6 +537,7 @@ class RowwiseEvaluator(
             fun=expression._fun,
             args=expression._args,
             kwargs=expression._kwargs,
+            is_async=True,
         )
 
         columns, input_storage, engine_input_table = self.run_subexpressions(args)
@@ -713,7 +823,11 @@ class RowwiseEvaluator(
         fun: Callable,
         args: tuple[expr.ColumnExpression, ...],
         kwargs: dict[str, expr.ColumnExpression],
+        is_async: bool = False,
     ) -> tuple[Callable, tuple[expr.ColumnExpression, ...]]:
+        profiler = self.scope_context.profiler
+        if profiler is not None:
+            fun = profiler.attribute(fun, is_async=is_async)
         if kwargs:
             args_len = len(args)
             kwarg_names = list(kwargs.keys())
@@ -1065,10 +1179,13 @@ class JoinEvaluator(ExpressionEvaluator, context_type=clmn.JoinContext):
             right_input_storage.get_path(column)
             for column in self.context.on_right.columns
         ]
+        left_condition, right_condition = self.scope_context.pushed_filters.get(
+            self.context, (None, None)
+        )
         properties = self._table_properties(join_storage)
         output_engine_table = self.scope.join_tables(
-            self.maybe_flatten_table(left_input_storage),
-            self.maybe_flatten_table(right_input_storage),
+            self.maybe_flatten_filtered_table(left_input_storage, left_condition),
+            self.maybe_flatten_filtered_table(right_input_storage, right_condition),
             left_paths,
             right_paths,
             last_column_is_instance=self.context.last_column_is_instance,
@@ -1076,6 +1193,7 @@ class JoinEvaluator(ExpressionEvaluator, context_type=clmn.JoinContext):
             assign_id=self.context.assign_id,
             left_ear=self.context.left_ear,
             right_ear=self.context.right_ear,
+            skew_split=self.context.skew_split,
         )
         self.state.set_table(join_storage, output_engine_table)
 
@@ -1098,6 +1216,48 @@ class JoinEvaluator(ExpressionEvaluator, context_type=clmn.JoinContext):
         )
 
 
+class JoinManyEvaluator(ExpressionEvaluator, context_type=clmn.JoinManyContext):
+    context: clmn.JoinManyContext
+
+    def run_join(self, output_storage: Storage) -> None:
+        base_input_storage = output_storage.maybe_flattened_inputs["base_storage"]
+        dimension_input_storages = [
+            output_storage.maybe_flattened_inputs[f"dimension_storage_{i}"]
+            for i in range(len(self.context.dimension_tables))
+        ]
+        join_storage = output_storage.maybe_flattened_inputs["join_storage"]
+        base_paths = [
+            [base_input_storage.get_path(column) for column in on.columns]
+            for on in self.context.on_base
+        ]
+        dimension_paths = [
+            [storage.get_path(column) for column in on.columns]
+            for storage, on in zip(dimension_input_storages, self.context.on_dimensions)
+        ]
+        properties = self._table_properties(join_storage)
+        output_engine_table = self.scope.join_many(
+            self.maybe_flatten_table(base_input_storage),
+            base_paths,
+            [self.maybe_flatten_table(storage) for storage in dimension_input_storages],
+            dimension_paths,
+            table_properties=properties,
+        )
+        self.state.set_table(join_storage, output_engine_table)
+
+    def run(self, output_storage: Storage) -> api.Table:
+        self.run_join(output_storage)
+        rowwise_evaluator = RowwiseEvaluator(
+            clmn.RowwiseContext(self.context.id_column),
+            self.scope,
+            self.state,
+            self.scope_context,
+        )
+        return rowwise_evaluator.run(
+            output_storage,
+            disable_runtime_typechecking=True,
+        )
+
+
 class JoinRowwiseEvaluator(RowwiseEvaluator, context_type=clmn.JoinRowwiseContext):
     context: clmn.JoinRowwiseContext
 
@@ -1149,6 +1309,7 @@ class GroupedEvaluator(ExpressionEvaluator, context_type=clmn.GroupedContext):
             reducers,
             self.context.set_id,
             properties,
+            skew_split=self.context.skew_split,
         )
 
         return reduced_engine_table
@@ -1186,9 +1347,17 @@ class GroupedEvaluator(ExpressionEvaluator, context_type=clmn.GroupedContext):
         args = expression._args + expression._reducer.additional_args_from_context(
             self.context
         )
-        engine_reducer = expression._reducer.engine_reducer(
-            [arg._dtype for arg in expression._args]
-        )
+        reducer = expression._reducer
+        profiler = self.scope_context.profiler
+        if profiler is not None and isinstance(reducer, StatefulManyReducer):
+            # also stateful_single and udf_reducer, they are built on stateful_many
+            engine_reducer = api.Reducer.stateful_many(
+                profiler.attribute(reducer.combine_many)
+            )
+        else:
+            engine_reducer = reducer.engine_reducer(
+                [arg._dtype for arg in expression._args]
+            )
         return self._reducer_data(engine_reducer, args)
 
 
@@ -1223,11 +1392,20 @@ class DeduplicateEvaluator(ExpressionEvaluator, context_type=clmn.DeduplicateCon
                     state = (col, *cols)
             return state
 
+        combine: Callable | api.DeduplicateAcceptor
+        if isinstance(self.context.acceptor, Acceptor):
+            combine = self.context.acceptor._to_engine()
+        else:
+            combine = is_different_with_state
+            profiler = self.scope_context.profiler
+            if profiler is not None:
+                combine = profiler.attribute(combine)
+
         return self.scope.deduplicate(
             self.state.get_table(input_storage._universe),
             instance_paths,
             reduced_columns_paths,
-            is_different_with_state,
+            combine,
             self.context.persistent_id,
             properties,
         )
@@ -1277,7 +1455,18 @@ class ConcatUnsafeEvaluator(ExpressionEvaluator, context_type=clmn.ConcatUnsafeC
     context: clmn.ConcatUnsafeContext
 
     def run(self, output_storage: Storage) -> api.Table:
-        engine_input_tables = self.maybe_flatten_tables(output_storage)
+        conditions = self.scope_context.pushed_filters.get(self.context)
+        if conditions is None:
+            engine_input_tables = self.maybe_flatten_tables(output_storage)
+        else:
+            engine_input_tables = tuple(
+                self.maybe_flatten_filtered_table(flattened_storage, condition)
+                for flattened_storage, condition in zip(
+                    output_storage.maybe_flattened_inputs.values(),
+                    conditions,
+                    strict=True,
+                )
+            )
         properties = self._table_properties(output_storage)
         engine_table = self.scope.concat_tables(engine_input_tables, properties)
         return engine_table
@@ -1313,6 +1502,40 @@ class SortingEvaluator(ExpressionEvaluator, context_type=clmn.SortingContext):
         )
 
 
+class RankEvaluator(ExpressionEvaluator, context_type=clmn.RankContext):
+    context: clmn.RankContext
+
+    def run(self, output_storage: Storage) -> api.Table:
+        input_storage = self.state.get_storage(self.context.universe)
+        key_column_path = input_storage.get_path(self.context.key_column)
+        instance_column_path = input_storage.get_path(self.context.instance_column)
+        properties = self._table_properties(output_storage)
+        return self.scope.rank_table(
+            self.state.get_table(input_storage._universe),
+            key_column_path,
+            instance_column_path,
+            properties,
+        )
+
+
+class LimitEvaluator(ExpressionEvaluator, context_type=clmn.LimitContext):
+    context: clmn.LimitContext
+
+    def run(self, output_storage: Storage) -> api.Table:
+        input_storage = self.state.get_storage(self.context.input_universe())
+        key_column_path = input_storage.get_path(self.context.key_column)
+        instance_column_path = input_storage.get_path(self.context.instance_column)
+        properties = self._table_properties(output_storage)
+        return self.scope.limit_table(
+            self.state.get_table(input_storage._universe),
+            key_column_path,
+            instance_column_path,
+            self.context.offset,
+            self.context.limit,
+            properties,
+        )
+
+
 class SetSchemaContextEvaluator(
     ExpressionEvaluator, context_type=clmn.SetSchemaContext
 ):
@@ -0,0 +1,311 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+import operator
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain
+
+from pathway.internals import column as clmn, dtype as dt, expression as expr
+from pathway.internals.expression_visitor import IdentityTransform
+from pathway.internals.graph_runner.scope_context import ScopeContext
+from pathway.internals.helpers import StableSet
+from pathway.internals.operator import ContextualizedIntermediateOperator
+from pathway.internals.table import Table
+from pathway.internals.universe import Universe
+
+# contexts of the columns that are computed from the result of a join or a concat
+# without changing its rows, their expressions can be moved below it
+_ROWWISE_CONTEXTS = (
+    clmn.RowwiseContext,
+    clmn.JoinRowwiseContext,
+    clmn.SetSchemaContext,
+)
+
+_ORDERED_DTYPES = (
+    dt.STR,
+    dt.BOOL,
+    dt.DATE_TIME_NAIVE,
+    dt.DATE_TIME_UTC,
+    dt.DURATION,
+)
+
+
+class _NotPushable(Exception):
+    pass
+
+
+class _ResolveColumns(IdentityTransform):
+    """Replaces the columns of the result of a join (or a concat), and of the rowwise
+    operators applied to it, with expressions over the columns of the inputs."""
+
+    def __init__(
+        self,
+        scope_context: ScopeContext,
+        source: clmn.JoinContext | clmn.ConcatUnsafeContext,
+        resolve_reference: Callable[[clmn.ColumnWithReference], expr.ColumnReference],
+    ):
+        self.scope_context = scope_context
+        self.source = source
+        self.resolve_reference = resolve_reference
+
+    def resolve(self, column: clmn.Column) -> expr.ColumnExpression:
+        if (
+            isinstance(column, clmn.ColumnWithReference)
+            and column.context is self.source
+        ):
+            return super().eval_column_val(self.resolve_reference(column))
+        if isinstance(column, clmn.ColumnWithExpression) and (
+            column.context is self.source or type(column.context) in _ROWWISE_CONTEXTS
+        ):
+            return self.eval_expression(self.scope_context.expression(column))
+        raise _NotPushable()
+
+    def eval_column_val(  # type: ignore[override]
+        self, expression: expr.ColumnReference, **kwargs
+    ) -> expr.ColumnExpression:
+        if expression._column.universe != self.source.universe:
+            return super().eval_column_val(expression, **kwargs)
+        return self.resolve(expression._column)
+
+
+def _references(expression: expr.ColumnExpression) -> Iterator[expr.ColumnReference]:
+    if isinstance(expression, expr.ColumnReference):
+        yield expression
+    for dep in expression._deps:
+        yield from _references(dep)
+
+
+def _conjuncts(expression: expr.ColumnExpression) -> Iterator[expr.ColumnExpression]:
+    if (
+        isinstance(expression, expr.ColumnBinaryOpExpression)
+        and expression._operator is operator.and_
+    ):
+        yield from _conjuncts(expression._left)
+        yield from _conjuncts(expression._right)
+    else:
+        yield expression
+
+
+def _is_ordered_pair(left: dt.DType, right: dt.DType) -> bool:
+    if left in (dt.INT, dt.FLOAT) and right in (dt.INT, dt.FLOAT):
+        return True
+    return left == right and left in _ORDERED_DTYPES
+
+
+def _cannot_fail(expression: expr.ColumnExpression) -> bool:
+    """Whether ``expression`` (with types) evaluates without errors on any row. Moved
+    conditions are evaluated on rows that were previously dropped by the join."""
+    if isinstance(expression, (expr.ColumnReference, expr.ColumnConstExpression)):
+        return True
+    if isinstance(expression, (expr.IsNoneExpression, expr.IsNotNoneExpression)):
+        return _cannot_fail(expression._expr)
+    if isinstance(expression, expr.ColumnUnaryOpExpression):
+        return (
+            expression._operator is operator.inv
+            and expression._expr._dtype == dt.BOOL
+            and _cannot_fail(expression._expr)
+        )
+    if isinstance(expression, expr.ColumnBinaryOpExpression):
+        left_dtype = expression._left._dtype
+        right_dtype = expression._right._dtype
+        if expression._operator in (operator.eq, operator.ne):
+            supported = True
+        elif expression._operator in (
+            operator.lt,
+            operator.le,
+            operator.gt,
+            operator.ge,
+        ):
+            supported = _is_ordered_pair(left_dtype, right_dtype)
+        elif expression._operator in (operator.and_, operator.or_, operator.xor):
+            supported = left_dtype == dt.BOOL and right_dtype == dt.BOOL
+        else:
+            supported = False
+        return (
+            supported
+            and _cannot_fail(expression._left)
+            and _cannot_fail(expression._right)
+        )
+    return False
+
+
+def _pushed_condition(
+    conjuncts: list[expr.ColumnExpression], id_column: clmn.IdColumn
+) -> clmn.ColumnWithExpression | None:
+    context = clmn.RowwiseContext(id_column)
+    pushed: list[expr.ColumnExpression] = []
+    for conjunct in conjuncts:
+        try:
+            typed = context.expression_with_type(conjunct)
+        except TypeError:
+            continue
+        if typed._dtype == dt.BOOL and _cannot_fail(typed):
+            pushed.append(conjunct)
+    if not pushed:
+        return None
+    condition = pushed[0]
+    for conjunct in pushed[1:]:
+        condition = expr.ColumnBinaryOpExpression(
+            left=condition, right=conjunct, operator=operator.and_
+        )
+    return clmn.ColumnWithExpression(context, id_column.universe, condition)
+
+
+def _input_universes(
+    context: clmn.JoinContext | clmn.ConcatUnsafeContext,
+) -> list[Universe]:
+    if isinstance(context, clmn.JoinContext):
+        return [context.left_table._universe, context.right_table._universe]
+    return [id_column.universe for id_column in context.union_ids]
+
+
+def push_down_filters(
+    scope_context: ScopeContext, output_tables: Iterable[Table] = ()
+) -> int:
+    """Moves the conditions of a ``filter`` applied to the result of a join or a
+    ``concat`` to the inputs of that operator, so that the rows not satisfying them are
+    dropped before they are joined (and arranged) or concatenated.
+
+    A condition, or a part of a conjunction, is moved only if:
+
+    - the result of the join (or the concat) is used only by rowwise operators
+      computing the condition and by the filter, so no other operator depends on its
+      rows,
+    - it uses the columns of one side of the join, which is not kept by an outer join
+      when unmatched from the other side (a concat moves it to all of its inputs),
+    - it consists of comparisons, boolean operators and ``is None`` checks only, so it
+      can't fail on the rows that were previously not reaching it.
+
+    The filter stays in place and evaluates its whole condition again, columns of
+    the inputs not needed by the operator are removed by the flattening of the
+    storages as before. The moved conditions are stored in
+    ``scope_context.pushed_filters``, the ParseGraph is not modified. Returns the
+    number of operators with moved conditions.
+    """
+    if scope_context.run_all:
+        # the whole result of the join is computed, it needs all of its rows
+        return 0
+
+    sources: dict[Universe, clmn.JoinContext | clmn.ConcatUnsafeContext] = {}
+    filters: StableSet[clmn.FilterContext] = StableSet()
+    consumers: dict[Universe, set[clmn.Context]] = defaultdict(set)
+    pinned: set[Universe] = set()
+    owners: dict[clmn.Column, tuple[Table, str]] = {}
+    for op in scope_context.nodes:
+        for table in op.hard_table_dependencies():
+            pinned.add(table._universe)
+        if not isinstance(op, ContextualizedIntermediateOperator):
+            for table in op.input_tables:
+                pinned.add(table._universe)
+        for table in op.intermediate_and_output_tables:
+            context = table._id_column.context
+            if isinstance(context, (clmn.JoinContext, clmn.ConcatUnsafeContext)):
+                sources[table._universe] = context
+            elif isinstance(context, clmn.FilterContext):
+                filters.add(context)
+            elif not isinstance(context, clmn.RowwiseContext):
+                # e.g. a table promised to have the same universe as another one
+                pinned.add(table._universe)
+            for name, column in table._columns.items():
+                owners.setdefault(column, (table, name))
+            for column in chain(table._columns.values(), [table._id_column]):
+                for dependency in scope_context.column_dependencies(column):
+                    if dependency.universe != column.universe:
+                        consumers[dependency.universe].add(column.context)
+    for table in output_tables:
+        pinned.add(table._universe)
+
+    pushed = 0
+    for filter_context in filters:
+        universe = filter_context.input_universe()
+        source = sources.get(universe)
+        if (
+            source is None
+            or universe in pinned
+            or consumers[universe] != {filter_context}
+            or universe in _input_universes(source)
+        ):
+            continue
+        if isinstance(source, clmn.JoinContext):
+            conditions = _push_below_join(scope_context, source, filter_context)
+        else:
+            conditions = _push_below_concat(
+                scope_context, source, filter_context, owners
+            )
+        if any(condition is not None for condition in conditions):
+            scope_context.pushed_filters[source] = conditions
+            pushed += 1
+    return pushed
+
+
+def _push_below_join(
+    scope_context: ScopeContext,
+    context: clmn.JoinContext,
+    filter_context: clmn.FilterContext,
+) -> tuple[clmn.ColumnWithExpression | None, ...]:
+    left_universe = context.left_table._universe
+    right_universe = context.right_table._universe
+    if left_universe == right_universe:
+        return (None, None)
+
+    def resolve_reference(column: clmn.ColumnWithReference) -> expr.ColumnReference:
+        raise _NotPushable()
+
+    transform = _ResolveColumns(scope_context, context, resolve_reference)
+    try:
+        condition = transform.resolve(filter_context.filtering_column)
+    except _NotPushable:
+        return (None, None)
+    left: list[expr.ColumnExpression] = []
+    right: list[expr.ColumnExpression] = []
+    for conjunct in _conjuncts(condition):
+        universes = {ref._column.universe for ref in _references(conjunct)}
+        # rows of a side kept by an outer join when unmatched can't be removed,
+        # and neither can the rows of the other side they could be matched with
+        if universes == {left_universe} and not context.right_ear:
+            left.append(conjunct)
+        elif universes == {right_universe} and not context.left_ear:
+            right.append(conjunct)
+    return (
+        _pushed_condition(left, context.left_table._id_column),
+        _pushed_condition(right, context.right_table._id_column),
+    )
+
+
+def _push_below_concat(
+    scope_context: ScopeContext,
+    context: clmn.ConcatUnsafeContext,
+    filter_context: clmn.FilterContext,
+    owners: dict[clmn.Column, tuple[Table, str]],
+) -> tuple[clmn.ColumnWithExpression | None, ...]:
+    conditions: list[clmn.ColumnWithExpression | None] = []
+    for i, id_column in enumerate(context.union_ids):
+
+        def resolve_reference(
+            column: clmn.ColumnWithReference, i: int = i
+        ) -> expr.ColumnReference:
+            if i == 0:
+                return column.expression
+            input_column = context.updates[i - 1][column.expression.name]
+            if input_column not in owners:
+                raise _NotPushable()
+            table, name = owners[input_column]
+            return expr.ColumnReference(_column=input_column, _table=table, _name=name)
+
+        transform = _ResolveColumns(scope_context, context, resolve_reference)
+        try:
+            condition = transform.resolve(filter_context.filtering_column)
+        except _NotPushable:
+            return tuple(None for _ in context.union_ids)
+        conjuncts = [
+            conjunct
+            for conjunct in _conjuncts(condition)
+            if all(
+                ref._column.universe == id_column.universe
+                for ref in _references(conjunct)
+            )
+        ]
+        conditions.append(_pushed_condition(conjuncts, id_column))
+    return tuple(conditions)
@@ -9,6 +9,7 @@ Handlers should not be constructed directly. Use `Operator.for_operator()` inste
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, ClassVar, Generic, TypeVar
 
 from pathway.internals import api, trace
@@ -36,6 +37,8 @@ from pathway.internals.operator import (
 from pathway.internals.table import Table
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from pathway.internals.graph_runner import GraphRunner
 
 
@@ -79,9 +82,22 @@ class OperatorHandler(ABC, Generic[T]):
         operator: T,
         output_storages: dict[Table, Storage],
     ):
-        with trace.custom_trace(operator.trace):
+        profiler = self.scope_context.profiler
+        with (
+            trace.custom_trace(operator.trace),
+            (
+                profiler.operator(
+                    self.operator_id, operator.label(), operator.trace.user_location
+                )
+                if profiler is not None
+                else nullcontext()
+            ),
+        ):
             self.scope.set_operator_properties(
-                self.operator_id, operator.depends_on_error_log
+                self.operator_id,
+                operator.depends_on_error_log,
+                operator.label(),
+                operator.trace.user_location,
             )
             if operator.error_log and not self.scope_context.inside_iterate:
                 self.scope.set_error_log(self.state.get_error_log(operator.error_log))
@@ -117,7 +133,7 @@ class InputOperatorHandler(OperatorHandler[InputOperator], operator_type=InputOp
                 assert table.schema is not None
                 materialized_table = api.static_table_from_pandas(
                     scope=self.scope,
-                    df=operator.debug_datasource.data,
+                    df=self._static_data(operator.debug_datasource.data),
                     connector_properties=operator.debug_datasource.connector_properties,
                     schema=operator.debug_datasource.schema,
                 )
@@ -127,7 +143,7 @@ class InputOperatorHandler(OperatorHandler[InputOperator], operator_type=InputOp
                 assert table.schema is not None
                 materialized_table = api.static_table_from_pandas(
                     scope=self.scope,
-                    df=datasource.data,
+                    df=self._static_data(datasource.data),
                     connector_properties=datasource.connector_properties,
                     schema=datasource.schema,
                 )
@@ -138,7 +154,9 @@ class InputOperatorHandler(OperatorHandler[InputOperator], operator_type=InputOp
                 materialized_table = self.scope.connector_table(
                     data_source=datasource.datastorage,
                     data_format=datasource.dataformat,
-                    properties=datasource.connector_properties,
+                    properties=self._connector_properties(
+                        datasource.connector_properties
+                    ),
                 )
                 self.state.set_table(output_storages[table], materialized_table)
         elif isinstance(datasource, EmptyDataSource):
@@ -164,6 +182,26 @@ class InputOperatorHandler(OperatorHandler[InputOperator], operator_type=InputOp
         else:
             raise RuntimeError("datasource not supported")
 
+    def _static_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.graph_builder.mode == "batch":
+            # all rows are inserted at a single logical time
+            df = df.drop(columns=api.TIME_PSEUDOCOLUMN, errors="ignore")
+        return df
+
+    def _connector_properties(
+        self, properties: api.ConnectorProperties
+    ) -> api.ConnectorProperties:
+        if self.graph_builder.mode == "batch":
+            # neither autocommits nor commits requested by the reader,
+            # so the data is not split into many logical times
+            properties = api.ConnectorProperties(
+                commit_duration_ms=None,
+                unsafe_trusted_ids=properties.unsafe_trusted_ids,
+                column_properties=properties.column_properties,
+                single_logical_time=True,
+            )
+        return properties
+
 
 class OutputOperatorHandler(
     OperatorHandler[OutputOperator], operator_type=OutputOperator
@@ -189,12 +227,20 @@ class OutputOperatorHandler(
                 data_format=datasink.dataformat,
             )
         elif isinstance(datasink, CallbackDataSink):
+            on_change = datasink.on_change
+            on_time_end = datasink.on_time_end
+            on_end = datasink.on_end
+            profiler = self.scope_context.profiler
+            if profiler is not None:
+                on_change = profiler.attribute(on_change)
+                on_time_end = profiler.attribute(on_time_end)
+                on_end = profiler.attribute(on_end)
             self.scope.subscribe_table(
                 table=engine_table,
                 column_paths=column_paths,
-                on_change=datasink.on_change,
-                on_time_end=datasink.on_time_end,
-                on_end=datasink.on_end,
+                on_change=on_change,
+                on_time_end=on_time_end,
+                on_end=on_end,
                 skip_persisted_batch=datasink.skip_persisted_batch,
                 skip_errors=datasink.skip_errors,
             )
@@ -5,7 +5,7 @@ from __future__ import annotations
 import itertools
 import math
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
 from typing import ClassVar
 
 import pathway.internals.column as clmn
@@ -22,6 +22,8 @@ def compute_paths(
     input_storages: dict[Universe, Storage],
     operator: op.Operator,
     context: clmn.Context,
+    shared_join_inputs: Collection[JoinInputKey] = (),
+    filtered_inputs: Collection[int] = (),
 ):
     evaluator: PathEvaluator
     match operator:
@@ -30,7 +32,9 @@ def compute_paths(
         case op.RowTransformerOperator():
             evaluator = FlatStoragePathEvaluator(context)
         case op.ContextualizedIntermediateOperator():
-            evaluator = PathEvaluator.for_context(context)(context)
+            evaluator = PathEvaluator.for_context(context)(
+                context, shared_join_inputs, filtered_inputs
+            )
         case _:
             raise ValueError(
                 f"Operator {operator} in update_storage() but it shouldn't produce tables."
@@ -41,6 +45,38 @@ def compute_paths(
     )
 
 
+JoinInputKey = tuple[Universe, tuple[clmn.Column, ...]]
+
+
+def join_input_keys(
+    context: clmn.JoinContext | clmn.JoinManyContext,
+) -> tuple[JoinInputKey, ...]:
+    """Identifies the sides of a join by the input universe and the joined columns."""
+
+    def key(universe: Universe, columns: Iterable[clmn.Column]) -> JoinInputKey:
+        return (
+            universe,
+            tuple(
+                (
+                    column.dereference()
+                    if isinstance(column, clmn.ColumnWithReference)
+                    else column
+                )
+                for column in columns
+            ),
+        )
+
+    if isinstance(context, clmn.JoinManyContext):
+        return tuple(
+            key(on.universe, on.columns)
+            for on in (*context.on_base, *context.on_dimensions)
+        )
+    return (
+        key(context.left_table._universe, context.on_left.columns),
+        key(context.right_table._universe, context.on_right.columns),
+    )
+
+
 def maybe_flatten_input_storage(
     storage: Storage, columns: Iterable[clmn.Column]
 ) -> Storage:
@@ -67,10 +103,20 @@ def maybe_flatten_input_storage(
 
 class PathEvaluator(ABC):
     context: clmn.Context
+    shared_join_inputs: Collection[JoinInputKey]
+    filtered_inputs: Collection[int]
+    """Indices of the inputs filtered before the operator, their storages are flat."""
 
-    def __init__(self, context: clmn.Context) -> None:
+    def __init__(
+        self,
+        context: clmn.Context,
+        shared_join_inputs: Collection[JoinInputKey] = (),
+        filtered_inputs: Collection[int] = (),
+    ) -> None:
         super().__init__()
         self.context = context
+        self.shared_join_inputs = shared_join_inputs
+        self.filtered_inputs = filtered_inputs
 
     @abstractmethod
     def compute(
@@ -202,6 +248,23 @@ class SortingPathEvaluator(PathEvaluator, context_types=[clmn.SortingContext]):
         )
 
 
+class RankPathEvaluator(PathEvaluator, context_types=[clmn.RankContext]):
+    context: clmn.RankContext
+
+    def compute(
+        self,
+        output_columns: Iterable[clmn.Column],
+        input_storages: dict[Universe, Storage],
+    ) -> Storage:
+        input_storage = input_storages[self.context.universe]
+        return Storage.merge_storages(
+            self.context.universe,
+            input_storage,
+            Storage.one_column_storage(self.context.rank_column),
+            Storage.one_column_storage(self.context.percent_rank_column),
+        )
+
+
 class NoNewColumnsMultipleSourcesPathEvaluator(
     PathEvaluator,
     context_types=[clmn.UpdateRowsContext, clmn.ConcatUnsafeContext],
@@ -245,6 +308,9 @@ class NoNewColumnsMultipleSourcesPathEvaluator(
         for columns in updates:
             source_columns.append([columns[name] for name in names])
 
+        if self.filtered_inputs:
+            keep_structure = False
+
         if keep_structure and isinstance(context, clmn.UpdateRowsContext):
             for universe, cols in zip(
                 self.context.universe_dependencies(), source_columns, strict=True
@@ -282,6 +348,7 @@ class NoNewColumnsMultipleSourcesPathEvaluator(
 
 NoNewColumnsContext = (
     clmn.FilterContext
+    | clmn.LimitContext
     | clmn.ReindexContext
     | clmn.ForgetContext
     | clmn.ForgetImmediatelyContext
@@ -299,6 +366,7 @@ class NoNewColumnsPathEvaluator(
     PathEvaluator,
     context_types=[
         clmn.FilterContext,
+        clmn.LimitContext,
         clmn.ReindexContext,
         clmn.ForgetContext,
         clmn.ForgetImmediatelyContext,
@@ -462,14 +530,39 @@ class JoinPathEvaluator(PathEvaluator, context_types=[clmn.JoinContext]):
             else:
                 assert right_input_storage.has_column(column)
                 right_columns.add(column)
-        left_input_storage = maybe_flatten_input_storage(
-            input_storages[self.context.left_table._universe], left_columns
+        left_key, right_key = join_input_keys(self.context)
+        left_input_storage = self.maybe_flatten_join_input_storage(
+            input_storages[self.context.left_table._universe],
+            left_columns,
+            left_key,
+            filtered=0 in self.filtered_inputs,
         )
-        right_input_storage = maybe_flatten_input_storage(
-            input_storages[self.context.right_table._universe], right_columns
+        right_input_storage = self.maybe_flatten_join_input_storage(
+            input_storages[self.context.right_table._universe],
+            right_columns,
+            right_key,
+            filtered=1 in self.filtered_inputs,
         )
         return (left_input_storage, right_input_storage)
 
+    def maybe_flatten_join_input_storage(
+        self,
+        storage: Storage,
+        columns: Iterable[clmn.Column],
+        key: JoinInputKey,
+        *,
+        filtered: bool = False,
+    ) -> Storage:
+        if filtered:
+            # the filtered input is a new table, built with the flat layout
+            return Storage.flat(storage._universe, columns)
+        # If the same table is joined on the same columns in multiple joins, all of them
+        # get the same unflattened input so that the engine can share a single arrangement
+        # of it instead of building one per join.
+        if key in self.shared_join_inputs:
+            return storage
+        return maybe_flatten_input_storage(storage, columns)
+
     def merge_storages(self, left_storage: Storage, right_storage: Storage) -> Storage:
         left_id_storage = Storage.one_column_storage(self.context.left_table._id_column)
         right_id_storage = Storage.one_column_storage(
@@ -511,6 +604,97 @@ class JoinPathEvaluator(PathEvaluator, context_types=[clmn.JoinContext]):
         )
 
 
+class JoinManyPathEvaluator(PathEvaluator, context_types=[clmn.JoinManyContext]):
+    context: clmn.JoinManyContext
+
+    def maybe_flatten_input_storages(
+        self,
+        output_columns: Iterable[clmn.Column],
+        input_storages: dict[Universe, Storage],
+    ) -> list[tuple[Storage, StableSet[clmn.Column]]]:
+        tables = self.context.input_tables()
+        on = (
+            StableSet(itertools.chain(*(on.columns for on in self.context.on_base))),
+            *(StableSet(on.columns) for on in self.context.on_dimensions),
+        )
+        own_columns = [
+            StableSet([*table._columns.values(), table._id_column, *on_columns])
+            for table, on_columns in zip(tables, on)
+        ]
+
+        required_input_columns: list[clmn.Column] = []
+        for column in itertools.chain(
+            output_columns, self.context.column_dependencies()
+        ):
+            if (
+                isinstance(column, clmn.ColumnWithExpression)
+                and column.context == self.context
+            ):
+                required_input_columns.extend(column.column_dependencies())
+            else:
+                required_input_columns.append(column)
+
+        columns: list[StableSet[clmn.Column]] = [StableSet() for _ in tables]
+        for column in required_input_columns:
+            index = next(
+                (i for i, own in enumerate(own_columns) if column in own),
+                None,
+            )
+            if index is None:
+                index = next(
+                    i
+                    for i, table in enumerate(tables)
+                    if input_storages[table._universe].has_column(column)
+                )
+            columns[index].add(column)
+
+        input_keys = join_input_keys(self.context)
+        base_keys = input_keys[: len(self.context.on_base)]
+        keys = [base_keys, *((key,) for key in input_keys[len(self.context.on_base) :])]
+        storages = []
+        for table, table_columns, table_keys in zip(tables, columns, keys):
+            storage = input_storages[table._universe]
+            # inputs shared with other joins are not flattened, see JoinPathEvaluator
+            if not any(key in self.shared_join_inputs for key in table_keys):
+                storage = maybe_flatten_input_storage(storage, table_columns)
+            storages.append((storage, table_columns))
+        return storages
+
+    def compute(
+        self,
+        output_columns: Iterable[clmn.Column],
+        input_storages: dict[Universe, Storage],
+    ) -> Storage:
+        output_columns = list(output_columns)
+        storages = self.maybe_flatten_input_storages(output_columns, input_storages)
+        join_storage = Storage.merge_storages(
+            self.context.universe,
+            *itertools.chain.from_iterable(
+                (
+                    Storage.one_column_storage(table._id_column),
+                    storage.restrict_to(columns),
+                )
+                for table, (storage, columns) in zip(
+                    self.context.input_tables(), storages
+                )
+            ),
+        )
+        output_storage = FlatStoragePathEvaluator(self.context).compute(
+            output_columns, {}
+        )
+        base_storage, *dimension_storages = (storage for storage, _ in storages)
+        return output_storage.with_maybe_flattened_inputs(
+            {
+                "base_storage": base_storage,
+                **{
+                    f"dimension_storage_{i}": storage
+                    for i, storage in enumerate(dimension_storages)
+                },
+                "join_storage": join_storage,
+            }
+        )
+
+
 class FlattenPathEvaluator(PathEvaluator, context_types=[clmn.FlattenContext]):
     context: clmn.FlattenContext
 
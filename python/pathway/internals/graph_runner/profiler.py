@@ -0,0 +1,237 @@
+# Copyright © 2024 Pathway
+
+"""Sampling profiler enabled with ``pw.run(profile=...)``.
+
+A background thread periodically samples the Python stacks of all threads. Python
+functions called by the engine on behalf of an operator (user-defined functions,
+custom reducers, ``deduplicate`` acceptors, row transformers, subscribe callbacks)
+are wrapped when the operator is built, so the samples taken
+while they run are attributed to the operator. Stacks of other threads, like the
+ones of Python connectors, are attributed to the thread. Native code of the engine
+can't be sampled from Python, so the time the engine spends in every operator is
+taken from its scheduling measurements at the end of the run.
+
+Every sample is weighted by the time elapsed since the previous one, as the sampling
+thread can be woken up late, so the profile shows the wall-clock time of the threads.
+Like in ``py-spy``, idle threads are not sampled: the ones whose innermost Python
+frame waits in a blocking call of the standard library (on a lock or a condition, in
+``select``, reading from a socket, waiting for a child process), like an idle asyncio
+event loop, connector threads waiting for data or telemetry exporters. Threads blocked
+in other native calls (e.g. ``time.sleep``) are sampled as running.
+
+The profile is written in the folded stacks format, one ``frame;frame;... count``
+line per stack, with the time spent in the stack in microseconds as the count, read
+by ``flamegraph.pl``, ``inferno`` and speedscope.
+"""
+
+from __future__ import annotations
+
+import collections
+import functools
+import os
+import sys
+import threading
+import time
+import types
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from pathway.internals import api
+
+ENGINE_FRAME = "[engine]"
+
+_STDLIB_DIR = os.path.dirname(threading.__file__)
+
+# functions of the standard library whose frames are the innermost Python frames of
+# threads blocked in a native call, by the path relative to the standard library
+_IDLE_FUNCTIONS = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+    ("socket.py", "accept"),
+    ("socket.py", "readinto"),
+    ("ssl.py", "read"),
+    ("ssl.py", "recv_into"),
+    ("subprocess.py", "_try_wait"),
+    ("concurrent/futures/thread.py", "_worker"),
+    ("multiprocessing/connection.py", "_recv"),
+}
+
+
+@functools.cache
+def _is_idle(code: types.CodeType) -> bool:
+    if not code.co_filename.startswith(_STDLIB_DIR + os.sep):
+        return False
+    path = code.co_filename[len(_STDLIB_DIR) + 1 :].replace(os.sep, "/")
+    return (path, code.co_name) in _IDLE_FUNCTIONS
+
+
+def _format_frame(frame: types.FrameType) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    # ";" separates the frames of a stack
+    return f"{name} ({code.co_filename}:{frame.f_lineno})".replace(";", ",")
+
+
+class Profiler:
+    """Samples the Python stacks of all threads every ``interval`` seconds while
+    inside the ``with`` block and writes the profile to ``path`` when leaving it.
+
+    The thread entering the block is expected to call the engine there, its stacks
+    ending in the frame of the block are spent in the engine and are not sampled.
+    Stacks of idle threads are sampled only with ``idle=True``.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        *,
+        interval: float = 0.005,
+        idle: bool = False,
+    ) -> None:
+        self.path = path
+        self.interval = interval
+        self.idle = idle
+        # operator id -> root frame of its stacks
+        self._operators: dict[int, str] = {}
+        # id of the code object of a wrapper -> operator id, the code objects are
+        # kept alive in _wrapper_codes, so the ids are not reused
+        self._wrappers: dict[int, int] = {}
+        self._wrapper_codes: list[types.CodeType] = []
+        self._building = threading.local()
+        self._stack_time_ns: collections.Counter[tuple[str, ...]] = (
+            collections.Counter()
+        )
+        # time of the Python functions of every operator
+        self._operator_time_ns: collections.Counter[int] = collections.Counter()
+        self._engine_time_ns: dict[int, int] = {}
+        self._entry_code: types.CodeType | None = None
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @contextmanager
+    def operator(
+        self, operator_id: int, name: str, location: str | None
+    ) -> Iterator[None]:
+        """Attributes the functions wrapped with :meth:`attribute` in the current
+        thread inside the block to the operator."""
+        root = f"{name} [{operator_id}]"
+        if location is not None:
+            root += f" at {location}"
+        self._operators[operator_id] = root.replace(";", ",")
+        previous = getattr(self._building, "operator_id", None)
+        self._building.operator_id = operator_id
+        try:
+            yield
+        finally:
+            self._building.operator_id = previous
+
+    def attribute(self, fun: Callable, *, is_async: bool = False) -> Callable:
+        """Wraps ``fun`` so that the samples taken while it runs are attributed to
+        the operator being built."""
+        operator_id = getattr(self._building, "operator_id", None)
+        if operator_id is None:
+            return fun
+
+        wrapped: Callable
+        if is_async:
+
+            async def wrapped(*args, **kwargs):
+                return await fun(*args, **kwargs)
+
+        else:
+
+            def wrapped(*args, **kwargs):
+                return fun(*args, **kwargs)
+
+        # a separate code object identifies the operator in the sampled stacks
+        code = wrapped.__code__.replace(co_name=f"<operator {operator_id}>")
+        wrapped.__code__ = code
+        self._wrapper_codes.append(code)
+        self._wrappers[id(code)] = operator_id
+        return wrapped
+
+    def set_operator_metrics(self, metrics: dict[int, api.OperatorMetrics]) -> None:
+        self._engine_time_ns = {
+            operator_id: operator_metrics.processing_time_ns
+            for operator_id, operator_metrics in metrics.items()
+        }
+
+    def __enter__(self) -> Profiler:
+        self._entry_code = sys._getframe(1).f_code
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="pathway:profiler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._stopped.set()
+        assert self._thread is not None
+        self._thread.join()
+        self._thread = None
+        self.write()
+
+    def _sample_loop(self) -> None:
+        own_id = threading.get_ident()
+        previous_ns = time.perf_counter_ns()
+        while not self._stopped.wait(self.interval):
+            now_ns = time.perf_counter_ns()
+            elapsed_ns = now_ns - previous_ns
+            previous_ns = now_ns
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    thread_name = names.get(thread_id, f"thread {thread_id}")
+                    self._sample(frame, thread_name, elapsed_ns)
+
+    def _sample(
+        self, frame: types.FrameType | None, thread_name: str, elapsed_ns: int
+    ) -> None:
+        if frame is not None and not self.idle and _is_idle(frame.f_code):
+            return
+        stack: list[str] = []
+        operator_id = None
+        while frame is not None:
+            code = frame.f_code
+            operator_id = self._wrappers.get(id(code))
+            if operator_id is not None:
+                break
+            if code is self._entry_code:
+                if not stack:
+                    return  # the engine runs outside of Python
+                break
+            stack.append(_format_frame(frame))
+            frame = frame.f_back
+        if operator_id is None:
+            root = thread_name.replace(";", ",")
+        else:
+            root = self._operators[operator_id]
+            self._operator_time_ns[operator_id] += elapsed_ns
+        stack.append(root)
+        stack.reverse()
+        self._stack_time_ns[tuple(stack)] += elapsed_ns
+
+    def folded_stacks(self) -> list[str]:
+        """Lines of the profile, with the time of the engine outside of Python
+        added to the sampled time of the Python stacks."""
+        stack_time_ns = self._stack_time_ns.copy()
+        for operator_id, time_ns in self._engine_time_ns.items():
+            root = self._operators.get(operator_id)
+            if root is None:
+                continue
+            # the engine's measurements include the time of the Python functions
+            engine_time_ns = time_ns - self._operator_time_ns[operator_id]
+            if engine_time_ns > 0:
+                stack_time_ns[(root, ENGINE_FRAME)] += engine_time_ns
+        return sorted(
+            f"{';'.join(stack)} {time_ns // 1000}"
+            for stack, time_ns in stack_time_ns.items()
+            if time_ns >= 1000
+        )
+
+    def write(self) -> None:
+        with open(self.path, "w") as f:
+            for line in self.folded_stacks():
+                f.write(line + "\n")
@@ -131,6 +131,10 @@ class RowTransformerOperatorHandler(
             computer_logic = state.get_computer_logic(computer_id)
             return computer_logic(context, *args, mapping=mapping, this_row=this_row)
 
+        profiler = self.scope_context.profiler
+        if profiler is not None:
+            func = profiler.attribute(func)
+
         return api.Computer.from_raising_fun(
             func,
             dtype=attribute.dtype,
@@ -161,6 +165,9 @@ class RowTransformerOperatorHandler(
             )
             return attribute.compute(row_reference, *args)
 
+        profiler = self.scope_context.profiler
+        if profiler is not None:
+            func = profiler.attribute(func)
         id = state.add_computer_logic(func)
 
         return api.Computer.from_raising_fun(
@@ -0,0 +1,159 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from functools import cache
+from itertools import chain
+
+from pathway.internals import column as clmn, expression as expr
+from pathway.internals.expression_visitor import IdentityTransform
+from pathway.internals.graph_runner.common_subexpressions import (
+    _eagerly_evaluated_deps,
+)
+from pathway.internals.graph_runner.scope_context import ScopeContext
+from pathway.internals.operator import ContextualizedIntermediateOperator
+from pathway.internals.table import Table
+
+# expressions that are evaluated in Python or that need dedicated handling,
+# they are never moved to another operator
+_NOT_FUSED_EXPRESSIONS = (
+    expr.ApplyExpression,
+    expr.ColumnCallExpression,
+)
+
+
+class _InlineColumns(IdentityTransform):
+    def __init__(self, inlined: set[clmn.Column]):
+        self.inlined = inlined
+
+    def eval_column_val(  # type: ignore[override]
+        self, expression: expr.ColumnReference, **kwargs
+    ) -> expr.ColumnExpression:
+        column = expression._column
+        if column not in self.inlined:
+            return super().eval_column_val(expression, **kwargs)
+        assert isinstance(column, clmn.ColumnWithExpression)
+        return self.eval_expression(column.expression, **kwargs)
+
+
+def _is_rowwise(column: clmn.Column) -> bool:
+    # subclasses of RowwiseContext (like SetSchemaContext) change the values
+    return (
+        isinstance(column, clmn.ColumnWithExpression)
+        and not isinstance(column, clmn.ColumnWithReference)
+        and type(column.context) is clmn.RowwiseContext
+    )
+
+
+def _can_be_fused(expression: expr.ColumnExpression) -> bool:
+    if isinstance(expression, _NOT_FUSED_EXPRESSIONS):
+        return False
+    return all(_can_be_fused(dep) for dep in expression._deps)
+
+
+def _references(expression: expr.ColumnExpression) -> Iterator[expr.ColumnReference]:
+    if isinstance(expression, expr.ColumnReference):
+        yield expression
+    for dep in expression._deps:
+        yield from _references(dep)
+
+
+def _eager_references(
+    expression: expr.ColumnExpression,
+) -> Iterator[expr.ColumnReference]:
+    """References evaluated whenever ``expression`` is evaluated. Columns referenced
+    elsewhere (e.g. in branches of ``if_else``) are evaluated for every row, inlining
+    them could hide their errors."""
+    if isinstance(expression, expr.ColumnReference):
+        yield expression
+    eager_deps = _eagerly_evaluated_deps(expression)
+    for dep in expression._deps:
+        if any(dep is arg for arg in eager_deps):
+            yield from _eager_references(dep)
+
+
+def fuse_rowwise_columns(
+    scope_context: ScopeContext, output_tables: Iterable[Table] = ()
+) -> int:
+    """Inlines expressions of columns computed by a ``select`` (or ``with_columns``,
+    or a ``filter`` condition) into the expression of the single column that uses
+    them, in a later rowwise operator on the same universe.
+
+    Chains of rowwise operators then evaluate their expressions in a single operator,
+    and the inlined columns, no longer needed, are removed from the computation by the
+    tree shaking of columns. Only columns referenced exactly once are inlined, so that
+    no expression is evaluated more times than before, and only if the reference is
+    evaluated for every row of the later operator, so that no expression is evaluated
+    fewer times either. Returns the number of inlined columns.
+
+    The expressions with inlined columns are stored in
+    ``scope_context.fused_expressions``, the ParseGraph is not modified.
+    """
+    if scope_context.run_all:
+        # all columns are computed anyway, inlining would evaluate them twice
+        return 0
+
+    uses: dict[clmn.Column, int] = defaultdict(int)
+    consumer: dict[clmn.Column, clmn.Column] = {}
+    pinned: set[clmn.Column] = set()
+    columns: list[clmn.Column] = []
+    for operator in scope_context.nodes:
+        for table in operator.hard_table_dependencies():
+            pinned.update(table._columns.values())
+        if not isinstance(operator, ContextualizedIntermediateOperator):
+            for table in operator.input_tables:
+                pinned.update(table._columns.values())
+        for table in operator.intermediate_and_output_tables:
+            for column in chain(table._columns.values(), [table._id_column]):
+                columns.append(column)
+                if _is_rowwise(column):
+                    assert isinstance(column, clmn.ColumnWithExpression)
+                    dependencies: Iterable[clmn.Column] = chain(
+                        column.context.column_dependencies(),
+                        (ref._column for ref in _references(column.expression)),
+                    )
+                else:
+                    dependencies = column.column_dependencies()
+                for dependency in dependencies:
+                    uses[dependency] += 1
+                    consumer[dependency] = column
+    for table in output_tables:
+        pinned.update(table._columns.values())
+
+    @cache
+    def eager_references(column: clmn.Column) -> set[clmn.Column]:
+        assert isinstance(column, clmn.ColumnWithExpression)
+        return {ref._column for ref in _eager_references(column.expression)}
+
+    inlined: set[clmn.Column] = set()
+    for column in columns:
+        if not _is_rowwise(column) or column in pinned or uses[column] != 1:
+            continue
+        assert isinstance(column, clmn.ColumnWithExpression)
+        target = consumer[column]
+        if (
+            _is_rowwise(target)
+            and target.universe == column.universe
+            and column in eager_references(target)
+            and _can_be_fused(column.expression)
+            and all(
+                dependency.universe == column.universe
+                for dependency in column.expression._column_dependencies()
+            )
+        ):
+            inlined.add(column)
+
+    if not inlined:
+        return 0
+    transform = _InlineColumns(inlined)
+    for column in columns:
+        if column in inlined or not _is_rowwise(column):
+            continue
+        assert isinstance(column, clmn.ColumnWithExpression)
+        if any(ref._column in inlined for ref in _references(column.expression)):
+            scope_context.fused_expressions[column] = transform.eval_expression(
+                column.expression
+            )
+    return len(inlined)
@@ -5,11 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING
 
-from pathway.internals import operator
+from pathway.internals import column as clmn, operator
 from pathway.internals.helpers import StableSet
 
 if TYPE_CHECKING:
+    from pathway.internals import expression as expr
     from pathway.internals.graph_runner import GraphRunner
+    from pathway.internals.graph_runner.profiler import Profiler
 
 
 @dataclass
@@ -19,6 +21,27 @@ class ScopeContext:
     subscopes: dict[operator.Operator, ScopeContext] = field(default_factory=dict)
     runtime_typechecking: bool = False
     inside_iterate: bool = False
+    profiler: Profiler | None = None
+    # expressions of columns with the expressions of other columns inlined,
+    # used instead of the expressions in the ParseGraph
+    fused_expressions: dict[clmn.Column, expr.ColumnExpression] = field(
+        default_factory=dict
+    )
+    # conditions of filters moved below joins and concats, one per input (in the order
+    # of the inputs of the context), applied to the inputs before the operator
+    pushed_filters: dict[clmn.Context, tuple[clmn.ColumnWithExpression | None, ...]] = (
+        field(default_factory=dict)
+    )
+
+    def expression(self, column: clmn.ColumnWithExpression) -> expr.ColumnExpression:
+        return self.fused_expressions.get(column, column.expression)
+
+    def column_dependencies(self, column: clmn.Column) -> StableSet[clmn.Column]:
+        expression = self.fused_expressions.get(column)
+        if expression is None:
+            return column.column_dependencies()
+        assert isinstance(column, clmn.ColumnWithExpression)
+        return column.context.column_dependencies() | expression._column_dependencies()
 
     def iterate_subscope(
         self, operator: operator.IterateOperator, graph_builder: GraphRunner
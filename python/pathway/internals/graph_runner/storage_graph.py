@@ -9,7 +9,14 @@ from itertools import chain
 from typing import TYPE_CHECKING
 
 from pathway.internals import api
-from pathway.internals.column import Column, IdColumn, MaterializedColumn
+from pathway.internals.column import (
+    Column,
+    Context,
+    IdColumn,
+    JoinContext,
+    JoinManyContext,
+    MaterializedColumn,
+)
 from pathway.internals.column_path import ColumnPath
 from pathway.internals.graph_runner import path_evaluator
 from pathway.internals.graph_runner.path_storage import Storage
@@ -40,6 +47,9 @@ class OperatorStorageGraph:
     )
     final_storages: dict[Universe, Storage] | None = None
     table_to_storage: dict[Table, Storage] = field(default_factory=dict)
+    shared_join_inputs: StableSet[path_evaluator.JoinInputKey] = field(
+        default_factory=StableSet
+    )
 
     def get_iterate_subgraph(self, operator: Operator) -> OperatorStorageGraph:
         return self.iterate_subgraphs[operator]
@@ -161,7 +171,7 @@ class OperatorStorageGraph:
             for column in chain(table._columns.values(), [table._id_column]):
                 # if the first condition is not met, the column is not needed (tree shaking)
                 if column in output_deps or isinstance(column, IdColumn):
-                    for dependency in column.column_dependencies():
+                    for dependency in scope_context.column_dependencies(column):
                         if not isinstance(dependency, IdColumn):
                             column_dependencies[dependency.universe].add(dependency)
 
@@ -214,7 +224,27 @@ class OperatorStorageGraph:
             inner_column_dependencies, input_universes
         )
 
+    def _compute_shared_join_inputs(self) -> None:
+        join_inputs_count: dict[path_evaluator.JoinInputKey, int] = defaultdict(int)
+        for operator in self.scope_context.nodes:
+            for table in operator.intermediate_and_output_tables:
+                context = table._id_column.context
+                if context in self.scope_context.pushed_filters:
+                    # a join with filtered inputs doesn't use the shared arrangements
+                    continue
+                if isinstance(context, (JoinContext, JoinManyContext)):
+                    for key in path_evaluator.join_input_keys(context):
+                        join_inputs_count[key] += 1
+        self.shared_join_inputs = StableSet(
+            key for key, count in join_inputs_count.items() if count > 1
+        )
+
+    def _filtered_inputs(self, context: Context) -> list[int]:
+        conditions = self.scope_context.pushed_filters.get(context, ())
+        return [i for i, condition in enumerate(conditions) if condition is not None]
+
     def _compute_storage_paths(self):
+        self._compute_shared_join_inputs()
         storages: dict[Universe, Storage] = self.initial_storages.copy()
         for operator in self.scope_context.nodes:
             if isinstance(operator, InputOperator):
@@ -237,6 +267,8 @@ class OperatorStorageGraph:
                 storages,
                 operator,
                 table._id_column.context,
+                self.shared_join_inputs,
+                self._filtered_inputs(table._id_column.context),
             )
             if path_storage.max_depth > 3:
                 # TODO: 3 is arbitrarily specified number. Check what's best.
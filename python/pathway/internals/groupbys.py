@@ -94,6 +94,7 @@ class GroupedTable(GroupedJoinable, OperatorInput):
     _filter_out_results_of_forgetting: bool
     _skip_errors: bool
     _is_window: bool
+    _skew_split: int
 
     def __init__(
         self,
@@ -105,6 +106,7 @@ class GroupedTable(GroupedJoinable, OperatorInput):
         _filter_out_results_of_forgetting: bool = False,
         _skip_errors: bool = True,
         _is_window: bool = False,
+        _skew_split: int = 1,
     ):
         super().__init__(Universe(), {thisclass.this: self}, _table)
         self._grouping_columns = StableSet(_grouping_columns)
@@ -114,6 +116,7 @@ class GroupedTable(GroupedJoinable, OperatorInput):
         self._filter_out_results_of_forgetting = _filter_out_results_of_forgetting
         self._skip_errors = _skip_errors
         self._is_window = _is_window
+        self._skew_split = _skew_split
 
     @classmethod
     def create(
@@ -126,12 +129,13 @@ class GroupedTable(GroupedJoinable, OperatorInput):
         _filter_out_results_of_forgetting: bool = False,
         _skip_errors: bool = True,
         _is_window: bool = False,
+        skew_split: int = 1,
     ) -> GroupedTable:
         cols = tuple(arg._to_original()._to_internal() for arg in grouping_columns)
         col_sort_by = (
             sort_by._to_original()._to_internal() if sort_by is not None else None
         )
-        key = (cls.__name__, table, cols, set_id, col_sort_by)
+        key = (cls.__name__, table, cols, set_id, col_sort_by, skew_split)
         if key not in G.cache:
             result = GroupedTable(
                 _table=table,
@@ -142,6 +146,7 @@ class GroupedTable(GroupedJoinable, OperatorInput):
                 _filter_out_results_of_forgetting=_filter_out_results_of_forgetting,
                 _skip_errors=_skip_errors,
                 _is_window=_is_window,
+                _skew_split=skew_split,
             )
             G.cache[key] = result
         return G.cache[key]
@@ -223,6 +228,7 @@ class GroupedTable(GroupedJoinable, OperatorInput):
             inner_context=self._joinable_to_group._rowwise_context,
             sort_by=self._sort_by,
             skip_errors=self._skip_errors,
+            skew_split=self._skew_split,
         )
 
         for column_name, value in kwargs.items():
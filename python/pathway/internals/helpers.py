@@ -3,10 +3,11 @@
 
 from __future__ import annotations
 
+import importlib
 from collections import namedtuple
-from collections.abc import Iterable, Iterator, MutableSet
+from collections.abc import Iterable, Iterator, Mapping, MutableSet
 from functools import partial, wraps
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from pathway.internals import arg_tuple
 from pathway.internals.shadows import inspect
@@ -41,6 +42,42 @@ class SetOnceProperty(Generic[T]):
         raise AttributeError("trying to delete read-only property")
 
 
+class LazyAttribute:
+    """Class attribute defined in a module that is imported on first access.
+
+    On first access, the attribute of the class is replaced by the imported value.
+    """
+
+    def __init__(self, module: str, name: str):
+        self._module = module
+        self._name = name
+
+    def __get__(self, obj, owner=None):
+        value = getattr(importlib.import_module(self._module), self._name)
+        if owner is not None:
+            setattr(owner, self._name, value)
+        if obj is None or not hasattr(value, "__get__"):
+            return value
+        return value.__get__(obj, owner)
+
+
+def import_lazy_attribute(
+    namespace: dict[str, Any], lazy_attributes: Mapping[str, str], name: str
+) -> Any:
+    """Imports an attribute of a module on first access (PEP 562).
+
+    ``lazy_attributes`` maps names to ``"module"`` for submodules or to
+    ``"module:attribute"`` for other attributes. The imported value is stored in
+    ``namespace`` (``globals()`` of the module), so that it is imported only once.
+    """
+    module_name, _, attribute = lazy_attributes[name].partition(":")
+    value = importlib.import_module(module_name)
+    if attribute:
+        value = getattr(value, attribute)
+    namespace[name] = value
+    return value
+
+
 def with_optional_kwargs(decorator):
     @wraps(
         decorator
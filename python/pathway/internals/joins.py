@@ -140,6 +140,7 @@ class Joinable(TableLike, DesugaringContext):
         how: JoinMode = JoinMode.INNER,
         left_instance: expr.ColumnReference | None = None,
         right_instance: expr.ColumnReference | None = None,
+        skew_split: int = 1,
     ) -> JoinResult:
         """Join self with other using the given join expression.
 
@@ -152,6 +153,11 @@ class Joinable(TableLike, DesugaringContext):
               correspond to inner, left, right and outer join respectively.
             left_instance/right_instance: optional arguments describing partitioning of the data into
               separate instances
+            skew_split: number of parts the rows of each join key on the left side are split
+                into. Values greater than 1 spread join keys with many rows (hot keys) over
+                multiple workers at the cost of replicating the matching right side rows.
+                The split is not chosen automatically: with multiple workers, hot keys
+                are only detected and reported in the logs.
 
         Returns:
             JoinResult: an object on which `.select()` may be called to extract relevant
@@ -187,6 +193,7 @@ class Joinable(TableLike, DesugaringContext):
             id=id,
             left_instance=left_instance,
             right_instance=right_instance,
+            skew_split=skew_split,
         )
 
     @trace_user_frame
@@ -199,6 +206,7 @@ class Joinable(TableLike, DesugaringContext):
         id: expr.ColumnReference | None = None,
         left_instance: expr.ColumnReference | None = None,
         right_instance: expr.ColumnReference | None = None,
+        skew_split: int = 1,
     ) -> JoinResult:
         """Inner-joins two tables or join results.
 
@@ -209,6 +217,8 @@ class Joinable(TableLike, DesugaringContext):
             id: optional argument for id of result, can be only self.id or other.id
             left_instance/right_instance: optional arguments describing partitioning of the data
                 into separate instances
+            skew_split: spreads join keys with many rows over multiple workers, see
+                `Joinable.join`.
 
         Returns:
             JoinResult: an object on which `.select()` may be called to extract relevant
@@ -244,6 +254,7 @@ class Joinable(TableLike, DesugaringContext):
             id=id,
             left_instance=left_instance,
             right_instance=right_instance,
+            skew_split=skew_split,
         )
 
     @trace_user_frame
@@ -256,6 +267,7 @@ class Joinable(TableLike, DesugaringContext):
         id: expr.ColumnReference | None = None,
         left_instance: expr.ColumnReference | None = None,
         right_instance: expr.ColumnReference | None = None,
+        skew_split: int = 1,
     ) -> JoinResult:
         """
         Left-joins two tables or join results.
@@ -266,6 +278,8 @@ class Joinable(TableLike, DesugaringContext):
             id: optional id column of the result
             left_instance/right_instance: optional arguments describing partitioning of the data into
               separate instances
+            skew_split: spreads join keys with many rows over multiple workers, see
+                `Joinable.join`.
 
         Remarks:
         args cannot contain id column from either of tables, \
@@ -321,6 +335,7 @@ class Joinable(TableLike, DesugaringContext):
             id=id,
             left_instance=left_instance,
             right_instance=right_instance,
+            skew_split=skew_split,
         )
 
     @trace_user_frame
@@ -333,6 +348,7 @@ class Joinable(TableLike, DesugaringContext):
         id: expr.ColumnReference | None = None,
         left_instance: expr.ColumnReference | None = None,
         right_instance: expr.ColumnReference | None = None,
+        skew_split: int = 1,
     ) -> JoinResult:
         """
         Outer-joins two tables or join results.
@@ -343,6 +359,8 @@ class Joinable(TableLike, DesugaringContext):
             id: optional id column of the result
             left_instance/right_instance: optional arguments describing partitioning of the data into separate
               instances
+            skew_split: spreads join keys with many rows over multiple workers, see
+                `Joinable.join`.
 
         Remarks: args cannot contain id column from either of tables, \
         as the result table has id column with auto-generated ids; \
@@ -401,6 +419,7 @@ class Joinable(TableLike, DesugaringContext):
             id=id,
             left_instance=left_instance,
             right_instance=right_instance,
+            skew_split=skew_split,
         )
 
     @trace_user_frame
@@ -413,6 +432,7 @@ class Joinable(TableLike, DesugaringContext):
         id: expr.ColumnReference | None = None,
         left_instance: expr.ColumnReference | None = None,
         right_instance: expr.ColumnReference | None = None,
+        skew_split: int = 1,
     ) -> JoinResult:
         """Outer-joins two tables or join results.
 
@@ -421,6 +441,8 @@ class Joinable(TableLike, DesugaringContext):
             *on: Columns to join, syntax `self.col1 == other.col2`
             id: optional id column of the result
             instance: optional argument describing partitioning of the data into separate instances
+            skew_split: spreads join keys with many rows over multiple workers, see
+                `Joinable.join`.
 
         Remarks: args cannot contain id column from either of tables, \
             as the result table has id column with auto-generated ids; \
@@ -478,6 +500,7 @@ class Joinable(TableLike, DesugaringContext):
             id=id,
             left_instance=left_instance,
             right_instance=right_instance,
+            skew_split=skew_split,
         )
 
     @property
@@ -541,20 +564,39 @@ class JoinResult(Joinable, OperatorInput):
         _joined_on_names: StableSet[str],
         _join_mode: JoinMode,
     ):
-        super().__init__(_context)
-        self._inner_table = _inner_table
-        self._columns_mapping = _columns_mapping
         self._left_table = _left_table
         self._right_table = _right_table
-        self._substitution = {**_substitution, thisclass.this: self}
-        self._joined_on_names = _joined_on_names
-        self._join_mode = _join_mode
         self._original_left = _original_left
         self._original_right = _original_right
         assert _original_left._subtables().isdisjoint(_original_right._subtables())
-        self._all_colnames = StableSet.union(
-            _original_left.keys(), _original_right.keys()
+        self._init_join_result(
+            _context,
+            _inner_table,
+            _columns_mapping,
+            _substitution,
+            _joined_on_names,
+            _join_mode,
+            StableSet.union(_original_left.keys(), _original_right.keys()),
         )
+
+    def _init_join_result(
+        self,
+        _context: clmn.Context,
+        _inner_table: Table,
+        _columns_mapping: dict[expr.InternalColRef, expr.ColumnReference],
+        _substitution: dict[thisclass.ThisMetaclass, Joinable],
+        _joined_on_names: StableSet[str],
+        _join_mode: JoinMode,
+        _all_colnames: StableSet[str],
+    ) -> None:
+        """Initialization shared with ``JoinManyResult``."""
+        super().__init__(_context)
+        self._inner_table = _inner_table
+        self._columns_mapping = _columns_mapping
+        self._substitution = {**_substitution, thisclass.this: self}
+        self._joined_on_names = _joined_on_names
+        self._join_mode = _join_mode
+        self._all_colnames = _all_colnames
         self._chained_join_desugaring = SubstitutionDesugaring(self._substitutions()[1])
 
     @staticmethod
@@ -730,10 +772,18 @@ class JoinResult(Joinable, OperatorInput):
         )
         inner_table._rowwise_context = context
 
+        return self._with_inner_table(context, inner_table, new_columns_mapping)
+
+    def _with_inner_table(
+        self,
+        context: clmn.JoinRowwiseContext,
+        inner_table: Table,
+        columns_mapping: dict[expr.InternalColRef, expr.ColumnReference],
+    ) -> JoinResult:
         return JoinResult(
             _context=context,
             _inner_table=inner_table,
-            _columns_mapping=new_columns_mapping,
+            _columns_mapping=columns_mapping,
             _left_table=self._left_table,
             _right_table=self._right_table,
             _original_left=self._original_left,
@@ -863,7 +913,9 @@ class JoinResult(Joinable, OperatorInput):
     @contextualized_operator
     @staticmethod
     def _join(
-        context: clmn.JoinContext, *args: expr.ColumnReference, **kwargs: Any
+        context: clmn.JoinContext | clmn.JoinManyContext,
+        *args: expr.ColumnReference,
+        **kwargs: Any,
     ) -> Table:
         """Used internally to create an internal Table containing result of a join."""
         columns: dict[str, clmn.Column] = {}
@@ -941,12 +993,17 @@ class JoinResult(Joinable, OperatorInput):
         id: expr.ColumnReference | None = None,
         left_instance: expr.ColumnReference | None = None,
         right_instance: expr.ColumnReference | None = None,
+        skew_split: int = 1,
         exact_match: bool = False,  # if True do not optionalize output columns even if other than inner join is used
     ) -> JoinResult:
         if left == right:
             raise ValueError(
                 "Cannot join table with itself. Use <table>.copy() as one of the arguments of the join."
             )
+        if skew_split < 1:
+            raise ValueError(
+                "skew_split argument of a join has to be a positive integer."
+            )
 
         left_table, left_substitutions = left._substitutions()
         right_table, right_substitutions = right._substitutions()
@@ -1021,6 +1078,7 @@ class JoinResult(Joinable, OperatorInput):
                 mode in [JoinMode.RIGHT, JoinMode.OUTER],
                 mode in [JoinMode.LEFT, JoinMode.OUTER],
                 exact_match,
+                skew_split,
             )
         else:
             context = clmn.JoinContext(
@@ -1034,6 +1092,7 @@ class JoinResult(Joinable, OperatorInput):
                 mode in [JoinMode.LEFT, JoinMode.OUTER],
                 mode in [JoinMode.RIGHT, JoinMode.OUTER],
                 exact_match,
+                skew_split,
             )
         inner_table, columns_mapping = JoinResult._prepare_inner_table_with_mapping(
             context,
@@ -1055,6 +1114,163 @@ class JoinResult(Joinable, OperatorInput):
         )
 
 
+class JoinManyResult(JoinResult):
+    """Result of an inner join of a table with multiple other tables, see
+    ``Table.join_many``."""
+
+    _inputs: tuple[Table, ...]
+
+    def __init__(
+        self,
+        _context: clmn.Context,
+        _inner_table: Table,
+        _columns_mapping: dict[expr.InternalColRef, expr.ColumnReference],
+        _inputs: tuple[Table, ...],
+        _joined_on_names: StableSet[str],
+    ):
+        # the pairwise attributes of JoinResult.__init__ don't apply here
+        self._inputs = _inputs
+        self._init_join_result(
+            _context,
+            _inner_table,
+            _columns_mapping,
+            {thisclass.left: _inputs[0]},
+            _joined_on_names,
+            JoinMode.INNER,
+            StableSet.union(*(table.keys() for table in _inputs)),
+        )
+
+    def _subtables(self) -> StableSet[Table]:
+        return StableSet.union(*(table._subtables() for table in self._inputs))
+
+    def keys(self):
+        names_count: dict[str, int] = {}
+        for table in self._inputs:
+            for name in table.keys():
+                names_count[name] = names_count.get(name, 0) + 1
+        common_colnames = StableSet(
+            name for name, count in names_count.items() if count > 1
+        )
+        return self._all_colnames - (common_colnames - self._joined_on_names)
+
+    def _get_colref_by_name(
+        self,
+        name: str,
+        exception_type,
+    ) -> expr.ColumnReference:
+        name = self._column_deprecation_rename(name)
+        if name == "id":
+            return self._inner_table.id
+        elif name in self._joined_on_names:
+            return self._inputs[0][name]
+        owners = [table for table in self._inputs if name in table.keys()]
+        if len(owners) > 1:
+            raise exception_type(
+                f"Column {name} appears in more than one input of join_many."
+            )
+        elif len(owners) == 1:
+            return owners[0][name]
+        else:
+            raise exception_type(f"No column with name {name}.")
+
+    @lru_cache
+    def _operator_dependencies(self) -> StableSet[Table]:
+        return StableSet.union(
+            *(table._operator_dependencies() for table in self._inputs)
+        )
+
+    def _with_inner_table(
+        self,
+        context: clmn.JoinRowwiseContext,
+        inner_table: Table,
+        columns_mapping: dict[expr.InternalColRef, expr.ColumnReference],
+    ) -> JoinManyResult:
+        return JoinManyResult(
+            _context=context,
+            _inner_table=inner_table,
+            _columns_mapping=columns_mapping,
+            _inputs=self._inputs,
+            _joined_on_names=self._joined_on_names,
+        )
+
+    @staticmethod
+    def _table_join_many(base: Table, *on: expr.ColumnExpression) -> JoinManyResult:
+        from pathway.internals.table import Table
+
+        if len(on) == 0:
+            raise ValueError("join_many() requires at least one join condition.")
+
+        conditions: dict[Table, list[expr.ColumnBinaryOpExpression]] = {}
+        joined_on_names: StableSet[str] = StableSet()
+        for cond in on:
+            cond = validate_shape(cond)
+            cond_left = cast(expr.ColumnReference, cond._left)
+            cond_right = cast(expr.ColumnReference, cond._right)
+            dimension = cond_right.table
+            if not isinstance(dimension, Table) or dimension == base:
+                raise ValueError(
+                    "In join_many() each join condition should be of form "
+                    + "<table>.<column> == <other_table>.<column>, where <table> is the "
+                    + "table join_many() is called on."
+                )
+            validate_join_condition(cond, base, dimension)
+            if cond_left.name == cond_right.name:
+                joined_on_names.add(cond_left.name)
+            conditions.setdefault(dimension, []).append(cond)
+
+        dimensions = tuple(conditions.keys())
+        on_base = tuple(
+            clmn.ContextTable(
+                universe=base._universe,
+                columns=tuple(
+                    base._eval(cond._left, base._table_restricted_context)
+                    for cond in dimension_conditions
+                ),
+            )
+            for dimension_conditions in conditions.values()
+        )
+        on_dimensions = tuple(
+            clmn.ContextTable(
+                universe=dimension._universe,
+                columns=tuple(
+                    dimension._eval(cond._right, dimension._table_restricted_context)
+                    for cond in dimension_conditions
+                ),
+            )
+            for dimension, dimension_conditions in conditions.items()
+        )
+        universe = Universe()
+        if any(table._universe.is_empty() for table in (base, *dimensions)):
+            universe.register_as_empty(no_warn=False)
+        context = clmn.JoinManyContext(
+            universe, base, dimensions, on_base, on_dimensions
+        )
+
+        cnt = itertools.count(0)
+        expressions: dict[str, expr.ColumnExpression] = {}
+        colref_to_name_mapping: dict[expr.InternalColRef, str] = {}
+        for table in (base, *dimensions):
+            for ref in [*table, table.id]:
+                inner_name = f"_pw_{next(cnt)}"
+                expressions[inner_name] = ref
+                colref_to_name_mapping[ref._to_internal()] = inner_name
+        inner_table = JoinResult._join(context, **expressions)
+        columns_mapping = {
+            colref: inner_table[name] for colref, name in colref_to_name_mapping.items()
+        }
+        columns_mapping[inner_table.id._to_internal()] = inner_table.id
+        inner_table._rowwise_context = clmn.JoinRowwiseContext.from_mapping(
+            inner_table._id_column, columns_mapping
+        )
+        return JoinManyResult(
+            context,
+            inner_table,
+            columns_mapping,
+            (base, *dimensions),
+            joined_on_names,
+        )
+
+
 def validate_shape(cond: expr.ColumnExpression) -> expr.ColumnBinaryOpExpression:
     if (
         not isinstance(cond, expr.ColumnBinaryOpExpression)
@@ -1110,6 +1326,7 @@ def join(
     how: JoinMode = JoinMode.INNER,
     left_instance: expr.ColumnReference | None = None,
     right_instance: expr.ColumnReference | None = None,
+    skew_split: int = 1,
 ) -> JoinResult:
     """Join self with other using the given join expression.
 
@@ -1123,6 +1340,8 @@ def join(
             correspond to inner, left, right and outer join respectively.
         left_instance/right_instance: optional arguments describing partitioning of the data into
             separate instances
+        skew_split: spreads join keys with many rows over multiple workers, see
+            `Joinable.join`.
 
     Returns:
         JoinResult: an object on which `.select()` may be called to extract relevant
@@ -1157,6 +1376,7 @@ def join(
         how=how,
         left_instance=left_instance,
         right_instance=right_instance,
+        skew_split=skew_split,
     )
 
 
@@ -1167,6 +1387,7 @@ def join_inner(
     id: expr.ColumnReference | None = None,
     left_instance: expr.ColumnReference | None = None,
     right_instance: expr.ColumnReference | None = None,
+    skew_split: int = 1,
 ) -> JoinResult:
     """Inner-joins two tables or join results.
 
@@ -1177,6 +1398,8 @@ def join_inner(
             and be of the form LHS: ColumnReference == RHS: ColumnReference.
         id: optional argument for id of result, can be only self.id or other.id
         left_instance/right_instance: optional arguments describing partitioning of the data into separate instances
+        skew_split: spreads join keys with many rows over multiple workers, see
+            `Joinable.join`.
 
     Returns:
         JoinResult: an object on which `.select()` may be called to extract relevant
@@ -1205,7 +1428,12 @@ def join_inner(
     9   | Bob        | L
     """
     return left.join_inner(
-        right, *on, id=id, left_instance=left_instance, right_instance=right_instance
+        right,
+        *on,
+        id=id,
+        left_instance=left_instance,
+        right_instance=right_instance,
+        skew_split=skew_split,
     )
 
 
@@ -1216,6 +1444,7 @@ def join_left(
     id: expr.ColumnReference | None = None,
     left_instance: expr.ColumnReference | None = None,
     right_instance: expr.ColumnReference | None = None,
+    skew_split: int = 1,
 ) -> JoinResult:
     """
     Left-joins two tables or join results.
@@ -1227,6 +1456,8 @@ def join_left(
         id: optional id column of the result
         left_instance/right_instance: optional arguments describing partitioning of the data into
             separate instances
+        skew_split: spreads join keys with many rows over multiple workers, see
+            `Joinable.join`.
 
     Remarks:
     args cannot contain id column from either of tables, \
@@ -1275,7 +1506,12 @@ def join_left(
     13 |      |
     """
     return left.join_left(
-        right, *on, id=id, left_instance=left_instance, right_instance=right_instance
+        right,
+        *on,
+        id=id,
+        left_instance=left_instance,
+        right_instance=right_instance,
+        skew_split=skew_split,
     )
 
 
@@ -1286,6 +1522,7 @@ def join_right(
     id: expr.ColumnReference | None = None,
     left_instance: expr.ColumnReference | None = None,
     right_instance: expr.ColumnReference | None = None,
+    skew_split: int = 1,
 ) -> JoinResult:
     """
     Outer-joins two tables or join results.
@@ -1297,6 +1534,8 @@ def join_right(
         id: optional id column of the result
         left_instance/right_instance: optional arguments describing partitioning of the data into separate
             instances
+        skew_split: spreads join keys with many rows over multiple workers, see
+            `Joinable.join`.
 
     Remarks: args cannot contain id column from either of tables, \
     as the result table has id column with auto-generated ids; \
@@ -1348,7 +1587,12 @@ def join_right(
 
     """
     return left.join_right(
-        right, *on, id=id, left_instance=left_instance, right_instance=right_instance
+        right,
+        *on,
+        id=id,
+        left_instance=left_instance,
+        right_instance=right_instance,
+        skew_split=skew_split,
     )
 
 
@@ -1359,6 +1603,7 @@ def join_outer(
     id: expr.ColumnReference | None = None,
     left_instance: expr.ColumnReference | None = None,
     right_instance: expr.ColumnReference | None = None,
+    skew_split: int = 1,
 ) -> JoinResult:
     """Outer-joins two tables or join results.
 
@@ -1368,6 +1613,8 @@ def join_outer(
         *on: Columns to join, syntax `self.col1 == other.col2`
         id: optional id column of the result
         instance: optional argument describing partitioning of the data into separate instances
+        skew_split: spreads join keys with many rows over multiple workers, see
+            `Joinable.join`.
 
     Remarks: args cannot contain id column from either of tables, \
         as the result table has id column with auto-generated ids; \
@@ -1418,5 +1665,10 @@ def join_outer(
     13 |      |
     """
     return left.join_outer(
-        right, *on, id=id, left_instance=left_instance, right_instance=right_instance
+        right,
+        *on,
+        id=id,
+        left_instance=left_instance,
+        right_instance=right_instance,
+        skew_split=skew_split,
     )
@@ -106,6 +106,27 @@ class MonitoringOutput:
             )
         return table
 
+    def get_iterate_table(self) -> Table:
+        table = Table(
+            caption="Rounds of the latest fixed point computation of each iterate.",
+            box=box.SIMPLE,
+        )
+        table.add_column("iterate", justify="left")
+        table.add_column("rounds", justify="right")
+        table.add_column("rows changed in the last round", justify="right")
+        table.add_column(r"time of the last round \[ms]", justify="right")
+        table.add_column(r"total time \[ms]", justify="right")
+
+        for i, entry in enumerate(self.data.iterate_stats):
+            table.add_row(
+                f"iterate {i}",
+                f"{entry.rounds}",
+                f"{entry.rows_per_round[-1]}" if entry.rows_per_round else "",
+                f"{entry.round_durations_ms[-1]}" if entry.round_durations_ms else "",
+                f"{sum(entry.round_durations_ms)}",
+            )
+        return table
+
     def get_operators_table(self, max_height) -> Table:
         if len(self.node_names) == 0:
             caption = (
@@ -154,7 +175,14 @@ class MonitoringOutput:
     ) -> RenderResult:
         layout = Layout(name="monitoring_inner")
         layout.split_row(Layout(name="connectors"), Layout(name="operators"))
-        layout["connectors"].update(Align.center(self.get_connectors_table()))
+        if self.data.iterate_stats:
+            layout["connectors"].update(
+                Align.center(
+                    Group(self.get_connectors_table(), self.get_iterate_table())
+                )
+            )
+        else:
+            layout["connectors"].update(Align.center(self.get_connectors_table()))
         layout["operators"].update(
             Align.center(self.get_operators_table(options.max_height - 2))
         )
@@ -1,10 +1,15 @@
 # Copyright © 2024 Pathway
 
 
+import os
+from typing import Literal
+
 from pathway.internals import parse_graph
+from pathway.internals.config import get_pathway_config
 from pathway.internals.graph_runner import GraphRunner
 from pathway.internals.monitoring import MonitoringLevel
 from pathway.internals.runtime_type_check import check_arg_types
+from pathway.internals.table import Table
 from pathway.persistence import Config as PersistenceConfig
 
 
@@ -19,6 +24,8 @@ def run(
     runtime_typechecking: bool | None = None,
     license_key: str | None = None,
     terminate_on_error: bool | None = None,
+    mode: Literal["streaming", "batch"] = "streaming",
+    profile: str | os.PathLike | None = None,
 ) -> None:
     """Runs the computation graph.
 
@@ -37,8 +44,31 @@ def run(
             persistence is required.
         runtime_typechecking: enables additional strict type checking at runtime
         terminate_on_error: whether to terminate the computation if the data/user-logic error occurs
+        mode: ``"streaming"`` (default) processes the data incrementally, keeping the
+            logical times of the inputs. ``"batch"`` requires all inputs to be bounded
+            and processes all of them at a single logical time, so intermediate
+            results and the updates retracting them are never produced. The
+            ``__time__`` column of static tables, autocommits and the commits of
+            connectors (e.g. ``ConnectorSubject.commit``) are ignored. The results
+            of operators that depend on the order or the time of updates, such as
+            ``deduplicate`` acceptors, ``latest``/``earliest`` and stateful
+            reducers, ``asof_now`` joins and indexes, and windows with ``forget``
+            behaviors, are computed as if all the data arrived at once and can
+            differ from the results in the streaming mode.
+        profile: if set, Python stacks of all threads are sampled during the run and
+            a flamegraph-compatible profile, in the folded stacks format, is written
+            to this path. Time spent in user-defined functions (also of custom
+            reducers and ``deduplicate`` acceptors) and subscribe callbacks is
+            attributed to the operators calling them, and the time the engine spends
+            in every operator to an ``[engine]`` frame of the operator. The count of
+            every stack is the wall-clock time spent in it in microseconds, summed
+            over the threads. Idle threads, waiting on a lock, in ``select`` (like an
+            idle asyncio event loop), for data from a socket or for a child process,
+            are not sampled, while threads blocked in other calls (e.g.
+            ``time.sleep`` in a UDF) are counted as running.
+            With several processes, process ``n > 0`` writes to ``<profile>.n``.
     """
-    GraphRunner(
+    runner = GraphRunner(
         parse_graph.G,
         debug=debug,
         monitoring_level=monitoring_level,
@@ -48,8 +78,15 @@ def run(
         license_key=license_key,
         runtime_typechecking=runtime_typechecking,
         terminate_on_error=terminate_on_error,
+        mode=mode,
+        profile=profile,
         _stacklevel=4,
-    ).run_outputs()
+    )
+    explain_mode = get_pathway_config().explain
+    if explain_mode is not None:
+        print(runner.explain_outputs(analyze=explain_mode == "analyze"))
+    else:
+        runner.run_outputs()
 
 
 @check_arg_types
@@ -63,6 +100,8 @@ def run_all(
     runtime_typechecking: bool | None = None,
     license_key: str | None = None,
     terminate_on_error: bool | None = None,
+    mode: Literal["streaming", "batch"] = "streaming",
+    profile: str | os.PathLike | None = None,
 ) -> None:
     """Runs the computation graph with disabled tree-shaking optimization.
 
@@ -81,8 +120,31 @@ def run_all(
             persistence is required.
         runtime_typechecking: enables additional strict type checking at runtime
         terminate_on_error: whether to terminate the computation if the data/user-logic error occurs
+        mode: ``"streaming"`` (default) processes the data incrementally, keeping the
+            logical times of the inputs. ``"batch"`` requires all inputs to be bounded
+            and processes all of them at a single logical time, so intermediate
+            results and the updates retracting them are never produced. The
+            ``__time__`` column of static tables, autocommits and the commits of
+            connectors (e.g. ``ConnectorSubject.commit``) are ignored. The results
+            of operators that depend on the order or the time of updates, such as
+            ``deduplicate`` acceptors, ``latest``/``earliest`` and stateful
+            reducers, ``asof_now`` joins and indexes, and windows with ``forget``
+            behaviors, are computed as if all the data arrived at once and can
+            differ from the results in the streaming mode.
+        profile: if set, Python stacks of all threads are sampled during the run and
+            a flamegraph-compatible profile, in the folded stacks format, is written
+            to this path. Time spent in user-defined functions (also of custom
+            reducers and ``deduplicate`` acceptors) and subscribe callbacks is
+            attributed to the operators calling them, and the time the engine spends
+            in every operator to an ``[engine]`` frame of the operator. The count of
+            every stack is the wall-clock time spent in it in microseconds, summed
+            over the threads. Idle threads, waiting on a lock, in ``select`` (like an
+            idle asyncio event loop), for data from a socket or for a child process,
+            are not sampled, while threads blocked in other calls (e.g.
+            ``time.sleep`` in a UDF) are counted as running.
+            With several processes, process ``n > 0`` writes to ``<profile>.n``.
     """
-    GraphRunner(
+    runner = GraphRunner(
         parse_graph.G,
         debug=debug,
         monitoring_level=monitoring_level,
@@ -92,5 +154,49 @@ def run_all(
         runtime_typechecking=runtime_typechecking,
         license_key=license_key,
         terminate_on_error=terminate_on_error,
+        mode=mode,
+        profile=profile,
         _stacklevel=4,
-    ).run_all()
+    )
+    explain_mode = get_pathway_config().explain
+    if explain_mode is not None:
+        print(runner.explain_all(analyze=explain_mode == "analyze"))
+    else:
+        runner.run_all()
+
+
+@check_arg_types
+def explain(*tables: Table, analyze: bool = False) -> None:
+    """Prints the physical plan of the computation: the engine operators that
+    compute each table, their keys, arrangements and data exchange between workers,
+    and whether the expressions of the columns are evaluated natively or in Python.
+
+    Args:
+        tables: tables whose computation is explained. If none are given, the plan
+            of ``pw.run()``, computing all outputs, is printed.
+        analyze: run the computation and annotate the operators with the number of
+            rows they received and produced, their processing time, the number of
+            arrangements they built and of records they keep in them. All inputs have
+            to be bounded.
+
+    The plan of ``pw.run()`` in an existing program can also be printed, without
+    modifying it, with ``pathway explain [--analyze] program.py``.
+
+    Example:
+
+    >>> import pathway as pw
+    >>> t = pw.debug.table_from_markdown('''
+    ... a | b
+    ... 1 | 2
+    ... ''')
+    >>> pw.explain(t.select(c=t.a + t.b))  # doctest: +ELLIPSIS
+    Physical plan:
+    ...
+    """
+    runner = GraphRunner(
+        parse_graph.G, monitoring_level=MonitoringLevel.NONE, _stacklevel=4
+    )
+    if tables:
+        print(runner.explain_tables(*tables, analyze=analyze))
+    else:
+        print(runner.explain_outputs(analyze=analyze))
@@ -11,6 +11,7 @@ import pathway.internals.column as clmn
 import pathway.internals.expression as expr
 from pathway.engine import ExternalIndexFactory
 from pathway.internals import api, dtype as dt, groupbys, thisclass, universes
+from pathway.internals.acceptors import Acceptor
 from pathway.internals.api import Value
 from pathway.internals.arg_handlers import (
     arg_handler,
@@ -26,7 +27,7 @@ from pathway.internals.desugaring import (
 )
 from pathway.internals.expression_visitor import collect_tables
 from pathway.internals.helpers import SetOnceProperty, StableSet
-from pathway.internals.joins import Joinable, JoinResult
+from pathway.internals.joins import Joinable, JoinManyResult, JoinResult
 from pathway.internals.operator import DebugOperator, OutputHandle
 from pathway.internals.operator_input import OperatorInput
 from pathway.internals.parse_graph import G
@@ -935,6 +936,60 @@ id_type=<class 'pathway.engine.Pointer'>>
 
         return table_type(_columns=columns, _context=self._rowwise_context, **kwargs)
 
+    @trace_user_frame
+    @desugar
+    def join_many(self, *on: expr.ColumnExpression) -> JoinResult:
+        """Inner-joins the table with multiple other tables at once, each of them
+        matched directly with the rows of this table, e.g. a fact table with its
+        dimension tables.
+
+        Unlike a chain of ``join`` calls, no intermediate join results are indexed. An
+        update of any input is looked up directly in the indexes of the other inputs,
+        which are shared with other joins using the same tables and conditions.
+
+        Args:
+            on: a list of column expressions. Each must be of the form
+                ``self.column == other.column``, where ``other`` is one of the joined
+                tables. Conditions referring to the same table are combined, so to join
+                the same table twice on different columns, join its ``copy()``.
+
+        Returns:
+            JoinResult: an object on which `.select()` may be called to extract relevant
+            columns from the result of the join.
+
+        Example:
+
+        >>> import pathway as pw
+        >>> orders = pw.debug.table_from_markdown('''
+        ... customer | product | amount
+        ... 1        | 10      | 3
+        ... 2        | 10      | 1
+        ... 2        | 20      | 2
+        ... 3        | 30      | 5
+        ... ''')
+        >>> customers = pw.debug.table_from_markdown('''
+        ... customer_id | name
+        ... 1           | Alice
+        ... 2           | Bob
+        ... ''')
+        >>> products = pw.debug.table_from_markdown('''
+        ... product_id | title
+        ... 10         | apple
+        ... 20         | pear
+        ... 30         | plum
+        ... ''')
+        >>> result = orders.join_many(
+        ...     orders.customer == customers.customer_id,
+        ...     orders.product == products.product_id,
+        ... ).select(customers.name, products.title, orders.amount)
+        >>> pw.debug.compute_and_print(result, include_id=False)
+        name  | title | amount
+        Alice | apple | 3
+        Bob   | apple | 1
+        Bob   | pear  | 2
+        """
+        return JoinManyResult._table_join_many(self, *on)
+
     @trace_user_frame
     @desugar
     @arg_handler(handler=groupby_handler)
@@ -948,6 +1003,7 @@ id_type=<class 'pathway.engine.Pointer'>>
         instance: expr.ColumnReference | None = None,
         _skip_errors: bool = True,
         _is_window: bool = False,
+        skew_split: int = 1,
     ) -> groupbys.GroupedTable:
         """Groups table by columns from args.
 
@@ -959,6 +1015,12 @@ id_type=<class 'pathway.engine.Pointer'>>
             id: if provided, is the column used to set id's of the rows of the result
             sort_by: if provided, column values are used as sorting keys for particular reducers
             instance: optional argument describing partitioning of the data into separate instances
+            skew_split: number of parts each group is split into before being reduced.
+                Values greater than 1 spread groups with many rows (hot keys) over
+                multiple workers at the cost of an additional merging step. It is ignored
+                if some of the reducers cannot be computed in parts. The split is not
+                chosen automatically: with multiple workers, hot keys are only detected
+                and reported in the logs.
 
         Returns:
             GroupedTable: Groupby object.
@@ -980,6 +1042,8 @@ id_type=<class 'pathway.engine.Pointer'>>
         Alice | dog | 10
         Bob   | dog | 16
         """
+        if skew_split < 1:
+            raise ValueError("Table.groupby() skew_split has to be a positive integer.")
         if instance is not None:
             args = (*args, instance)
         if id is not None:
@@ -1017,6 +1081,7 @@ id_type=<class 'pathway.engine.Pointer'>>
             _filter_out_results_of_forgetting=_filter_out_results_of_forgetting,
             _skip_errors=_skip_errors,
             _is_window=_is_window,
+            skew_split=skew_split,
         )
 
     @trace_user_frame
@@ -1066,20 +1131,23 @@ id_type=<class 'pathway.engine.Pointer'>>
         *,
         value: expr.ColumnExpression | Value,
         instance: expr.ColumnExpression | None = None,
-        acceptor: Callable[[T, T], bool],
+        acceptor: Callable[[T, T], bool] | Acceptor,
         persistent_id: str | None = None,
     ) -> Table:
         """Deduplicates rows in `self` on `value` column using acceptor function.
 
         It keeps rows which where accepted by the acceptor function.
         Acceptor operates on two arguments - *CURRENT* value and *PREVIOUS* value.
+        Built-in acceptors from ``pw.acceptors`` (e.g. ``pw.acceptors.absolute_change``)
+        are evaluated by the engine, without calling Python for every row.
 
         Args:
             value: column expression used for deduplication.
             instance: Grouping column. For rows with different
                 values in this column, deduplication will be performed separately.
                 Defaults to None.
-            acceptor: callback telling whether two values are different.
+            acceptor: callback telling whether two values are different, or a built-in
+                acceptor from ``pw.acceptors``.
             persistent_id: (unstable) An identifier, under which the state of the table
                 will be persisted or ``None``, if there is no need to persist the state of this table.
                 When a program restarts, it restores the state for all input tables according to what
@@ -2223,6 +2291,135 @@ id_type=<class 'pathway.engine.Pointer'>>
             _context=context,
         )
 
+    @trace_user_frame
+    @desugar
+    @contextualized_operator
+    @check_arg_types
+    def rank(
+        self,
+        key: expr.ColumnExpression,
+        instance: expr.ColumnExpression | None = None,
+    ) -> Table:
+        """
+        Computes the rank of every row within its instance, as ordered by ``key``.
+
+        The rows are kept in an engine-maintained order-statistics index, so locating
+        a change costs ``O(log n)``. The ranks of all rows following a changed row are
+        updated and, as ``percent_rank`` depends on the size of the instance, it is
+        updated for every row of an instance whenever a row is added to it or removed
+        from it.
+
+        Args:
+            key (ColumnExpression[int | float | datetime | str | bytes]):
+                An expression to rank by.
+            instance : ColumnReference or None
+                An expression with instance. Rows are ranked within an instance.
+
+        Returns:
+            pw.Table: Table with the same universe as ``self``, containing two columns:
+            ``rank``, equal to one plus the number of rows of the instance with a smaller
+            key, and ``percent_rank``, equal to ``(rank - 1) / (instance_size - 1)``
+            (or ``0.0`` in an instance with a single row).
+
+        Example:
+
+        >>> import pathway as pw
+        >>> table = pw.debug.table_from_markdown('''
+        ... name     | age | score
+        ... Alice    | 25  | 80
+        ... Bob      | 20  | 90
+        ... Charlie  | 30  | 80
+        ... ''')
+        >>> table += table.rank(key=pw.this.score)
+        >>> pw.debug.compute_and_print(table, include_id=False)
+        name    | age | score | rank | percent_rank
+        Alice   | 25  | 80    | 1    | 0.0
+        Bob     | 20  | 90    | 3    | 1.0
+        Charlie | 30  | 80    | 1    | 0.0
+        """
+        instance = clmn.ColumnExpression._wrap(instance)
+        context = clmn.RankContext(
+            self._eval(key),
+            self._eval(instance),
+            self._id_column.dtype,
+        )
+        return Table(
+            _columns={
+                "rank": context.rank_column,
+                "percent_rank": context.percent_rank_column,
+            },
+            _context=context,
+        )
+
+    @trace_user_frame
+    @desugar
+    @contextualized_operator
+    @check_arg_types
+    def limit(
+        self,
+        limit: int,
+        *,
+        key: expr.ColumnExpression,
+        offset: int = 0,
+        instance: expr.ColumnExpression | None = None,
+    ) -> Table[TSchema]:
+        """
+        Keeps the rows at positions ``offset, ..., offset + limit - 1`` of every instance,
+        as ordered by ``key``. Rows with equal keys are ordered by their ids.
+
+        The result is maintained incrementally with an engine-maintained
+        order-statistics index: an update costs ``O(log n)`` plus the number of rows
+        entering and leaving the page, which makes it suitable for live top-N
+        leaderboards and paginated views. ``table.limit(1, key=..., offset=k)`` looks up
+        the row at position ``k``.
+
+        Args:
+            limit: The maximal number of rows kept per instance.
+            key (ColumnExpression[int | float | datetime | str | bytes]):
+                An expression to order by.
+            offset: The number of leading rows of every instance to skip.
+            instance : ColumnReference or None
+                An expression with instance. Pages are computed within an instance.
+
+        Returns:
+            Table: Result has the same schema as ``self`` and its ids are subset of
+            ``self.id``.
+
+        Example:
+
+        >>> import pathway as pw
+        >>> table = pw.debug.table_from_markdown('''
+        ... name     | score
+        ... Alice    | 80
+        ... Bob      | 90
+        ... Charlie  | 70
+        ... David    | 95
+        ... ''')
+        >>> top = table.limit(2, key=-pw.this.score)
+        >>> pw.debug.compute_and_print(top, include_id=False)
+        name  | score
+        Bob   | 90
+        David | 95
+        >>> second_page = table.limit(2, key=-pw.this.score, offset=2)
+        >>> pw.debug.compute_and_print(second_page, include_id=False)
+        name    | score
+        Alice   | 80
+        Charlie | 70
+        """
+        if limit < 0:
+            raise ValueError(f"limit has to be non-negative, got {limit}.")
+        if offset < 0:
+            raise ValueError(f"offset has to be non-negative, got {offset}.")
+        instance = clmn.ColumnExpression._wrap(instance)
+        context = clmn.LimitContext(
+            self._eval(key),
+            self._eval(instance),
+            self._id_column,
+            offset,
+            limit,
+        )
+        return self._table_with_context(context)
+
     def _set_source(self, source: OutputHandle):
         self._source = source
         if not hasattr(self._id_column, "lineage"):
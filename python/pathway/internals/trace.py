@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import contextlib
 import functools
+import linecache
 import sys
-import traceback
+import types
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, ParamSpec, TypeVar
@@ -22,47 +23,97 @@ class Frame:
     function: str
 
     def is_external(self) -> bool:
-        if "pathway/tests/test_" in self.filename:
-            return True
-        exclude_patterns = [
-            "pathway/tests",
-            "pathway/internals",
-            "pathway/io",
-            "pathway/stdlib",
-            "pathway/debug",
-            "@beartype",
-        ]
-        return all(pattern not in self.filename for pattern in exclude_patterns)
+        return _is_external(self.filename)
 
     def is_marker(self) -> bool:
-        return self.function == "_pathway_trace_marker"
+        return _is_marker(self.function)
+
+
+_EXCLUDE_PATTERNS = (
+    "pathway/tests",
+    "pathway/internals",
+    "pathway/io",
+    "pathway/stdlib",
+    "pathway/debug",
+    "@beartype",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _is_external(filename: str) -> bool:
+    if "pathway/tests/test_" in filename:
+        return True
+    return all(pattern not in filename for pattern in _EXCLUDE_PATTERNS)
+
+
+def _is_marker(function: str) -> bool:
+    return function == "_pathway_trace_marker"
+
+
+RawFrame = tuple[str, int, str]
+
+
+def _resolve_frame(raw_frame: RawFrame) -> Frame:
+    filename, line_number, function = raw_frame
+    linecache.checkcache(filename)
+    return Frame(
+        filename=filename,
+        line_number=line_number,
+        line=linecache.getline(filename, line_number).strip(),
+        function=function,
+    )
 
 
 @dataclass(frozen=True)
 class Trace:
-    frames: list[Frame]
-    user_frame: Frame | None
+    """Call stack captured when a part of the graph is created.
+
+    Only file names, line numbers and function names are captured, as traces are
+    created for every expression, column and operator. Source lines are read from
+    disk when the frames are needed, usually only to report an error.
+    """
+
+    raw_frames: tuple[RawFrame, ...]
 
     @staticmethod
     def from_traceback():
-        frames = [
-            Frame(
-                filename=e.filename,
-                line_number=e.lineno,
-                line=e.line,
-                function=e.name,
-            )
-            for e in traceback.extract_stack()[:-1]
-        ]
-
-        user_frame: Frame | None = None
-        for frame in frames:
-            if frame.is_marker():
+        raw_frames = []
+        frame: types.FrameType | None = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            raw_frames.append((code.co_filename, frame.f_lineno, code.co_name))
+            frame = frame.f_back
+        raw_frames.reverse()
+        return Trace(raw_frames=tuple(raw_frames))
+
+    @functools.cached_property
+    def frames(self) -> list[Frame]:
+        return [_resolve_frame(raw_frame) for raw_frame in self.raw_frames]
+
+    @functools.cached_property
+    def _user_raw_frame(self) -> RawFrame | None:
+        user_frame: RawFrame | None = None
+        for raw_frame in self.raw_frames:
+            filename, _line_number, function = raw_frame
+            if _is_marker(function):
                 break
-            elif frame.is_external():
-                user_frame = frame
+            elif _is_external(filename):
+                user_frame = raw_frame
+        return user_frame
+
+    @functools.cached_property
+    def user_frame(self) -> Frame | None:
+        if self._user_raw_frame is None:
+            return None
+        return _resolve_frame(self._user_raw_frame)
 
-        return Trace(frames=frames, user_frame=user_frame)
+    @property
+    def user_location(self) -> str | None:
+        """``file:line`` of the user code, without reading the source line."""
+        if self._user_raw_frame is None:
+            return None
+        filename, line_number, _function = self._user_raw_frame
+        return f"{filename}:{line_number}"
 
     def to_engine(self) -> api.Trace | None:
         user_frame = self.user_frame
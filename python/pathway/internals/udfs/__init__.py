@@ -107,6 +107,7 @@ class UDF(abc.ABC):
     func: Callable
     return_type: Any
     deterministic: bool
+    memoize_for_retractions: bool
     propagate_none: bool
     executor: Executor
     cache_strategy: CacheStrategy | None
@@ -116,6 +117,7 @@ class UDF(abc.ABC):
         *,
         return_type: Any = ...,
         deterministic: bool = False,
+        memoize_for_retractions: bool = False,
         propagate_none: bool = False,
         executor: Executor = AutoExecutor(),
         cache_strategy: CacheStrategy | None = None,
@@ -132,6 +134,12 @@ class UDF(abc.ABC):
                 to True as it will improve the performance.
                 Defaults to False, meaning that the function is not deterministic
                 and its results will be kept.
+            memoize_for_retractions: If True, the results of a deterministic function
+                are kept until the row deletion, as for non-deterministic functions,
+                so that the function is not called again to retract a row when it is
+                deleted or updated. Useful for expensive functions (e.g. calling an
+                LLM or computing embeddings), at the cost of storing the results.
+                Not supported inside ``pw.iterate``. Defaults to False.
             propagate_none: If True, the UDF won't be called if at least one of its
                 arguments is None. Then None will be returned without calling the function.
                 If False, the function is called also on None.
@@ -145,6 +153,7 @@ class UDF(abc.ABC):
         """
         self.return_type = return_type
         self.deterministic = deterministic
+        self.memoize_for_retractions = memoize_for_retractions
         self.propagate_none = propagate_none
         self.executor = self._prepare_executor(executor)
         self.cache_strategy = cache_strategy
@@ -154,6 +163,7 @@ class UDF(abc.ABC):
         return {
             "return_type": self.return_type,
             "deterministic": self.deterministic,
+            "memoize_for_retractions": self.memoize_for_retractions,
             "propagate_none": self.propagate_none,
             "executor": self.executor,
             "cache_strategy": self.cache_strategy,
@@ -205,7 +215,8 @@ class UDF(abc.ABC):
             self.func,
             return_type=self._get_return_type(),
             propagate_none=self.propagate_none,
-            deterministic=self.deterministic,
+            # results of non-deterministic functions are stored until the row deletion
+            deterministic=self.deterministic and not self.memoize_for_retractions,
             args=args,
             kwargs=kwargs,
         )
@@ -291,6 +302,7 @@ def udf(
     *,
     return_type: Any = None,
     deterministic: bool = False,
+    memoize_for_retractions: bool = False,
     propagate_none: bool = False,
     executor: Executor = AutoExecutor(),
     cache_strategy: CacheStrategy | None = None,
@@ -304,6 +316,7 @@ def udf(
     *,
     return_type: Any = None,
     deterministic: bool = False,
+    memoize_for_retractions: bool = False,
     propagate_none: bool = False,
     executor: Executor = AutoExecutor(),
     cache_strategy: CacheStrategy | None = None,
@@ -318,6 +331,7 @@ def udf(
     *,
     return_type: Any = ...,
     deterministic: bool = False,
+    memoize_for_retractions: bool = False,
     propagate_none: bool = False,
     executor: Executor = AutoExecutor(),
     cache_strategy: CacheStrategy | None = None,
@@ -338,6 +352,12 @@ def udf(
             to True as it will improve the performance.
             Defaults to False, meaning that the function is not deterministic
             and its results will be kept.
+        memoize_for_retractions: If True, the results of a deterministic function
+            are kept until the row deletion, as for non-deterministic functions,
+            so that the function is not called again to retract a row when it is
+            deleted or updated. Useful for expensive functions (e.g. calling an
+            LLM or computing embeddings), at the cost of storing the results.
+            Not supported inside ``pw.iterate``. Defaults to False.
         executor: Defines the executor of the UDF. It determines if the execution is
             synchronous or asynchronous.
             Defaults to AutoExecutor(), meaning that the execution strategy will be
@@ -396,6 +416,7 @@ def udf(
         fun,
         return_type=return_type,
         deterministic=deterministic,
+        memoize_for_retractions=memoize_for_retractions,
         propagate_none=propagate_none,
         executor=executor,
         cache_strategy=cache_strategy,
@@ -1,9 +1,10 @@
 # Copyright © 2024 Pathway
 
+import contextlib
 import itertools
 import warnings
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 
 from pysat.solvers import Solver
 
@@ -12,16 +13,107 @@ from pathway.internals.universe import Universe
 
 
 class UniverseSolver:
+    """Reasons about relations (subset, equality, disjointness) between universes.
+
+    All relations are encoded in a SAT solver. Queries are answered without calling
+    it when possible: registered equalities are kept in a union-find structure and
+    registered subsets in a graph, in which a path is a proof of a subset relation.
+    Answers are memoized. Positive answers hold forever, as relations are only ever
+    added, while negative ones (and universes known to be non-empty) are forgotten
+    when a new relation between existing universes is registered.
+    """
+
     universe_vars: dict[Universe, int]
     var_counter: Iterator[int]
     solver: Solver
     no_warn: set[Universe]
+    equal_parent: dict[Universe, Universe]
+    supersets: defaultdict[Universe, set[Universe]]
+    known_subsets: set[tuple[Universe, Universe]]
+    known_not_subsets: set[tuple[Universe, Universe]]
+    empty_vars: set[int]
+    nonempty_vars: set[int]
+    defining: bool
 
     def __init__(self):
         self.solver = Solver(name="g4")
         self.var_counter = itertools.count(start=1)
         self.universe_vars = defaultdict(lambda: next(self.var_counter))
         self.no_warn = set()
+        self.equal_parent = {}
+        self.supersets = defaultdict(set)
+        self.known_subsets = set()
+        self.known_not_subsets = set()
+        self.empty_vars = set()
+        self.nonempty_vars = set()
+        self.defining = False
+
+    def _add_clause(self, clause: list[int]) -> None:
+        self.solver.add_clause(clause)
+        if not self.defining:
+            self.known_not_subsets.clear()
+            self.nonempty_vars.clear()
+
+    def _solve(self, assumptions: list[int]) -> bool:
+        result = self.solver.solve(assumptions=assumptions)
+        if result:
+            # the model proves that all universes present in it can be non-empty
+            self.nonempty_vars.update(
+                var for var in self.solver.get_model() or [] if var > 0
+            )
+        return result
+
+    @contextlib.contextmanager
+    def _defining_new_universe(self, result: Universe) -> Iterator[None]:
+        """Registers relations of a universe that wasn't used before to existing ones.
+
+        The relations defining a difference, intersection, union, subset or superset
+        are satisfied by some choice of the new universe for every assignment of the
+        existing ones, so they don't change any relation between the existing
+        universes. The memoized answers stay valid and only the new universe has to
+        be checked for emptiness.
+        """
+        assert result not in self.universe_vars
+        self.defining = True
+        try:
+            yield
+        finally:
+            self.defining = False
+        self._validate_nonempty_universes([result])
+
+    def _find(self, universe: Universe) -> Universe:
+        root = universe
+        while (parent := self.equal_parent.get(root, root)) is not root:
+            root = parent
+        while universe is not root:
+            parent = self.equal_parent[universe]
+            self.equal_parent[universe] = root
+            universe = parent
+        return root
+
+    def _union(self, left: Universe, right: Universe) -> None:
+        left_root = self._find(left)
+        right_root = self._find(right)
+        if left_root is right_root:
+            return
+        self.equal_parent[right_root] = left_root
+        self.supersets[left_root].update(self.supersets.pop(right_root, ()))
+
+    def _is_subset_in_graph(self, subset: Universe, superset: Universe) -> bool:
+        target = self._find(superset)
+        start = self._find(subset)
+        visited = {start}
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            if current is target:
+                return True
+            for next_ in self.supersets.get(current, ()):
+                next_ = self._find(next_)
+                if next_ not in visited:
+                    visited.add(next_)
+                    stack.append(next_)
+        return False
 
     def register_as_equal(self, left: Universe, right: Universe) -> None:
         self._register_as_equal(left, right)
@@ -30,6 +122,7 @@ class UniverseSolver:
     def _register_as_equal(self, left: Universe, right: Universe) -> None:
         self._register_as_subset(left, right)
         self._register_as_subset(right, left)
+        self._union(left, right)
 
     def register_as_subset(self, subset: Universe, superset: Universe) -> None:
         self._register_as_subset(subset, superset)
@@ -39,16 +132,19 @@ class UniverseSolver:
         varA = self.universe_vars[subset]
         varB = self.universe_vars[superset]
         # varA => varB
-        self.solver.add_clause([-varA, varB])
+        self._add_clause([-varA, varB])
+        self.supersets[self._find(subset)].add(self._find(superset))
 
     def get_subset(self, superset: Universe) -> Universe:
         subset = Universe()
-        self.register_as_subset(subset, superset)
+        with self._defining_new_universe(subset):
+            self._register_as_subset(subset, superset)
         return subset
 
     def get_superset(self, subset: Universe) -> Universe:
         superset = Universe()
-        self.register_as_subset(subset, superset)
+        with self._defining_new_universe(superset):
+            self._register_as_subset(subset, superset)
         return superset
 
     def register_as_difference(
@@ -67,11 +163,12 @@ class UniverseSolver:
         varLeft = self.universe_vars[setLeft]
         varRight = self.universe_vars[setRight]
         # (varLeft and ~varRight) => varResult
-        self.solver.add_clause([varResult, -varLeft, varRight])
+        self._add_clause([varResult, -varLeft, varRight])
 
     def get_difference(self, setLeft: Universe, setRight: Universe) -> Universe:
         result = Universe()
-        self.register_as_difference(result, setLeft, setRight)
+        with self._defining_new_universe(result):
+            self._register_as_difference(result, setLeft, setRight)
         return result
 
     def register_as_intersection(self, result: Universe, *args: Universe) -> None:
@@ -85,11 +182,12 @@ class UniverseSolver:
         result_var = self.universe_vars[result]
         args_var = [self.universe_vars[arg] for arg in args]
         # (arg1 and arg2 and ...) => result
-        self.solver.add_clause([result_var, *[-arg_var for arg_var in args_var]])
+        self._add_clause([result_var, *[-arg_var for arg_var in args_var]])
 
     def get_intersection(self, *args: Universe) -> Universe:
         result = Universe()
-        self.register_as_intersection(result, *args)
+        with self._defining_new_universe(result):
+            self._register_as_intersection(result, *args)
         return result
 
     def register_as_union(self, result: Universe, *args: Universe) -> None:
@@ -103,28 +201,48 @@ class UniverseSolver:
         result_var = self.universe_vars[result]
         args_var = [self.universe_vars[arg] for arg in args]
         # result => (arg1 or arg2 or ...)
-        self.solver.add_clause([-result_var, *args_var])
+        self._add_clause([-result_var, *args_var])
 
     def get_union(self, *args: Universe) -> Universe:
         result = Universe()
-        self.register_as_union(result, *args)
+        with self._defining_new_universe(result):
+            self._register_as_union(result, *args)
         return result
 
     def query_is_subset(self, subset: Universe, superset: Universe) -> bool:
+        key = (subset, superset)
+        if key in self.known_subsets:
+            return True
+        if key in self.known_not_subsets:
+            return False
+        if self._is_subset_in_graph(subset, superset):
+            self.known_subsets.add(key)
+            return True
         varA = self.universe_vars[subset]
         varB = self.universe_vars[superset]
         # assume varA and ~varB and check if fails
-        return not self.solver.solve(assumptions=[varA, -varB])
+        if self._solve(assumptions=[varA, -varB]):
+            self.known_not_subsets.add(key)
+            return False
+        self.known_subsets.add(key)
+        # the proven relation shortcuts later searches in the graph
+        self.supersets[self._find(subset)].add(self._find(superset))
+        return True
 
     def query_are_equal(self, setA: Universe, setB: Universe) -> bool:
-        return self.query_is_subset(setA, setB) and self.query_is_subset(setB, setA)
+        if self._find(setA) is self._find(setB):
+            return True
+        if self.query_is_subset(setA, setB) and self.query_is_subset(setB, setA):
+            self._union(setA, setB)
+            return True
+        return False
 
     def query_are_disjoint(self, *args: Universe) -> bool:
         # TODO: this code might be doable with O(n) checks, not O(n^2)
         vars = [self.universe_vars[arg] for arg in args]
         for i in range(len(vars)):
             for j in range(i):
-                if self.solver.solve(assumptions=[vars[i], vars[j]]):
+                if self._solve(assumptions=[vars[i], vars[j]]):
                     return False
         return True
 
@@ -138,11 +256,16 @@ class UniverseSolver:
         for i in range(len(vars)):
             for j in range(i):
                 # varI => ~varJ
-                self.solver.add_clause([-vars[i], -vars[j]])
+                self._add_clause([-vars[i], -vars[j]])
 
     def query_is_empty(self, setA: Universe) -> bool:
         varA = self.universe_vars[setA]
-        return not self.solver.solve(assumptions=[varA])
+        if varA in self.empty_vars:
+            return True
+        if varA in self.nonempty_vars or self._solve(assumptions=[varA]):
+            return False
+        self.empty_vars.add(varA)
+        return True
 
     def register_as_empty(self, setA: Universe, no_warn: bool = True) -> None:
         self._register_as_empty(setA)
@@ -152,10 +275,15 @@ class UniverseSolver:
 
     def _register_as_empty(self, setA: Universe) -> None:
         varA = self.universe_vars[setA]
-        self.solver.add_clause([-varA])
+        self._add_clause([-varA])
+        self.empty_vars.add(varA)
 
-    def _validate_nonempty_universes(self) -> None:
-        for univ in self.universe_vars.keys():
+    def _validate_nonempty_universes(
+        self, universes: Iterable[Universe] | None = None
+    ) -> None:
+        if universes is None:
+            universes = list(self.universe_vars.keys())
+        for univ in universes:
             if univ in self.no_warn:
                 continue
             if self.query_is_empty(univ):
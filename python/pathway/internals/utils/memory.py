@@ -0,0 +1,16 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+import sys
+
+
+def peak_memory() -> int | None:
+    """Peak resident set size of this process in bytes, if it is known."""
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
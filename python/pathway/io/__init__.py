@@ -1,36 +1,74 @@
 # Copyright © 2024 Pathway
 
-from pathway.io import (
-    airbyte,
-    bigquery,
-    csv,
-    debezium,
-    deltalake,
-    elasticsearch,
-    fs,
-    gdrive,
-    http,
-    jsonlines,
-    kafka,
-    logstash,
-    minio,
-    mongodb,
-    nats,
-    null,
-    plaintext,
-    postgres,
-    pubsub,
-    pyfilesystem,
-    python,
-    redpanda,
-    s3,
-    s3_csv,
-    slack,
-    sqlite,
-)
+from typing import TYPE_CHECKING
+
+from pathway.internals.helpers import import_lazy_attribute
 from pathway.io._subscribe import OnChangeCallback, OnFinishCallback, subscribe
 from pathway.io._utils import CsvParserSettings
 
+if TYPE_CHECKING:
+    from pathway.io import (
+        airbyte,
+        bigquery,
+        csv,
+        debezium,
+        deltalake,
+        elasticsearch,
+        fs,
+        gdrive,
+        http,
+        jsonlines,
+        kafka,
+        logstash,
+        minio,
+        mongodb,
+        nats,
+        null,
+        plaintext,
+        postgres,
+        pubsub,
+        pyfilesystem,
+        python,
+        redpanda,
+        s3,
+        s3_csv,
+        slack,
+        sqlite,
+    )
+
+# Connectors are imported on first access, as many of them pull in large dependencies.
+_lazy_attributes = {
+    name: f"pathway.io.{name}"
+    for name in [
+        "airbyte",
+        "bigquery",
+        "csv",
+        "debezium",
+        "deltalake",
+        "elasticsearch",
+        "fs",
+        "gdrive",
+        "http",
+        "jsonlines",
+        "kafka",
+        "logstash",
+        "minio",
+        "mongodb",
+        "nats",
+        "null",
+        "plaintext",
+        "postgres",
+        "pubsub",
+        "pyfilesystem",
+        "python",
+        "redpanda",
+        "s3",
+        "s3_csv",
+        "slack",
+        "sqlite",
+    ]
+}
+
 __all__ = [
     "airbyte",
     "bigquery",
@@ -63,3 +101,13 @@ __all__ = [
     "mongodb",
     "nats",
 ]
+
+
+def __getattr__(name: str):
+    if name in _lazy_attributes:
+        return import_lazy_attribute(globals(), _lazy_attributes, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_lazy_attributes])
@@ -1 +1,28 @@
 # Copyright © 2024 Pathway
+
+from pathway.internals.helpers import import_lazy_attribute
+
+_lazy_attributes = {
+    name: f"pathway.stdlib.{name}"
+    for name in [
+        "graphs",
+        "indexing",
+        "ml",
+        "ordered",
+        "stateful",
+        "statistical",
+        "temporal",
+        "utils",
+        "viz",
+    ]
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_attributes:
+        return import_lazy_attribute(globals(), _lazy_attributes, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_lazy_attributes])
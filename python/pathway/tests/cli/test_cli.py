@@ -1,5 +1,6 @@
 # Copyright © 2024 Pathway
 
+import json
 import os
 import pathlib
 
@@ -7,6 +8,12 @@ import pytest
 from click.testing import CliRunner
 
 from pathway import cli
+from pathway.internals.affinity import (
+    format_core_list,
+    parse_core_list,
+    pin_to_auxiliary_cores,
+    plan_placement,
+)
 
 
 def run_record(
@@ -80,3 +87,107 @@ def test_record_replay_through_cli(tmp_path: pathlib.Path):
 
     # Without replay (and with empty input connector), there are no rows
     run_record(replay_dir, timestamp_file, 0, 0)
+
+
+def test_core_list_roundtrip():
+    assert parse_core_list("0-3,8,10-11\n") == [0, 1, 2, 3, 8, 10, 11]
+    assert format_core_list([11, 0, 1, 2, 3, 8, 10]) == "0-3,8,10-11"
+
+
+def test_plan_placement_numa():
+    placements = plan_placement(
+        processes=4,
+        threads=2,
+        cores=list(range(16)),
+        nodes=[list(range(8)), list(range(8, 16))],
+    )
+    assert [placement.env() for placement in placements] == [
+        {"PATHWAY_WORKER_CORES": "0-1", "PATHWAY_AUXILIARY_CORES": "2-3"},
+        {"PATHWAY_WORKER_CORES": "8-9", "PATHWAY_AUXILIARY_CORES": "10-11"},
+        {"PATHWAY_WORKER_CORES": "4-5", "PATHWAY_AUXILIARY_CORES": "6-7"},
+        {"PATHWAY_WORKER_CORES": "12-13", "PATHWAY_AUXILIARY_CORES": "14-15"},
+    ]
+    assert [placement.numa_node for placement in placements] == [0, 1, 0, 1]
+
+
+def test_plan_placement_not_enough_cores():
+    placements = plan_placement(processes=2, threads=4, cores=[0, 1, 2])
+    assert placements[0].worker_cores == [0]
+    assert placements[0].auxiliary_cores == [0]
+    assert placements[1].worker_cores == [1]
+
+
+@pytest.mark.parametrize("core_list", ["a-b", "100000"])
+def test_pin_to_invalid_cores(core_list, monkeypatch, caplog):
+    if not hasattr(os, "sched_setaffinity"):
+        pytest.skip("pinning threads is not supported on this platform")
+    monkeypatch.setenv("PATHWAY_AUXILIARY_CORES", core_list)
+    affinity = os.sched_getaffinity(0)
+
+    pin_to_auxiliary_cores()
+
+    assert os.sched_getaffinity(0) == affinity
+    assert "Can't pin a thread to cores" in caplog.text
+
+
+def test_bench(tmp_path: pathlib.Path):
+    report_path = tmp_path / "report.json"
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.bench,
+        [
+            "--workload",
+            "ingest_csv",
+            "--workload",
+            "groupby_reduce",
+            "--rows",
+            "200",
+            "--batch-size",
+            "50",
+            "--output",
+            os.fspath(report_path),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    report = json.loads(report_path.read_text())
+    assert report["rows"] == 200
+    ingest, groupby = report["results"]
+    assert ingest["workload"] == "ingest_csv"
+    assert ingest["rows"] == 200
+    assert ingest["throughput_rows_per_s"] > 0
+    assert ingest["latency_ms"] is None
+    assert groupby["workload"] == "groupby_reduce"
+    assert set(groupby["latency_ms"]) == {"p50", "p90", "p99", "max"}
+    assert groupby["peak_rss_bytes"] > 0
+
+
+def test_bench_startup(tmp_path: pathlib.Path):
+    report_path = tmp_path / "report.json"
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.bench,
+        [
+            "--workload",
+            "startup",
+            "--rows",
+            "1000",
+            "--output",
+            os.fspath(report_path),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    (startup,) = json.loads(report_path.read_text())["results"]
+    assert startup["rows"] == 10
+    assert startup["import_s"] > 0
+    assert startup["program_s"] > 0
+    assert startup["plan_s"] > 0
+    assert startup["elapsed_s"] > startup["plan_s"]
+
+
+def test_bench_unknown_workload():
+    runner = CliRunner()
+    result = runner.invoke(cli.bench, ["--workload", "nonexistent"])
+    assert result.exit_code != 0
+    assert "unknown workload 'nonexistent'" in result.output
@@ -0,0 +1,78 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+import pathway as pw
+from pathway.tests.utils import T
+
+
+def test_run_batch_mode():
+    t = T(
+        """
+          | a | __time__ | __diff__
+        1 | 1 |     2    |     1
+        2 | 2 |     2    |     1
+        1 | 1 |     4    |    -1
+        1 | 3 |     4    |     1
+        3 | 4 |     6    |     1
+    """
+    )
+    result = t.reduce(s=pw.reducers.sum(pw.this.a))
+
+    on_change = mock.Mock()
+    pw.io.subscribe(result, on_change)
+    pw.run(mode="batch")
+
+    on_change.assert_called_once_with(
+        key=mock.ANY, row={"s": 9}, time=mock.ANY, is_addition=True
+    )
+
+
+def test_run_batch_mode_requires_bounded_input():
+    t = pw.demo.range_stream(nb_rows=5)
+    pw.io.subscribe(t, lambda **kwargs: None)
+
+    with pytest.raises(
+        ValueError, match="batch mode requires all inputs to be bounded"
+    ):
+        pw.run(mode="batch")
+
+
+@pytest.mark.parametrize("run", [pw.run, pw.run_all])
+def test_run_with_unknown_mode(run):
+    t = T(
+        """
+        a
+        1
+        """
+    )
+    pw.io.null.write(t)
+
+    with pytest.raises(ValueError, match="mode has to be either"):
+        run(mode="batched")  # type: ignore[arg-type]
+
+
+def test_run_batch_mode_ignores_connector_commits():
+    class InputSchema(pw.Schema):
+        a: int
+
+    class Subject(pw.io.python.ConnectorSubject):
+        def run(self):
+            for a in [1, 2, 3]:
+                self.next(a=a)
+                self.commit()
+
+    t = pw.io.python.read(Subject(), schema=InputSchema)
+    result = t.reduce(s=pw.reducers.sum(pw.this.a))
+
+    on_change = mock.Mock()
+    pw.io.subscribe(result, on_change)
+    pw.run(mode="batch")
+
+    on_change.assert_called_once_with(
+        key=mock.ANY, row={"s": 6}, time=mock.ANY, is_addition=True
+    )
@@ -1,5 +1,6 @@
 # Copyright © 2024 Pathway
 
+import datetime
 import pathlib
 from unittest import mock
 
@@ -548,3 +549,66 @@ def test_selective_persistence_no_persistent_id_set_or_different_ids_set(
     assert_stream_equality_wo_index(
         result, expected_2, persistence_config=persistence_config
     )
+
+
+@pytest.mark.parametrize(
+    "acceptor",
+    [
+        pw.acceptors.changed(),
+        pw.acceptors.absolute_change(1.5),
+        pw.acceptors.relative_change(0.4),
+        pw.acceptors.min_interval(2),
+        pw.acceptors.increasing(),
+    ],
+)
+def test_deduplicate_builtin_acceptors_match_python(acceptor):
+    data = """
+    val | instance | __time__
+     1  |     1    |     2
+     1  |     2    |     2
+     2  |     1    |     4
+     4  |     2    |     4
+     4  |     1    |     6
+     3  |     2    |     6
+     3  |     1    |     8
+     7  |     2    |     8
+     7  |     1    |    10
+    """
+
+    table = pw.debug.table_from_markdown(data)
+    result = table.deduplicate(
+        value=pw.this.val, instance=pw.this.instance, acceptor=acceptor
+    )
+    expected = table.deduplicate(
+        value=pw.this.val,
+        instance=pw.this.instance,
+        acceptor=lambda new, old: acceptor(new, old),
+    )
+    assert_stream_equality_wo_index(result, expected)
+
+
+def test_deduplicate_min_interval_datetimes():
+    table = pw.debug.table_from_markdown(
+        """
+        t                   | __time__
+        2024-01-01T10:00:00 |     2
+        2024-01-01T10:00:30 |     4
+        2024-01-01T10:01:10 |     6
+        2024-01-01T10:01:20 |     8
+        """
+    ).select(t=pw.this.t.dt.strptime("%Y-%m-%dT%H:%M:%S"))
+    result = table.deduplicate(
+        value=pw.this.t,
+        acceptor=pw.acceptors.min_interval(datetime.timedelta(minutes=1)),
+    )
+    expected = pw.debug.table_from_markdown(
+        """
+        t                   | __time__ | __diff__
+        2024-01-01T10:00:00 |     2    |     1
+        2024-01-01T10:00:00 |     6    |    -1
+        2024-01-01T10:01:10 |     6    |     1
+        """
+    ).select(
+        t=pw.this.t.dt.strptime("%Y-%m-%dT%H:%M:%S"),
+    )
+    assert_stream_equality_wo_index(result, expected)
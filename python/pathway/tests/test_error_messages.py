@@ -719,3 +719,21 @@ def test_this():
         match=re.escape("You cannot instantiate `this` class."),
     ):
         pw.this()  # cause
+
+
+def test_expression_trace_resolved_lazily():
+    tab = T(
+        """a
+            1
+            2"""
+    )
+
+    expression = tab.a + 1  # cause
+    trace = expression._trace
+    assert "user_frame" not in trace.__dict__
+
+    frame = trace.user_frame
+    assert frame is not None
+    assert frame.filename == __file__
+    assert frame.line == "expression = tab.a + 1  # cause"
+    assert frame.function == "test_expression_trace_resolved_lazily"
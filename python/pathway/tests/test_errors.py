@@ -132,6 +132,40 @@ def test_filter_with_error_in_condition():
     )
 
 
+def test_error_in_column_used_in_if_else_branch():
+    t1 = pw.debug.table_from_markdown(
+        """
+        a | b
+        6 | 2
+        4 | 0
+    """
+    )
+
+    t2 = t1.select(pw.this.b, x=pw.this.a // pw.this.b)
+    # x is computed for every row, even if the branch using it is not taken
+    res = t2.select(y=pw.if_else(pw.this.b > 0, pw.this.x, -1))
+
+    expected = T(
+        """
+        y
+        3
+        -1
+    """
+    )
+    expected_errors = T(
+        """
+        message
+        division by zero
+    """,
+        split_on_whitespace=False,
+    )
+    assert_table_equality_wo_index(
+        (res, pw.global_error_log().select(pw.this.message)),
+        (expected, expected_errors),
+        terminate_on_error=False,
+    )
+
+
 def test_filter_with_error_in_other_column():
     t1 = pw.debug.table_from_markdown(
         """
@@ -213,6 +247,66 @@ def test_inner_join_with_error_in_condition():
     )
 
 
+def test_joins_sharing_input_with_error_in_condition():
+    t1 = pw.debug.table_from_markdown(
+        """
+        a | c
+        1 | 1
+        2 | 0
+    """
+    ).with_columns(a=pw.this.a // pw.this.c)
+    t2 = pw.debug.table_from_markdown(
+        """
+        b
+        1
+    """
+    )
+    t3 = pw.debug.table_from_markdown(
+        """
+        d
+        1
+    """
+    )
+    # both joins use the same arrangement of t1, the error is reported by each
+    with pw.local_error_log() as error_log_1:
+        res_1 = t1.join(t2, pw.left.a == pw.right.b).select(pw.left.a, pw.right.b)
+    with pw.local_error_log() as error_log_2:
+        res_2 = t1.join(t3, pw.left.a == pw.right.d).select(pw.left.a, pw.right.d)
+
+    expected_errors = T(
+        """
+        message
+        Error value encountered in join condition, skipping the row
+    """,
+        split_on_whitespace=False,
+    )
+    assert_table_equality_wo_index(
+        (
+            res_1,
+            res_2,
+            error_log_1.select(pw.this.message),
+            error_log_2.select(pw.this.message),
+        ),
+        (
+            T(
+                """
+                a | b
+                1 | 1
+            """
+            ),
+            T(
+                """
+                a | d
+                1 | 1
+            """
+            ),
+            expected_errors,
+            expected_errors,
+        ),
+        terminate_on_error=False,
+    )
+
+
 def test_left_join_with_error_in_condition():
     t1 = pw.debug.table_from_markdown(
         """
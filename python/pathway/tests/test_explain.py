@@ -0,0 +1,82 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+import pytest
+
+import pathway as pw
+import pathway.internals.graph_runner as graph_runner
+from pathway.internals.parse_graph import G
+from pathway.tests.utils import T, assert_table_equality
+
+
+def test_explain(capsys):
+    t = T(
+        """
+        a | b
+        1 | 2
+        1 | 3
+        2 | 4
+    """
+    )
+    t2 = t.select(pw.this.a, c=pw.apply(lambda b: b * 2, pw.this.b))
+    result = t2.groupby(pw.this.a).reduce(pw.this.a, s=pw.reducers.sum(pw.this.c))
+
+    pw.explain(result)
+    plan = capsys.readouterr().out
+    assert plan.startswith("Physical plan:")
+    assert "expression_table" in plan
+    assert "group_by_table" in plan
+    assert "[python]" in plan
+    assert "rows in:" not in plan
+
+    pw.explain(result, analyze=True)
+    plan = capsys.readouterr().out
+    assert "rows in:" in plan
+    assert "Total time:" in plan
+
+
+def test_explain_does_not_change_the_computation(capsys):
+    t = T(
+        """
+      | x
+    1 | 1
+    2 | 2
+    3 | 3
+    """
+    )
+    t1 = t.select(a=pw.this.x + 1)
+    t2 = t1.select(b=pw.this.a * 2)
+    result = t2.select(c=pw.this.b - 1)
+    expressions = {
+        column: column.expression
+        for table in (t1, t2, result)
+        for column in table._columns.values()
+    }
+    plan = graph_runner.GraphRunner(G).explain_tables(result)
+
+    pw.explain(result)
+    pw.explain(result, analyze=True)
+    capsys.readouterr()
+
+    for column, expression in expressions.items():
+        assert column.expression is expression
+    assert graph_runner.GraphRunner(G).explain_tables(result) == plan
+    assert_table_equality(
+        result,
+        T(
+            """
+      | c
+    1 | 3
+    2 | 5
+    3 | 7
+    """
+        ),
+    )
+
+
+def test_explain_analyze_requires_bounded_input():
+    t = pw.demo.range_stream(nb_rows=5)
+
+    with pytest.raises(ValueError, match="requires all inputs to be bounded"):
+        pw.explain(t, analyze=True)
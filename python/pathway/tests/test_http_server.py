@@ -47,6 +47,68 @@ def test_http_server_runs_when_enabled():
     assert updates_stream[0].values[0] == 200
 
 
+def http_server_metrics(_, max_retries: int = 1) -> str:
+    port = os.environ.get("PATHWAY_MONITORING_HTTP_PORT", "20000")
+
+    metrics = ""
+    for n_attempt in range(max_retries):
+        time.sleep(2**n_attempt * 0.1)
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/metrics") as response:
+                metrics = response.read().decode()
+        except urllib.error.URLError:
+            continue
+        if "operator_rows_out_total{" in metrics:
+            break
+    return metrics
+
+
+@pytest.mark.xdist_group(name="http_server_tests")
+def test_http_server_exports_operator_metrics(monkeypatch):
+    monkeypatch.setenv("PATHWAY_OPERATOR_METRICS", "1")
+    table = T(
+        """
+            | foo
+        1   | 42
+        """
+    )
+
+    metrics = table.select(
+        metrics=pw.apply_async(http_server_metrics, table.foo, max_retries=4)
+    )
+
+    updates_stream = graph_runner.GraphRunner(
+        G, with_http_server=True, monitoring_level=pw.MonitoringLevel.NONE
+    ).run_tables(metrics)[0]
+    metrics_text = updates_stream[0].values[0]
+    assert "operator_rows_out_total{" in metrics_text
+    assert 'operator="' in metrics_text
+    assert 'worker="0"' in metrics_text
+    assert "# TYPE operator_arranged_records gauge" in metrics_text
+
+
+@pytest.mark.xdist_group(name="http_server_tests")
+def test_http_server_skips_operator_metrics_by_default(monkeypatch):
+    monkeypatch.delenv("PATHWAY_OPERATOR_METRICS", raising=False)
+    table = T(
+        """
+            | foo
+        1   | 42
+        """
+    )
+
+    metrics = table.select(
+        metrics=pw.apply_async(http_server_metrics, table.foo, max_retries=3)
+    )
+
+    updates_stream = graph_runner.GraphRunner(
+        G, with_http_server=True, monitoring_level=pw.MonitoringLevel.NONE
+    ).run_tables(metrics)[0]
+    metrics_text = updates_stream[0].values[0]
+    assert metrics_text
+    assert "operator_rows_out_total{" not in metrics_text
+
+
 @pytest.mark.xfail(reason="fails randomly")
 def test_http_server_doesnt_run_when_disabled():
     table = T(
@@ -0,0 +1,46 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pathway as pw
+
+LAZY_MODULES = [
+    "pathway.debug",
+    "pathway.demo",
+    "pathway.io.airbyte",
+    "pathway.io.kafka",
+    "pathway.io.s3",
+    "pathway.stdlib.ml",
+    "pathway.stdlib.temporal",
+    "pathway.stdlib.viz",
+    "panel",
+    "bokeh",
+    "networkx",
+    "jmespath",
+]
+
+
+def _run_python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def test_import_is_lazy():
+    output = _run_python(
+        "import json, sys; import pathway; print(json.dumps(sorted(sys.modules)))"
+    )
+    imported = set(json.loads(output))
+    assert imported.isdisjoint(LAZY_MODULES), imported.intersection(LAZY_MODULES)
+
+
+def test_lazy_attributes():
+    assert pw.io.csv.read is not None
+    assert pw.temporal.windowby is pw.Table.windowby
+    assert pw.stdlib.ordered.diff is pw.Table.diff
+    assert "io" in dir(pw)
+    assert "kafka" in dir(pw.io)
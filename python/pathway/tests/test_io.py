@@ -290,6 +290,54 @@ def test_python_connector_remove():
     )
 
 
+def test_python_connector_interned_strings():
+    statuses = ["new", "paid", "sent"]
+    # more distinct tags than the engine interns per column
+    rows = [
+        {"key": i, "status": statuses[i % 3], "tag": f"tag-{i}"} for i in range(1500)
+    ]
+    removed = rows[::5]
+
+    class TestSubject(pw.io.python.ConnectorSubject):
+        def run(self):
+            for row in rows:
+                self._add(api.ref_scalar(row["key"]), json.dumps(row).encode())
+            for row in removed:
+                self._remove(api.ref_scalar(row["key"]), json.dumps(row).encode())
+
+    class InputSchema(pw.Schema):
+        key: int
+        status: str
+        tag: str
+
+    def summarize(table: pw.Table) -> pw.Table:
+        labels = T(
+            """
+            status | label
+            new    | N
+            paid   | P
+            sent   | S
+            """
+        )
+        counts = table.groupby(pw.this.status).reduce(
+            pw.this.status,
+            count=pw.reducers.count(),
+            last_tag=pw.reducers.max(pw.this.tag),
+        )
+        return counts.join(labels, pw.left.status == pw.right.status).select(
+            pw.left.status, pw.left.count, pw.left.last_tag, pw.right.label
+        )
+
+    interned = pw.io.python.read(TestSubject(), schema=InputSchema)
+    # tables from pandas don't go through a connector, their strings are not interned
+    plain = pw.debug.table_from_pandas(
+        pd.DataFrame([row for row in rows if row["key"] % 5 != 0]),
+        schema=InputSchema,
+    )
+
+    assert_table_equality_wo_index(summarize(interned), summarize(plain))
+
+
 def test_python_connector_deletions_disabled():
     class TestSubject(pw.io.python.ConnectorSubject):
         def run(self):
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import re
 from typing import Optional
 
 import pytest
 
 import pathway as pw
+from pathway.internals.graph_runner import GraphRunner
 from pathway.internals.parse_graph import G
 from pathway.tests.utils import (
     T,
@@ -1545,3 +1547,261 @@ def test_use_other_column_after_left_join_preserving_universe():
     """
     )
     assert_table_equality(res, expected)
+
+
+@pytest.mark.parametrize(
+    "how", [pw.JoinMode.INNER, pw.JoinMode.LEFT, pw.JoinMode.RIGHT, pw.JoinMode.OUTER]
+)
+def test_join_skew_split(how):
+    t1 = T(
+        """
+          | k | a
+        1 | 1 | 11
+        2 | 1 | 12
+        3 | 1 | 13
+        4 | 1 | 14
+        5 | 2 | 15
+        6 | 3 | 16
+        """
+    )
+    t2 = T(
+        """
+          | k | b
+        1 | 1 | 21
+        2 | 1 | 22
+        3 | 2 | 23
+        4 | 4 | 24
+        """
+    )
+    expected = t1.join(t2, t1.k == t2.k, how=how).select(t1.a, t2.b)
+    res = t1.join(t2, t1.k == t2.k, how=how, skew_split=3).select(t1.a, t2.b)
+    assert_table_equality(res, expected)
+
+
+def test_join_skew_split_must_be_positive():
+    t1 = T(
+        """
+        k | a
+        1 | 11
+        """
+    )
+    t2 = T(
+        """
+        k | b
+        1 | 21
+        """
+    )
+    with pytest.raises(ValueError):
+        t1.join(t2, t1.k == t2.k, skew_split=0)
+
+
+def test_multiple_joins_on_the_same_key():
+    customers = T(
+        """
+          | cid | name  | city
+        1 | 1   | Alice | Paris
+        2 | 2   | Bob   | Rome
+        """
+    )
+    orders = T(
+        """
+          | cid | amount
+        1 | 1   | 10
+        2 | 1   | 20
+        3 | 2   | 30
+        """
+    )
+    visits = T(
+        """
+          | cid | page
+        1 | 2   | home
+        2 | 3   | cart
+        """
+    )
+
+    res_orders = orders.join(customers, orders.cid == customers.cid).select(
+        customers.name, orders.amount
+    )
+    res_visits = visits.join_left(customers, visits.cid == customers.cid).select(
+        visits.page, customers.city
+    )
+
+    assert_table_equality_wo_index(
+        (res_orders, res_visits),
+        (
+            T(
+                """
+                name  | amount
+                Alice | 10
+                Alice | 20
+                Bob   | 30
+                """
+            ),
+            T(
+                """
+                page | city
+                home | Rome
+                cart |
+                """
+            ),
+        ),
+    )
+
+
+def test_join_many():
+    orders = T(
+        """
+          | cid | pid | amount | __time__ | __diff__
+        1 | 1   | 10  | 3      | 2        | 1
+        2 | 2   | 10  | 1      | 2        | 1
+        3 | 2   | 20  | 2      | 4        | 1
+        4 | 3   | 30  | 5      | 4        | 1
+        2 | 2   | 10  | 1      | 6        | -1
+        """
+    )
+    customers = T(
+        """
+          | cid | name  | __time__ | __diff__
+        1 | 1   | Alice | 2        | 1
+        2 | 2   | Bob   | 4        | 1
+        3 | 3   | Carol | 6        | 1
+        """
+    )
+    products = T(
+        """
+          | pid | title | __time__ | __diff__
+        1 | 10  | apple | 2        | 1
+        2 | 20  | pear  | 4        | 1
+        3 | 30  | plum  | 8        | 1
+        3 | 30  | plum  | 10       | -1
+        """
+    )
+
+    res = orders.join_many(
+        orders.cid == customers.cid, orders.pid == products.pid
+    ).select(customers.name, products.title, orders.amount, pw.this.cid)
+    chained = (
+        orders.join(customers, orders.cid == customers.cid)
+        .join(products, pw.left.pid == products.pid)
+        .select(customers.name, products.title, orders.amount, pw.this.cid)
+    )
+
+    expected = T(
+        """
+        name  | title | amount | cid
+        Alice | apple | 3      | 1
+        Bob   | pear  | 2      | 2
+        """
+    )
+    assert_table_equality_wo_index((res, chained), (expected, expected))
+
+
+def test_join_many_filter():
+    orders = T(
+        """
+        cid | pid | amount
+        1   | 10  | 3
+        2   | 10  | 1
+        2   | 20  | 2
+        """
+    )
+    customers = T(
+        """
+        cid | name
+        1   | Alice
+        2   | Bob
+        """
+    )
+    products = T(
+        """
+        pid | title
+        10  | apple
+        20  | pear
+        """
+    )
+
+    res = (
+        orders.join_many(orders.cid == customers.cid, orders.pid == products.pid)
+        .filter(orders.amount > 1)
+        .select(customers.name, products.title)
+    )
+
+    assert_table_equality_wo_index(
+        res,
+        T(
+            """
+            name  | title
+            Alice | apple
+            Bob   | pear
+            """
+        ),
+    )
+
+
+def test_join_many_condition_not_on_base_table():
+    orders = T(
+        """
+        cid | pid
+        1   | 10
+        """
+    )
+    customers = T(
+        """
+        cid
+        1
+        """
+    )
+    products = T(
+        """
+        pid
+        10
+        """
+    )
+
+    with pytest.raises(ValueError):
+        orders.join_many(customers.cid == products.pid)
+
+
+def _explain_two_joins_on_customers(shared: bool) -> str:
+    customers = T(
+        """
+          | cid | cid_copy | name
+        1 | 1   | 1        | Alice
+        2 | 2   | 2        | Bob
+        """
+    )
+    orders = T(
+        """
+          | cid | amount
+        1 | 1   | 10
+        2 | 2   | 30
+        """
+    )
+    visits = T(
+        """
+          | cid | page
+        1 | 2   | home
+        """
+    )
+    res_orders = orders.join(customers, orders.cid == customers.cid).select(
+        customers.name, orders.amount
+    )
+    other_key = customers.cid if shared else customers.cid_copy
+    res_visits = visits.join(customers, visits.cid == other_key).select(
+        customers.name, visits.page
+    )
+    return GraphRunner(G).explain_tables(res_orders, res_visits, analyze=True)
+
+
+def test_multiple_joins_on_the_same_key_arrangements():
+    def count_arrangements(plan: str) -> int:
+        return sum(int(n) for n in re.findall(r"arrangements: (\d+)", plan))
+
+    shared_plan = _explain_two_joins_on_customers(shared=True)
+    G.clear()
+    separate_plan = _explain_two_joins_on_customers(shared=False)
+
+    assert "shared with other joins" in shared_plan
+    assert "shared with other joins" not in separate_plan
+    # the same plan, except that customers are arranged once instead of twice
+    assert count_arrangements(shared_plan) == count_arrangements(separate_plan) - 1
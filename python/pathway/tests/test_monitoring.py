@@ -0,0 +1,51 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+import contextlib
+import time
+from typing import Any
+
+import pathway as pw
+import pathway.internals.graph_runner as graph_runner
+from pathway.tests.utils import T
+
+
+def test_iterate_round_statistics(monkeypatch):
+    reports: list[Any] = []
+
+    class StatsRecorder:
+        def update_monitoring(self, data: Any, now: int) -> None:
+            reports.append(data)
+
+    @contextlib.contextmanager
+    def monitor_stats(*args, **kwargs):
+        yield StatsRecorder()
+
+    monkeypatch.setattr(graph_runner, "monitor_stats", monitor_stats)
+
+    def slow_halve(v: int) -> int:
+        time.sleep(0.02)
+        return v // 2 if v > 1 else v
+
+    def f(t: pw.Table):
+        return t.select(v=pw.apply(slow_halve, pw.this.v))
+
+    t = T(
+        """
+        v
+        8
+        """
+    )
+    result = pw.iterate(f, t=t)
+    pw.io.null.write(result)
+    pw.run(monitoring_level=pw.MonitoringLevel.IN_OUT)
+
+    [stats] = reports[-1].iterate_stats
+    # 8 -> 4 -> 2 -> 1
+    assert stats.rounds >= 3
+    assert len(stats.rows_per_round) == len(stats.round_durations_ms)
+    for rows, duration_ms in zip(stats.rows_per_round, stats.round_durations_ms):
+        if rows > 0:
+            # a round calls slow_halve at least once, even if it takes one batch
+            assert duration_ms >= 10
@@ -131,3 +131,95 @@ def test_groupby_count(persistence_mode, tmp_path):
     time.sleep(2)
     p.terminate()
     p.join()
+
+
+@pytest.mark.parametrize(
+    "persistence_mode",
+    [pw.PersistenceMode.PERSISTING, pw.PersistenceMode.OPERATOR_PERSISTING],
+)
+@needs_multiprocessing_fork
+def test_groupby_count_rescaling(persistence_mode, tmp_path):
+    input_path = tmp_path / "data"
+    os.makedirs(input_path)
+    output_path = tmp_path / "output"
+    os.makedirs(output_path)
+    pstorage_path = tmp_path / "PStorage"
+
+    def run(output_path, threads):
+        os.environ["PATHWAY_THREADS"] = str(threads)
+
+        class InputSchema(pw.Schema):
+            w: str
+
+        t = pw.io.csv.read(input_path, schema=InputSchema)
+        res = t.groupby(pw.this.w).reduce(pw.this.w, c=pw.reducers.count())
+        pw.io.csv.write(res, output_path)
+
+        pw.run(
+            persistence_config=pw.persistence.Config(
+                pw.persistence.Backend.filesystem(pstorage_path),
+                snapshot_interval_ms=1000,
+                persistence_mode=persistence_mode,
+            ),
+            monitoring_level=pw.MonitoringLevel.NONE,
+        )
+
+    files = [
+        """
+        w
+        abc
+        def
+        foo
+        """,
+        """
+        w
+        foo
+        xyz
+        abc
+        """,
+        """
+        w
+        abc
+        xxx
+        """,
+    ]
+    expected = [
+        """
+           w | c
+         abc | 1
+         def | 1
+         foo | 1
+        """,
+        """
+           w | c
+         abc | 2
+         def | 1
+         foo | 2
+         xyz | 1
+        """,
+        """
+           w | c
+         abc | 3
+         def | 1
+         foo | 2
+         xyz | 1
+         xxx | 1
+        """,
+    ]
+    # the state persisted by 2 workers is restored by 4 workers and then by 3
+    for i, threads in enumerate([2, 4, 3]):
+        write_csv(input_path / f"{i}.csv", files[i])
+        p = multiprocessing.Process(
+            target=run, daemon=True, args=(output_path / f"{i}.csv", threads)
+        )
+        p.start()
+        wait_result_with_checker(
+            CsvPathwayChecker(expected[i], output_path, id_from=["w"]),
+            10,
+            target=None,
+            step=1,
+        )
+        # sleep needed to save persistence state (see snapshot_interval_ms)
+        time.sleep(2)
+        p.terminate()
+        p.join()
@@ -0,0 +1,121 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+import pathlib
+import re
+import threading
+import time
+
+import pathway as pw
+from pathway.internals.graph_runner.profiler import Profiler
+from pathway.tests.utils import T
+
+
+def test_profile(tmp_path: pathlib.Path):
+    t = T(
+        """
+        a
+        1
+        2
+        3
+    """
+    )
+
+    def slow_identity(a: int) -> int:
+        time.sleep(0.05)
+        return a
+
+    result = t.select(b=pw.apply(slow_identity, pw.this.a))
+    rows = []
+    pw.io.subscribe(
+        result, on_change=lambda key, row, time, is_addition: rows.append(row)
+    )
+    profile_path = tmp_path / "profile.folded"
+    pw.run(profile=profile_path)
+
+    assert sorted(row["b"] for row in rows) == [1, 2, 3]
+    samples = {}
+    for line in profile_path.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        samples[stack] = int(count)
+    udf_stacks = [stack for stack in samples if "slow_identity" in stack]
+    assert udf_stacks
+    for stack in udf_stacks:
+        root = stack.split(";")[0]
+        assert re.fullmatch(r".+ \[\d+\] at .*test_profiler\.py:\d+", root)
+
+
+def test_profile_attributes_reducers_and_acceptors(tmp_path: pathlib.Path):
+    t = T(
+        """
+        a | b
+        1 | 1
+        1 | 2
+        2 | 3
+    """
+    )
+
+    @pw.reducers.stateful_single
+    def slow_sum(state: int | None, value: int) -> int:
+        time.sleep(0.05)
+        return value if state is None else state + value
+
+    def slow_acceptor(new_value: int, old_value: int) -> bool:
+        time.sleep(0.05)
+        return new_value > old_value
+
+    sums = t.groupby(pw.this.a).reduce(pw.this.a, s=slow_sum(pw.this.b))
+    maxima = t.deduplicate(value=pw.this.b, acceptor=slow_acceptor)
+    pw.io.null.write(sums)
+    pw.io.null.write(maxima)
+    profile_path = tmp_path / "profile.folded"
+    pw.run(profile=profile_path)
+
+    stacks = [line.rsplit(" ", 1)[0] for line in profile_path.read_text().splitlines()]
+    for name in ["slow_sum", "slow_acceptor"]:
+        function_stacks = [stack for stack in stacks if name in stack]
+        assert function_stacks
+        for stack in function_stacks:
+            root = stack.split(";")[0]
+            assert re.fullmatch(r".+ \[\d+\] at .*test_profiler\.py:\d+", root)
+
+
+def test_profile_weights_samples_by_time(tmp_path: pathlib.Path):
+    profile_path = tmp_path / "profile.folded"
+    profiler = Profiler(profile_path, interval=0.02)
+    with profiler.operator(1, "slow", None):
+        slow = profiler.attribute(lambda: time.sleep(0.5))
+
+    with profiler:
+        slow()
+
+    time_us = 0
+    for line in profile_path.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        if stack.startswith("slow [1];"):
+            time_us += int(count)
+    # about 25 samples, each weighted by the time since the previous one
+    assert 0.4e6 <= time_us <= 1e6
+
+
+def test_profile_skips_idle_threads(tmp_path: pathlib.Path):
+    event = threading.Event()
+    waiting = threading.Thread(target=event.wait, name="waiting-thread")
+    waiting.start()
+    try:
+        for idle in [False, True]:
+            profile_path = tmp_path / f"profile-{idle}.folded"
+            with Profiler(profile_path, interval=0.01, idle=idle):
+                time.sleep(0.2)
+            stacks = [
+                line.rsplit(" ", 1)[0] for line in profile_path.read_text().splitlines()
+            ]
+            waiting_stacks = [
+                stack for stack in stacks if stack.startswith("waiting-thread;")
+            ]
+            # the thread waits on a condition in threading.py all the time
+            assert bool(waiting_stacks) == idle
+    finally:
+        event.set()
+        waiting.join()
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import math
 
+import pytest
+
 import pathway as pw
 from pathway.tests.utils import T, assert_table_equality, assert_table_equality_wo_types
 
@@ -394,3 +396,102 @@ def test_stateful_many_binary():
             id_from=["pet"],
         ),
     )
+
+
+def test_groupby_skew_split():
+    t = T(
+        """
+        pet | age | weight | kind
+        dog | 10  | 1.5    | a
+        dog | 9   | 2.5    | a
+        dog | 8   | 3.5    | a
+        dog | 7   | 4.5    | a
+        dog | 6   | 5.5    | a
+        cat | 8   | 1.0    | b
+        cat | 3   | 2.0    | b
+        """
+    )
+
+    res = t.groupby(t.pet, skew_split=3).reduce(
+        t.pet,
+        cnt=pw.reducers.count(),
+        age_sum=pw.reducers.sum(t.age),
+        weight_sum=pw.reducers.sum(t.weight),
+        age_min=pw.reducers.min(t.age),
+        age_max=pw.reducers.max(t.age),
+        kind=pw.reducers.unique(t.kind),
+    )
+
+    assert_table_equality(
+        res,
+        T(
+            """
+            pet | cnt | age_sum | weight_sum | age_min | age_max | kind
+            dog | 5   | 40      | 17.5       | 6       | 10      | a
+            cat | 2   | 11      | 3.0        | 3       | 8       | b
+            """,
+            id_from=["pet"],
+        ),
+    )
+
+
+def test_groupby_skew_split_not_splittable_reducer():
+    t = T(
+        """
+        pet | age
+        dog | 10
+        dog | 9
+        cat | 8
+        """
+    )
+
+    res = t.groupby(t.pet, skew_split=3).reduce(
+        t.pet, ages=pw.reducers.sorted_tuple(t.age)
+    )
+    expected = t.groupby(t.pet).reduce(t.pet, ages=pw.reducers.sorted_tuple(t.age))
+
+    assert_table_equality(res, expected)
+
+
+def test_count_and_int_sum_pre_aggregated(monkeypatch: pytest.MonkeyPatch):
+    # count and int sum are pre-aggregated within each worker with multiple workers
+    monkeypatch.setenv("PATHWAY_THREADS", "2")
+    t = T(
+        """
+        pet | age | __time__ | __diff__
+        dog | 10  |     2    |     1
+        dog | 9   |     2    |     1
+        cat | 8   |     2    |     1
+        dog | 7   |     4    |     1
+        dog | 10  |     4    |    -1
+        cat | 3   |     6    |     1
+        cat | 8   |     6    |    -1
+        cow | 5   |     6    |     1
+        dog | 6   |     8    |     1
+        cow | 5   |     8    |    -1
+        """
+    )
+
+    res = t.groupby(t.pet).reduce(
+        t.pet, cnt=pw.reducers.count(), age_sum=pw.reducers.sum(t.age)
+    )
+    # tuples are not pre-aggregated
+    plain = (
+        t.groupby(t.pet)
+        .reduce(t.pet, ages=pw.reducers.tuple(t.age))
+        .select(
+            pw.this.pet,
+            cnt=pw.apply(len, pw.this.ages),
+            age_sum=pw.apply(sum, pw.this.ages),
+        )
+    )
+
+    expected = T(
+        """
+        pet | cnt | age_sum
+        dog | 3   | 22
+        cat | 1   | 3
+        """,
+        id_from=["pet"],
+    )
+    assert_table_equality_wo_types((res, plain), (expected, expected))
@@ -0,0 +1,278 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+import pathway as pw
+import pathway.internals.graph_runner as graph_runner
+from pathway.internals.graph_runner.filter_pushdown import push_down_filters
+from pathway.internals.graph_runner.rowwise_fusion import fuse_rowwise_columns
+from pathway.internals.graph_runner.scope_context import ScopeContext
+from pathway.internals.parse_graph import G
+from pathway.tests.utils import (
+    T,
+    assert_table_equality,
+    assert_table_equality_wo_index,
+    assert_table_equality_wo_index_types,
+)
+
+
+def test_rowwise_chain_fusion():
+    t = T(
+        """
+      | x | y
+    1 | 1 | 10
+    2 | 2 | 20
+    3 | 3 | 30
+    """
+    )
+    t1 = t.select(a=pw.this.x + 1, b=pw.this.y)
+    t2 = t1.with_columns(c=pw.this.a * 2, a=pw.this.a - 1)
+    t3 = t2.filter(pw.this.c > 4).select(pw.this.a, d=pw.this.b - pw.this.c)
+    t4 = t1.select(e=pw.this.a + pw.this.b)
+
+    assert_table_equality(
+        t3,
+        T(
+            """
+      | a | d
+    2 | 2 | 14
+    3 | 3 | 22
+    """
+        ),
+    )
+    assert_table_equality(
+        t4,
+        T(
+            """
+      | e
+    1 | 12
+    2 | 23
+    3 | 34
+    """
+        ),
+    )
+
+
+def test_rowwise_fusion_inlines_eagerly_evaluated_columns():
+    t = T(
+        """
+      | x | y
+    1 | 1 | 10
+    2 | 2 | 20
+    """
+    )
+    t1 = t.select(a=pw.this.x + 1, b=pw.this.y * 2)
+    t2 = t1.select(c=pw.this.a * pw.this.b)
+    t3 = t2.select(d=pw.this.c - 1)
+    u1 = t.select(p=pw.this.x * 3, q=pw.this.y + 1)
+    # q is evaluated only in one branch, it is not inlined
+    u2 = u1.select(r=pw.if_else(pw.this.p > 3, pw.this.q, 0))
+
+    d_expression = t3._columns["d"].expression
+    r_expression = u2._columns["r"].expression
+    context = ScopeContext(
+        nodes=graph_runner.GraphRunner(G).tree_shake_tables(G.global_scope, [t3, u2])
+    )
+    # a, b, c and p
+    assert fuse_rowwise_columns(context, [t3, u2]) == 4
+    assert set(context.fused_expressions) == {
+        t2._columns["c"],
+        t3._columns["d"],
+        u2._columns["r"],
+    }
+    # the expressions in the ParseGraph are not modified
+    assert t3._columns["d"].expression is d_expression
+    assert u2._columns["r"].expression is r_expression
+
+    assert_table_equality(
+        t3,
+        T(
+            """
+      | d
+    1 | 39
+    2 | 119
+    """
+        ),
+    )
+    assert_table_equality(
+        u2,
+        T(
+            """
+      | r
+    1 | 0
+    2 | 21
+    """
+        ),
+    )
+
+
+def _plan(*tables: pw.Table) -> ScopeContext:
+    return ScopeContext(
+        nodes=graph_runner.GraphRunner(G).tree_shake_tables(G.global_scope, tables)
+    )
+
+
+def test_filter_pushdown_below_join(capsys):
+    t1 = T(
+        """
+      | a | x
+    1 | 1 | 1
+    2 | 2 | 2
+    3 | 3 | 3
+    """
+    )
+    t2 = T(
+        """
+      | b | y
+    4 | 1 | 10
+    5 | 2 | 20
+    6 | 3 | 30
+    """
+    )
+    result = (
+        t1.join(t2, t1.a == t2.b)
+        .filter((t1.x > 1) & (t2.y != 30) & (t1.x + t2.y > 0))
+        .select(t1.x, t2.y)
+    )
+
+    context = _plan(result)
+    assert push_down_filters(context, [result]) == 1
+    [(left, right)] = context.pushed_filters.values()
+    # x + y > 0 uses both sides, it is evaluated only after the join
+    assert left is not None and right is not None
+
+    pw.explain(result)
+    plan = capsys.readouterr().out
+    assert "filter on left:" in plan
+    assert "filter on right:" in plan
+
+    assert_table_equality_wo_index(
+        result,
+        T(
+            """
+    x | y
+    2 | 20
+    """
+        ),
+    )
+
+
+def test_filter_pushdown_keeps_outer_join_side():
+    t1 = T(
+        """
+      | a | x
+    1 | 1 | 1
+    2 | 2 | 2
+    3 | 3 | 3
+    """
+    )
+    t2 = T(
+        """
+      | b | y
+    5 | 2 | 20
+    6 | 3 | 30
+    """
+    )
+    result = (
+        t1.join_left(t2, t1.a == t2.b)
+        .filter((t1.x > 1) & (t2.y != 20))
+        .select(t1.x, t2.y)
+    )
+
+    context = _plan(result)
+    assert push_down_filters(context, [result]) == 1
+    # dropping the row 5 of t2 would produce the row 2 of t1 without a match
+    [(left, right)] = context.pushed_filters.values()
+    assert left is not None and right is None
+
+    assert_table_equality_wo_index_types(
+        result,
+        T(
+            """
+    x | y
+    3 | 30
+    """
+        ),
+    )
+
+
+def test_filter_pushdown_below_concat():
+    t1 = T(
+        """
+    x | y
+    1 | a
+    2 | b
+    """
+    )
+    t2 = T(
+        """
+    x | y
+    3 | c
+    4 | d
+    """
+    )
+    result = pw.Table.concat_reindex(t1, t2).filter(pw.this.x % 2 == 0)
+
+    context = _plan(result)
+    assert push_down_filters(context, [result]) == 0
+
+    result = pw.Table.concat_reindex(t1, t2).filter(pw.this.x > 1)
+
+    context = _plan(result)
+    assert push_down_filters(context, [result]) == 1
+    [conditions] = context.pushed_filters.values()
+    assert all(condition is not None for condition in conditions)
+
+    assert_table_equality_wo_index(
+        result,
+        T(
+            """
+    x | y
+    2 | b
+    3 | c
+    4 | d
+    """
+        ),
+    )
+
+
+def test_filter_pushdown_skips_results_with_other_consumers():
+    t1 = T(
+        """
+      | a | x
+    1 | 1 | 1
+    2 | 2 | 2
+    """
+    )
+    t2 = T(
+        """
+      | b | y
+    4 | 1 | 10
+    5 | 2 | 20
+    """
+    )
+    joined = t1.join(t2, t1.a == t2.b).select(t1.x, t2.y)
+    filtered = joined.filter(pw.this.x > 1)
+    total = joined.reduce(s=pw.reducers.sum(pw.this.y))
+
+    context = _plan(filtered, total)
+    assert push_down_filters(context, [filtered, total]) == 0
+
+    assert_table_equality_wo_index(
+        filtered,
+        T(
+            """
+    x | y
+    2 | 20
+    """
+        ),
+    )
+    assert_table_equality_wo_index(
+        total,
+        T(
+            """
+    s
+    30
+    """
+        ),
+    )
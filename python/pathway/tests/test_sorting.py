@@ -103,3 +103,114 @@ def test_prevnext_many_instance():
             next=nodes.pointer_from(this.next, optional=True),
         ),
     )
+
+
+def test_rank_many_instance():
+    nodes = T(
+        """
+          | key | instance
+        1 |  1  | 42
+        2 |  5  | 42
+        3 |  3  | 42
+        4 |  3  | 42
+        5 |  8  | 28
+        6 |  2  | 28
+        """
+    )
+    result = nodes.rank(key=nodes.key, instance=nodes.instance)
+
+    assert_table_equality(
+        result,
+        T(
+            """
+              | rank | percent_rank
+            1 |  1   | 0.0
+            2 |  4   | 1.0
+            3 |  2   | 0.3333333333333333
+            4 |  2   | 0.3333333333333333
+            5 |  2   | 1.0
+            6 |  1   | 0.0
+            """
+        ),
+    )
+
+
+def test_rank_with_updates():
+    nodes = T(
+        """
+          | key | __time__ | __diff__
+        1 |  1  |     2    |     1
+        2 |  5  |     2    |     1
+        3 |  3  |     4    |     1
+        1 |  1  |     6    |    -1
+        4 |  0  |     6    |     1
+        """
+    )
+    result = nodes.rank(key=nodes.key)
+
+    assert_table_equality(
+        result,
+        T(
+            """
+              | rank | percent_rank
+            2 |  3   | 1.0
+            3 |  2   | 0.5
+            4 |  1   | 0.0
+            """
+        ),
+    )
+
+
+def test_limit():
+    nodes = T(
+        """
+          | key | instance
+        1 |  1  | 42
+        2 |  5  | 42
+        3 |  3  | 42
+        4 |  8  | 42
+        5 |  8  | 28
+        6 |  2  | 28
+        7 |  4  | 28
+        """
+    )
+    result = nodes.limit(2, key=nodes.key, offset=1, instance=nodes.instance)
+
+    assert_table_equality(
+        result,
+        T(
+            """
+              | key | instance
+            2 |  5  | 42
+            3 |  3  | 42
+            5 |  8  | 28
+            7 |  4  | 28
+            """
+        ),
+    )
+
+
+def test_limit_with_updates():
+    nodes = T(
+        """
+          | key | __time__ | __diff__
+        1 |  1  |     2    |     1
+        2 |  5  |     2    |     1
+        3 |  3  |     2    |     1
+        4 |  0  |     4    |     1
+        3 |  3  |     6    |    -1
+        5 |  2  |     8    |     1
+        """
+    )
+    result = nodes.limit(2, key=-nodes.key)
+
+    assert_table_equality(
+        result,
+        T(
+            """
+              | key
+            2 |  5
+            5 |  2
+            """
+        ),
+    )
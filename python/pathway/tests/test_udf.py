@@ -510,6 +510,56 @@ def test_udf_make_deterministic(sync: bool) -> None:
     assert internal_inc.call_count == 5
 
 
+@pytest.mark.parametrize("sync", [True, False])
+def test_udf_memoize_for_retractions(sync: bool) -> None:
+    internal_inc = mock.Mock()
+
+    if sync:
+
+        @pw.udf(deterministic=True, memoize_for_retractions=True)
+        def inc(a: int) -> int:
+            internal_inc(a)
+            return a + 1
+
+    else:
+
+        @pw.udf(deterministic=True, memoize_for_retractions=True)
+        async def inc(a: int) -> int:
+            await asyncio.sleep(a / 10)
+            internal_inc(a)
+            return a + 1
+
+    input = T(
+        """
+          | a | __time__ | __diff__
+        1 | 1 |     2    |     1
+        2 | 2 |     2    |     1
+        2 | 2 |     4    |    -1
+        3 | 3 |     6    |     1
+        3 | 3 |     8    |    -1
+        3 | 4 |     8    |     1
+        """
+    )
+
+    result = input.select(ret=inc(pw.this.a))
+
+    assert_table_equality(
+        result,
+        T(
+            """
+              | ret
+            1 | 2
+            3 | 5
+            """,
+        ),
+    )
+    internal_inc.assert_has_calls(
+        [mock.call(1), mock.call(2), mock.call(3), mock.call(4)],
+        any_order=True,
+    )
+    assert internal_inc.call_count == 4
+
+
 @pytest.mark.parametrize("sync", [True, False])
 def test_udf_make_deterministic_2(sync: bool) -> None:
     counter = mock.Mock()
@@ -1045,3 +1095,40 @@ def test_cast_on_return() -> None:
     """
     )
     assert_table_equality(res, expected)
+
+
+def test_deterministic_udf_common_subexpression_evaluated_once():
+    internal_inc = mock.Mock()
+
+    @pw.udf(deterministic=True)
+    def inc(a: int) -> int:
+        internal_inc(a)
+        return a + 1
+
+    input = T(
+        """
+        a | b
+        1 | 0
+        2 | 1
+        3 | 2
+        """
+    )
+    result = input.select(
+        x=inc(pw.this.a) * 2,
+        y=inc(pw.this.a) + pw.this.b,
+        z=pw.if_else(pw.this.b > 0, 6 // pw.this.b, 0),
+        t=pw.if_else(pw.this.b > 0, 6 // pw.this.b, 1),
+    )
+    expected = T(
+        """
+        x | y | z | t
+        4 | 2 | 0 | 1
+        6 | 4 | 6 | 6
+        8 | 6 | 3 | 3
+        """
+    )
+    assert_table_equality(result, expected)
+    internal_inc.assert_has_calls(
+        [mock.call(1), mock.call(2), mock.call(3)], any_order=True
+    )
+    assert internal_inc.call_count == 3
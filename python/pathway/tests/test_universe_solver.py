@@ -0,0 +1,28 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+import pytest
+
+from pathway.internals.universe import Universe
+from pathway.internals.universe_solver import UniverseSolver
+
+
+def test_universe_solver_relations():
+    solver = UniverseSolver()
+    a = Universe()
+    b = solver.get_subset(a)
+    c = solver.get_subset(b)
+    d = solver.get_difference(a, c)
+
+    assert solver.query_is_subset(c, a)
+    assert not solver.query_is_subset(a, c)
+    assert not solver.query_are_equal(a, b)
+    assert not solver.query_is_empty(d)
+
+    with pytest.warns(UserWarning, match="always empty"):
+        solver.register_as_equal(a, c)
+
+    assert solver.query_are_equal(a, b)
+    assert solver.query_are_equal(b, c)
+    assert solver.query_is_empty(d)
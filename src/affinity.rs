@@ -0,0 +1,146 @@
+// Copyright © 2024 Pathway
+
+use std::fmt::{self, Display};
+use std::str::FromStr;
+use std::sync::OnceLock;
+
+use cfg_if::cfg_if;
+use itertools::Itertools;
+use log::{info, warn};
+
+use crate::env::parse_env_var;
+
+/// A list of CPU cores in the format used by `cpuset`, e.g. `0-3,8,10-11`.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct CoreList(Vec<usize>);
+
+#[derive(Debug, thiserror::Error)]
+#[error("invalid list of cores {0:?}")]
+pub struct InvalidCoreList(String);
+
+impl FromStr for CoreList {
+    type Err = InvalidCoreList;
+
+    fn from_str(s: &str) -> Result<Self, Self::Err> {
+        let invalid = || InvalidCoreList(s.to_string());
+        let mut cores = Vec::new();
+        for range in s
+            .split(',')
+            .map(str::trim)
+            .filter(|range| !range.is_empty())
+        {
+            let (start, end) = range.split_once('-').unwrap_or((range, range));
+            let start: usize = start.trim().parse().map_err(|_| invalid())?;
+            let end: usize = end.trim().parse().map_err(|_| invalid())?;
+            if start > end {
+                return Err(invalid());
+            }
+            cores.extend(start..=end);
+        }
+        if cores.is_empty() {
+            return Err(invalid());
+        }
+        cores.sort_unstable();
+        cores.dedup();
+        Ok(Self(cores))
+    }
+}
+
+impl Display for CoreList {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        let ranges = self
+            .0
+            .iter()
+            .copied()
+            .map(|core| (core, core))
+            .coalesce(|(start, end), (next_start, next_end)| {
+                if end + 1 == next_start {
+                    Ok((start, next_end))
+                } else {
+                    Err(((start, end), (next_start, next_end)))
+                }
+            })
+            .map(|(start, end)| {
+                if start == end {
+                    start.to_string()
+                } else {
+                    format!("{start}-{end}")
+                }
+            })
+            .join(",");
+        f.write_str(&ranges)
+    }
+}
+
+/// Placement of the threads of this process on CPU cores.
+///
+/// `PATHWAY_WORKER_CORES` lists the cores of the worker threads, the `i`-th worker of
+/// the process is pinned to the `i`-th core (modulo the length of the list).
+/// `PATHWAY_AUXILIARY_CORES` lists the cores shared by the other threads started by
+/// the engine, like connector readers. It defaults to all worker cores, so that these
+/// threads don't inherit the single core of the worker that started them.
+struct Layout {
+    worker_cores: Option<CoreList>,
+    auxiliary_cores: Option<CoreList>,
+}
+
+fn parse_core_list_env_var(name: &str) -> Option<CoreList> {
+    parse_env_var(name).unwrap_or_else(|error| {
+        warn!("{error}, threads won't be pinned to cores");
+        None
+    })
+}
+
+fn layout() -> &'static Layout {
+    static LAYOUT: OnceLock<Layout> = OnceLock::new();
+    LAYOUT.get_or_init(|| {
+        let worker_cores = parse_core_list_env_var("PATHWAY_WORKER_CORES");
+        let auxiliary_cores =
+            parse_core_list_env_var("PATHWAY_AUXILIARY_CORES").or_else(|| worker_cores.clone());
+        if let (Some(worker_cores), Some(auxiliary_cores)) = (&worker_cores, &auxiliary_cores) {
+            info!("Pinning worker threads to cores {worker_cores} and other threads to cores {auxiliary_cores}");
+        }
+        Layout {
+            worker_cores,
+            auxiliary_cores,
+        }
+    })
+}
+
+/// Pins the calling thread, being the worker `local_index` of this process, to its core.
+pub fn pin_worker_thread(local_index: usize) {
+    if let Some(CoreList(cores)) = &layout().worker_cores {
+        pin_current_thread(&[cores[local_index % cores.len()]]);
+    }
+}
+
+/// Pins the calling thread to the cores of threads other than workers.
+pub fn pin_auxiliary_thread() {
+    if let Some(CoreList(cores)) = &layout().auxiliary_cores {
+        pin_current_thread(cores);
+    }
+}
+
+fn pin_current_thread(cores: &[usize]) {
+    cfg_if! {
+        if #[cfg(target_os = "linux")] {
+            use nix::sched::{sched_setaffinity, CpuSet};
+            use nix::unistd::Pid;
+
+            let mut cpu_set = CpuSet::new();
+            for core in cores {
+                if let Err(error) = cpu_set.set(*core) {
+                    warn!("Can't pin a thread to core {core}: {error}");
+                    return;
+                }
+            }
+            // pid 0 is the calling thread
+            if let Err(error) = sched_setaffinity(Pid::from_raw(0), &cpu_set) {
+                warn!("Can't pin a thread to cores {}: {error}", CoreList(cores.to_vec()));
+            }
+        } else {
+            let _ = cores;
+            warn!("Pinning threads to cores is only supported on Linux");
+        }
+    }
+}
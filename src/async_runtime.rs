@@ -2,8 +2,12 @@ use std::io;
 
 use tokio::runtime::Runtime as TokioRuntime;
 
+use crate::affinity::pin_auxiliary_thread;
+
 pub fn create_async_tokio_runtime() -> Result<TokioRuntime, io::Error> {
     tokio::runtime::Builder::new_current_thread()
         .enable_all()
+        // threads of the blocking pool would inherit the core of a worker
+        .on_thread_start(pin_auxiliary_thread)
         .build()
 }
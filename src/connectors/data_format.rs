@@ -1141,7 +1141,7 @@ fn serialize_value_to_json(value: &Value) -> Result<JsonValue, FormatterError> {
         Value::DateTimeNaive(dt) => Ok(json!(dt.to_string())),
         Value::DateTimeUtc(dt) => Ok(json!(dt.to_string())),
         Value::Duration(d) => Ok(json!(d.nanoseconds())),
-        Value::Json(j) => Ok((**j).clone()),
+        Value::Json(j) => Ok(j.to_json()),
         Value::Error => Err(FormatterError::ErrorValueNonJsonSerializable),
         Value::PyObjectWrapper(_) => Err(FormatterError::TypeNonJsonSerializable {
             type_: Type::PyObjectWrapper,
@@ -1180,7 +1180,7 @@ mod to_sql {
                 }
                 Self::Duration(_) => "duration", // TODO
                 Self::Json(j) => {
-                    try_forward!(&serde_json::Value, &**j);
+                    try_forward!(serde_json::Value, j.to_json());
                     "JSON"
                 }
                 Self::Error => "error",
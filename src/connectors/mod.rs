@@ -25,8 +25,11 @@ pub mod monitoring;
 pub mod offset;
 pub mod posix_like;
 pub mod scanner;
+pub mod string_interner;
 
+use crate::affinity::pin_auxiliary_thread;
 use crate::connectors::monitoring::ConnectorMonitor;
+use crate::connectors::string_interner::StringInterner;
 use crate::engine::error::{DynError, Trace};
 use crate::engine::report_error::{
     LogError, ReportError, SpawnWithReporter, UnwrapWithErrorLogger,
@@ -90,11 +93,13 @@ impl StartedConnectorState {
 
 pub struct Connector {
     commit_duration: Option<Duration>,
+    single_logical_time: bool,
     current_timestamp: Timestamp,
     num_columns: usize,
     current_frontier: OffsetAntichain,
     skip_all_errors: bool,
     error_logger: Rc<dyn LogError>,
+    string_interner: StringInterner,
 }
 
 #[derive(Debug)]
@@ -190,17 +195,20 @@ impl Connector {
     */
     pub fn new(
         commit_duration: Option<Duration>,
+        single_logical_time: bool,
         num_columns: usize,
         skip_all_errors: bool,
         error_logger: Rc<dyn LogError>,
     ) -> Self {
         Connector {
             commit_duration,
+            single_logical_time,
             current_timestamp: Timestamp(0), // default is 0 now. If changing, make sure it is even (required for alt-neu).
             num_columns,
             current_frontier: OffsetAntichain::new(),
             skip_all_errors,
             error_logger,
+            string_interner: StringInterner::new(num_columns),
         }
     }
 
@@ -461,6 +469,7 @@ impl Connector {
         let input_thread_handle = thread::Builder::new()
             .name(thread_name)
             .spawn_with_reporter(error_reporter, move |reporter| {
+                pin_auxiliary_thread();
                 let sender = guard(sender, |sender| {
                     // ensure that we always unpark the main thread after dropping the sender, so it
                     // notices we are done sending
@@ -602,7 +611,7 @@ impl Connector {
                     commit_allowed: commit_allowed_external,
                 } => {
                     *commit_allowed = commit_allowed_external;
-                    if *commit_allowed {
+                    if *commit_allowed && !self.single_logical_time {
                         let parsed_entries = vec![ParsedEventWithErrors::AdvanceTime];
                         self.on_parsed_data(
                             parsed_entries,
@@ -633,7 +642,9 @@ impl Connector {
                         }
                     };
 
-                    if !*backfilling_finished {
+                    // In the single logical time mode the commits requested by the
+                    // reader are ignored, all the data is inserted at one time.
+                    if !*backfilling_finished || self.single_logical_time {
                         parsed_entries.retain(|x| !matches!(x, ParsedEventWithErrors::AdvanceTime));
                     }
 
@@ -816,21 +827,26 @@ impl Connector {
             }
 
             match entry {
-                ParsedEvent::Insert((_, values)) => {
+                ParsedEvent::Insert((_, mut values)) => {
                     if values.len() != self.num_columns {
                         error!("There are {} tokens in the entry, but the expected number of tokens was {}", values.len(), self.num_columns);
                         continue;
                     }
+                    self.string_interner.intern(&mut values);
                     Self::on_insert(key.expect("No key"), values, input_session);
                 }
-                ParsedEvent::Upsert((_, values)) => {
+                ParsedEvent::Upsert((_, mut values)) => {
+                    if let Some(values) = &mut values {
+                        self.string_interner.intern(values);
+                    }
                     Self::on_upsert(key.expect("No key"), values, input_session);
                 }
-                ParsedEvent::Delete((_, values)) => {
+                ParsedEvent::Delete((_, mut values)) => {
                     if values.len() != self.num_columns {
                         error!("There are {} tokens in the entry, but the expected number of tokens was {}", values.len(), self.num_columns);
                         continue;
                     }
+                    self.string_interner.intern(&mut values);
                     Self::on_remove(key.expect("No key"), values, input_session);
                 }
                 ParsedEvent::AdvanceTime => {
@@ -878,6 +894,7 @@ pub fn read_persisted_state(
     let input_thread_handle = thread::Builder::new()
         .name(thread_name)
         .spawn(move || {
+            pin_auxiliary_thread();
             Connector::rewind_from_disk_snapshot(
                 persistent_id,
                 &persistent_storage,
@@ -9,6 +9,7 @@ use log::{info, warn};
 use rayon::iter::{IntoParallelRefIterator, ParallelIterator};
 use rayon::{ThreadPool, ThreadPoolBuilder};
 
+use crate::affinity::pin_auxiliary_thread;
 use crate::connectors::metadata::SourceMetadata;
 use crate::connectors::scanner::{PosixLikeScanner, QueuedAction};
 use crate::connectors::ReadError;
@@ -200,6 +201,7 @@ impl S3Scanner {
             objects_prefix,
             downloader_pool: ThreadPoolBuilder::new()
                 .num_threads(downloader_threads_count)
+                .start_handler(|_thread_index| pin_auxiliary_thread())
                 .build()
                 .expect("Failed to create downloader pool"),
             pending_modifications: HashMap::new(),
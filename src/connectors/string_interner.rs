@@ -0,0 +1,50 @@
+// Copyright © 2024 Pathway
+
+use std::collections::HashSet;
+
+use arcstr::ArcStr;
+
+use crate::engine::Value;
+
+const MAX_DICTIONARY_SIZE: usize = 1024;
+const MAX_INTERNED_LENGTH: usize = 256;
+
+/// Per-column dictionaries of the strings read by a connector.
+///
+/// Equal strings of a column are replaced with a single shared `ArcStr`, so rows (and
+/// arrangements holding them) store each distinct string only once, and comparing
+/// them is a pointer comparison. Low-cardinality columns are detected automatically:
+/// once a column has more than `MAX_DICTIONARY_SIZE` distinct strings, its dictionary
+/// is dropped and its values are kept as parsed.
+pub struct StringInterner {
+    dictionaries: Vec<Option<HashSet<ArcStr>>>,
+}
+
+impl StringInterner {
+    pub fn new(num_columns: usize) -> Self {
+        Self {
+            dictionaries: (0..num_columns).map(|_| Some(HashSet::new())).collect(),
+        }
+    }
+
+    pub fn intern(&mut self, values: &mut [Value]) {
+        for (value, dictionary) in values.iter_mut().zip(self.dictionaries.iter_mut()) {
+            let Value::String(string) = value else {
+                continue;
+            };
+            let Some(entries) = dictionary else {
+                continue;
+            };
+            if string.len() > MAX_INTERNED_LENGTH {
+                continue;
+            }
+            if let Some(interned) = entries.get(string.as_str()) {
+                *string = interned.clone();
+            } else if entries.len() < MAX_DICTIONARY_SIZE {
+                entries.insert(string.clone());
+            } else {
+                *dictionary = None;
+            }
+        }
+    }
+}
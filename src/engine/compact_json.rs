@@ -0,0 +1,349 @@
+// Copyright © 2024 Pathway
+
+use std::fmt::{self, Debug, Display};
+use std::iter;
+
+use serde::ser::{SerializeMap, SerializeSeq};
+use serde::{Serialize, Serializer};
+use serde_json::{Map, Number, Value as JsonValue};
+
+#[derive(Debug, Clone)]
+enum Node {
+    Null,
+    Bool(bool),
+    Number(Number),
+    /// A range of `CompactJson::strings`.
+    String {
+        start: usize,
+        end: usize,
+    },
+    /// Followed by the `len` elements, `end` is the index of the first node after them.
+    Array {
+        len: usize,
+        end: usize,
+    },
+    /// Followed by the `len` entries, each being a `String` key and a value.
+    Object {
+        len: usize,
+        end: usize,
+    },
+}
+
+/// A JSON value stored as a tape of nodes in preorder, with all strings (including
+/// object keys) kept in a single buffer.
+///
+/// Compared to a `serde_json::Value` tree, it takes two allocations regardless of the
+/// size of the document and containers store the index of their end, so elements and
+/// entries can be looked up without materializing (or even visiting) the skipped
+/// subtrees. Object entries are kept in the order of the `serde_json::Value` they are
+/// built from (insertion order, as `serde_json` is built with the `preserve_order`
+/// feature), so the textual representation (used for hashing and serialization) is
+/// the same.
+#[derive(Clone)]
+pub struct CompactJson {
+    nodes: Box<[Node]>,
+    strings: Box<str>,
+}
+
+/// A reference to a value stored inside a [`CompactJson`].
+#[derive(Clone, Copy)]
+pub struct JsonRef<'a> {
+    json: &'a CompactJson,
+    index: usize,
+}
+
+impl CompactJson {
+    pub fn root(&self) -> JsonRef<'_> {
+        JsonRef {
+            json: self,
+            index: 0,
+        }
+    }
+
+    pub fn to_json(&self) -> JsonValue {
+        self.root().to_json()
+    }
+
+    pub fn is_null(&self) -> bool {
+        self.root().is_null()
+    }
+
+    pub fn as_bool(&self) -> Option<bool> {
+        self.root().as_bool()
+    }
+
+    pub fn as_i64(&self) -> Option<i64> {
+        self.root().as_i64()
+    }
+
+    pub fn as_f64(&self) -> Option<f64> {
+        self.root().as_f64()
+    }
+
+    pub fn as_str(&self) -> Option<&str> {
+        self.root().as_str()
+    }
+}
+
+impl<'a> JsonRef<'a> {
+    fn node(&self) -> &'a Node {
+        &self.json.nodes[self.index]
+    }
+
+    fn end(&self) -> usize {
+        match self.node() {
+            Node::Array { end, .. } | Node::Object { end, .. } => *end,
+            _ => self.index + 1,
+        }
+    }
+
+    fn children(&self) -> impl Iterator<Item = JsonRef<'a>> {
+        let json = self.json;
+        let end = self.end();
+        let mut next = self.index + 1;
+        iter::from_fn(move || {
+            if next >= end {
+                return None;
+            }
+            let child = JsonRef { json, index: next };
+            next = child.end();
+            Some(child)
+        })
+    }
+
+    pub fn is_null(&self) -> bool {
+        matches!(self.node(), Node::Null)
+    }
+
+    pub fn as_bool(&self) -> Option<bool> {
+        match self.node() {
+            Node::Bool(b) => Some(*b),
+            _ => None,
+        }
+    }
+
+    pub fn as_i64(&self) -> Option<i64> {
+        match self.node() {
+            Node::Number(n) => n.as_i64(),
+            _ => None,
+        }
+    }
+
+    pub fn as_f64(&self) -> Option<f64> {
+        match self.node() {
+            Node::Number(n) => n.as_f64(),
+            _ => None,
+        }
+    }
+
+    pub fn as_str(&self) -> Option<&'a str> {
+        match self.node() {
+            Node::String { start, end } => Some(&self.json.strings[*start..*end]),
+            _ => None,
+        }
+    }
+
+    /// Elements of an array, `None` for other values.
+    pub fn elements(&self) -> Option<impl Iterator<Item = JsonRef<'a>>> {
+        matches!(self.node(), Node::Array { .. }).then(|| self.children())
+    }
+
+    /// Entries of an object, `None` for other values.
+    pub fn entries(&self) -> Option<impl Iterator<Item = (&'a str, JsonRef<'a>)>> {
+        if !matches!(self.node(), Node::Object { .. }) {
+            return None;
+        }
+        let mut children = self.children();
+        Some(iter::from_fn(move || {
+            let key = children.next()?;
+            let value = children.next()?;
+            Some((key.as_str()?, value))
+        }))
+    }
+
+    pub fn get_index(&self, index: usize) -> Option<JsonRef<'a>> {
+        self.elements()?.nth(index)
+    }
+
+    pub fn get_key(&self, key: &str) -> Option<JsonRef<'a>> {
+        self.entries()?
+            .find(|(entry_key, _value)| *entry_key == key)
+            .map(|(_key, value)| value)
+    }
+
+    pub fn to_json(&self) -> JsonValue {
+        match self.node() {
+            Node::Null => JsonValue::Null,
+            Node::Bool(b) => JsonValue::Bool(*b),
+            Node::Number(n) => JsonValue::Number(n.clone()),
+            Node::String { .. } => JsonValue::String(self.as_str().unwrap_or_default().to_owned()),
+            Node::Array { .. } => {
+                JsonValue::Array(self.children().map(|element| element.to_json()).collect())
+            }
+            Node::Object { .. } => JsonValue::Object(
+                self.entries()
+                    .into_iter()
+                    .flatten()
+                    .map(|(key, value)| (key.to_owned(), value.to_json()))
+                    .collect::<Map<_, _>>(),
+            ),
+        }
+    }
+}
+
+#[derive(Default)]
+struct TapeBuilder {
+    nodes: Vec<Node>,
+    strings: String,
+}
+
+impl TapeBuilder {
+    fn push_string(&mut self, string: &str) {
+        let start = self.strings.len();
+        self.strings.push_str(string);
+        self.nodes.push(Node::String {
+            start,
+            end: self.strings.len(),
+        });
+    }
+
+    fn start_container(&mut self, node: Node) -> usize {
+        self.nodes.push(node);
+        self.nodes.len() - 1
+    }
+
+    fn finish_container(&mut self, index: usize, count: usize) {
+        let nodes_end = self.nodes.len();
+        match &mut self.nodes[index] {
+            Node::Array { len, end } | Node::Object { len, end } => {
+                *len = count;
+                *end = nodes_end;
+            }
+            _ => unreachable!("not a container"),
+        }
+    }
+
+    fn push_json(&mut self, json: &JsonValue) {
+        match json {
+            JsonValue::Null => self.nodes.push(Node::Null),
+            JsonValue::Bool(b) => self.nodes.push(Node::Bool(*b)),
+            JsonValue::Number(n) => self.nodes.push(Node::Number(n.clone())),
+            JsonValue::String(s) => self.push_string(s),
+            JsonValue::Array(elements) => {
+                let index = self.start_container(Node::Array { len: 0, end: 0 });
+                for element in elements {
+                    self.push_json(element);
+                }
+                self.finish_container(index, elements.len());
+            }
+            JsonValue::Object(entries) => {
+                let index = self.start_container(Node::Object { len: 0, end: 0 });
+                for (key, value) in entries {
+                    self.push_string(key);
+                    self.push_json(value);
+                }
+                self.finish_container(index, entries.len());
+            }
+        }
+    }
+
+    fn push_ref(&mut self, json: JsonRef) {
+        match json.node() {
+            Node::Null | Node::Bool(_) | Node::Number(_) => self.nodes.push(json.node().clone()),
+            Node::String { .. } => self.push_string(json.as_str().unwrap_or_default()),
+            Node::Array { len, .. } => {
+                let index = self.start_container(Node::Array { len: 0, end: 0 });
+                for element in json.children() {
+                    self.push_ref(element);
+                }
+                self.finish_container(index, *len);
+            }
+            Node::Object { len, .. } => {
+                let index = self.start_container(Node::Object { len: 0, end: 0 });
+                for child in json.children() {
+                    self.push_ref(child);
+                }
+                self.finish_container(index, *len);
+            }
+        }
+    }
+
+    fn finish(self) -> CompactJson {
+        CompactJson {
+            nodes: self.nodes.into(),
+            strings: self.strings.into(),
+        }
+    }
+}
+
+impl From<&JsonValue> for CompactJson {
+    fn from(json: &JsonValue) -> Self {
+        let mut builder = TapeBuilder::default();
+        builder.push_json(json);
+        builder.finish()
+    }
+}
+
+impl From<JsonRef<'_>> for CompactJson {
+    fn from(json: JsonRef<'_>) -> Self {
+        let mut builder = TapeBuilder::default();
+        builder.push_ref(json);
+        builder.finish()
+    }
+}
+
+impl Serialize for JsonRef<'_> {
+    fn serialize<S>(&self, serializer: S) -> Result<S::Ok, S::Error>
+    where
+        S: Serializer,
+    {
+        match self.node() {
+            Node::Null => serializer.serialize_unit(),
+            Node::Bool(b) => serializer.serialize_bool(*b),
+            Node::Number(n) => n.serialize(serializer),
+            Node::String { .. } => serializer.serialize_str(self.as_str().unwrap_or_default()),
+            Node::Array { len, .. } => {
+                let mut seq = serializer.serialize_seq(Some(*len))?;
+                for element in self.children() {
+                    seq.serialize_element(&element)?;
+                }
+                seq.end()
+            }
+            Node::Object { len, .. } => {
+                let mut map = serializer.serialize_map(Some(*len))?;
+                for (key, value) in self.entries().into_iter().flatten() {
+                    map.serialize_entry(key, &value)?;
+                }
+                map.end()
+            }
+        }
+    }
+}
+
+impl Serialize for CompactJson {
+    fn serialize<S>(&self, serializer: S) -> Result<S::Ok, S::Error>
+    where
+        S: Serializer,
+    {
+        self.root().serialize(serializer)
+    }
+}
+
+impl Display for JsonRef<'_> {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        let repr = serde_json::to_string(self).map_err(|_| fmt::Error)?;
+        f.write_str(&repr)
+    }
+}
+
+impl Display for CompactJson {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        Display::fmt(&self.root(), f)
+    }
+}
+
+impl Debug for CompactJson {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        write!(f, "Json({self})")
+    }
+}
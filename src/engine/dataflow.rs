@@ -7,11 +7,16 @@ mod complex_columns;
 pub mod config;
 mod export;
 pub mod maybe_total;
+pub mod operator_metrics;
 pub mod operators;
 pub mod persist;
 pub mod shard;
+pub mod skew;
+pub mod spill;
+pub mod transport;
 mod variable;
 
+use crate::affinity::pin_worker_thread;
 use crate::connectors::adaptors::{GenericValues, ValuesSessionAdaptor};
 use crate::connectors::data_format::{Formatter, Parser};
 use crate::connectors::data_storage::{ReaderBuilder, Writer};
@@ -36,15 +41,17 @@ use std::cell::RefCell;
 use std::cmp::min;
 use std::collections::hash_map::Entry;
 use std::collections::HashMap;
+use std::hash::Hash;
 use std::iter::once;
 use std::marker::PhantomData;
+use std::mem::take;
 use std::ops::{ControlFlow, Deref};
 use std::panic::{catch_unwind, resume_unwind, AssertUnwindSafe};
 use std::rc::Rc;
 use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::{mpsc, Arc};
 use std::thread::{Builder, JoinHandle};
-use std::time::{Duration, SystemTime};
+use std::time::{Duration, Instant, SystemTime};
 use std::{env, slice};
 
 use arcstr;
@@ -64,7 +71,7 @@ use differential_dataflow::{Collection, ExchangeData};
 use futures::future::BoxFuture;
 use id_arena::Arena;
 use itertools::{chain, process_results, Itertools};
-use log::{error, info};
+use log::{error, info, warn};
 use ndarray::ArrayD;
 use once_cell::unsync::{Lazy, OnceCell};
 use persist::{
@@ -77,23 +84,32 @@ use timely::dataflow::operators::probe::Handle as ProbeHandle;
 use timely::dataflow::operators::{Filter, Inspect, Probe};
 use timely::dataflow::operators::{Map, ToStream as _};
 use timely::dataflow::scopes::Child;
-use timely::execute;
 use timely::order::{Product, TotalOrder};
 use timely::progress::timestamp::Refines;
 use timely::progress::Timestamp as TimestampTrait;
+use timely::worker::AsWorker as _;
 use xxhash_rust::xxh3::Xxh3 as Hasher;
 
 use self::complex_columns::complex_columns;
 use self::export::{export_table, import_table};
 use self::maybe_total::{MaybeTotalScope, MaybeTotalTimestamp, NotTotal, Total};
+use self::operator_metrics::{
+    HotKeyCounter, OperatorLabels, OperatorMetricsRecorder, OperatorMetricsRegistry, SpillCounter,
+};
+use self::operators::half_join::{HalfJoin, HalfJoinMatch};
+use self::operators::order_statistics::{OrderStatistics, OrderStatisticsOutput};
 use self::operators::output::{ConsolidateForOutput, OutputBatch};
 use self::operators::prev_next::add_prev_next_pointers;
 use self::operators::stateful_reduce::StatefulReduce;
 use self::operators::time_column::{MaxTimestamp, TimeColumnBuffer};
-use self::operators::{ArrangeWithTypes, MapWithConsistentDeletions, MapWrapped};
+use self::operators::{
+    ArrangeWithTypes, ConsolidateLocally, MapWithConsistentDeletions, MapWrapped,
+};
 use self::operators::{MaybeTotal, Reshard};
 use self::shard::Shard;
+use self::skew::{HotKeyDetector, SkewSplit};
 use self::variable::SafeVariable;
+use super::compact_json::CompactJson;
 use super::error::{DataError, DataResult, DynError, DynResult, Trace};
 use super::expression::AnyExpression;
 use super::external_index_wrappers::{ExternalIndexData, ExternalIndexQuery};
@@ -114,15 +130,15 @@ use super::report_error::{
 use super::telemetry::maybe_run_telemetry_thread;
 use super::{
     BatchWrapper, ColumnHandle, ColumnPath, ColumnProperties, ComplexColumn, Error, ErrorLogHandle,
-    Expression, ExpressionData, Graph, IterationLogic, IxKeyPolicy, JoinData, JoinType, Key,
-    LegacyTable, OperatorStats, ProberStats, Reducer, ReducerData, Result, ShardPolicy,
-    TableHandle, TableProperties, Timestamp, UniverseHandle, Value,
+    Expression, ExpressionData, Graph, IterateStats, IterationLogic, IxKeyPolicy, JoinData,
+    JoinType, Key, LegacyTable, OperatorStats, ProberStats, Reducer, ReducerData, Result,
+    ShardPolicy, TableHandle, TableProperties, Timestamp, UniverseHandle, Value,
 };
 use crate::external_integration::{
     make_accessor, make_option_accessor, ExternalIndex, IndexDerivedImpl,
 };
 
-pub use self::config::Config;
+pub use self::config::{CommunicationLogFn, Config};
 
 pub type WakeupReceiver = Receiver<Box<dyn FnOnce() -> DynResult<()> + Send + Sync + 'static>>;
 
@@ -569,6 +585,41 @@ impl ErrorLog {
     }
 }
 
+/// Source of an argument of the expressions of `expression_table`.
+enum ExpressionArgument {
+    Column(ColumnPath),
+    /// A subexpression common to several expressions, evaluated once per row.
+    /// It can use the arguments preceding it.
+    Shared(ExpressionData),
+}
+
+impl ExpressionArgument {
+    fn layout(
+        column_paths: Vec<ColumnPath>,
+        mut shared_expressions: Vec<(usize, ExpressionData)>,
+    ) -> Result<Vec<Self>> {
+        shared_expressions.sort_by_key(|(index, _expression_data)| *index);
+        let len = column_paths.len() + shared_expressions.len();
+        let mut column_paths = column_paths.into_iter();
+        let mut shared_expressions = shared_expressions.into_iter().peekable();
+        let arguments = (0..len)
+            .map(|index| {
+                match shared_expressions.next_if(|(shared_index, _)| *shared_index == index) {
+                    Some((_index, expression_data)) => Ok(Self::Shared(expression_data)),
+                    None => column_paths
+                        .next()
+                        .map(Self::Column)
+                        .ok_or(Error::IndexOutOfBounds),
+                }
+            })
+            .collect::<Result<_>>()?;
+        if shared_expressions.next().is_some() {
+            return Err(Error::IndexOutOfBounds);
+        }
+        Ok(arguments)
+    }
+}
+
 struct ErrorLogger {
     operator_id: i64,
     error_log: Option<ErrorLog>,
@@ -672,6 +723,7 @@ impl Prober {
         output_probe: &ProbeHandle<Timestamp>,
         intermediate_probes: &HashMap<usize, ProbeHandle<Timestamp>>,
         connector_monitors: &[Rc<RefCell<ConnectorMonitor>>],
+        iterate_monitors: &[Rc<RefCell<IterateMonitor>>],
     ) {
         let now = Lazy::new(SystemTime::now);
 
@@ -726,6 +778,10 @@ impl Prober {
                 output_stats: Self::create_stats(output_probe, self.input_time),
                 operators_stats: self.stats.clone(),
                 connector_stats,
+                iterate_stats: iterate_monitors
+                    .iter()
+                    .map(|monitor| monitor.borrow().get_stats())
+                    .collect(),
             };
 
             (self.callback)(prober_stats);
@@ -733,6 +789,75 @@ impl Prober {
     }
 }
 
+struct IterateRound {
+    rows: u64,
+    finished: Instant,
+}
+
+/// Gathers statistics of the rounds of an `iterate` from the updates that are fed
+/// back to the next round. A round starts when the previous one has finished, the
+/// first one when the input of the fixed point computation reaches the `iterate`.
+#[derive(Default)]
+struct IterateMonitor {
+    outer_time: Option<u64>,
+    started: Option<Instant>,
+    rounds: Vec<IterateRound>,
+}
+
+impl IterateMonitor {
+    fn start(&mut self, outer_time: u64) {
+        if self.outer_time != Some(outer_time) {
+            // a new fixed point computation has started
+            self.outer_time = Some(outer_time);
+            self.started = Some(Instant::now());
+            self.rounds.clear();
+        }
+    }
+
+    fn observe(&mut self, outer_time: u64, round: u32, rows: u64) {
+        self.start(outer_time);
+        let now = Instant::now();
+        let round = round as usize;
+        while self.rounds.len() <= round {
+            self.rounds.push(IterateRound {
+                rows: 0,
+                finished: now,
+            });
+        }
+        let stats = &mut self.rounds[round];
+        stats.rows += rows;
+        stats.finished = now;
+    }
+
+    #[allow(clippy::cast_possible_truncation)]
+    fn get_stats(&self) -> IterateStats {
+        let mut round_started = self.started;
+        IterateStats {
+            rounds: self.rounds.iter().filter(|round| round.rows > 0).count(),
+            rows_per_round: self.rounds.iter().map(|round| round.rows).collect(),
+            round_durations_ms: self
+                .rounds
+                .iter()
+                .map(|round| {
+                    let started = round_started.replace(round.finished);
+                    started.map_or(0, |started| {
+                        round
+                            .finished
+                            .saturating_duration_since(started)
+                            .as_millis() as u64
+                    })
+                })
+                .collect(),
+        }
+    }
+}
+
+fn hash_outer_time(time: &impl Hash) -> u64 {
+    let mut hasher = Hasher::default();
+    time.hash(&mut hasher);
+    hasher.digest()
+}
+
 #[derive(Debug, Clone, PartialEq, PartialOrd, Eq, Ord, Hash, Serialize, Deserialize)]
 struct SortingCell {
     instance: Value,
@@ -764,6 +889,7 @@ struct DataflowGraphInner<S: MaybeTotalScope> {
     pollers: Vec<Poller>,
     connector_threads: Vec<JoinHandle<()>>,
     connector_monitors: Vec<Rc<RefCell<ConnectorMonitor>>>,
+    iterate_monitors: Vec<Rc<RefCell<IterateMonitor>>>,
     error_reporter: ErrorReporter,
     input_probe: ProbeHandle<S::Timestamp>,
     output_probe: ProbeHandle<S::Timestamp>,
@@ -777,6 +903,64 @@ struct DataflowGraphInner<S: MaybeTotalScope> {
     default_error_log: Option<ErrorLog>,
     current_error_log: Option<ErrorLog>,
     current_operator_properties: Option<OperatorProperties>,
+    operator_metrics: Option<OperatorMetricsRecorder>,
+    join_sides: HashMap<(TableHandle, Vec<ColumnPath>, ShardPolicy), Rc<JoinSide<S>>>,
+}
+
+fn extract_join_key(
+    key: &Key,
+    values: &Value,
+    column_paths: &[ColumnPath],
+    shard_policy: ShardPolicy,
+    error_reporter: &ErrorReporter,
+) -> DataResult<Key> {
+    let join_key_parts: Vec<_> = column_paths
+        .iter()
+        .map(|path| path.extract(key, values))
+        .collect::<Result<Vec<_>>>()
+        .unwrap_with_reporter(error_reporter)
+        .into_iter()
+        .map(|v| v.into_result().map_err(|_err| DataError::ErrorInJoin))
+        .try_collect()?;
+    Ok(shard_policy.generate_key(&join_key_parts))
+}
+
+/// A partial result of a delta join: join keys of the base row and the rows matched so far,
+/// indexed by input (the base table first).
+type DeltaJoinRow = (Vec<Key>, Vec<Option<(Key, Value)>>);
+
+/// Builds the result row of a multi-way join from the matched rows of all its inputs.
+fn join_many_result(parts: &[(Key, Value)]) -> (Key, Value) {
+    let keys: Vec<Value> = parts
+        .iter()
+        .map(|(key, _values)| Value::Pointer(*key))
+        .collect();
+    let values: Vec<Value> = parts
+        .iter()
+        .flat_map(|(key, values)| [Value::Pointer(*key), values.clone()])
+        .collect();
+    (Key::for_values(&keys), Value::from(values.as_slice()))
+}
+
+/// Rows of a table with their join keys extracted, together with the arrangement by the
+/// join key. Shared by all joins using the same table with the same join condition, so that
+/// the table is indexed only once.
+struct JoinSide<S: MaybeTotalScope> {
+    with_join_key: Collection<S, (Option<Key>, (Key, Value))>,
+    // one update per update of a row whose join key couldn't be extracted, logged
+    // separately by every join using the side
+    failed: Collection<S, ()>,
+    arranged: OnceCell<ArrangedByKey<S, Key, (Key, Value)>>,
+}
+
+impl<S: MaybeTotalScope> JoinSide<S> {
+    fn arranged(&self) -> &ArrangedByKey<S, Key, (Key, Value)> {
+        self.arranged.get_or_init(|| {
+            self.with_join_key
+                .flat_map(|(join_key, key_values)| Some((join_key?, key_values)))
+                .arrange()
+        })
+    }
 }
 
 #[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Ord, Hash, Serialize, Deserialize)]
@@ -966,6 +1150,7 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
         config: Arc<Config>,
         terminate_on_error: bool,
         default_error_log: Option<ErrorLog>,
+        operator_metrics: Option<OperatorMetricsRecorder>,
     ) -> Result<Self> {
         Ok(Self {
             scope,
@@ -977,6 +1162,7 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
             pollers: Vec::new(),
             connector_threads: Vec::new(),
             connector_monitors: Vec::new(),
+            iterate_monitors: Vec::new(),
             error_reporter,
             input_probe: ProbeHandle::new(),
             output_probe: ProbeHandle::new(),
@@ -990,6 +1176,8 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
             default_error_log,
             current_error_log: None,
             current_operator_properties: None,
+            operator_metrics,
+            join_sides: HashMap::new(),
         })
     }
 
@@ -1248,6 +1436,7 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
         table_handle: TableHandle,
         column_paths: Vec<ColumnPath>,
         expressions: Vec<ExpressionData>,
+        shared_expressions: Vec<(usize, ExpressionData)>,
         wrapper: BatchWrapper,
         deterministic: bool,
     ) -> Result<TableHandle> {
@@ -1262,15 +1451,29 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
             .collect();
         let properties = TableProperties::Table(properties.as_slice().into());
 
+        let arguments = ExpressionArgument::layout(column_paths, shared_expressions)?;
+
         let error_reporter = self.error_reporter.clone();
         let error_logger = self.create_error_logger()?;
 
         let closure = move |(key, values)| {
-            let args: Vec<Value> = column_paths
-                .iter()
-                .map(|path| path.extract(&key, &values))
-                .collect::<Result<_>>()
-                .unwrap_with_reporter(&error_reporter);
+            let mut args: Vec<Value> = Vec::with_capacity(arguments.len());
+            for argument in &arguments {
+                let value = match argument {
+                    ExpressionArgument::Column(path) => path
+                        .extract(&key, &values)
+                        .unwrap_with_reporter(&error_reporter),
+                    ExpressionArgument::Shared(expression_data) => expression_data
+                        .expression
+                        .eval(&args)
+                        .unwrap_or_log_with_trace(
+                            error_logger.as_ref(),
+                            expression_data.properties.trace(),
+                            Value::Error,
+                        ),
+                };
+                args.push(value);
+            }
             let new_values = expressions.iter().map(|expression_data| {
                 let result = expression_data
                     .expression
@@ -1295,6 +1498,8 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
             table.values().map_named_with_consistent_deletions(
                 "expression_table::evaluate_expression",
                 wrapper,
+                self.error_reporter.clone(),
+                self.spill_counter(),
                 closure,
             )
         };
@@ -1484,6 +1689,8 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
         } else {
             table.values().map_named_async_with_consistent_deletions(
                 "expression_column::apply_async",
+                self.error_reporter.clone(),
+                self.spill_counter(),
                 closure,
             )
         };
@@ -1855,8 +2062,10 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
                     .map(|c| Value::from(ArcStr::from(c.to_string())))
                     .collect()),
                 Value::Json(json) => {
-                    if let serde_json::Value::Array(array) = (*json).clone() {
-                        Ok(array.into_iter().map(Value::from).collect())
+                    if let Some(elements) = json.root().elements() {
+                        Ok(elements
+                            .map(|element| Value::from(CompactJson::from(element)))
+                            .collect())
                     } else {
                         let repr = json.to_string();
                         Err(DataError::ValueError(format!(
@@ -2266,7 +2475,75 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
             .alloc(Table::from_collection(new_values).with_properties(table_properties)))
     }
 
+    /// Extracts join keys of a table, reusing the result (and its arrangement) if the same
+    /// table was already used in a join with the same join condition. Errors in the join
+    /// condition are reported to the error log of the current operator, so every join
+    /// sharing the side logs them.
+    fn join_side(&mut self, data: JoinData, shard_policy: ShardPolicy) -> Result<Rc<JoinSide<S>>> {
+        let side = self.shared_join_side(data, shard_policy)?;
+        let error_logger = self.create_error_logger()?;
+        side.failed.inner.inspect(move |_update| {
+            error_logger.log_error(DataError::ErrorInJoin);
+        });
+        Ok(side)
+    }
+
+    /// Like `join_side`, but leaves logging the errors in the join condition to the caller.
+    fn shared_join_side(
+        &mut self,
+        data: JoinData,
+        shard_policy: ShardPolicy,
+    ) -> Result<Rc<JoinSide<S>>> {
+        let cache_key = (data.table_handle, data.column_paths, shard_policy);
+        let side = if let Some(side) = self.join_sides.get(&cache_key) {
+            side.clone()
+        } else {
+            let table = self
+                .tables
+                .get(data.table_handle)
+                .ok_or(Error::InvalidTableHandle)?;
+            let error_reporter = self.error_reporter.clone();
+            let mut hot_key_detector = HotKeyDetector::maybe_new(
+                "join",
+                self.worker_index(),
+                self.worker_count(),
+                self.hot_key_counter(),
+            );
+            let column_paths = cache_key.1.clone();
+            let with_join_key =
+                table
+                    .values()
+                    .map_named("join::extract_keys", move |(key, values)| {
+                        // the only error is DataError::ErrorInJoin, logged by the joins
+                        let join_key = extract_join_key(
+                            &key,
+                            &values,
+                            &column_paths,
+                            shard_policy,
+                            &error_reporter,
+                        )
+                        .ok();
+                        if let (Some(detector), Some(join_key)) = (&mut hot_key_detector, &join_key)
+                        {
+                            detector.observe(join_key);
+                        }
+                        (join_key, (key, values))
+                    });
+            let failed =
+                with_join_key.flat_map(|(join_key, _key_values)| join_key.is_none().then_some(()));
+            let side = Rc::new(JoinSide {
+                with_join_key,
+                failed,
+                arranged: OnceCell::new(),
+            });
+            self.join_sides.insert(cache_key, side.clone());
+            side
+        };
+        Ok(side)
+    }
+
     #[allow(clippy::too_many_lines)]
+    #[allow(clippy::too_many_arguments)]
     fn join_tables(
         &mut self,
         left_data: JoinData,
@@ -2274,93 +2551,55 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
         shard_policy: ShardPolicy,
         join_type: JoinType,
         table_properties: Arc<TableProperties>,
+        skew_split: usize,
     ) -> Result<TableHandle> {
-        fn extract_join_key(
-            key: &Key,
-            values: &Value,
-            column_paths: &[ColumnPath],
-            shard_policy: ShardPolicy,
-            error_reporter: &ErrorReporter,
-            error_logger: &mut dyn LogError,
-        ) -> Option<Key> {
-            let join_key_parts: DataResult<Vec<_>> = column_paths
-                .iter()
-                .map(|path| path.extract(key, values))
-                .collect::<Result<Vec<_>>>()
-                .unwrap_with_reporter(error_reporter)
-                .into_iter()
-                .map(|v| v.into_result().map_err(|_err| DataError::ErrorInJoin))
-                .try_collect();
-            match join_key_parts {
-                Ok(join_key_parts) => {
-                    let join_key = shard_policy.generate_key(&join_key_parts);
-                    Some(join_key)
-                }
-                Err(error) => {
-                    error_logger.log_error(error);
-                    None
-                }
-            }
-        }
-
         if left_data.column_paths.len() != right_data.column_paths.len() {
             return Err(Error::DifferentJoinConditionLengths);
         }
 
-        let left_table = self
-            .tables
-            .get(left_data.table_handle)
-            .ok_or(Error::InvalidTableHandle)?;
-        let right_table = self
-            .tables
-            .get(right_data.table_handle)
-            .ok_or(Error::InvalidTableHandle)?;
-
-        let error_reporter_left = self.error_reporter.clone();
-        let error_reporter_right = self.error_reporter.clone();
-
-        let mut error_logger_left = self.create_error_logger()?;
-        let mut error_logger_right = self.create_error_logger()?;
-
-        let left_with_join_key =
-            left_table
-                .values()
-                .map_named("join::extract_keys", move |(key, values)| {
-                    let join_key = extract_join_key(
-                        &key,
-                        &values,
-                        &left_data.column_paths,
-                        shard_policy,
-                        &error_reporter_left,
-                        error_logger_left.as_mut(),
-                    );
-                    (join_key, (key, values))
-                });
-        let join_left = left_with_join_key
-            .flat_map(|(join_key, left_key_values)| Some((join_key?, left_key_values)));
-        let join_left_arranged: ArrangedByKey<S, Key, (Key, Value)> = join_left.arrange();
-        let right_with_join_key =
-            right_table
-                .values()
-                .map_named("join::extract_keys", move |(key, values)| {
-                    let join_key = extract_join_key(
-                        &key,
-                        &values,
-                        &right_data.column_paths,
-                        shard_policy,
-                        &error_reporter_right,
-                        error_logger_right.as_mut(),
+        let left_side = self.join_side(left_data, shard_policy)?;
+        let right_side = self.join_side(right_data, shard_policy)?;
+        let left_with_join_key = left_side.with_join_key.clone();
+        let right_with_join_key = right_side.with_join_key.clone();
+
+        let skew_split = SkewSplit::new(skew_split);
+        let join_left_right = if skew_split.is_enabled() {
+            // With skew splitting, every left row goes to a single bucket of its join key
+            // and right rows are replicated to all buckets of their join key.
+            let join_left = left_with_join_key.flat_map(move |(join_key, left_key_values)| {
+                Some((
+                    skew_split.salt(join_key?, &left_key_values.0),
+                    left_key_values,
+                ))
+            });
+            let join_left_arranged: ArrangedByKey<S, Key, (Key, Value)> = join_left.arrange();
+            let join_right = right_with_join_key.flat_map(move |(join_key, right_key_values)| {
+                let mut replicated = Vec::new();
+                if let Some(join_key) = join_key {
+                    replicated.extend(
+                        skew_split
+                            .salts(join_key)
+                            .map(|salted_key| (salted_key, right_key_values.clone())),
                     );
-                    (join_key, (key, values))
-                });
-        let join_right = right_with_join_key
-            .flat_map(|(join_key, right_key_values)| Some((join_key?, right_key_values)));
-        let join_right_arranged: ArrangedByKey<S, Key, (Key, Value)> = join_right.arrange();
-
-        let join_left_right = join_left_arranged
-            .join_core(&join_right_arranged, |join_key, left_key, right_key| {
-                once((*join_key, left_key.clone(), right_key.clone()))
+                }
+                replicated
             });
+            let join_right_arranged: ArrangedByKey<S, Key, (Key, Value)> = join_right.arrange();
+            join_left_arranged.join_core(
+                &join_right_arranged,
+                move |salted_join_key, left_key: &(Key, Value), right_key| {
+                    let join_key = skew_split.unsalt(*salted_join_key, &left_key.0);
+                    once((join_key, left_key.clone(), right_key.clone()))
+                },
+            )
+        } else {
+            left_side.arranged().join_core(
+                right_side.arranged(),
+                |join_key, left_key, right_key| {
+                    once((*join_key, left_key.clone(), right_key.clone()))
+                },
+            )
+        };
 
         let join_left_right_to_result_fn = match join_type {
             JoinType::LeftKeysFull | JoinType::LeftKeysSubset => {
@@ -2514,6 +2753,106 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
         Ok(self.tables.alloc(result_table))
     }
 
+    /// Rows of the base table of a multi-way join together with the join keys of all
+    /// dimensions. Rows with an error in any of the join keys cannot be matched and are
+    /// skipped.
+    fn join_many_base(
+        &self,
+        base_handle: TableHandle,
+        base_column_paths: &[Vec<ColumnPath>],
+        shard_policy: ShardPolicy,
+        log_errors: bool,
+    ) -> Result<Collection<S, (Vec<Key>, (Key, Value))>> {
+        let table = self
+            .tables
+            .get(base_handle)
+            .ok_or(Error::InvalidTableHandle)?;
+        let error_reporter = self.error_reporter.clone();
+        let error_logger = if log_errors {
+            Some(self.create_error_logger()?)
+        } else {
+            None
+        };
+        let base_column_paths = base_column_paths.to_vec();
+        Ok(table.values().flat_map(move |(key, values)| {
+            let join_keys: DataResult<Vec<Key>> = base_column_paths
+                .iter()
+                .map(|column_paths| {
+                    extract_join_key(&key, &values, column_paths, shard_policy, &error_reporter)
+                })
+                .try_collect();
+            match join_keys {
+                Ok(join_keys) => Some((join_keys, (key, values))),
+                Err(error) => {
+                    if let Some(error_logger) = &error_logger {
+                        error_logger.log_error(error);
+                    }
+                    None
+                }
+            }
+        }))
+    }
+
+    fn join_many_dimensions(
+        &mut self,
+        base_column_paths: &[Vec<ColumnPath>],
+        dimensions: Vec<JoinData>,
+        shard_policy: ShardPolicy,
+    ) -> Result<Vec<Rc<JoinSide<S>>>> {
+        if base_column_paths.len() != dimensions.len() {
+            return Err(Error::DifferentJoinConditionLengths);
+        }
+        dimensions
+            .into_iter()
+            .zip(base_column_paths)
+            .map(|(dimension, base_paths)| {
+                if dimension.column_paths.len() != base_paths.len() {
+                    return Err(Error::DifferentJoinConditionLengths);
+                }
+                self.join_side(dimension, shard_policy)
+            })
+            .collect()
+    }
+
+    /// Inner join of a base table with multiple dimension tables, each on its own condition,
+    /// performed as a chain of binary joins. Used where the delta join is not available.
+    fn join_many(
+        &mut self,
+        base_handle: TableHandle,
+        base_column_paths: Vec<Vec<ColumnPath>>,
+        dimensions: Vec<JoinData>,
+        shard_policy: ShardPolicy,
+        table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle> {
+        let dimensions = self.join_many_dimensions(&base_column_paths, dimensions, shard_policy)?;
+        let mut rows = self
+            .join_many_base(base_handle, &base_column_paths, shard_policy, true)?
+            .map_named("join_many::base", |(join_keys, base_key_values)| {
+                (join_keys, vec![base_key_values])
+            });
+        for (index, dimension) in dimensions.iter().enumerate() {
+            let rows_by_join_key: ArrangedByKey<S, Key, (Vec<Key>, Vec<(Key, Value)>)> = rows
+                .map_named("join_many::join_key", move |(join_keys, parts)| {
+                    (join_keys[index], (join_keys, parts))
+                })
+                .arrange();
+            rows = rows_by_join_key.join_core(
+                dimension.arranged(),
+                |_join_key, (join_keys, parts), dimension_key_values| {
+                    let mut parts = parts.clone();
+                    parts.push(dimension_key_values.clone());
+                    once((join_keys.clone(), parts))
+                },
+            );
+        }
+        let result = rows.map_named("join_many::result", |(_join_keys, parts)| {
+            join_many_result(&parts)
+        });
+        Ok(self
+            .tables
+            .alloc(Table::from_collection(result).with_properties(table_properties)))
+    }
+
     fn complex_columns(&mut self, inputs: Vec<ComplexColumn>) -> Result<Vec<ColumnHandle>> {
         complex_columns(self, inputs)
     }
@@ -2595,7 +2934,27 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
         }
     }
 
+    fn hot_key_counter(&self) -> Option<HotKeyCounter> {
+        let operator_id = self.current_operator_properties.as_ref()?.id;
+        Some(self.operator_metrics.as_ref()?.hot_key_counter(operator_id))
+    }
+
+    fn spill_counter(&self) -> Option<SpillCounter> {
+        let operator_id = self.current_operator_properties.as_ref()?.id;
+        Some(self.operator_metrics.as_ref()?.spill_counter(operator_id))
+    }
+
     fn set_operator_properties(&mut self, operator_properties: OperatorProperties) -> Result<()> {
+        if let Some(operator_metrics) = &self.operator_metrics {
+            operator_metrics.start_operator(
+                self.scope.new_identifier(),
+                operator_properties.id,
+                OperatorLabels {
+                    name: operator_properties.name.clone(),
+                    location: operator_properties.location.clone(),
+                },
+            );
+        }
         self.current_operator_properties = Some(operator_properties);
         Ok(())
     }
@@ -2669,6 +3028,25 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
         }
     }
 
+    /// Combines updates of a semigroup reducer within each worker before they are
+    /// exchanged, so that only one partial state per key and time leaves the worker.
+    /// It is skipped with a single worker, as there is no exchange then.
+    fn maybe_pre_aggregate<D, R>(
+        &self,
+        collection: Collection<S, D, R>,
+        name: &str,
+    ) -> Collection<S, D, R>
+    where
+        D: Data,
+        R: Semigroup,
+    {
+        if self.worker_count() > 1 {
+            collection.consolidate_locally_named(name)
+        } else {
+            collection
+        }
+    }
+
     fn maybe_persist<D, R>(
         &mut self,
         collection: Collection<S, D, R>,
@@ -2803,6 +3181,7 @@ impl<S: MaybeTotalScope> DataflowReducer<S> for IntSumReducer {
                 }
             })
             .explode(|(key, state)| once((key, state)));
+        let initialized = graph.maybe_pre_aggregate(initialized, "IntSumReducer::pre_aggregate");
         Ok(graph
             .maybe_persist(initialized, "IntSumReducer::reduce")?
             .count()
@@ -2825,6 +3204,7 @@ impl<S: MaybeTotalScope> DataflowReducer<S> for CountReducer {
             "CountReducer::reduce::init",
             |(_source_key, result_key, _values)| (result_key),
         );
+        let initialized = graph.maybe_pre_aggregate(initialized, "CountReducer::pre_aggregate");
         Ok(graph
             .maybe_persist(initialized, "CountReducer::reduce")?
             .count()
@@ -2988,6 +3368,133 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S>
 where
     <S::MaybeTotalTimestamp as MaybeTotalTimestamp>::IsTotal: CreateDataflowReducer<S>,
 {
+    fn reduce_columns(
+        &mut self,
+        rows: &Collection<S, (Key, Key, Value)>,
+        reducers: Vec<ReducerData>,
+    ) -> Result<Vec<Values<S>>> {
+        let reducer_impls: Vec<_> = reducers
+            .iter()
+            .map(|reducer_data| {
+                <S::MaybeTotalTimestamp as MaybeTotalTimestamp>::IsTotal::create_dataflow_reducer(
+                    &reducer_data.reducer,
+                )
+            })
+            .try_collect()?;
+        reducer_impls
+            .iter()
+            .zip(reducers)
+            .map(|(reducer_impl, data)| {
+                let error_reporter = self.error_reporter.clone();
+                let with_extracted_value = rows.flat_map(move |(key, new_key, values)| {
+                    let new_values: Vec<_> = data
+                        .column_paths
+                        .iter()
+                        .map(|path| path.extract(&key, &values))
+                        .try_collect()
+                        .unwrap_with_reporter(&error_reporter);
+                    if new_values.contains(&Value::Error) && data.skip_errors {
+                        None
+                    } else {
+                        Some((key, new_key, new_values))
+                    }
+                });
+                reducer_impl.clone().reduce(
+                    &with_extracted_value,
+                    self.create_error_logger()?.into(),
+                    data.trace,
+                    self,
+                )
+            })
+            .collect()
+    }
+
+    fn join_reduced_columns(
+        reduced_columns: &[Values<S>],
+    ) -> Option<Collection<S, (Key, Arc<[Value]>)>> {
+        let first = reduced_columns.first()?;
+        let mut joined: Collection<S, (Key, Arc<[Value]>)> = first
+            .map_named("group_by_table::join", |(key, value)| {
+                (key, Arc::from([value].as_slice()))
+            });
+        for column in reduced_columns.iter().skip(1) {
+            let joined_arranged: ArrangedByKey<S, Key, Arc<[Value]>> = joined.arrange();
+            let column_arranged: ArrangedByKey<S, Key, Value> = column.arrange();
+            joined = joined_arranged.join_core(&column_arranged, |key, values, value| {
+                let new_values: Arc<[Value]> = values.iter().chain([value]).cloned().collect();
+                once((*key, new_values))
+            });
+        }
+        Some(joined)
+    }
+
+    /// Reduces every group in two stages. First, each group is split into `skew_split`
+    /// buckets (chosen by the source row key) that are reduced independently on different
+    /// workers, carrying the original grouping key as an additional column. Then the partial
+    /// results of all buckets are merged under the original grouping key.
+    fn reduce_columns_split(
+        &mut self,
+        rows: &Collection<S, (Key, Key, Value)>,
+        reducers: Vec<ReducerData>,
+        merge_reducers: Vec<Reducer>,
+        skew_split: SkewSplit,
+    ) -> Result<Collection<S, (Key, Arc<[Value]>)>> {
+        let salted = rows.map_named("group_by_table::salt", move |(key, new_key, values)| {
+            (
+                key,
+                skew_split.salt(new_key, &key),
+                Value::from([Value::Pointer(new_key), values].as_slice()),
+            )
+        });
+        let nested_path = |path: ColumnPath| match path {
+            ColumnPath::Key => ColumnPath::Key,
+            ColumnPath::ValuePath(path) => ColumnPath::ValuePath(once(1).chain(path).collect()),
+        };
+        let mut traces = Vec::with_capacity(reducers.len());
+        let mut partial_reducers = vec![ReducerData::new(
+            Reducer::Unique,
+            false,
+            vec![ColumnPath::ValuePath(vec![0])],
+            Trace::Empty,
+        )];
+        for data in reducers {
+            traces.push(data.trace.clone());
+            partial_reducers.push(ReducerData {
+                column_paths: data.column_paths.into_iter().map(nested_path).collect(),
+                ..data
+            });
+        }
+        let partial_columns = self.reduce_columns(&salted, partial_reducers)?;
+        let partial = Self::join_reduced_columns(&partial_columns)
+            .expect("partial results should contain the grouping key");
+
+        let error_reporter = self.error_reporter.clone();
+        let partial_with_key =
+            partial.map_named("group_by_table::unsalt", move |(salted_key, values)| {
+                let new_key = values[0].as_pointer().unwrap_with_reporter(&error_reporter);
+                (salted_key, new_key, Value::Tuple(values))
+            });
+        let merging_reducers = merge_reducers
+            .into_iter()
+            .zip(traces)
+            .enumerate()
+            .map(|(i, (reducer, trace))| {
+                ReducerData::new(
+                    reducer,
+                    false,
+                    vec![ColumnPath::ValuePath(vec![i + 1])],
+                    trace,
+                )
+            })
+            .collect();
+        let merged_columns = self.reduce_columns(&partial_with_key, merging_reducers)?;
+        Ok(
+            Self::join_reduced_columns(&merged_columns)
+                .expect("merged results should not be empty"),
+        )
+    }
+
+    #[allow(clippy::too_many_arguments)]
     fn group_by_table(
         &mut self,
         table_handle: TableHandle,
@@ -2996,6 +3503,7 @@ where
         reducers: Vec<ReducerData>,
         set_id: bool,
         table_properties: Arc<TableProperties>,
+        skew_split: usize,
     ) -> Result<TableHandle> {
         if set_id {
             assert!(grouping_columns_paths.len() == 1);
@@ -3005,23 +3513,34 @@ where
             .get(table_handle)
             .ok_or(Error::InvalidTableHandle)?;
 
-        let error_reporter_1 = self.error_reporter.clone();
-        let reducer_impls: Vec<_> = reducers
-            .iter()
-            .map(|reducer_data| {
-                <S::MaybeTotalTimestamp as MaybeTotalTimestamp>::IsTotal::create_dataflow_reducer(
-                    &reducer_data.reducer,
-                )
-            })
-            .try_collect()?;
+        let skew_split = SkewSplit::new(skew_split);
+        let merge_reducers = if skew_split.is_enabled() && !reducers.is_empty() {
+            let merge_reducers: Option<Vec<_>> = reducers
+                .iter()
+                .map(|reducer_data| reducer_data.reducer.merge_reducer())
+                .collect();
+            if merge_reducers.is_none() {
+                warn!("skew_split is set but some of the reducers cannot be computed in parts, the groupby is computed without splitting");
+            }
+            merge_reducers
+        } else {
+            None
+        };
 
+        let error_reporter = self.error_reporter.clone();
         let error_logger = self.create_error_logger()?;
+        let mut hot_key_detector = HotKeyDetector::maybe_new(
+            "groupby",
+            self.worker_index(),
+            self.worker_count(),
+            self.hot_key_counter(),
+        );
         let with_new_key = table.values().flat_map(move |(key, values)| {
             let new_key_parts: Vec<Value> = grouping_columns_paths
                 .iter()
                 .map(|path| path.extract(&key, &values))
                 .collect::<Result<_>>()
-                .unwrap_with_reporter(&error_reporter_1);
+                .unwrap_with_reporter(&error_reporter);
             let new_key = if new_key_parts.contains(&Value::Error) {
                 error_logger.log_error(DataError::ErrorInGroupby);
                 None
@@ -3031,52 +3550,23 @@ where
                         .first()
                         .unwrap()
                         .as_pointer()
-                        .unwrap_with_reporter(&error_reporter_1),
+                        .unwrap_with_reporter(&error_reporter),
                 )
             } else {
                 Some(shard_policy.generate_key(&new_key_parts))
             };
+            if let (Some(detector), Some(new_key)) = (&mut hot_key_detector, &new_key) {
+                detector.observe(new_key);
+            }
             Some((key, new_key?, values))
         });
-        let reduced_columns: Vec<_> = reducer_impls
-            .iter()
-            .zip(reducers)
-            .map(|(reducer_impl, data)| {
-                let error_reporter_2 = self.error_reporter.clone();
-                let with_extracted_value = with_new_key.flat_map(move |(key, new_key, values)| {
-                    let new_values: Vec<_> = data
-                        .column_paths
-                        .iter()
-                        .map(|path| path.extract(&key, &values))
-                        .try_collect()
-                        .unwrap_with_reporter(&error_reporter_2);
-                    if new_values.contains(&Value::Error) && data.skip_errors {
-                        None
-                    } else {
-                        Some((key, new_key, new_values))
-                    }
-                });
-                reducer_impl.clone().reduce(
-                    &with_extracted_value,
-                    self.create_error_logger()?.into(),
-                    data.trace,
-                    self,
-                )
-            })
-            .collect::<Result<_>>()?;
-        let new_values = if let Some(first) = reduced_columns.first() {
-            let mut joined: Collection<S, (Key, Arc<[Value]>)> = first
-                .map_named("group_by_table::join", |(key, value)| {
-                    (key, Arc::from([value].as_slice()))
-                });
-            for column in reduced_columns.iter().skip(1) {
-                let joined_arranged: ArrangedByKey<S, Key, Arc<[Value]>> = joined.arrange();
-                let column_arranged: ArrangedByKey<S, Key, Value> = column.arrange();
-                joined = joined_arranged.join_core(&column_arranged, |key, values, value| {
-                    let new_values: Arc<[Value]> = values.iter().chain([value]).cloned().collect();
-                    once((*key, new_values))
-                });
-            }
+        let joined = if let Some(merge_reducers) = merge_reducers {
+            Some(self.reduce_columns_split(&with_new_key, reducers, merge_reducers, skew_split)?)
+        } else {
+            let reduced_columns = self.reduce_columns(&with_new_key, reducers)?;
+            Self::join_reduced_columns(&reduced_columns)
+        };
+        let new_values = if let Some(joined) = joined {
             joined.map_named("group_by_table::wrap", |(key, values)| {
                 (key, Value::Tuple(values))
             })
@@ -3097,6 +3587,125 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
 where
     S::MaybeTotalTimestamp: TotalOrder,
 {
+    /// Inner join of a base table with multiple dimension tables, each on its own condition,
+    /// performed as a delta join. An update of any input is looked up directly in the
+    /// arrangements of the other inputs (shared with binary joins using the same
+    /// conditions), so no intermediate join result is arranged.
+    #[allow(clippy::too_many_lines)]
+    fn join_many_delta(
+        &mut self,
+        base_handle: TableHandle,
+        base_column_paths: Vec<Vec<ColumnPath>>,
+        dimensions: Vec<JoinData>,
+        shard_policy: ShardPolicy,
+        table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle> {
+        fn half_join_dimension<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>>(
+            rows: &Collection<S, DeltaJoinRow>,
+            dimension: &JoinSide<S>,
+            index: usize,
+            matching: HalfJoinMatch,
+        ) -> Collection<S, DeltaJoinRow> {
+            rows.map_named("join_many::join_key", move |(join_keys, parts)| {
+                (join_keys[index], (join_keys, parts))
+            })
+            .half_join_named(
+                "join_many::half_join",
+                dimension.arranged(),
+                matching,
+                move |_join_key, (join_keys, parts), dimension_key_values| {
+                    let mut parts = parts.clone();
+                    parts[index + 1] = Some(dimension_key_values.clone());
+                    (join_keys.clone(), parts)
+                },
+            )
+        }
+
+        let dimensions = self.join_many_dimensions(&base_column_paths, dimensions, shard_policy)?;
+        let input_count = dimensions.len() + 1;
+        // errors in the join conditions are logged by the shared join sides
+        let base = self.join_many_base(base_handle, &base_column_paths, shard_policy, false)?;
+        let mut streams = Vec::with_capacity(input_count);
+
+        // Updates of the i-th input are matched with the updates of the preceding inputs
+        // up to their time and with the updates of the following ones before their time,
+        // so that every pair of simultaneous updates is matched exactly once.
+        let mut base_rows =
+            base.map_named("join_many::base", move |(join_keys, base_key_values)| {
+                let mut parts = vec![None; input_count];
+                parts[0] = Some(base_key_values);
+                (join_keys, parts)
+            });
+        for (index, dimension) in dimensions.iter().enumerate() {
+            base_rows =
+                half_join_dimension(&base_rows, dimension, index, HalfJoinMatch::BeforeTime);
+        }
+        streams.push(base_rows);
+
+        for (updated_index, updated_dimension) in dimensions.iter().enumerate() {
+            // errors of the base table are logged by join_many_base
+            let base_side = self.shared_join_side(
+                JoinData::new(base_handle, base_column_paths[updated_index].clone()),
+                shard_policy,
+            )?;
+            let error_reporter = self.error_reporter.clone();
+            let base_column_paths = base_column_paths.clone();
+            let mut rows = updated_dimension
+                .with_join_key
+                .flat_map(|(join_key, key_values)| Some((join_key?, key_values)))
+                .half_join_named(
+                    "join_many::half_join",
+                    base_side.arranged(),
+                    HalfJoinMatch::UpToTime,
+                    |_join_key, dimension_key_values, base_key_values: &(Key, Value)| {
+                        (base_key_values.clone(), dimension_key_values.clone())
+                    },
+                )
+                .flat_map(move |((base_key, base_values), dimension_key_values)| {
+                    let join_keys: Vec<Key> = base_column_paths
+                        .iter()
+                        .map(|column_paths| {
+                            extract_join_key(
+                                &base_key,
+                                &base_values,
+                                column_paths,
+                                shard_policy,
+                                &error_reporter,
+                            )
+                            .ok()
+                        })
+                        .collect::<Option<_>>()?;
+                    let mut parts = vec![None; input_count];
+                    parts[0] = Some((base_key, base_values));
+                    parts[updated_index + 1] = Some(dimension_key_values);
+                    Some((join_keys, parts))
+                });
+            for (index, dimension) in dimensions.iter().enumerate() {
+                let matching = match index.cmp(&updated_index) {
+                    std::cmp::Ordering::Less => HalfJoinMatch::UpToTime,
+                    std::cmp::Ordering::Equal => continue,
+                    std::cmp::Ordering::Greater => HalfJoinMatch::BeforeTime,
+                };
+                rows = half_join_dimension(&rows, dimension, index, matching);
+            }
+            streams.push(rows);
+        }
+
+        let result = concatenate(&mut self.scope, streams).map_named(
+            "join_many::result",
+            |(_join_keys, parts)| {
+                let parts: Vec<(Key, Value)> = parts
+                    .into_iter()
+                    .map(|part| part.expect("all inputs of a delta join should be matched"))
+                    .collect();
+                join_many_result(&parts)
+            },
+        );
+        Ok(self
+            .tables
+            .alloc(Table::from_collection(result).with_properties(table_properties)))
+    }
+
     #[allow(clippy::too_many_lines)]
     fn deduplicate(
         &mut self,
@@ -3240,6 +3849,39 @@ where
             .tables
             .alloc(Table::from_collection(new_values_persisted).with_properties(table_properties)))
     }
+
+    fn order_statistics_table(
+        &mut self,
+        table_handle: TableHandle,
+        key_column_path: ColumnPath,
+        instance_column_path: ColumnPath,
+        output: OrderStatisticsOutput,
+        table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle> {
+        let table = self
+            .tables
+            .get(table_handle)
+            .ok_or(Error::InvalidTableHandle)?;
+
+        let error_reporter = self.error_reporter.clone();
+
+        let new_values = table
+            .values()
+            .map_named("order_statistics_table::rows", move |(id, values)| {
+                let instance = instance_column_path
+                    .extract(&id, &values)
+                    .unwrap_with_reporter(&error_reporter);
+                let key = key_column_path
+                    .extract(&id, &values)
+                    .unwrap_with_reporter(&error_reporter);
+                (instance, key, id, values)
+            })
+            .order_statistics_named("order_statistics_table::order_statistics", output);
+
+        Ok(self
+            .tables
+            .alloc(Table::from_collection(new_values).with_properties(table_properties)))
+    }
 }
 
 #[derive(Debug, Clone)]
@@ -3288,6 +3930,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
         mut reader: Box<dyn ReaderBuilder>,
         parser: Box<dyn Parser>,
         commit_duration: Option<Duration>,
+        single_logical_time: bool,
         parallel_readers: usize,
         table_properties: Arc<TableProperties>,
         external_persistent_id: Option<&ExternalPersistentId>,
@@ -3338,6 +3981,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
 
             let connector = Connector::new(
                 commit_duration,
+                single_logical_time,
                 parser.column_count(),
                 self.terminate_on_error,
                 self.create_error_logger()?.into(),
@@ -3748,6 +4392,22 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
                 return Err(Error::IterationLimitTooSmall);
             }
         }
+        let monitor = Rc::new(RefCell::new(IterateMonitor::default()));
+        for (universe_handle, _column_handles) in iterated.iter().chain(&iterated_with_universe) {
+            let universe = self
+                .universes
+                .get(*universe_handle)
+                .ok_or(Error::InvalidUniverseHandle)?;
+            let monitor = monitor.clone();
+            universe
+                .keys()
+                .inner
+                .inspect_batch(move |_capability_time, data| {
+                    for (_key, time, _diff) in data {
+                        monitor.borrow_mut().start(hash_outer_time(time));
+                    }
+                });
+        }
         scope.iterative::<u32, _, _>(|subscope| {
             #[allow(clippy::default_trait_access)] // not really more readable
             let step = Product::new(Default::default(), 1);
@@ -3758,6 +4418,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
                 self.config.clone(),
                 self.terminate_on_error,
                 self.current_error_log.clone(),
+                self.operator_metrics.clone(),
             )?;
             let mut subgraph_ref = subgraph.0.borrow_mut();
             let mut state = BeforeIterate::new(self, &mut subgraph_ref, step);
@@ -3776,8 +4437,10 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
                 iterated_with_universe_handles,
                 extra_handles,
             )?;
+            // statistics of iterates nested in this one are reported together with it
+            let nested_monitors = take(&mut subgraph.0.borrow_mut().iterate_monitors);
             let subgraph_ref = subgraph.0.borrow();
-            let mut state = AfterIterate::new(self, &subgraph_ref, limit);
+            let mut state = AfterIterate::new(self, &subgraph_ref, limit, monitor.clone());
             let result = result
                 .into_iter()
                 .zip_longest(inner_iterated)
@@ -3796,6 +4459,8 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
                     inner_table.finish(&mut state, universe_handle, column_handles)
                 })
                 .collect::<Result<_>>()?;
+            self.iterate_monitors.push(monitor);
+            self.iterate_monitors.extend(nested_monitors);
             Ok((result, result_with_universe))
         })
     }
@@ -3977,6 +4642,7 @@ impl<'c, S: MaybeTotalScope> InnerUniverse
             .get(inner_handle)
             .ok_or(Error::InvalidUniverseHandle)?;
         let keys = universe.keys_consolidated();
+        state.monitor_rounds(keys);
         self.keys_var.set(&state.apply_limit(keys));
         // arrange consolidates the output
         let outer_handle = state
@@ -4109,6 +4775,7 @@ impl<'c, S: MaybeTotalScope> IteratedColumn<S, Child<'c, S, Product<S::Timestamp
             .get(inner_handle)
             .ok_or(Error::InvalidColumnHandle)?;
         let values = column.values_consolidated();
+        state.monitor_rounds(values);
         self.values_var.set(&state.apply_limit(values));
         // arrange consolidates the output
         let outer_handle = state.outer.columns.alloc(Column::from_arranged(
@@ -4217,6 +4884,7 @@ struct AfterIterate<'g, O: MaybeTotalScope, I: MaybeTotalScope> {
     outer: &'g mut DataflowGraphInner<O>,
     inner: &'g DataflowGraphInner<I>,
     limit: Option<u32>,
+    monitor: Rc<RefCell<IterateMonitor>>,
 }
 
 impl<'g, 'c, S: MaybeTotalScope> AfterIterate<'g, S, Child<'c, S, Product<S::Timestamp, u32>>> {
@@ -4224,14 +4892,52 @@ impl<'g, 'c, S: MaybeTotalScope> AfterIterate<'g, S, Child<'c, S, Product<S::Tim
         outer: &'g mut DataflowGraphInner<S>,
         inner: &'g DataflowGraphInner<Child<'c, S, Product<S::MaybeTotalTimestamp, u32>>>,
         limit: Option<u32>,
+        monitor: Rc<RefCell<IterateMonitor>>,
     ) -> Self {
         Self {
             outer,
             inner,
             limit,
+            monitor,
         }
     }
 
+    fn monitor_rounds<D>(
+        &self,
+        collection: &Collection<Child<'c, S, Product<S::Timestamp, u32>>, D>,
+    ) where
+        D: Data,
+    {
+        let monitor = self.monitor.clone();
+        let mut observe = move |time: &Product<S::Timestamp, u32>, rows: u64| {
+            monitor
+                .borrow_mut()
+                .observe(hash_outer_time(&time.outer), time.inner, rows);
+        };
+        collection
+            .inner
+            .inspect_batch(move |_capability_time, data| {
+                let mut current: Option<(&Product<S::Timestamp, u32>, u64)> = None;
+                for (_data, time, diff) in data {
+                    let rows = diff.unsigned_abs() as u64;
+                    match &mut current {
+                        Some((current_time, current_rows)) if *current_time == time => {
+                            *current_rows += rows;
+                        }
+                        _ => {
+                            if let Some((current_time, current_rows)) = current {
+                                observe(current_time, current_rows);
+                            }
+                            current = Some((time, rows));
+                        }
+                    }
+                }
+                if let Some((current_time, current_rows)) = current {
+                    observe(current_time, current_rows);
+                }
+            });
+    }
+
     fn apply_limit<'a, D>(
         &self,
         collection: &'a Collection<Child<'c, S, Product<S::Timestamp, u32>>, D>,
@@ -4284,6 +4990,7 @@ impl<S: MaybeTotalScope> InnerDataflowGraph<S> {
         config: Arc<Config>,
         terminate_on_error: bool,
         default_error_log: Option<ErrorLog>,
+        operator_metrics: Option<OperatorMetricsRecorder>,
     ) -> Result<Self> {
         Ok(Self(RefCell::new(DataflowGraphInner::new(
             scope,
@@ -4293,6 +5000,7 @@ impl<S: MaybeTotalScope> InnerDataflowGraph<S> {
             config,
             terminate_on_error,
             default_error_log,
+            operator_metrics,
         )?)))
     }
 }
@@ -4382,6 +5090,7 @@ where
         table_handle: TableHandle,
         column_paths: Vec<ColumnPath>,
         expressions: Vec<ExpressionData>,
+        shared_expressions: Vec<(usize, ExpressionData)>,
         wrapper: BatchWrapper,
         deterministic: bool,
     ) -> Result<TableHandle> {
@@ -4390,6 +5099,7 @@ where
                 table_handle,
                 column_paths,
                 expressions,
+                shared_expressions,
                 wrapper,
                 deterministic,
             )
@@ -4617,6 +5327,28 @@ where
         Err(Error::NotSupportedInIteration)
     }
 
+    fn rank_table(
+        &self,
+        _table_handle: TableHandle,
+        _key_column_path: ColumnPath,
+        _instance_column_path: ColumnPath,
+        _table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle> {
+        Err(Error::NotSupportedInIteration)
+    }
+
+    fn limit_table(
+        &self,
+        _table_handle: TableHandle,
+        _key_column_path: ColumnPath,
+        _instance_column_path: ColumnPath,
+        _offset: usize,
+        _limit: usize,
+        _table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle> {
+        Err(Error::NotSupportedInIteration)
+    }
+
     fn reindex_table(
         &self,
         table_handle: TableHandle,
@@ -4664,6 +5396,7 @@ where
         reducers: Vec<ReducerData>,
         set_id: bool,
         table_properties: Arc<TableProperties>,
+        skew_split: usize,
     ) -> Result<TableHandle> {
         self.0.borrow_mut().group_by_table(
             table_handle,
@@ -4672,6 +5405,7 @@ where
             reducers,
             set_id,
             table_properties,
+            skew_split,
         )
     }
 
@@ -4745,6 +5479,7 @@ where
         shard_policy: ShardPolicy,
         join_type: JoinType,
         table_properties: Arc<TableProperties>,
+        skew_split: usize,
     ) -> Result<TableHandle> {
         self.0.borrow_mut().join_tables(
             left_data,
@@ -4752,6 +5487,24 @@ where
             shard_policy,
             join_type,
             table_properties,
+            skew_split,
+        )
+    }
+
+    fn join_many(
+        &self,
+        base_table_handle: TableHandle,
+        base_column_paths: Vec<Vec<ColumnPath>>,
+        dimensions: Vec<JoinData>,
+        shard_policy: ShardPolicy,
+        table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle> {
+        self.0.borrow_mut().join_many(
+            base_table_handle,
+            base_column_paths,
+            dimensions,
+            shard_policy,
+            table_properties,
         )
     }
 
@@ -4788,6 +5541,7 @@ where
         _reader: Box<dyn ReaderBuilder>,
         _parser: Box<dyn Parser>,
         _commit_duration: Option<Duration>,
+        _single_logical_time: bool,
         _parallel_readers: usize,
         _table_properties: Arc<TableProperties>,
         _external_persistent_id: Option<&ExternalPersistentId>,
@@ -4871,6 +5625,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> OuterDataflowGraph<S>
         persistence_config: Option<PersistenceManagerOuterConfig>,
         config: Arc<Config>,
         terminate_on_error: bool,
+        operator_metrics: Option<OperatorMetricsRecorder>,
     ) -> Result<Self> {
         let worker_idx = scope.index();
         let total_workers = scope.peers();
@@ -4889,6 +5644,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> OuterDataflowGraph<S>
             config,
             terminate_on_error,
             None,
+            operator_metrics,
         )?)))
     }
 }
@@ -4975,6 +5731,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
         table_handle: TableHandle,
         column_paths: Vec<ColumnPath>,
         expressions: Vec<ExpressionData>,
+        shared_expressions: Vec<(usize, ExpressionData)>,
         wrapper: BatchWrapper,
         deterministic: bool,
     ) -> Result<TableHandle> {
@@ -4982,6 +5739,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
             table_handle,
             column_paths,
             expressions,
+            shared_expressions,
             wrapper,
             deterministic,
         )
@@ -5237,6 +5995,40 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
         )
     }
 
+    fn rank_table(
+        &self,
+        table_handle: TableHandle,
+        key_column_path: ColumnPath,
+        instance_column_path: ColumnPath,
+        table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle> {
+        self.0.borrow_mut().order_statistics_table(
+            table_handle,
+            key_column_path,
+            instance_column_path,
+            OrderStatisticsOutput::Rank,
+            table_properties,
+        )
+    }
+
+    fn limit_table(
+        &self,
+        table_handle: TableHandle,
+        key_column_path: ColumnPath,
+        instance_column_path: ColumnPath,
+        offset: usize,
+        limit: usize,
+        table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle> {
+        self.0.borrow_mut().order_statistics_table(
+            table_handle,
+            key_column_path,
+            instance_column_path,
+            OrderStatisticsOutput::Page { offset, limit },
+            table_properties,
+        )
+    }
+
     fn reindex_table(
         &self,
         table_handle: TableHandle,
@@ -5284,6 +6076,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
         reducers: Vec<ReducerData>,
         set_id: bool,
         table_properties: Arc<TableProperties>,
+        skew_split: usize,
     ) -> Result<TableHandle> {
         self.0.borrow_mut().group_by_table(
             table_handle,
@@ -5292,6 +6085,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
             reducers,
             set_id,
             table_properties,
+            skew_split,
         )
     }
 
@@ -5372,6 +6166,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
         shard_policy: ShardPolicy,
         join_type: JoinType,
         table_properties: Arc<TableProperties>,
+        skew_split: usize,
     ) -> Result<TableHandle> {
         self.0.borrow_mut().join_tables(
             left_data,
@@ -5379,6 +6174,24 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
             shard_policy,
             join_type,
             table_properties,
+            skew_split,
+        )
+    }
+
+    fn join_many(
+        &self,
+        base_table_handle: TableHandle,
+        base_column_paths: Vec<Vec<ColumnPath>>,
+        dimensions: Vec<JoinData>,
+        shard_policy: ShardPolicy,
+        table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle> {
+        self.0.borrow_mut().join_many_delta(
+            base_table_handle,
+            base_column_paths,
+            dimensions,
+            shard_policy,
+            table_properties,
         )
     }
 
@@ -5417,6 +6230,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
         reader: Box<dyn ReaderBuilder>,
         parser: Box<dyn Parser>,
         commit_duration: Option<Duration>,
+        single_logical_time: bool,
         parallel_readers: usize,
         table_properties: Arc<TableProperties>,
         external_persistent_id: Option<&ExternalPersistentId>,
@@ -5425,6 +6239,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
             reader,
             parser,
             commit_duration,
+            single_logical_time,
             parallel_readers,
             table_properties,
             external_persistent_id,
@@ -5516,6 +6331,7 @@ pub fn run_with_new_dataflow_graph<R, R2>(
     #[allow(unused)] license: &License,
     telemetry_config: TelemetryConfig,
     terminate_on_error: bool,
+    operator_metrics: Option<Arc<OperatorMetricsRegistry>>,
 ) -> Result<Vec<R2>>
 where
     R: 'static,
@@ -5535,8 +6351,24 @@ where
     let failed = Arc::new(AtomicBool::new(false));
     let failed_2 = failed.clone();
 
-    let guards = execute(config.to_timely_config(), move |worker| {
+    // Per-operator metrics are exported by the http server only on request. Recording
+    // them adds a few clock reads and counter updates to every activation of every
+    // operator and the endpoint exports a series per (operator, worker) pair and metric.
+    let export_operator_metrics =
+        with_http_server && env::var("PATHWAY_OPERATOR_METRICS").is_ok_and(|v| v == "1");
+    let operator_metrics = operator_metrics.or_else(|| export_operator_metrics.then(Arc::default));
+    let communication_log_fn: CommunicationLogFn = match &operator_metrics {
+        Some(operator_metrics) => operator_metrics.communication_log_fn(),
+        None => Box::new(|_| None),
+    };
+
+    let worker_config = config.clone();
+    let guards = Config::execute(&config, communication_log_fn, move |worker| {
         catch_unwind(AssertUnwindSafe(|| {
+            pin_worker_thread(worker.index() % worker_config.threads());
+            let operator_metrics_recorder = operator_metrics
+                .clone()
+                .map(|registry| OperatorMetricsRecorder::register(worker, registry));
             if let Ok(addr) = env::var("DIFFERENTIAL_LOG_ADDR") {
                 if let Ok(stream) = std::net::TcpStream::connect(&addr) {
                     differential_dataflow::logging::enable(worker, stream);
@@ -5552,6 +6384,7 @@ where
                 mut pollers,
                 connector_threads,
                 connector_monitors,
+                iterate_monitors,
                 input_probe,
                 output_probe,
                 intermediate_probes,
@@ -5565,16 +6398,21 @@ where
                     error_reporter.clone(),
                     ignore_asserts,
                     persistence_config.clone(),
-                    config.clone(),
+                    worker_config.clone(),
                     terminate_on_error,
+                    operator_metrics_recorder.clone(),
                 )
                 .unwrap_with_reporter(&error_reporter);
                 let telemetry_runner = maybe_run_telemetry_thread(&graph, telemetry_config.clone());
                 let res = logic(&graph).unwrap_with_reporter(&error_reporter);
                 let progress_reporter_runner =
                     maybe_run_reporter(&monitoring_level, &graph, stats_monitor.clone());
-                let http_server_runner =
-                    maybe_run_http_server_thread(with_http_server, &graph, config.process_id());
+                let http_server_runner = maybe_run_http_server_thread(
+                    with_http_server,
+                    &graph,
+                    worker_config.process_id(),
+                    operator_metrics.clone(),
+                );
                 let graph = graph.0.into_inner();
                 (
                     res,
@@ -5582,6 +6420,7 @@ where
                     graph.pollers,
                     graph.connector_threads,
                     graph.connector_monitors,
+                    graph.iterate_monitors,
                     graph.input_probe,
                     graph.output_probe,
                     graph.probes,
@@ -5603,6 +6442,7 @@ where
                         &output_probe,
                         &intermediate_probes,
                         &connector_monitors,
+                        &iterate_monitors,
                     );
                 }
 
@@ -5659,6 +6499,7 @@ where
                     &output_probe,
                     &intermediate_probes,
                     &connector_monitors,
+                    &iterate_monitors,
                 );
             }
 
@@ -1,15 +1,39 @@
 // Copyright © 2024 Pathway
 
+use std::any::Any;
+use std::env;
+use std::net::TcpStream;
+use std::path::PathBuf;
+use std::time::{Duration, Instant};
+
 use crate::env::{parse_env_var, parse_env_var_required, Error as EnvError};
-use log::warn;
+use log::{info, warn};
+use timely::communication::allocator::zero_copy::initialize::initialize_networking_from_sockets;
+use timely::communication::allocator::GenericBuilder;
+use timely::communication::logging::{CommunicationEvent, CommunicationSetup};
+use timely::communication::{Allocator, WorkerGuards};
+use timely::dataflow::operators::capture::EventWriterCore;
+use timely::execute::execute_from;
+use timely::logging::{BatchLogger, TimelyEvent};
+use timely::logging_core::Logger;
+use timely::worker::Worker;
 use timely::{CommunicationConfig, Config as TimelyConfig, WorkerConfig};
 
+use super::transport::{create_unix_sockets, unix_socket_path, Transport};
+
 const MAX_WORKERS: usize = if cfg!(feature = "unlimited-workers") {
     usize::MAX
 } else {
     8
 };
 
+/// Creates loggers of the threads sending and receiving data between processes.
+pub type CommunicationLogFn = Box<
+    dyn Fn(CommunicationSetup) -> Option<Logger<CommunicationEvent, CommunicationSetup>>
+        + Send
+        + Sync,
+>;
+
 #[derive(Debug, thiserror::Error)]
 #[non_exhaustive]
 pub enum Error {
@@ -30,6 +54,7 @@ pub enum Error {
 enum Processes {
     Single,
     Multi(Vec<String>),
+    MultiUnix(Vec<PathBuf>),
 }
 
 #[derive(Clone, Debug)]
@@ -53,6 +78,7 @@ impl Config {
         match &self.processes {
             Processes::Single => 1,
             Processes::Multi(addresses) => addresses.len(),
+            Processes::MultiUnix(paths) => paths.len(),
         }
     }
 
@@ -60,7 +86,7 @@ impl Config {
         self.process_id
     }
 
-    pub fn to_timely_config(&self) -> TimelyConfig {
+    fn to_timely_config(&self, log_fn: CommunicationLogFn) -> TimelyConfig {
         match &self.processes {
             Processes::Single => {
                 if self.threads > 1 {
@@ -77,14 +103,49 @@ impl Config {
                         process: self.process_id,
                         addresses: addresses.clone(),
                         report: false,
-                        log_fn: Box::new(|_| None),
+                        log_fn,
                     },
                     worker: WorkerConfig::default(),
                 }
             }
+            Processes::MultiUnix(_) => unreachable!("Unix sockets are set up in execute"),
         }
     }
 
+    /// Starts the workers, like `timely::execute`, including its logging to
+    /// `TIMELY_WORKER_LOG_ADDR` and `TIMELY_COMM_LOG_ADDR`.
+    pub fn execute<T, F>(
+        &self,
+        log_fn: CommunicationLogFn,
+        func: F,
+    ) -> Result<WorkerGuards<T>, String>
+    where
+        T: Send + 'static,
+        F: Fn(&mut Worker<Allocator>) -> T + Send + Sync + 'static,
+    {
+        let log_fn = with_timely_communication_log(log_fn);
+        let (builders, others): (Vec<GenericBuilder>, Box<dyn Any + Send>) =
+            if let Processes::MultiUnix(paths) = &self.processes {
+                let sockets = create_unix_sockets(paths, self.process_id)
+                    .map_err(|error| format!("failed to initialize networking: {error}"))?;
+                let (builders, guard) = initialize_networking_from_sockets(
+                    sockets,
+                    self.process_id,
+                    self.threads,
+                    log_fn,
+                )
+                .map_err(|error| format!("failed to initialize networking: {error}"))?;
+                let builders = builders.into_iter().map(GenericBuilder::ZeroCopy).collect();
+                (builders, Box::new(guard))
+            } else {
+                self.to_timely_config(log_fn).communication.try_build()?
+            };
+        execute_from(builders, others, WorkerConfig::default(), move |worker| {
+            register_timely_worker_log(worker);
+            func(worker)
+        })
+    }
+
     pub fn from_env() -> Result<Self, Error> {
         let mut threads: usize = parse_env_var("PATHWAY_THREADS")?.unwrap_or(1);
         if threads == 0 {
@@ -111,10 +172,28 @@ impl Config {
                 return Err(Error::InvalidId(process_id));
             }
             let first_port: usize = parse_env_var_required("PATHWAY_FIRST_PORT")?;
-            let addresses = (0..processes)
-                .map(|id| format!("127.0.0.1:{}", first_port + id))
-                .collect();
-            (process_id, Processes::Multi(addresses))
+            // all processes run on the same host, so they can skip the TCP stack
+            let transport = parse_env_var("PATHWAY_TRANSPORT")?.unwrap_or(Transport::Unix);
+            let processes = match transport {
+                Transport::Tcp => Processes::Multi(
+                    (0..processes)
+                        .map(|id| format!("127.0.0.1:{}", first_port + id))
+                        .collect(),
+                ),
+                Transport::Unix => {
+                    let run_id: String =
+                        parse_env_var("PATHWAY_RUN_ID")?.unwrap_or_else(|| "run".to_string());
+                    Processes::MultiUnix(
+                        (0..processes)
+                            .map(|id| unix_socket_path(&run_id, first_port, id))
+                            .collect(),
+                    )
+                }
+            };
+            if process_id == 0 {
+                info!("Processes communicate using {transport:?} transport");
+            }
+            (process_id, processes)
         } else {
             (0, Processes::Single)
         };
@@ -126,3 +205,40 @@ impl Config {
         })
     }
 }
+
+/// Sends the communication events to `TIMELY_COMM_LOG_ADDR` if it is set, in place of
+/// `log_fn`, as `timely::execute` does.
+fn with_timely_communication_log(log_fn: CommunicationLogFn) -> CommunicationLogFn {
+    let Ok(addr) = env::var("TIMELY_COMM_LOG_ADDR") else {
+        return log_fn;
+    };
+    info!("Logging communication events to {addr}");
+    Box::new(move |setup| {
+        let stream = TcpStream::connect(&addr).unwrap_or_else(|error| {
+            panic!("Could not connect to communication log address {addr:?}: {error}")
+        });
+        let mut logger = BatchLogger::new(EventWriterCore::new(stream));
+        Some(Logger::new(
+            Instant::now(),
+            Duration::default(),
+            setup,
+            move |time, data| logger.publish_batch(time, data),
+        ))
+    })
+}
+
+/// Sends the timely events of the worker to `TIMELY_WORKER_LOG_ADDR` if it is set, as
+/// `timely::execute` does.
+fn register_timely_worker_log(worker: &mut Worker<Allocator>) {
+    let Ok(addr) = env::var("TIMELY_WORKER_LOG_ADDR") else {
+        return;
+    };
+    let stream = TcpStream::connect(&addr)
+        .unwrap_or_else(|error| panic!("Could not connect logging stream to {addr:?}: {error}"));
+    let mut logger = BatchLogger::new(EventWriterCore::new(stream));
+    worker
+        .log_register()
+        .insert::<TimelyEvent, _>("timely", move |time, data| {
+            logger.publish_batch(time, data);
+        });
+}
@@ -0,0 +1,448 @@
+// Copyright © 2024 Pathway
+
+//! Per-operator metrics gathered from timely and differential logging.
+//!
+//! Timely operators are attributed to the Pathway operator that was being built when
+//! they were created. Before building a Pathway operator, a worker-unique timely
+//! identifier is allocated as a marker, so the timely operators with identifiers
+//! greater than the marker (and smaller than the next one) belong to that operator.
+//!
+//! Bytes sent to other processes are counted by the loggers of the communication
+//! threads, per exchange channel, and attributed to the operator receiving the data.
+//!
+//! Hot keys and the state spilled to disk are reported directly by the operators.
+
+use std::cell::RefCell;
+use std::collections::{HashMap, HashSet};
+use std::rc::Rc;
+use std::sync::{Arc, Mutex};
+use std::time::{Duration, Instant};
+
+use differential_dataflow::logging::DifferentialEvent;
+use timely::communication::logging::{CommunicationEvent, CommunicationSetup, MessageEvent};
+use timely::communication::Allocate;
+use timely::logging::{StartStop, TimelyEvent, WorkerIdentifier};
+use timely::logging_core::Logger;
+use timely::worker::Worker;
+
+use super::config::CommunicationLogFn;
+use super::spill::SpillStats;
+use crate::engine::OperatorMetrics;
+
+/// User-facing description of a Pathway operator.
+#[derive(Debug, Clone)]
+pub struct OperatorLabels {
+    pub name: String,
+    pub location: Option<String>,
+}
+
+/// Metrics of Pathway operators on the workers of this process.
+#[derive(Debug, Default)]
+pub struct OperatorMetricsRegistry {
+    // keyed by (Pathway operator id, worker index)
+    metrics: Mutex<HashMap<(usize, usize), OperatorMetrics>>,
+    labels: Mutex<HashMap<usize, OperatorLabels>>,
+    // exchange channel -> Pathway operator receiving its data
+    channels: Mutex<HashMap<usize, usize>>,
+}
+
+impl OperatorMetricsRegistry {
+    /// Metrics of every operator, summed over the workers.
+    pub fn snapshot(&self) -> HashMap<usize, OperatorMetrics> {
+        let mut snapshot: HashMap<usize, OperatorMetrics> = HashMap::new();
+        for ((operator_id, _worker), metrics) in self.metrics.lock().unwrap().iter() {
+            snapshot.entry(*operator_id).or_default().add(metrics);
+        }
+        snapshot
+    }
+
+    /// Metrics of every operator on every worker, with the labels of the operator.
+    pub fn snapshot_per_worker(
+        &self,
+    ) -> Vec<(usize, usize, Option<OperatorLabels>, OperatorMetrics)> {
+        let labels = self.labels.lock().unwrap();
+        let mut snapshot: Vec<_> = self
+            .metrics
+            .lock()
+            .unwrap()
+            .iter()
+            .map(|((operator_id, worker), metrics)| {
+                (
+                    *operator_id,
+                    *worker,
+                    labels.get(operator_id).cloned(),
+                    metrics.clone(),
+                )
+            })
+            .collect();
+        snapshot.sort_by_key(|(operator_id, worker, _labels, _metrics)| (*operator_id, *worker));
+        snapshot
+    }
+
+    /// Creates loggers of the threads sending data to other processes, which count the
+    /// bytes sent by every exchange channel.
+    pub fn communication_log_fn(self: &Arc<Self>) -> CommunicationLogFn {
+        let registry = self.clone();
+        Box::new(move |setup: CommunicationSetup| {
+            if !setup.sender {
+                return None;
+            }
+            let registry = registry.clone();
+            Some(Logger::new(
+                Instant::now(),
+                Duration::ZERO,
+                setup,
+                move |_time, events: &mut Vec<(Duration, CommunicationSetup, CommunicationEvent)>| {
+                    let mut sent: HashMap<(usize, usize), u64> = HashMap::new();
+                    for (_time, _setup, event) in events.drain(..) {
+                        if let CommunicationEvent::Message(MessageEvent {
+                            is_send: true,
+                            header,
+                        }) = event
+                        {
+                            *sent.entry((header.channel, header.source)).or_default() +=
+                                header.length as u64;
+                        }
+                    }
+                    registry.add_exchanged_bytes(sent);
+                },
+            ))
+        })
+    }
+
+    /// Creates a counter of the hot keys detected by the operator `operator_id` on the
+    /// worker `worker`.
+    pub fn hot_key_counter(self: &Arc<Self>, operator_id: usize, worker: usize) -> HotKeyCounter {
+        HotKeyCounter {
+            registry: self.clone(),
+            operator_id,
+            worker,
+        }
+    }
+
+    /// Creates a counter of the state spilled to disk by the operator `operator_id` on
+    /// the worker `worker`.
+    pub fn spill_counter(self: &Arc<Self>, operator_id: usize, worker: usize) -> SpillCounter {
+        SpillCounter {
+            registry: self.clone(),
+            operator_id,
+            worker,
+        }
+    }
+
+    fn update(&self, operator_id: usize, worker: usize, change: impl FnOnce(&mut OperatorMetrics)) {
+        change(
+            self.metrics
+                .lock()
+                .unwrap()
+                .entry((operator_id, worker))
+                .or_default(),
+        );
+    }
+
+    fn set_labels(&self, operator_id: usize, labels: OperatorLabels) {
+        self.labels.lock().unwrap().insert(operator_id, labels);
+    }
+
+    fn set_channel_operator(&self, channel: usize, operator_id: usize) {
+        self.channels.lock().unwrap().insert(channel, operator_id);
+    }
+
+    fn add(&self, worker: usize, updates: &mut HashMap<usize, OperatorMetrics>) {
+        if updates.is_empty() {
+            return;
+        }
+        let mut metrics = self.metrics.lock().unwrap();
+        for (operator_id, update) in updates.drain() {
+            metrics
+                .entry((operator_id, worker))
+                .or_default()
+                .add(&update);
+        }
+    }
+
+    fn add_exchanged_bytes(&self, sent: HashMap<(usize, usize), u64>) {
+        if sent.is_empty() {
+            return;
+        }
+        // other channels, like the ones of progress tracking, are not counted
+        let channels = self.channels.lock().unwrap();
+        let mut metrics = self.metrics.lock().unwrap();
+        for ((channel, worker), bytes) in sent {
+            if let Some(operator_id) = channels.get(&channel) {
+                metrics
+                    .entry((*operator_id, worker))
+                    .or_default()
+                    .exchanged_bytes += bytes;
+            }
+        }
+    }
+}
+
+/// Counts the hot keys detected by a Pathway operator on a worker.
+#[derive(Clone)]
+pub struct HotKeyCounter {
+    registry: Arc<OperatorMetricsRegistry>,
+    operator_id: usize,
+    worker: usize,
+}
+
+impl HotKeyCounter {
+    pub fn report(&self) {
+        self.registry
+            .update(self.operator_id, self.worker, |metrics| {
+                metrics.hot_keys += 1;
+            });
+    }
+}
+
+/// Counts the bytes a Pathway operator on a worker spilled to disk and read back.
+#[derive(Clone)]
+pub struct SpillCounter {
+    registry: Arc<OperatorMetricsRegistry>,
+    operator_id: usize,
+    worker: usize,
+}
+
+impl SpillCounter {
+    pub fn report(&self, change: &SpillStats) {
+        self.registry
+            .update(self.operator_id, self.worker, |metrics| {
+                metrics.spilled_bytes += change.spilled_bytes;
+                metrics.spill_read_bytes += change.read_bytes;
+                metrics.spill_compacted_bytes += change.compacted_bytes;
+            });
+    }
+}
+
+struct Channel {
+    source: Vec<usize>,
+    target: Vec<usize>,
+    // an output connected to many operators sends the same rows to each of them,
+    // they are counted once, on the first channel of the output
+    counts_output: bool,
+}
+
+struct WorkerState {
+    worker: usize,
+    registry: Arc<OperatorMetricsRegistry>,
+    // (marker, Pathway operator id), in the order of markers
+    markers: Vec<(usize, usize)>,
+    addresses: HashMap<usize, Vec<usize>>,
+    operators: HashMap<Vec<usize>, usize>,
+    scopes: HashSet<Vec<usize>>,
+    channels: HashMap<usize, Channel>,
+    // channels not yet known to the registry, as their target operator wasn't created
+    unregistered_channels: Vec<usize>,
+    connected_outputs: HashSet<(Vec<usize>, usize)>,
+    // timely operators that built an arrangement
+    arranging_operators: HashSet<usize>,
+    running: Vec<(usize, Duration)>,
+    updates: HashMap<usize, OperatorMetrics>,
+}
+
+impl WorkerState {
+    fn pathway_operator(&self, timely_id: usize) -> Option<usize> {
+        let position = self
+            .markers
+            .partition_point(|(marker, _operator_id)| *marker < timely_id);
+        position
+            .checked_sub(1)
+            .map(|position| self.markers[position].1)
+    }
+
+    fn pathway_operator_at(&self, address: &[usize]) -> Option<usize> {
+        self.operators
+            .get(address)
+            .and_then(|timely_id| self.pathway_operator(*timely_id))
+    }
+
+    fn update(&mut self, timely_id: usize) -> Option<&mut OperatorMetrics> {
+        let operator_id = self.pathway_operator(timely_id)?;
+        Some(self.updates.entry(operator_id).or_default())
+    }
+
+    fn record_timely_event(&mut self, time: Duration, event: TimelyEvent) {
+        match event {
+            TimelyEvent::Operates(event) => {
+                if let Some((_index, scope)) = event.addr.split_last() {
+                    self.scopes.insert(scope.to_vec());
+                }
+                self.operators.insert(event.addr.clone(), event.id);
+                self.addresses.insert(event.id, event.addr);
+            }
+            TimelyEvent::Channels(event) => {
+                let mut source = event.scope_addr.clone();
+                source.push(event.source.0);
+                let mut target = event.scope_addr;
+                target.push(event.target.0);
+                let counts_output = self
+                    .connected_outputs
+                    .insert((source.clone(), event.source.1));
+                self.unregistered_channels.push(event.id);
+                self.channels.insert(
+                    event.id,
+                    Channel {
+                        source,
+                        target,
+                        counts_output,
+                    },
+                );
+            }
+            TimelyEvent::Messages(event) => {
+                let Some(channel) = self.channels.get(&event.channel) else {
+                    return;
+                };
+                let rows = event.length as u64;
+                if event.is_send && channel.counts_output {
+                    if let Some(operator_id) = self.pathway_operator_at(&channel.source) {
+                        self.updates.entry(operator_id).or_default().rows_out += rows;
+                    }
+                } else if !event.is_send {
+                    if let Some(operator_id) = self.pathway_operator_at(&channel.target) {
+                        self.updates.entry(operator_id).or_default().rows_in += rows;
+                    }
+                }
+            }
+            TimelyEvent::Schedule(event) => match event.start_stop {
+                StartStop::Start => self.running.push((event.id, time)),
+                StartStop::Stop => {
+                    let Some((id, start)) = self.running.pop() else {
+                        return;
+                    };
+                    debug_assert_eq!(id, event.id);
+                    // time spent in a scope is the time of operators inside it
+                    let is_scope = self
+                        .addresses
+                        .get(&id)
+                        .is_some_and(|address| self.scopes.contains(address));
+                    if !is_scope {
+                        if let Some(update) = self.update(id) {
+                            update.processing_time_ns +=
+                                time.saturating_sub(start).as_nanos() as u64;
+                        }
+                    }
+                }
+            },
+            _ => {}
+        }
+    }
+
+    fn record_differential_event(&mut self, event: DifferentialEvent) {
+        // (operator, change of the number of records, change of the number of batches)
+        let (operator, records, batches) = match event {
+            DifferentialEvent::Batch(event) => {
+                if self.arranging_operators.insert(event.operator) {
+                    if let Some(update) = self.update(event.operator) {
+                        update.arrangements += 1;
+                    }
+                }
+                (event.operator, event.length as i64, 1)
+            }
+            DifferentialEvent::Merge(event) => match event.complete {
+                Some(length) => (
+                    event.operator,
+                    length as i64 - (event.length1 + event.length2) as i64,
+                    -1,
+                ),
+                None => return,
+            },
+            DifferentialEvent::Drop(event) => (event.operator, -(event.length as i64), -1),
+            _ => return,
+        };
+        if let Some(update) = self.update(operator) {
+            update.arranged_records += records;
+            update.arranged_batches += batches;
+        }
+    }
+
+    fn flush(&mut self) {
+        let mut unregistered_channels = std::mem::take(&mut self.unregistered_channels);
+        unregistered_channels.retain(|channel| {
+            let target = &self.channels[channel].target;
+            let Some(operator_id) = self.pathway_operator_at(target) else {
+                return true;
+            };
+            self.registry.set_channel_operator(*channel, operator_id);
+            false
+        });
+        self.unregistered_channels = unregistered_channels;
+        self.registry.add(self.worker, &mut self.updates);
+    }
+}
+
+/// Gathers metrics of the operators of a single worker.
+#[derive(Clone)]
+pub struct OperatorMetricsRecorder {
+    state: Rc<RefCell<WorkerState>>,
+}
+
+impl OperatorMetricsRecorder {
+    /// Registers timely and differential loggers of `worker`, so it has to be called
+    /// before any dataflow is built.
+    pub fn register<A: Allocate>(
+        worker: &mut Worker<A>,
+        registry: Arc<OperatorMetricsRegistry>,
+    ) -> Self {
+        let state = Rc::new(RefCell::new(WorkerState {
+            worker: worker.index(),
+            registry,
+            markers: Vec::new(),
+            addresses: HashMap::new(),
+            operators: HashMap::new(),
+            scopes: HashSet::new(),
+            channels: HashMap::new(),
+            unregistered_channels: Vec::new(),
+            connected_outputs: HashSet::new(),
+            arranging_operators: HashSet::new(),
+            running: Vec::new(),
+            updates: HashMap::new(),
+        }));
+        let mut register = worker.log_register();
+        {
+            let state = state.clone();
+            register.insert::<TimelyEvent, _>(
+                "timely",
+                move |_time, events: &mut Vec<(Duration, WorkerIdentifier, TimelyEvent)>| {
+                    let mut state = state.borrow_mut();
+                    for (time, _worker, event) in events.drain(..) {
+                        state.record_timely_event(time, event);
+                    }
+                    state.flush();
+                },
+            );
+        }
+        {
+            let state = state.clone();
+            register.insert::<DifferentialEvent, _>(
+                "differential/arrange",
+                move |_time, events: &mut Vec<(Duration, WorkerIdentifier, DifferentialEvent)>| {
+                    let mut state = state.borrow_mut();
+                    for (_time, _worker, event) in events.drain(..) {
+                        state.record_differential_event(event);
+                    }
+                    state.flush();
+                },
+            );
+        }
+        Self { state }
+    }
+
+    pub fn hot_key_counter(&self, operator_id: usize) -> HotKeyCounter {
+        let state = self.state.borrow();
+        state.registry.hot_key_counter(operator_id, state.worker)
+    }
+
+    pub fn spill_counter(&self, operator_id: usize) -> SpillCounter {
+        let state = self.state.borrow();
+        state.registry.spill_counter(operator_id, state.worker)
+    }
+
+    /// Attributes timely operators with identifiers greater than `marker` to the
+    /// Pathway operator `operator_id`.
+    pub fn start_operator(&self, marker: usize, operator_id: usize, labels: OperatorLabels) {
+        let mut state = self.state.borrow_mut();
+        state.markers.push((marker, operator_id));
+        state.registry.set_labels(operator_id, labels);
+    }
+}
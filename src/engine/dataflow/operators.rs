@@ -2,6 +2,8 @@
 
 pub mod external_index;
 pub mod gradual_broadcast;
+pub mod half_join;
+pub mod order_statistics;
 pub mod output;
 pub mod prev_next;
 pub mod stateful_reduce;
@@ -9,10 +11,11 @@ pub mod time_column;
 mod utils;
 
 use std::any::type_name;
-use std::collections::HashMap;
 use std::hash::Hash;
+use std::io;
 use std::panic::Location;
 
+use differential_dataflow::consolidation::consolidate_updates;
 use differential_dataflow::difference::{Monoid, Semigroup};
 use differential_dataflow::operators::arrange::{Arranged, TraceAgent};
 use differential_dataflow::trace::{Batch, Trace, TraceReader};
@@ -22,15 +25,18 @@ use futures::StreamExt;
 use futures::{future, Future};
 use timely::dataflow::channels::pact::{Exchange, Pipeline};
 use timely::dataflow::operators::Exchange as _;
-use timely::dataflow::operators::Operator;
+use timely::dataflow::operators::{Capability, Operator};
 
 use crate::engine::dataflow::operators::output::OutputBatch;
-use crate::engine::BatchWrapper;
+use crate::engine::report_error::{ReportError, UnwrapWithReporter};
+use crate::engine::{BatchWrapper, Error};
 
 use self::output::ConsolidateForOutput;
 
 use super::maybe_total::{MaybeTotalScope, MaybeTotalSwitch};
+use super::operator_metrics::SpillCounter;
 use super::shard::Shard;
+use super::spill::SpillableMap;
 use super::ArrangedBySelf;
 
 pub trait ArrangeWithTypes<S, K, V, R>
@@ -305,25 +311,36 @@ where
     }
 }
 
+fn spill_failed<K, V>(cache: &SpillableMap<K, V>, error: io::Error) -> Error {
+    Error::SpillFailed {
+        name: cache.name().to_string(),
+        source: error,
+    }
+}
+
 pub trait MapWithConsistentDeletions<S, K, V, R>
 where
     S: MaybeTotalScope,
     R: Monoid + ExchangeData,
 {
-    fn map_named_with_consistent_deletions<V2: Data>(
+    fn map_named_with_consistent_deletions<V2: ExchangeData>(
         &self,
         name: &str,
         wrapper: BatchWrapper,
+        error_reporter: impl ReportError + 'static,
+        spill_counter: Option<SpillCounter>,
         logic: impl FnMut((K, V)) -> (K, V2) + 'static,
     ) -> Collection<S, (K, V2), R>;
 
     fn map_named_async_with_consistent_deletions<F: Future>(
         &self,
         name: &str,
+        error_reporter: impl ReportError + 'static,
+        spill_counter: Option<SpillCounter>,
         logic: impl Fn((K, V)) -> F + 'static,
     ) -> Collection<S, F::Output, R>
     where
-        F::Output: Data;
+        F::Output: ExchangeData;
 }
 
 impl<S, K, V, R> MapWithConsistentDeletions<S, K, V, R> for Collection<S, (K, V), R>
@@ -335,15 +352,17 @@ where
     R: Monoid + ExchangeData,
 {
     #[track_caller]
-    fn map_named_with_consistent_deletions<V2: Data>(
+    fn map_named_with_consistent_deletions<V2: ExchangeData>(
         &self,
         name: &str,
         wrapper: BatchWrapper,
+        error_reporter: impl ReportError + 'static,
+        spill_counter: Option<SpillCounter>,
         mut logic: impl FnMut((K, V)) -> (K, V2) + 'static,
     ) -> Collection<S, (K, V2), R> {
         let caller = Location::caller();
         let name = format!("{name} at {caller}");
-        let mut cache: HashMap<K, V2> = HashMap::new();
+        let mut cache: SpillableMap<K, V2> = SpillableMap::new(&name).with_counter(spill_counter);
         self.consolidate_for_output_named(&format!("ConsolidateForOutput: {name}"), false)
             .unary(Pipeline, &name, move |_, _| {
                 let mut vector = Vec::new();
@@ -358,11 +377,15 @@ where
                                         let result = if diff < Monoid::zero() {
                                             cache
                                                 .remove(&key)
+                                                .map_err(|error| spill_failed(&cache, error))
+                                                .unwrap_with_reporter(&error_reporter)
                                                 .expect("result for negative diff should be stored")
-                                                .clone()
                                         } else {
                                             let (_, result_value) = logic((key.clone(), value));
-                                            cache.insert(key.clone(), result_value.clone());
+                                            cache
+                                                .insert(key.clone(), result_value.clone())
+                                                .map_err(|error| spill_failed(&cache, error))
+                                                .unwrap_with_reporter(&error_reporter);
                                             result_value
                                         };
                                         ((key, result), time.clone(), diff)
@@ -380,15 +403,18 @@ where
     fn map_named_async_with_consistent_deletions<F: Future>(
         &self,
         name: &str,
+        error_reporter: impl ReportError + 'static,
+        spill_counter: Option<SpillCounter>,
         logic: impl Fn((K, V)) -> F + 'static,
     ) -> Collection<S, F::Output, R>
     where
-        F::Output: Data,
+        F::Output: ExchangeData,
     {
         let caller = Location::caller();
         let name = format!("{name} at {caller}");
         let mut buffer = Vec::new();
-        let mut cache: HashMap<K, F::Output> = HashMap::new();
+        let mut cache: SpillableMap<K, F::Output> =
+            SpillableMap::new(&name).with_counter(spill_counter);
         self.consolidate_for_output_named(&format!("ConsolidateForOutput: {name}"), false)
             .unary(Pipeline, &name, move |_, _| {
                 let mut vector = Vec::new();
@@ -397,35 +423,43 @@ where
                         data.swap(&mut vector);
                         for batch in vector.drain(..) {
                             let OutputBatch { time, mut data } = batch;
-                            let futures: FuturesOrdered<_> =
-                                data.drain(..)
-                                    .map(|((key, value), diff)| {
-                                        let maybe_result =
-                                            if diff < Monoid::zero() {
-                                                Some(cache.remove(&key).expect(
-                                            "result for negative diff should be stored",
-                                        ).clone())
-                                            } else {
-                                                None
-                                            };
-                                        ((key, value), diff, maybe_result)
-                                    })
-                                    .map(|((key, value), diff, maybe_result)| async {
-                                        if let Some(result) = maybe_result {
-                                            (result, diff, key)
-                                        } else {
-                                            (logic((key.clone(), value)).await, diff, key)
-                                        }
-                                    })
-                                    .collect();
+                            let futures: FuturesOrdered<_> = data
+                                .drain(..)
+                                .map(|((key, value), diff)| {
+                                    let maybe_result = if diff < Monoid::zero() {
+                                        Some(
+                                            cache
+                                                .remove(&key)
+                                                .map_err(|error| spill_failed(&cache, error))
+                                                .unwrap_with_reporter(&error_reporter)
+                                                .expect(
+                                                    "result for negative diff should be stored",
+                                                ),
+                                        )
+                                    } else {
+                                        None
+                                    };
+                                    ((key, value), diff, maybe_result)
+                                })
+                                .map(|((key, value), diff, maybe_result)| async {
+                                    if let Some(result) = maybe_result {
+                                        (result, diff, key)
+                                    } else {
+                                        (logic((key.clone(), value)).await, diff, key)
+                                    }
+                                })
+                                .collect();
                             assert!(buffer.is_empty());
                             buffer.reserve(futures.len());
 
                             futures::executor::block_on(futures.for_each(|item| {
                                 let (result, diff, key) = item;
                                 if diff > Monoid::zero() {
-                                    let current = cache.insert(key, result.clone());
-                                    assert!(current.is_none());
+                                    let replaced = cache
+                                        .insert(key, result.clone())
+                                        .map_err(|error| spill_failed(&cache, error))
+                                        .unwrap_with_reporter(&error_reporter);
+                                    assert!(!replaced);
                                 }
                                 buffer.push((result, time.clone(), diff));
                                 future::ready(())
@@ -460,3 +494,61 @@ where
             .as_collection()
     }
 }
+
+pub trait ConsolidateLocally<S, D, R>
+where
+    S: MaybeTotalScope,
+    D: Data,
+    R: Semigroup,
+{
+    /// Consolidates updates within a single worker, without exchanging them. Applied
+    /// before an exchange, it makes every worker send at most one update per distinct
+    /// record and time, e.g. one partial count per key.
+    fn consolidate_locally_named(&self, name: &str) -> Collection<S, D, R>;
+}
+
+impl<S, D, R> ConsolidateLocally<S, D, R> for Collection<S, D, R>
+where
+    S: MaybeTotalScope,
+    D: Data,
+    R: Semigroup,
+{
+    #[track_caller]
+    fn consolidate_locally_named(&self, name: &str) -> Collection<S, D, R> {
+        let caller = Location::caller();
+        let name = format!("{name} at {caller}");
+        self.inner
+            .unary_frontier(Pipeline, &name, |_capability, _info| {
+                let mut buffer = Vec::new();
+                let mut stash: Vec<(Capability<S::Timestamp>, Vec<(D, S::Timestamp, R)>)> =
+                    Vec::new();
+                move |input, output| {
+                    input.for_each(|capability, data| {
+                        data.swap(&mut buffer);
+                        if let Some((_capability, updates)) = stash
+                            .iter_mut()
+                            .find(|(stashed, _updates)| stashed.time() == capability.time())
+                        {
+                            updates.append(&mut buffer);
+                        } else {
+                            stash.push((capability.retain(), std::mem::take(&mut buffer)));
+                        }
+                    });
+                    // updates are only released once no more updates for their time can arrive,
+                    // which costs no latency as the downstream arrangement waits for that anyway
+                    stash.retain_mut(|(capability, updates)| {
+                        if input.frontier().less_equal(capability.time()) {
+                            true
+                        } else {
+                            consolidate_updates(updates);
+                            output
+                                .session(&*capability)
+                                .give_iterator(updates.drain(..));
+                            false
+                        }
+                    });
+                }
+            })
+            .as_collection()
+    }
+}
@@ -0,0 +1,180 @@
+// Copyright © 2024 Pathway
+
+use std::collections::BTreeMap;
+
+use differential_dataflow::consolidation::consolidate;
+use differential_dataflow::operators::arrange::Arranged;
+use differential_dataflow::trace::{Cursor, TraceReader};
+use differential_dataflow::{AsCollection, Collection, Data, ExchangeData};
+use timely::dataflow::channels::pact::{Exchange, Pipeline};
+use timely::dataflow::operators::{Capability, Operator};
+use timely::progress::Antichain;
+
+use crate::engine::dataflow::maybe_total::MaybeTotalScope;
+use crate::engine::dataflow::shard::Shard;
+use crate::engine::{Key, Timestamp};
+
+/// Which updates of the arrangement an update of the stream is matched with.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum HalfJoinMatch {
+    /// Updates with times less than or equal to the time of the stream update.
+    UpToTime,
+    /// Updates with times strictly less than the time of the stream update.
+    BeforeTime,
+}
+
+impl HalfJoinMatch {
+    fn matches(self, arrangement_time: &Timestamp, stream_time: &Timestamp) -> bool {
+        match self {
+            Self::UpToTime => arrangement_time <= stream_time,
+            Self::BeforeTime => arrangement_time < stream_time,
+        }
+    }
+}
+
+/// An equijoin of a stream with an arrangement that responds only to the updates
+/// of the stream.
+///
+/// Every update `((key, val), time, diff)` of `stream` is matched with the state of
+/// `arrangement` at `time` (or just before it, depending on `matching`) and produces
+/// `(logic(key, val, arranged_val), time, diff * arranged_diff)` for every value
+/// present under `key`. Updates of the arrangement itself produce nothing, so a join
+/// of `n` collections can be built from `n` chains of half joins, one per collection,
+/// without arranging any intermediate result. Ties between the chains are resolved by
+/// matching collections preceding the updated one with `UpToTime` and the following
+/// ones with `BeforeTime`.
+///
+/// This requires totally ordered timestamps, so it is only available in the outer
+/// scope.
+pub trait HalfJoin<S, V>
+where
+    S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>,
+{
+    fn half_join_named<Tr, D2>(
+        &self,
+        name: &str,
+        arrangement: &Arranged<S, Tr>,
+        matching: HalfJoinMatch,
+        logic: impl FnMut(&Key, &V, &Tr::Val) -> D2 + 'static,
+    ) -> Collection<S, D2>
+    where
+        Tr: TraceReader<Key = Key, Time = Timestamp, R = isize> + Clone + 'static,
+        D2: Data;
+}
+
+impl<S, V> HalfJoin<S, V> for Collection<S, (Key, V)>
+where
+    S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>,
+    V: ExchangeData,
+{
+    fn half_join_named<Tr, D2>(
+        &self,
+        name: &str,
+        arrangement: &Arranged<S, Tr>,
+        matching: HalfJoinMatch,
+        mut logic: impl FnMut(&Key, &V, &Tr::Val) -> D2 + 'static,
+    ) -> Collection<S, D2>
+    where
+        Tr: TraceReader<Key = Key, Time = Timestamp, R = isize> + Clone + 'static,
+        D2: Data,
+    {
+        let mut trace = Some(arrangement.trace.clone());
+        if let Some(trace) = &mut trace {
+            // the operator only reads accumulated updates, so merging batches is fine
+            trace.set_physical_compaction(Antichain::new().borrow());
+        }
+        // stream updates are routed like the arranged ones
+        let exchange =
+            Exchange::new(|((key, _val), _time, _diff): &((Key, V), Timestamp, isize)| key.shard());
+        let mut stash: BTreeMap<Timestamp, (Capability<Timestamp>, Vec<((Key, V), isize)>)> =
+            BTreeMap::new();
+        let mut buffer = Vec::new();
+        let mut times_buffer = Vec::new();
+
+        self.inner
+            .binary_frontier(
+                &arrangement.stream,
+                exchange,
+                Pipeline,
+                name,
+                move |_capability, _info| {
+                    move |stream_input, arrangement_input, output| {
+                        stream_input.for_each(|capability, data| {
+                            data.swap(&mut buffer);
+                            for (data, time, diff) in buffer.drain(..) {
+                                stash
+                                    .entry(time)
+                                    .or_insert_with(|| (capability.delayed(&time), Vec::new()))
+                                    .1
+                                    .push((data, diff));
+                            }
+                        });
+                        // batches are not needed, the arrangement is read through the trace
+                        arrangement_input.for_each(|_capability, _data| {});
+
+                        let arrangement_frontier = arrangement_input.frontier().frontier();
+                        while let Some(entry) = stash.first_entry() {
+                            let time = *entry.key();
+                            // all arrangement updates that can match have to be present
+                            if arrangement_frontier
+                                .iter()
+                                .any(|frontier_time| matching.matches(frontier_time, &time))
+                            {
+                                break;
+                            }
+                            let (capability, mut updates) = entry.remove();
+                            let Some(trace) = &mut trace else {
+                                continue;
+                            };
+                            consolidate(&mut updates);
+                            let mut session = output.session(&capability);
+                            let (mut cursor, storage) = trace.cursor();
+                            for ((key, val), diff) in &updates {
+                                cursor.seek_key(&storage, key);
+                                if cursor.get_key(&storage) != Some(key) {
+                                    continue;
+                                }
+                                while let Some(arranged_val) = cursor.get_val(&storage) {
+                                    cursor.map_times(&storage, |arranged_time, arranged_diff| {
+                                        if matching.matches(arranged_time, &time) {
+                                            times_buffer.push(((), *arranged_diff));
+                                        }
+                                    });
+                                    consolidate(&mut times_buffer);
+                                    for ((), arranged_diff) in times_buffer.drain(..) {
+                                        session.give((
+                                            logic(key, val, arranged_val),
+                                            time,
+                                            diff * arranged_diff,
+                                        ));
+                                    }
+                                    cursor.step_val(&storage);
+                                }
+                                cursor.rewind_vals(&storage);
+                            }
+                        }
+
+                        // Keep the history needed to answer the pending updates. Compacting
+                        // to a time strictly before them keeps the `BeforeTime` comparisons
+                        // exact (a total order and integer times are assumed).
+                        let mut compaction_frontier = Antichain::new();
+                        for time in stream_input
+                            .frontier()
+                            .frontier()
+                            .iter()
+                            .chain(stash.keys())
+                        {
+                            compaction_frontier.insert(Timestamp(time.0.saturating_sub(1)));
+                        }
+                        if let Some(trace) = &mut trace {
+                            trace.set_logical_compaction(compaction_frontier.borrow());
+                        }
+                        if stream_input.frontier().is_empty() && stash.is_empty() {
+                            trace = None;
+                        }
+                    }
+                },
+            )
+            .as_collection()
+    }
+}
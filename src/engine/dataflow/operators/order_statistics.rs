@@ -0,0 +1,385 @@
+// Copyright © 2024 Pathway
+
+use std::collections::{BTreeMap, HashMap};
+use std::sync::Arc;
+
+use differential_dataflow::consolidation::consolidate;
+use differential_dataflow::{AsCollection, Collection};
+use ordered_float::OrderedFloat;
+use timely::dataflow::channels::pact::Exchange;
+use timely::dataflow::operators::{Capability, Operator};
+
+use crate::engine::dataflow::maybe_total::MaybeTotalScope;
+use crate::engine::dataflow::shard::Shard;
+use crate::engine::{Key, Timestamp, Value};
+
+type Link<K, P> = Option<Box<Node<K, P>>>;
+
+struct Node<K, P> {
+    key: K,
+    payload: P,
+    priority: u64,
+    size: usize,
+    left: Link<K, P>,
+    right: Link<K, P>,
+}
+
+fn size<K, P>(link: &Link<K, P>) -> usize {
+    link.as_ref().map_or(0, |node| node.size)
+}
+
+impl<K, P> Node<K, P> {
+    fn update_size(&mut self) {
+        self.size = 1 + size(&self.left) + size(&self.right);
+    }
+}
+
+/// A sorted multiset with positional access.
+///
+/// It is a treap in which every node stores the size of its subtree, so finding the
+/// position of an entry, inserting and removing cost `O(log n)` in expectation and
+/// visiting `k` consecutive positions costs `O(log n + k)`. Priorities are supplied by
+/// the caller and have to be random-looking for the balance to hold.
+pub struct OrderStatisticsTree<K, P> {
+    root: Link<K, P>,
+}
+
+impl<K: Ord, P> Default for OrderStatisticsTree<K, P> {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+impl<K: Ord, P> OrderStatisticsTree<K, P> {
+    pub fn new() -> Self {
+        Self { root: None }
+    }
+
+    pub fn len(&self) -> usize {
+        size(&self.root)
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.root.is_none()
+    }
+
+    pub fn insert(&mut self, key: K, payload: P, priority: u64) {
+        let (left, right) = Self::split(self.root.take(), &key);
+        let node = Box::new(Node {
+            key,
+            payload,
+            priority,
+            size: 1,
+            left: None,
+            right: None,
+        });
+        self.root = Self::merge(Self::merge(left, Some(node)), right);
+    }
+
+    /// Removes one entry equal to `key` and returns its payload.
+    pub fn remove(&mut self, key: &K) -> Option<P> {
+        let (left, right) = Self::split(self.root.take(), key);
+        let found = Self::first(&right).is_some_and(|first| first == key);
+        let (right, removed) = if found {
+            Self::pop_first(right)
+        } else {
+            (right, None)
+        };
+        self.root = Self::merge(left, right);
+        removed.map(|node| node.payload)
+    }
+
+    /// Counts the entries for which `is_before` holds. `is_before` has to hold for a
+    /// prefix of the entries.
+    pub fn count_before(&self, mut is_before: impl FnMut(&K) -> bool) -> usize {
+        let mut count = 0;
+        let mut link = &self.root;
+        while let Some(node) = link {
+            if is_before(&node.key) {
+                count += size(&node.left) + 1;
+                link = &node.right;
+            } else {
+                link = &node.left;
+            }
+        }
+        count
+    }
+
+    /// Calls `logic` for the entries at positions `start..end`, in order.
+    pub fn for_each_in_range(
+        &self,
+        start: usize,
+        end: usize,
+        mut logic: impl FnMut(usize, &K, &P),
+    ) {
+        Self::visit(&self.root, 0, start, end, &mut logic);
+    }
+
+    fn visit<F: FnMut(usize, &K, &P)>(
+        link: &Link<K, P>,
+        offset: usize,
+        start: usize,
+        end: usize,
+        logic: &mut F,
+    ) {
+        let Some(node) = link else {
+            return;
+        };
+        let position = offset + size(&node.left);
+        if start < position {
+            Self::visit(&node.left, offset, start, end, logic);
+        }
+        if start <= position && position < end {
+            logic(position, &node.key, &node.payload);
+        }
+        if position + 1 < end {
+            Self::visit(&node.right, position + 1, start, end, logic);
+        }
+    }
+
+    fn first(mut link: &Link<K, P>) -> Option<&K> {
+        let mut first = None;
+        while let Some(node) = link {
+            first = Some(&node.key);
+            link = &node.left;
+        }
+        first
+    }
+
+    fn pop_first(link: Link<K, P>) -> (Link<K, P>, Option<Box<Node<K, P>>>) {
+        let Some(mut node) = link else {
+            return (None, None);
+        };
+        if node.left.is_none() {
+            let rest = node.right.take();
+            return (rest, Some(node));
+        }
+        let (rest, first) = Self::pop_first(node.left.take());
+        node.left = rest;
+        node.update_size();
+        (Some(node), first)
+    }
+
+    /// Splits `link` into the entries less than `key` and the remaining ones.
+    fn split(link: Link<K, P>, key: &K) -> (Link<K, P>, Link<K, P>) {
+        let Some(mut node) = link else {
+            return (None, None);
+        };
+        if node.key < *key {
+            let (left, right) = Self::split(node.right.take(), key);
+            node.right = left;
+            node.update_size();
+            (Some(node), right)
+        } else {
+            let (left, right) = Self::split(node.left.take(), key);
+            node.left = right;
+            node.update_size();
+            (left, Some(node))
+        }
+    }
+
+    /// Joins two treaps, all entries of `left` have to precede the entries of `right`.
+    fn merge(left: Link<K, P>, right: Link<K, P>) -> Link<K, P> {
+        match (left, right) {
+            (None, right) => right,
+            (left, None) => left,
+            (Some(mut left), Some(mut right)) => {
+                if left.priority >= right.priority {
+                    left.right = Self::merge(left.right.take(), Some(right));
+                    left.update_size();
+                    Some(left)
+                } else {
+                    right.left = Self::merge(Some(left), right.left.take());
+                    right.update_size();
+                    Some(right)
+                }
+            }
+        }
+    }
+}
+
+/// Which rows of every instance the order statistics operator reports.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum OrderStatisticsOutput {
+    /// Every row, with value `(payload, rank, percent_rank)`. `rank` is one plus the
+    /// number of rows with a smaller sorting key and `percent_rank` is
+    /// `(rank - 1) / (instance_size - 1)`.
+    Rank,
+    /// Rows at positions `offset..offset + limit` of the instance, with their payload.
+    /// Ties between equal sorting keys are broken by row keys.
+    Page { offset: usize, limit: usize },
+}
+
+/// A row of the input: `(instance, sorting_key, row_key, payload)`.
+pub type OrderStatisticsRow = (Value, Value, Key, Value);
+
+type InstanceTree = OrderStatisticsTree<(Value, Key), Value>;
+
+/// Maintains rows sorted within their instances and reports their ranks or a window of
+/// positions.
+///
+/// An update only touches the positions starting from the lowest changed row, so
+/// keeping a page of `limit` rows costs `O((u + limit) log n)` for `u` updates of an
+/// instance of `n` rows. Ranks of all rows following a change are reported again, and
+/// `percent_rank` of every row of the instance changes whenever its size does.
+///
+/// The updates of a time are applied only when the time is complete, so this requires
+/// totally ordered timestamps and is only available in the outer scope.
+pub trait OrderStatistics<S>
+where
+    S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>,
+{
+    fn order_statistics_named(
+        &self,
+        name: &str,
+        output: OrderStatisticsOutput,
+    ) -> Collection<S, (Key, Value)>;
+}
+
+impl<S> OrderStatistics<S> for Collection<S, OrderStatisticsRow>
+where
+    S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>,
+{
+    fn order_statistics_named(
+        &self,
+        name: &str,
+        output: OrderStatisticsOutput,
+    ) -> Collection<S, (Key, Value)> {
+        // all rows of an instance have to be processed by the same worker
+        let exchange = Exchange::new(
+            |((instance, _sorting_key, _row_key, _payload), _time, _diff): &(
+                OrderStatisticsRow,
+                Timestamp,
+                isize,
+            )| Key::for_value(instance).shard(),
+        );
+        let mut stash: BTreeMap<
+            Timestamp,
+            (Capability<Timestamp>, Vec<(OrderStatisticsRow, isize)>),
+        > = BTreeMap::new();
+        let mut trees: HashMap<Value, InstanceTree> = HashMap::new();
+        let mut buffer = Vec::new();
+
+        self.inner
+            .unary_frontier(exchange, name, move |_capability, _info| {
+                move |input, output_handle| {
+                    input.for_each(|capability, data| {
+                        data.swap(&mut buffer);
+                        for (data, time, diff) in buffer.drain(..) {
+                            stash
+                                .entry(time)
+                                .or_insert_with(|| (capability.delayed(&time), Vec::new()))
+                                .1
+                                .push((data, diff));
+                        }
+                    });
+
+                    while let Some(entry) = stash.first_entry() {
+                        let time = *entry.key();
+                        if input.frontier().less_equal(&time) {
+                            break;
+                        }
+                        let (capability, mut updates) = entry.remove();
+                        // sorts the updates by instance and then by position
+                        consolidate(&mut updates);
+                        let mut changes = Vec::new();
+                        for instance_updates in
+                            updates.chunk_by(|(first, _), (second, _)| first.0 == second.0)
+                        {
+                            let instance = &instance_updates[0].0 .0;
+                            let tree = trees.entry(instance.clone()).or_default();
+                            update_instance(tree, instance_updates, output, &mut changes);
+                            if tree.is_empty() {
+                                trees.remove(instance);
+                            }
+                        }
+                        consolidate(&mut changes);
+                        let mut session = output_handle.session(&capability);
+                        for (data, diff) in changes {
+                            session.give((data, time, diff));
+                        }
+                    }
+                }
+            })
+            .as_collection()
+    }
+}
+
+#[allow(clippy::cast_possible_truncation)]
+fn priority(row_key: &Key) -> u64 {
+    // row keys are hashes, so they are already random-looking
+    (row_key.0 as u64) ^ ((row_key.0 >> 64) as u64)
+}
+
+fn update_instance(
+    tree: &mut InstanceTree,
+    updates: &[(OrderStatisticsRow, isize)],
+    output: OrderStatisticsOutput,
+    changes: &mut Vec<((Key, Value), isize)>,
+) {
+    // the updates are sorted, so the first one is the lowest changed row
+    let ((_instance, lowest_sorting_key, lowest_row_key, _payload), _diff) = &updates[0];
+    let lowest_position = tree.count_before(|(sorting_key, row_key)| {
+        (sorting_key, row_key) < (lowest_sorting_key, lowest_row_key)
+    });
+    let lowest_rank_position =
+        tree.count_before(|(sorting_key, _row_key)| sorting_key < lowest_sorting_key);
+    let resized = updates.iter().map(|(_row, diff)| diff).sum::<isize>() != 0;
+
+    let mut report = |tree: &InstanceTree, diff: isize| match output {
+        OrderStatisticsOutput::Rank => {
+            let len = tree.len();
+            let start = if resized { 0 } else { lowest_rank_position };
+            let mut rank = 0;
+            let mut previous_sorting_key: Option<Value> = None;
+            tree.for_each_in_range(start, len, |position, (sorting_key, row_key), payload| {
+                if previous_sorting_key.as_ref() != Some(sorting_key) {
+                    rank = position + 1;
+                    previous_sorting_key = Some(sorting_key.clone());
+                }
+                changes.push(((*row_key, rank_value(payload, rank, len)), diff));
+            });
+        }
+        OrderStatisticsOutput::Page { offset, limit } => {
+            let start = offset.max(lowest_position);
+            let end = offset.saturating_add(limit).min(tree.len());
+            tree.for_each_in_range(start, end, |_position, (_sorting_key, row_key), payload| {
+                changes.push(((*row_key, payload.clone()), diff));
+            });
+        }
+    };
+
+    report(tree, -1);
+    // retractions go first, so that a row changing its payload is removed before it is
+    // inserted again
+    for ((_instance, sorting_key, row_key, _payload), diff) in updates {
+        for _ in 0..(-diff).max(0) {
+            tree.remove(&(sorting_key.clone(), *row_key));
+        }
+    }
+    for ((_instance, sorting_key, row_key, payload), diff) in updates {
+        for _ in 0..(*diff).max(0) {
+            tree.insert(
+                (sorting_key.clone(), *row_key),
+                payload.clone(),
+                priority(row_key),
+            );
+        }
+    }
+    report(tree, 1);
+}
+
+#[allow(clippy::cast_possible_wrap)]
+#[allow(clippy::cast_precision_loss)]
+fn rank_value(payload: &Value, rank: usize, len: usize) -> Value {
+    let percent_rank = if len > 1 {
+        (rank - 1) as f64 / (len - 1) as f64
+    } else {
+        0.0
+    };
+    Value::Tuple(Arc::from([
+        payload.clone(),
+        Value::Int(rank as i64),
+        Value::Float(OrderedFloat(percent_rank)),
+    ]))
+}
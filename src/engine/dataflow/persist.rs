@@ -17,6 +17,7 @@ use timely::dataflow::operators::{Capability, Operator};
 use timely::dataflow::Scope;
 use timely::{order::TotalOrder, progress::Timestamp as TimelyTimestampTrait};
 
+use crate::affinity::pin_auxiliary_thread;
 use crate::engine::reduce::IntSumState;
 use crate::engine::{Key, Result, Timestamp, Value};
 use crate::persistence::config::PersistenceManagerConfig;
@@ -329,6 +330,7 @@ where
     let thread_handle = thread::Builder::new()
         .name(name.to_string())
         .spawn(move || {
+            pin_auxiliary_thread();
             let data = reader.load_persisted();
             if let Err(e) = sender.send(data) {
                 error!("Failed to send data from persistence: {e}"); // FIXME possibly exit
@@ -0,0 +1,126 @@
+// Copyright © 2024 Pathway
+
+use std::collections::{HashMap, HashSet};
+
+use log::warn;
+
+use super::operator_metrics::HotKeyCounter;
+use crate::engine::value::{KeyImpl, SHARD_MASK};
+use crate::engine::Key;
+
+const SAMPLING_RATE: u64 = 64;
+const SAMPLING_WINDOW: u64 = 1024;
+const HOT_KEY_SHARE_PERCENT: u64 = 20;
+
+/// Static splitting of grouping/join keys into `split` buckets.
+///
+/// A row is assigned to a bucket based on its own (source) key, so the assignment is
+/// deterministic and an insertion and its retraction always land in the same bucket.
+/// Salting only touches the shard bits of a key, so every bucket of a key is routed
+/// to a different worker.
+#[derive(Debug, Clone, Copy)]
+pub struct SkewSplit(KeyImpl);
+
+impl SkewSplit {
+    #[allow(clippy::cast_possible_truncation)]
+    pub fn new(split: usize) -> Self {
+        let split = split.clamp(1, (SHARD_MASK + 1) as usize);
+        Self(split as KeyImpl)
+    }
+
+    pub fn is_enabled(self) -> bool {
+        self.0 > 1
+    }
+
+    pub fn bucket(self, row_key: &Key) -> KeyImpl {
+        if self.is_enabled() {
+            row_key.0 % self.0
+        } else {
+            0
+        }
+    }
+
+    pub fn salt(self, key: Key, row_key: &Key) -> Key {
+        key.salted_with(self.bucket(row_key))
+    }
+
+    pub fn unsalt(self, salted_key: Key, row_key: &Key) -> Key {
+        // salting is a xor, so it is its own inverse
+        self.salt(salted_key, row_key)
+    }
+
+    pub fn salts(self, key: Key) -> impl Iterator<Item = Key> {
+        (0..self.0).map(move |bucket| key.salted_with(bucket))
+    }
+}
+
+/// Sampling detector of keys that receive a disproportionate share of rows.
+///
+/// Every `SAMPLING_RATE`-th row is sampled and when a single key accounts for at least
+/// `HOT_KEY_SHARE_PERCENT` of the samples in a window, a warning suggesting `skew_split`
+/// is logged once per key and the key is counted in the metrics of the operator.
+pub struct HotKeyDetector {
+    operator: &'static str,
+    worker_index: usize,
+    counter: Option<HotKeyCounter>,
+    seen: u64,
+    sampled: u64,
+    counts: HashMap<Key, u64>,
+    reported: HashSet<Key>,
+}
+
+impl HotKeyDetector {
+    pub fn new(
+        operator: &'static str,
+        worker_index: usize,
+        counter: Option<HotKeyCounter>,
+    ) -> Self {
+        Self {
+            operator,
+            worker_index,
+            counter,
+            seen: 0,
+            sampled: 0,
+            counts: HashMap::new(),
+            reported: HashSet::new(),
+        }
+    }
+
+    /// Returns a detector only if there is more than one worker, as otherwise there is
+    /// no imbalance to detect.
+    pub fn maybe_new(
+        operator: &'static str,
+        worker_index: usize,
+        worker_count: usize,
+        counter: Option<HotKeyCounter>,
+    ) -> Option<Self> {
+        (worker_count > 1).then(|| Self::new(operator, worker_index, counter))
+    }
+
+    pub fn observe(&mut self, key: &Key) {
+        self.seen += 1;
+        if self.seen % SAMPLING_RATE != 0 {
+            return;
+        }
+        self.sampled += 1;
+        *self.counts.entry(*key).or_default() += 1;
+        if self.sampled < SAMPLING_WINDOW {
+            return;
+        }
+        for (key, count) in &self.counts {
+            if count * 100 >= HOT_KEY_SHARE_PERCENT * self.sampled && self.reported.insert(*key) {
+                warn!(
+                    "Worker {}: key {key} accounts for {}% of the sampled rows of a {}. Consider setting skew_split to spread it over multiple workers.",
+                    self.worker_index,
+                    count * 100 / self.sampled,
+                    self.operator,
+                );
+                if let Some(counter) = &self.counter {
+                    counter.report();
+                }
+            }
+        }
+        self.sampled = 0;
+        self.counts.clear();
+    }
+}
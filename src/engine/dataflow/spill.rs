@@ -0,0 +1,342 @@
+// Copyright © 2024 Pathway
+
+use std::collections::{HashMap, VecDeque};
+use std::fs::File;
+use std::hash::Hash;
+use std::io;
+use std::os::unix::fs::FileExt;
+use std::path::PathBuf;
+use std::sync::OnceLock;
+
+use log::{info, warn};
+use serde::de::DeserializeOwned;
+use serde::Serialize;
+
+use super::operator_metrics::SpillCounter;
+use crate::env::parse_env_var;
+
+const DEFAULT_MEMORY_ENTRIES: usize = 1_000_000;
+const MIN_COMPACTION_GARBAGE_BYTES: u64 = 64 * 1024 * 1024;
+
+/// Configuration of spilling operator state to local disk.
+///
+/// Only the results of non-deterministic UDFs, stored to retract them consistently,
+/// are spilled. Arrangements (the state of joins, groupbys and indexes) always stay
+/// in memory.
+///
+/// Spilling is enabled by setting `PATHWAY_SPILL_DIR`. `PATHWAY_SPILL_MEMORY_ENTRIES`
+/// bounds the number of entries every operator keeps in memory on each worker. The
+/// budget counts entries, not bytes, so it has to be chosen with the size of the
+/// stored values in mind.
+#[derive(Debug, Clone)]
+pub struct SpillConfig {
+    directory: PathBuf,
+    memory_entries: usize,
+}
+
+impl SpillConfig {
+    pub fn new(directory: PathBuf, memory_entries: usize) -> Self {
+        Self {
+            directory,
+            memory_entries,
+        }
+    }
+
+    pub fn from_env() -> Option<Self> {
+        static CONFIG: OnceLock<Option<SpillConfig>> = OnceLock::new();
+        CONFIG
+            .get_or_init(|| {
+                let directory = match parse_env_var::<PathBuf>("PATHWAY_SPILL_DIR") {
+                    Ok(directory) => directory?,
+                    Err(error) => {
+                        warn!("Spilling state to disk is disabled: {error}");
+                        return None;
+                    }
+                };
+                let memory_entries = parse_env_var::<usize>("PATHWAY_SPILL_MEMORY_ENTRIES")
+                    .unwrap_or_else(|error| {
+                        warn!("{error}, using the default of {DEFAULT_MEMORY_ENTRIES} entries");
+                        None
+                    })
+                    .unwrap_or(DEFAULT_MEMORY_ENTRIES);
+                Some(Self::new(directory, memory_entries))
+            })
+            .clone()
+    }
+}
+
+#[derive(Debug, Default, Clone, Copy, PartialEq, Eq)]
+pub struct SpillStats {
+    pub spilled_entries: u64,
+    pub spilled_bytes: u64,
+    pub read_entries: u64,
+    pub read_bytes: u64,
+    pub compactions: u64,
+    pub compacted_bytes: u64,
+}
+
+impl SpillStats {
+    /// The change of the statistics since `earlier`.
+    pub fn since(&self, earlier: &Self) -> Self {
+        Self {
+            spilled_entries: self.spilled_entries - earlier.spilled_entries,
+            spilled_bytes: self.spilled_bytes - earlier.spilled_bytes,
+            read_entries: self.read_entries - earlier.read_entries,
+            read_bytes: self.read_bytes - earlier.read_bytes,
+            compactions: self.compactions - earlier.compactions,
+            compacted_bytes: self.compacted_bytes - earlier.compacted_bytes,
+        }
+    }
+
+    /// Bytes read from disk (by lookups and compactions) per byte of a value looked up.
+    #[allow(clippy::cast_precision_loss)]
+    pub fn read_amplification(&self) -> Option<f64> {
+        (self.read_bytes > 0)
+            .then(|| (self.read_bytes + self.compacted_bytes) as f64 / self.read_bytes as f64)
+    }
+}
+
+/// An append-only file of serialized values with an in-memory index of their positions.
+/// Removed values are left in place and the file is rewritten once they take most of it.
+struct SpillFile<K> {
+    directory: PathBuf,
+    file: File,
+    index: HashMap<K, (u64, usize)>,
+    end: u64,
+    garbage: u64,
+    stats: SpillStats,
+}
+
+impl<K> SpillFile<K>
+where
+    K: Eq + Hash,
+{
+    fn new(directory: PathBuf) -> io::Result<Self> {
+        let file = tempfile::tempfile_in(&directory)?;
+        Ok(Self {
+            directory,
+            file,
+            index: HashMap::new(),
+            end: 0,
+            garbage: 0,
+            stats: SpillStats::default(),
+        })
+    }
+
+    fn write<V: Serialize>(&mut self, key: K, value: &V) -> io::Result<()> {
+        let bytes = bincode::serialize(value).map_err(io::Error::other)?;
+        self.file.write_all_at(&bytes, self.end)?;
+        self.index.insert(key, (self.end, bytes.len()));
+        self.end += bytes.len() as u64;
+        self.stats.spilled_entries += 1;
+        self.stats.spilled_bytes += bytes.len() as u64;
+        Ok(())
+    }
+
+    fn read<V: DeserializeOwned>(&self, offset: u64, len: usize) -> io::Result<V> {
+        let mut bytes = vec![0; len];
+        self.file.read_exact_at(&mut bytes, offset)?;
+        bincode::deserialize(&bytes).map_err(io::Error::other)
+    }
+
+    fn take<V: DeserializeOwned>(&mut self, key: &K) -> io::Result<Option<V>> {
+        let Some((offset, len)) = self.index.remove(key) else {
+            return Ok(None);
+        };
+        let value = self.read(offset, len)?;
+        self.stats.read_entries += 1;
+        self.stats.read_bytes += len as u64;
+        self.garbage += len as u64;
+        if self.garbage >= MIN_COMPACTION_GARBAGE_BYTES && 2 * self.garbage >= self.end {
+            self.compact()?;
+        }
+        Ok(Some(value))
+    }
+
+    fn discard(&mut self, key: &K) -> bool {
+        let Some((_offset, len)) = self.index.remove(key) else {
+            return false;
+        };
+        self.garbage += len as u64;
+        true
+    }
+
+    fn compact(&mut self) -> io::Result<()> {
+        let file = tempfile::tempfile_in(&self.directory)?;
+        let mut end = 0;
+        let mut bytes = Vec::new();
+        for (offset, len) in self.index.values_mut() {
+            bytes.resize(*len, 0);
+            self.file.read_exact_at(&mut bytes, *offset)?;
+            file.write_all_at(&bytes, end)?;
+            *offset = end;
+            end += *len as u64;
+        }
+        self.file = file;
+        self.stats.compactions += 1;
+        self.stats.compacted_bytes += end;
+        self.end = end;
+        self.garbage = 0;
+        Ok(())
+    }
+}
+
+/// A map that keeps at most a configured number of entries in memory and moves the
+/// oldest ones to a file on local disk, keeping only their keys in memory.
+///
+/// Without a [`SpillConfig`] it is a plain `HashMap` and never fails. With a
+/// [`SpillCounter`], the disk traffic is also reported to the operator metrics.
+pub struct SpillableMap<K, V> {
+    name: String,
+    memory: HashMap<K, (V, u64)>,
+    insertion_order: VecDeque<(K, u64)>,
+    next_generation: u64,
+    memory_entries: usize,
+    spill: Option<SpillFile<K>>,
+    counter: Option<SpillCounter>,
+    reported: SpillStats,
+}
+
+impl<K, V> SpillableMap<K, V>
+where
+    K: Eq + Hash + Clone,
+    V: Serialize + DeserializeOwned,
+{
+    pub fn new(name: &str) -> Self {
+        Self::with_config(name, SpillConfig::from_env())
+    }
+
+    pub fn with_config(name: &str, config: Option<SpillConfig>) -> Self {
+        let (memory_entries, spill) = match config {
+            Some(config) => match SpillFile::new(config.directory) {
+                Ok(spill) => (config.memory_entries, Some(spill)),
+                Err(error) => {
+                    warn!("{name}: can't create a file to spill state to: {error}");
+                    (usize::MAX, None)
+                }
+            },
+            None => (usize::MAX, None),
+        };
+        Self {
+            name: name.to_string(),
+            memory: HashMap::new(),
+            insertion_order: VecDeque::new(),
+            next_generation: 0,
+            memory_entries,
+            spill,
+            counter: None,
+            reported: SpillStats::default(),
+        }
+    }
+
+    #[must_use]
+    pub fn with_counter(mut self, counter: Option<SpillCounter>) -> Self {
+        self.counter = counter;
+        self
+    }
+
+    pub fn name(&self) -> &str {
+        &self.name
+    }
+
+    /// Inserts the value, returns whether the key already had one.
+    pub fn insert(&mut self, key: K, value: V) -> io::Result<bool> {
+        let Some(spill) = &mut self.spill else {
+            return Ok(self.memory.insert(key, (value, 0)).is_some());
+        };
+        // a previous value of the key could have been spilled
+        let spilled = spill.discard(&key);
+        let generation = self.next_generation;
+        self.next_generation += 1;
+        let in_memory = self
+            .memory
+            .insert(key.clone(), (value, generation))
+            .is_some();
+        self.insertion_order.push_back((key, generation));
+        self.evict()?;
+        self.report();
+        Ok(spilled || in_memory)
+    }
+
+    pub fn remove(&mut self, key: &K) -> io::Result<Option<V>> {
+        if let Some((value, _generation)) = self.memory.remove(key) {
+            return Ok(Some(value));
+        }
+        let value = match &mut self.spill {
+            Some(spill) => spill.take(key)?,
+            None => return Ok(None),
+        };
+        self.report();
+        Ok(value)
+    }
+
+    pub fn stats(&self) -> SpillStats {
+        self.spill
+            .as_ref()
+            .map(|spill| spill.stats)
+            .unwrap_or_default()
+    }
+
+    fn report(&mut self) {
+        let Some(counter) = &self.counter else {
+            return;
+        };
+        let stats = self.stats();
+        // the statistics change only when the disk is accessed
+        if stats != self.reported {
+            counter.report(&stats.since(&self.reported));
+            self.reported = stats;
+        }
+    }
+
+    fn evict(&mut self) -> io::Result<()> {
+        let Some(spill) = &mut self.spill else {
+            return Ok(());
+        };
+        while self.memory.len() > self.memory_entries {
+            let Some((key, generation)) = self.insertion_order.pop_front() else {
+                break;
+            };
+            // entries that were removed (or inserted again later) are skipped
+            if self
+                .memory
+                .get(&key)
+                .is_some_and(|(_value, current)| *current == generation)
+            {
+                let (value, _generation) = self.memory.remove(&key).unwrap();
+                spill.write(key, &value)?;
+            }
+        }
+        if self.insertion_order.len() > 2 * self.memory.len() + 1024 {
+            let memory = &self.memory;
+            self.insertion_order.retain(|(key, generation)| {
+                memory
+                    .get(key)
+                    .is_some_and(|(_value, current)| current == generation)
+            });
+        }
+        Ok(())
+    }
+}
+
+impl<K, V> Drop for SpillableMap<K, V> {
+    fn drop(&mut self) {
+        let Some(spill) = &self.spill else {
+            return;
+        };
+        let stats = spill.stats;
+        if stats.spilled_entries > 0 {
+            info!(
+                "{}: spilled {} entries ({} bytes) to disk, read back {} entries ({} bytes), {} compactions rewrote {} bytes, read amplification {:.2}",
+                self.name,
+                stats.spilled_entries,
+                stats.spilled_bytes,
+                stats.read_entries,
+                stats.read_bytes,
+                stats.compactions,
+                stats.compacted_bytes,
+                stats.read_amplification().unwrap_or(0.0),
+            );
+        }
+    }
+}
@@ -0,0 +1,190 @@
+// Copyright © 2024 Pathway
+
+use std::fs;
+use std::io::{self, Read, Write};
+use std::os::unix::net::{UnixListener, UnixStream};
+use std::path::{Path, PathBuf};
+use std::str::FromStr;
+use std::thread;
+use std::time::Duration;
+
+use log::warn;
+
+// Sent right after connecting, like timely does for TCP connections, so that
+// an unrelated process connecting to the socket is rejected.
+const HANDSHAKE_MAGIC: u64 = 0xc2f1_fb77_0118_add9;
+const CONNECT_RETRY_INTERVAL: Duration = Duration::from_millis(100);
+const CONNECT_RETRIES_BETWEEN_WARNINGS: usize = 50;
+// size of `sun_path` in `sockaddr_un`, including the terminating null byte
+const MAX_SOCKET_PATH_LENGTH: usize = if cfg!(target_os = "linux") { 108 } else { 104 };
+
+/// How the processes of a multi-process computation communicate.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum Transport {
+    Tcp,
+    /// Unix domain sockets, only for processes running on the same host.
+    Unix,
+}
+
+#[derive(Debug, thiserror::Error)]
+#[error("unknown transport {0:?}, expected \"tcp\" or \"unix\"")]
+pub struct UnknownTransport(String);
+
+impl FromStr for Transport {
+    type Err = UnknownTransport;
+
+    fn from_str(s: &str) -> Result<Self, Self::Err> {
+        match s.to_lowercase().as_str() {
+            "tcp" => Ok(Self::Tcp),
+            "unix" => Ok(Self::Unix),
+            _ => Err(UnknownTransport(s.to_string())),
+        }
+    }
+}
+
+/// Path of the socket process `process_id` listens on.
+///
+/// Paths of Unix sockets are limited to about a hundred bytes, so they are kept
+/// short and put in the temporary directory. The limit is checked when the socket is
+/// created.
+pub fn unix_socket_path(run_id: &str, first_port: usize, process_id: usize) -> PathBuf {
+    std::env::temp_dir().join(format!("pathway-{run_id}-{first_port}-{process_id}.sock"))
+}
+
+/// Connects the process `my_index` to all other processes listening on `paths`.
+///
+/// The result has the same layout as the one of `timely::communication::networking::create_sockets`:
+/// the item at index `i` is a stream connected to process `i`, except for `my_index`,
+/// which is `None`. Processes with lower indices are connected to and the ones with
+/// higher indices are awaited.
+pub fn create_unix_sockets(
+    paths: &[PathBuf],
+    my_index: usize,
+) -> io::Result<Vec<Option<UnixStream>>> {
+    for path in paths {
+        check_path_length(path)?;
+    }
+    let listener = bind(&paths[my_index])?;
+    let connecting_paths = paths[..my_index].to_vec();
+    let connect_task = thread::Builder::new()
+        .name("pathway:connect".to_string())
+        .spawn(move || -> io::Result<Vec<Option<UnixStream>>> {
+            connecting_paths
+                .iter()
+                .map(|path| connect(path, my_index).map(Some))
+                .collect()
+        })?;
+
+    let mut awaited: Vec<Option<UnixStream>> = (my_index + 1..paths.len()).map(|_| None).collect();
+    let mut remaining = paths.len() - my_index - 1;
+    while remaining > 0 {
+        let (mut stream, _address) = listener.accept()?;
+        let index = match read_handshake(&mut stream) {
+            Ok(index) => index,
+            Err(error) => {
+                // e.g. another process checking if the socket is in use
+                warn!(
+                    "Process {my_index}: ignoring a connection to {}: {error}",
+                    paths[my_index].display()
+                );
+                continue;
+            }
+        };
+        if index <= my_index || index >= paths.len() || awaited[index - my_index - 1].is_some() {
+            return Err(io::Error::new(
+                io::ErrorKind::InvalidData,
+                format!("unexpected connection from process {index}"),
+            ));
+        }
+        awaited[index - my_index - 1] = Some(stream);
+        remaining -= 1;
+    }
+    // established connections don't need the socket file anymore
+    remove_socket_file(&paths[my_index])?;
+
+    let mut result = connect_task
+        .join()
+        .unwrap_or_else(|panic_payload| std::panic::resume_unwind(panic_payload))?;
+    result.push(None);
+    result.extend(awaited);
+    Ok(result)
+}
+
+fn remove_socket_file(path: &Path) -> io::Result<()> {
+    match fs::remove_file(path) {
+        Err(error) if error.kind() != io::ErrorKind::NotFound => Err(error),
+        _ => Ok(()),
+    }
+}
+
+fn check_path_length(path: &Path) -> io::Result<()> {
+    if path.as_os_str().len() >= MAX_SOCKET_PATH_LENGTH {
+        return Err(io::Error::new(
+            io::ErrorKind::InvalidInput,
+            format!(
+                "socket path {} is longer than {} bytes, set TMPDIR to a shorter directory or use PATHWAY_TRANSPORT=tcp",
+                path.display(),
+                MAX_SOCKET_PATH_LENGTH - 1
+            ),
+        ));
+    }
+    Ok(())
+}
+
+fn bind(path: &Path) -> io::Result<UnixListener> {
+    match UnixListener::bind(path) {
+        Err(error) if error.kind() == io::ErrorKind::AddrInUse => {
+            if UnixStream::connect(path).is_ok() {
+                return Err(io::Error::new(
+                    io::ErrorKind::AddrInUse,
+                    format!(
+                        "socket {} is used by another process, is another computation with the same PATHWAY_RUN_ID and PATHWAY_FIRST_PORT running?",
+                        path.display()
+                    ),
+                ));
+            }
+            // nothing listens on it, the socket file was left behind by a process
+            // that was killed
+            remove_socket_file(path)?;
+            UnixListener::bind(path)
+        }
+        result => result,
+    }
+}
+
+fn connect(path: &Path, my_index: usize) -> io::Result<UnixStream> {
+    let mut attempts = 0;
+    loop {
+        match UnixStream::connect(path) {
+            Ok(mut stream) => {
+                stream.write_all(&HANDSHAKE_MAGIC.to_le_bytes())?;
+                stream.write_all(&(my_index as u64).to_le_bytes())?;
+                return Ok(stream);
+            }
+            Err(error) => {
+                attempts += 1;
+                if attempts % CONNECT_RETRIES_BETWEEN_WARNINGS == 0 {
+                    warn!(
+                        "Process {my_index}: can't connect to {}: {error}, retrying",
+                        path.display()
+                    );
+                }
+                thread::sleep(CONNECT_RETRY_INTERVAL);
+            }
+        }
+    }
+}
+
+fn read_handshake(stream: &mut UnixStream) -> io::Result<usize> {
+    let mut buffer = [0; 8];
+    stream.read_exact(&mut buffer)?;
+    if u64::from_le_bytes(buffer) != HANDSHAKE_MAGIC {
+        return Err(io::Error::new(
+            io::ErrorKind::InvalidData,
+            "received incorrect handshake",
+        ));
+    }
+    stream.read_exact(&mut buffer)?;
+    usize::try_from(u64::from_le_bytes(buffer))
+        .map_err(|error| io::Error::new(io::ErrorKind::InvalidData, error))
+}
@@ -3,6 +3,7 @@
 use std::any::Any;
 use std::error;
 use std::fmt;
+use std::io;
 use std::result;
 
 use super::ColumnPath;
@@ -119,6 +120,13 @@ pub enum Error {
     #[error("persistent id {0} is assigned, but no persistent storage is configured")]
     NoPersistentStorage(ExternalPersistentId),
 
+    #[error("spilling state of {name} to local disk failed: {source}")]
+    SpillFailed {
+        name: String,
+        #[source]
+        source: io::Error,
+    },
+
     #[error("snapshot writer failed: {0}")]
     SnapshotWriterError(#[source] WriteError),
 
@@ -15,6 +15,7 @@ use derivative::Derivative;
 use itertools::Itertools;
 use smallvec::SmallVec;
 
+use super::compact_json::CompactJson;
 use super::error::{DataError, DynError, DynResult};
 use super::time::{DateTime, DateTimeNaive, DateTimeUtc, Duration};
 use super::value::Kind;
@@ -388,20 +389,20 @@ fn get_json_item(
 ) -> DynResult<Option<Value>> {
     let index = index.eval(values)?;
     let value = expr.eval(values)?;
-    let json = value.as_json()?;
+    let json = value.as_json()?.root();
     let json = match index {
         Value::Int(index) => match usize::try_from(index) {
-            Ok(index) => json.get(index),
+            Ok(index) => json.get_index(index),
             Err(_) => None,
         },
-        Value::String(index) => json.get(index.as_str()),
+        Value::String(index) => json.get_key(index.as_str()),
         _ => {
             return Err(DynError::from(DataError::ValueError(format!(
                 "json index must be string or integer, got {index}"
             ))))
         }
     };
-    Ok(json.map(|json| Value::from(json.clone())))
+    Ok(json.map(|json| Value::from(CompactJson::from(json))))
 }
 
 fn mat_mul_wrapper<T>(lhs: &ArrayD<T>, rhs: &ArrayD<T>) -> DynResult<Value>
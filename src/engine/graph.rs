@@ -120,7 +120,7 @@ impl Default for ScopedContext {
     }
 }
 
-#[derive(Clone, PartialEq, Eq, PartialOrd, Ord, Debug)]
+#[derive(Clone, PartialEq, Eq, PartialOrd, Ord, Hash, Debug)]
 pub enum ColumnPath {
     Key,
     ValuePath(Vec<usize>),
@@ -449,6 +449,8 @@ impl TableProperties {
 pub struct OperatorProperties {
     pub id: usize,
     pub depends_on_error_log: bool,
+    pub name: String,
+    pub location: Option<String>,
 }
 
 pub type IterationLogic<'a> = Box<
@@ -549,6 +551,70 @@ impl OperatorStats {
     }
 }
 
+/// Rounds of the latest fixed point computation of an `iterate`. Only rounds that
+/// changed some rows are counted.
+#[derive(Debug, Clone, Default)]
+#[pyclass]
+pub struct IterateStats {
+    #[pyo3(get, set)]
+    pub rounds: usize,
+    #[pyo3(get, set)]
+    pub rows_per_round: Vec<u64>,
+    #[pyo3(get, set)]
+    pub round_durations_ms: Vec<u64>,
+}
+
+/// Totals of the timely operators built for a Pathway operator. Rows are counted as
+/// updates, an insertion or a deletion of a row, sent and received by the operators.
+/// Arranged records are the updates currently kept in the operators' arrangements
+/// (in `arranged_batches` batches), `arrangements` is the number of arrangements the
+/// operators built. Exchanged bytes are sent to other processes for the operators'
+/// inputs. Spilled bytes are written to disk by the operators keeping the results of
+/// non-deterministic UDFs, read bytes are read back by lookups and compacted bytes are
+/// rewritten when the spill files are compacted.
+#[derive(Debug, Clone, Default)]
+#[pyclass]
+pub struct OperatorMetrics {
+    #[pyo3(get)]
+    pub rows_in: u64,
+    #[pyo3(get)]
+    pub rows_out: u64,
+    #[pyo3(get)]
+    pub processing_time_ns: u64,
+    #[pyo3(get)]
+    pub arranged_records: i64,
+    #[pyo3(get)]
+    pub arranged_batches: i64,
+    #[pyo3(get)]
+    pub arrangements: u64,
+    #[pyo3(get)]
+    pub exchanged_bytes: u64,
+    #[pyo3(get)]
+    pub hot_keys: u64,
+    #[pyo3(get)]
+    pub spilled_bytes: u64,
+    #[pyo3(get)]
+    pub spill_read_bytes: u64,
+    #[pyo3(get)]
+    pub spill_compacted_bytes: u64,
+}
+
+impl OperatorMetrics {
+    pub fn add(&mut self, other: &Self) {
+        self.rows_in += other.rows_in;
+        self.rows_out += other.rows_out;
+        self.processing_time_ns += other.processing_time_ns;
+        self.arranged_records += other.arranged_records;
+        self.arranged_batches += other.arranged_batches;
+        self.arrangements += other.arrangements;
+        self.exchanged_bytes += other.exchanged_bytes;
+        self.hot_keys += other.hot_keys;
+        self.spilled_bytes += other.spilled_bytes;
+        self.spill_read_bytes += other.spill_read_bytes;
+        self.spill_compacted_bytes += other.spill_compacted_bytes;
+    }
+}
+
 #[derive(Debug, Clone)]
 #[pyclass]
 pub struct ProberStats {
@@ -560,6 +626,8 @@ pub struct ProberStats {
     pub operators_stats: HashMap<usize, OperatorStats>,
     #[pyo3(get, set)]
     pub connector_stats: Vec<(String, ConnectorStats)>,
+    #[pyo3(get, set)]
+    pub iterate_stats: Vec<IterateStats>,
 }
 
 pub type OnDataFn = Box<dyn FnMut(Key, &[Value], Timestamp, isize) -> DynResult<()>>;
@@ -710,6 +778,7 @@ pub trait Graph {
         table_handle: TableHandle,
         column_paths: Vec<ColumnPath>,
         expressions: Vec<ExpressionData>,
+        shared_expressions: Vec<(usize, ExpressionData)>,
         wrapper: BatchWrapper,
         deterministic: bool,
     ) -> Result<TableHandle>;
@@ -859,6 +928,25 @@ pub trait Graph {
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle>;
 
+    fn rank_table(
+        &self,
+        table_handle: TableHandle,
+        key_column_path: ColumnPath,
+        instance_column_path: ColumnPath,
+        table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle>;
+
+    #[allow(clippy::too_many_arguments)]
+    fn limit_table(
+        &self,
+        table_handle: TableHandle,
+        key_column_path: ColumnPath,
+        instance_column_path: ColumnPath,
+        offset: usize,
+        limit: usize,
+        table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle>;
+
     fn reindex_table(
         &self,
         table_handle: TableHandle,
@@ -882,6 +970,7 @@ pub trait Graph {
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle>;
 
+    #[allow(clippy::too_many_arguments)]
     fn group_by_table(
         &self,
         table_handle: TableHandle,
@@ -890,6 +979,7 @@ pub trait Graph {
         reducers: Vec<ReducerData>,
         set_id: bool,
         table_properties: Arc<TableProperties>,
+        skew_split: usize,
     ) -> Result<TableHandle>;
 
     fn deduplicate(
@@ -929,6 +1019,7 @@ pub trait Graph {
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle>;
 
+    #[allow(clippy::too_many_arguments)]
     fn join_tables(
         &self,
         left_data: JoinData,
@@ -936,6 +1027,16 @@ pub trait Graph {
         shard_policy: ShardPolicy,
         join_type: JoinType,
         table_properties: Arc<TableProperties>,
+        skew_split: usize,
+    ) -> Result<TableHandle>;
+
+    fn join_many(
+        &self,
+        base_table_handle: TableHandle,
+        base_column_paths: Vec<Vec<ColumnPath>>,
+        dimensions: Vec<JoinData>,
+        shard_policy: ShardPolicy,
+        table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle>;
 
     fn iterate<'a>(
@@ -963,6 +1064,7 @@ pub trait Graph {
         reader: Box<dyn ReaderBuilder>,
         parser: Box<dyn Parser>,
         commit_duration: Option<Duration>,
+        single_logical_time: bool,
         parallel_readers: usize,
         table_properties: Arc<TableProperties>,
         external_persistent_id: Option<&ExternalPersistentId>,
@@ -1133,6 +1235,7 @@ impl Graph for ScopedGraph {
         table_handle: TableHandle,
         column_paths: Vec<ColumnPath>,
         expressions: Vec<ExpressionData>,
+        shared_expressions: Vec<(usize, ExpressionData)>,
         wrapper: BatchWrapper,
         deterministic: bool,
     ) -> Result<TableHandle> {
@@ -1141,6 +1244,7 @@ impl Graph for ScopedGraph {
                 table_handle,
                 column_paths,
                 expressions,
+                shared_expressions,
                 wrapper,
                 deterministic,
             )
@@ -1403,6 +1507,44 @@ impl Graph for ScopedGraph {
         })
     }
 
+    fn rank_table(
+        &self,
+        table_handle: TableHandle,
+        key_column_path: ColumnPath,
+        instance_column_path: ColumnPath,
+        table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle> {
+        self.try_with(|g| {
+            g.rank_table(
+                table_handle,
+                key_column_path,
+                instance_column_path,
+                table_properties,
+            )
+        })
+    }
+
+    fn limit_table(
+        &self,
+        table_handle: TableHandle,
+        key_column_path: ColumnPath,
+        instance_column_path: ColumnPath,
+        offset: usize,
+        limit: usize,
+        table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle> {
+        self.try_with(|g| {
+            g.limit_table(
+                table_handle,
+                key_column_path,
+                instance_column_path,
+                offset,
+                limit,
+                table_properties,
+            )
+        })
+    }
+
     fn reindex_table(
         &self,
         table_handle: TableHandle,
@@ -1448,6 +1590,7 @@ impl Graph for ScopedGraph {
         reducers: Vec<ReducerData>,
         set_id: bool,
         table_properties: Arc<TableProperties>,
+        skew_split: usize,
     ) -> Result<TableHandle> {
         self.try_with(|g| {
             g.group_by_table(
@@ -1457,6 +1600,7 @@ impl Graph for ScopedGraph {
                 reducers,
                 set_id,
                 table_properties,
+                skew_split,
             )
         })
     }
@@ -1529,6 +1673,7 @@ impl Graph for ScopedGraph {
         shard_policy: ShardPolicy,
         join_type: JoinType,
         table_properties: Arc<TableProperties>,
+        skew_split: usize,
     ) -> Result<TableHandle> {
         self.try_with(|g| {
             g.join_tables(
@@ -1537,6 +1682,26 @@ impl Graph for ScopedGraph {
                 shard_policy,
                 join_type,
                 table_properties,
+                skew_split,
+            )
+        })
+    }
+
+    fn join_many(
+        &self,
+        base_table_handle: TableHandle,
+        base_column_paths: Vec<Vec<ColumnPath>>,
+        dimensions: Vec<JoinData>,
+        shard_policy: ShardPolicy,
+        table_properties: Arc<TableProperties>,
+    ) -> Result<TableHandle> {
+        self.try_with(|g| {
+            g.join_many(
+                base_table_handle,
+                base_column_paths,
+                dimensions,
+                shard_policy,
+                table_properties,
             )
         })
     }
@@ -1574,6 +1739,7 @@ impl Graph for ScopedGraph {
         reader: Box<dyn ReaderBuilder>,
         parser: Box<dyn Parser>,
         commit_duration: Option<Duration>,
+        single_logical_time: bool,
         parallel_readers: usize,
         table_properties: Arc<TableProperties>,
         external_persistent_id: Option<&ExternalPersistentId>,
@@ -1583,6 +1749,7 @@ impl Graph for ScopedGraph {
                 reader,
                 parser,
                 commit_duration,
+                single_logical_time,
                 parallel_readers,
                 table_properties,
                 external_persistent_id,
@@ -1,6 +1,7 @@
 // Copyright © 2024 Pathway
 
 use std::env;
+use std::sync::atomic::AtomicU64;
 use std::sync::Arc;
 use std::thread::{Builder, JoinHandle};
 use std::time::SystemTime;
@@ -10,25 +11,135 @@ use hyper::service::{make_service_fn, service_fn};
 use hyper::{header, Body, Method, Response, Server, StatusCode};
 use log::{error, info};
 use prometheus_client::encoding::text::encode;
+use prometheus_client::metrics::counter::Counter;
+use prometheus_client::metrics::family::Family;
 use prometheus_client::metrics::gauge::Gauge;
 use prometheus_client::registry::Registry;
 use tokio::sync::oneshot::Sender;
 
+use super::dataflow::operator_metrics::OperatorMetricsRegistry;
 use super::Error;
 use super::Graph;
 use super::ProberStats;
+use crate::affinity::pin_auxiliary_thread;
 
 const DEFAULT_MONITORING_HTTP_PORT: u16 = 20000;
 
-/// Retrieves metrics from prober stats in the `OpenMetrics` format
+type OperatorLabelSet = Vec<(String, String)>;
+
+/// Registers per-operator metrics, labeled with the operator and the worker.
+fn register_operator_metrics(registry: &mut Registry, operator_metrics: &OperatorMetricsRegistry) {
+    let rows_in = Family::<OperatorLabelSet, Counter>::default();
+    let rows_out = Family::<OperatorLabelSet, Counter>::default();
+    let processing_time = Family::<OperatorLabelSet, Counter<f64, AtomicU64>>::default();
+    let arranged_records = Family::<OperatorLabelSet, Gauge>::default();
+    let arranged_batches = Family::<OperatorLabelSet, Gauge>::default();
+    let exchanged_bytes = Family::<OperatorLabelSet, Counter>::default();
+    let hot_keys = Family::<OperatorLabelSet, Counter>::default();
+    let spilled_bytes = Family::<OperatorLabelSet, Counter>::default();
+    let spill_read_bytes = Family::<OperatorLabelSet, Counter>::default();
+    let spill_compacted_bytes = Family::<OperatorLabelSet, Counter>::default();
+    for (operator_id, worker, labels, metrics) in operator_metrics.snapshot_per_worker() {
+        let mut label_set = vec![("operator_id".to_string(), operator_id.to_string())];
+        if let Some(labels) = labels {
+            label_set.push(("operator".to_string(), labels.name));
+            if let Some(location) = labels.location {
+                label_set.push(("location".to_string(), location));
+            }
+        }
+        label_set.push(("worker".to_string(), worker.to_string()));
+        rows_in.get_or_create(&label_set).inc_by(metrics.rows_in);
+        rows_out.get_or_create(&label_set).inc_by(metrics.rows_out);
+        #[allow(clippy::cast_precision_loss)]
+        processing_time
+            .get_or_create(&label_set)
+            .inc_by(metrics.processing_time_ns as f64 / 1e9);
+        arranged_records
+            .get_or_create(&label_set)
+            .set(metrics.arranged_records);
+        arranged_batches
+            .get_or_create(&label_set)
+            .set(metrics.arranged_batches);
+        exchanged_bytes
+            .get_or_create(&label_set)
+            .inc_by(metrics.exchanged_bytes);
+        hot_keys.get_or_create(&label_set).inc_by(metrics.hot_keys);
+        spilled_bytes
+            .get_or_create(&label_set)
+            .inc_by(metrics.spilled_bytes);
+        spill_read_bytes
+            .get_or_create(&label_set)
+            .inc_by(metrics.spill_read_bytes);
+        spill_compacted_bytes
+            .get_or_create(&label_set)
+            .inc_by(metrics.spill_compacted_bytes);
+    }
+    registry.register(
+        "operator_rows_in",
+        "Number of row updates received by an operator",
+        rows_in,
+    );
+    registry.register(
+        "operator_rows_out",
+        "Number of row updates produced by an operator",
+        rows_out,
+    );
+    registry.register(
+        "operator_processing_time_seconds",
+        "Time spent by a worker processing the data of an operator",
+        processing_time,
+    );
+    registry.register(
+        "operator_arranged_records",
+        "Number of row updates kept in the arrangements (indexes) of an operator",
+        arranged_records,
+    );
+    registry.register(
+        "operator_arranged_batches",
+        "Number of batches the arrangements of an operator consist of",
+        arranged_batches,
+    );
+    registry.register(
+        "operator_exchanged_bytes",
+        "Number of bytes sent by a worker to other processes for an operator's inputs",
+        exchanged_bytes,
+    );
+    registry.register(
+        "operator_hot_keys",
+        "Number of keys that received a disproportionate share of rows of an operator on a worker",
+        hot_keys,
+    );
+    registry.register(
+        "operator_spilled_bytes",
+        "Number of bytes of an operator's state written to disk when spilling",
+        spilled_bytes,
+    );
+    registry.register(
+        "operator_spill_read_bytes",
+        "Number of bytes of an operator's spilled state read back from disk by lookups",
+        spill_read_bytes,
+    );
+    registry.register(
+        "operator_spill_compacted_bytes",
+        "Number of bytes of an operator's spilled state rewritten by compactions of the spill file",
+        spill_compacted_bytes,
+    );
+}
+
+/// Retrieves metrics from prober stats and operator metrics in the `OpenMetrics` format
 /// See <https://github.com/OpenObservability/OpenMetrics>
-fn metrics_from_stats(stats: &Arc<ArcSwapOption<ProberStats>>) -> String {
+fn metrics_from_stats(
+    stats: &Arc<ArcSwapOption<ProberStats>>,
+    operator_metrics: Option<&OperatorMetricsRegistry>,
+) -> String {
     let stats_owned = stats.load().clone();
     let now = SystemTime::now();
     let mut metrics_text = String::new();
+    if stats_owned.is_none() && operator_metrics.is_none() {
+        return metrics_text;
+    }
+    let mut registry = <Registry>::default();
     if let Some(stats_owned) = stats_owned {
-        let mut registry = <Registry>::default();
-
         let input_latency_ms: Gauge = Gauge::default();
         input_latency_ms.set(
             if let Some(latency) = stats_owned.input_stats.latency(now) {
@@ -64,9 +175,11 @@ fn metrics_from_stats(stats: &Arc<ArcSwapOption<ProberStats>>) -> String {
             "A latency of output in milliseconds (-1 when finished)",
             output_latency_ms,
         );
-
-        encode(&mut metrics_text, &registry).unwrap();
     }
+    if let Some(operator_metrics) = operator_metrics {
+        register_operator_metrics(&mut registry, operator_metrics);
+    }
+    encode(&mut metrics_text, &registry).unwrap();
     metrics_text
 }
 
@@ -78,6 +191,7 @@ pub fn start_http_server_thread(
     process_id: u16,
     // monitoring_status: Arc<ArcSwap<String>>,
     stats: Arc<ArcSwapOption<ProberStats>>,
+    operator_metrics: Option<Arc<OperatorMetricsRegistry>>,
     http_terminate_receiver: tokio::sync::oneshot::Receiver<()>,
 ) -> JoinHandle<()> {
     let monitoring_http_port: u16 = env::var("PATHWAY_MONITORING_HTTP_PORT")
@@ -89,6 +203,7 @@ pub fn start_http_server_thread(
     Builder::new()
         .name("pathway:http_monitoring".to_string())
         .spawn(move || {
+            pin_auxiliary_thread();
             let stats = stats.clone();
             tokio::runtime::Builder::new_current_thread()
                 .enable_io()
@@ -98,15 +213,18 @@ pub fn start_http_server_thread(
                     let addr = ([127, 0, 0, 1], monitoring_http_port + process_id).into();
                     let make_service = make_service_fn(move |_| {
                         let stats = stats.clone();
+                        let operator_metrics = operator_metrics.clone();
                         async move {
                             Ok::<_, Error>(service_fn(move |req| {
                                 let stats = stats.clone();
+                                let operator_metrics = operator_metrics.clone();
 
                                 async move {
                                     let mut response = Response::new(Body::empty());
                                     let stats = stats.clone();
 
-                                    let metrics_text = metrics_from_stats(&stats);
+                                    let metrics_text =
+                                        metrics_from_stats(&stats, operator_metrics.as_deref());
                                     match (req.method(), req.uri().path()) {
                                         (&Method::GET, "/status") => {
                                             *response.body_mut() = Body::from(metrics_text);
@@ -158,7 +276,11 @@ pub struct Runner {
 }
 
 impl Runner {
-    fn run(stats: &Arc<ArcSwapOption<ProberStats>>, process_id: usize) -> Runner {
+    fn run(
+        stats: &Arc<ArcSwapOption<ProberStats>>,
+        operator_metrics: Option<Arc<OperatorMetricsRegistry>>,
+        process_id: usize,
+    ) -> Runner {
         let (http_terminate_transmitter, http_terminate_receiver) =
             tokio::sync::oneshot::channel::<()>();
         let http_server_thread_handle = {
@@ -166,6 +288,7 @@ impl Runner {
             start_http_server_thread(
                 u16::try_from(process_id).unwrap(),
                 stats,
+                operator_metrics,
                 http_terminate_receiver,
             )
         };
@@ -195,10 +318,11 @@ pub fn maybe_run_http_server_thread(
     with_http_server: bool,
     graph: &dyn Graph,
     process_id: usize,
+    operator_metrics: Option<Arc<OperatorMetricsRegistry>>,
 ) -> Option<Runner> {
     if with_http_server && graph.worker_index() == 0 {
         let stats_shared = Arc::new(ArcSwapOption::from(None));
-        let http_server_runner = Runner::run(&stats_shared, process_id);
+        let http_server_runner = Runner::run(&stats_shared, operator_metrics, process_id);
 
         graph
             .attach_prober(
@@ -9,6 +9,7 @@ pub use self::error::{DataError, Error, Result};
 
 pub mod report_error;
 
+pub mod compact_json;
 pub mod value;
 pub use self::value::{Key, KeyImpl, ShardPolicy, Type, Value};
 
@@ -19,9 +20,9 @@ pub mod graph;
 pub use graph::{
     BatchWrapper, ColumnHandle, ColumnPath, ColumnProperties, ComplexColumn, Computer,
     ConcatHandle, Context, DataRow, ErrorLogHandle, ExportedTable, ExportedTableCallback,
-    ExpressionData, Graph, IterationLogic, IxKeyPolicy, IxerHandle, JoinData, JoinType,
-    LegacyTable, OperatorStats, ProberStats, ReducerData, ScopedGraph, TableHandle,
-    TableProperties, UniverseHandle,
+    ExpressionData, Graph, IterateStats, IterationLogic, IxKeyPolicy, IxerHandle, JoinData,
+    JoinType, LegacyTable, OperatorMetrics, OperatorStats, ProberStats, ReducerData, ScopedGraph,
+    TableHandle, TableProperties, UniverseHandle,
 };
 
 pub mod http_server;
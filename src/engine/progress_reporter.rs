@@ -34,7 +34,9 @@ impl Runner {
                 .spawn(move || {
                     let thread_state = PythonThreadState::new();
 
-                    while !should_finish.load(Ordering::Relaxed) {
+                    loop {
+                        // the stats are reported once more after the run has finished
+                        let finishing = should_finish.load(Ordering::Relaxed);
                         if let Some(ref stats) = *stats.load() {
                             let now = SystemTime::now();
                             let duration = u64::try_from(
@@ -53,6 +55,9 @@ impl Runner {
                                     .unwrap();
                             });
                         }
+                        if finishing {
+                            break;
+                        }
 
                         thread::park_timeout(printing_period);
                     }
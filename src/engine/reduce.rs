@@ -37,6 +37,23 @@ pub enum Reducer {
     Latest,
 }
 
+impl Reducer {
+    /// Returns a reducer that combines the results of this reducer computed on
+    /// disjoint parts of a group into the result for the whole group, if there is one.
+    pub fn merge_reducer(&self) -> Option<Reducer> {
+        match self {
+            Self::Count | Self::IntSum => Some(Self::IntSum),
+            Self::FloatSum => Some(Self::FloatSum),
+            Self::ArraySum => Some(Self::ArraySum),
+            Self::Unique => Some(Self::Unique),
+            Self::Min => Some(Self::Min),
+            Self::Max => Some(Self::Max),
+            Self::Any => Some(Self::Any),
+            _ => None,
+        }
+    }
+}
+
 pub trait SemigroupReducerImpl: 'static {
     type State: ExchangeData + Semigroup + Multiply<isize>;
 
@@ -587,6 +604,100 @@ impl StatefulReducer {
     }
 }
 
+/// Acceptor of `deduplicate` evaluated in the engine, without calling Python.
+#[derive(Debug, Clone)]
+pub enum DeduplicateAcceptor {
+    /// Accepts a value different from the previous one.
+    Changed,
+    /// Accepts a number differing from the previous one by more than `threshold`.
+    AbsoluteChange { threshold: f64 },
+    /// Accepts a number differing from the previous one by more than `threshold` times
+    /// the absolute value of the previous one.
+    RelativeChange { threshold: f64 },
+    /// Accepts a value at least `interval` after the previous one. Works for numbers and
+    /// for datetimes and durations with a duration `interval`.
+    MinInterval { interval: Value },
+    /// Accepts a value greater than the previous one.
+    Increasing,
+}
+
+#[allow(clippy::cast_precision_loss)]
+fn as_number(value: &Value) -> DynResult<f64> {
+    match value {
+        Value::Int(i) => Ok(*i as f64),
+        value => value.as_float(),
+    }
+}
+
+impl DeduplicateAcceptor {
+    fn accepts(&self, new: &Value, previous: &Value) -> DynResult<bool> {
+        match self {
+            Self::Changed => Ok(new != previous),
+            Self::AbsoluteChange { threshold } => {
+                Ok((as_number(new)? - as_number(previous)?).abs() > *threshold)
+            }
+            Self::RelativeChange { threshold } => {
+                let previous = as_number(previous)?;
+                Ok((as_number(new)? - previous).abs() > threshold * previous.abs())
+            }
+            Self::MinInterval { interval } => match (new, previous, interval) {
+                (Value::Int(new), Value::Int(previous), Value::Int(interval)) => {
+                    Ok(*new >= previous.saturating_add(*interval))
+                }
+                (
+                    Value::DateTimeNaive(new),
+                    Value::DateTimeNaive(previous),
+                    Value::Duration(interval),
+                ) => Ok(*new >= *previous + *interval),
+                (
+                    Value::DateTimeUtc(new),
+                    Value::DateTimeUtc(previous),
+                    Value::Duration(interval),
+                ) => Ok(*new >= *previous + *interval),
+                (Value::Duration(new), Value::Duration(previous), Value::Duration(interval)) => {
+                    Ok(*new >= *previous + *interval)
+                }
+                (new, previous, interval) => {
+                    Ok(as_number(new)? >= as_number(previous)? + as_number(interval)?)
+                }
+            },
+            Self::Increasing => match (new, previous) {
+                (Value::Int(_), Value::Float(_)) | (Value::Float(_), Value::Int(_)) => {
+                    Ok(as_number(new)? > as_number(previous)?)
+                }
+                (new, previous) => Ok(new > previous),
+            },
+        }
+    }
+
+    /// Builds the state update function of `deduplicate`. The state is the tuple of
+    /// the last accepted row, with the deduplicated value at the first position.
+    pub fn into_combine_fn(self) -> StatefulCombineFn {
+        Arc::new(move |state, rows| {
+            let mut state = state.cloned();
+            for (values, diff) in rows {
+                let Some(new) = values.first() else {
+                    continue;
+                };
+                if diff <= 0 || *new == Value::Error {
+                    continue;
+                }
+                let accepted = match &state {
+                    Some(state) => {
+                        let previous = &state.as_tuple()?[0];
+                        *previous == Value::None || self.accepts(new, previous)?
+                    }
+                    None => true,
+                };
+                if accepted {
+                    state = Some(Value::from(values.as_slice()));
+                }
+            }
+            Ok(state)
+        })
+    }
+}
+
 #[derive(Debug, Clone, Copy)]
 pub struct LatestReducer;
 
@@ -5,6 +5,7 @@ use std::{
 };
 
 use super::{error::DynError, license::License, Graph, ProberStats, Result};
+use crate::affinity::pin_auxiliary_thread;
 use crate::env::parse_env_var;
 use arc_swap::ArcSwapOption;
 use itertools::Itertools;
@@ -295,9 +296,11 @@ fn start_telemetry_thread(
     let handle: JoinHandle<()> = Builder::new()
         .name("pathway:telemetry_thread".to_string())
         .spawn(move || {
+            pin_auxiliary_thread();
             tokio::runtime::Builder::new_multi_thread()
                 .enable_time()
                 .enable_io()
+                .on_thread_start(pin_auxiliary_thread)
                 .build()
                 .unwrap()
                 .block_on(async {
@@ -7,6 +7,7 @@ use std::mem::{align_of, size_of};
 use std::ops::Deref;
 use std::sync::Arc;
 
+use super::compact_json::CompactJson;
 use super::error::{DataError, DynError, DynResult};
 use super::time::{DateTime, DateTimeNaive, DateTimeUtc, Duration};
 use super::PyObjectWrapper;
@@ -90,7 +91,7 @@ impl Debug for Key {
     }
 }
 
-#[derive(Debug, Clone, Copy)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
 pub enum ShardPolicy {
     WholeKey,
     LastKeyColumn,
@@ -169,7 +170,7 @@ impl<T: HashInto> Handle<T> {
     }
 }
 
-fn serialize_json<S>(json: &JsonValue, s: S) -> Result<S::Ok, S::Error>
+fn serialize_json<S>(json: &CompactJson, s: S) -> Result<S::Ok, S::Error>
 where
     S: Serializer,
 {
@@ -179,7 +180,7 @@ where
 struct JsonVisitor;
 
 impl<'de> Visitor<'de> for JsonVisitor {
-    type Value = Handle<JsonValue>;
+    type Value = Handle<CompactJson>;
 
     fn expecting(&self, formatter: &mut fmt::Formatter) -> fmt::Result {
         formatter.write_str("A String containing a serialized JSON.")
@@ -189,14 +190,14 @@ impl<'de> Visitor<'de> for JsonVisitor {
     where
         E: serde::de::Error,
     {
-        match serde_json::from_str(v) {
-            Ok(json) => Ok(Handle::new(json)),
+        match serde_json::from_str::<JsonValue>(v) {
+            Ok(json) => Ok(Handle::new(CompactJson::from(&json))),
             Err(err) => Err(serde::de::Error::custom(err)),
         }
     }
 }
 
-fn deserialize_json<'de, D>(d: D) -> Result<Handle<JsonValue>, D::Error>
+fn deserialize_json<'de, D>(d: D) -> Result<Handle<CompactJson>, D::Error>
 where
     D: Deserializer<'de>,
 {
@@ -222,7 +223,7 @@ pub enum Value {
         serialize_with = "serialize_json",
         deserialize_with = "deserialize_json"
     )]
-    Json(Handle<JsonValue>),
+    Json(Handle<CompactJson>),
     Error,
     PyObjectWrapper(Handle<PyObjectWrapper>),
 }
@@ -327,7 +328,7 @@ impl Value {
         }
     }
 
-    pub fn as_json(&self) -> DynResult<&JsonValue> {
+    pub fn as_json(&self) -> DynResult<&CompactJson> {
         if let Self::Json(json) = self {
             Ok(json)
         } else {
@@ -470,6 +471,12 @@ impl From<Duration> for Value {
 
 impl From<JsonValue> for Value {
     fn from(json: JsonValue) -> Self {
+        Self::Json(Handle::new(CompactJson::from(&json)))
+    }
+}
+
+impl From<CompactJson> for Value {
+    fn from(json: CompactJson) -> Self {
         Self::Json(Handle::new(json))
     }
 }
@@ -732,7 +739,7 @@ impl HashInto for Value {
     }
 }
 
-impl HashInto for JsonValue {
+impl HashInto for CompactJson {
     fn hash_into(&self, hasher: &mut Hasher) {
         (*self).to_string().hash_into(hasher);
     }
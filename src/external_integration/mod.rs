@@ -350,7 +350,7 @@ impl Unpack<Vec<f64>> for Value {
 impl Unpack<Variable> for Value {
     fn unpack(self) -> DynResult<Variable> {
         //can I do that without deref.clone()?
-        Ok(self.as_json()?.to_jmespath()?.deref().clone())
+        Ok(self.as_json()?.to_json().to_jmespath()?.deref().clone())
     }
 }
 
@@ -15,6 +15,7 @@ pub mod external_integration;
 pub mod persistence;
 pub mod python_api;
 
+mod affinity;
 mod async_runtime;
 mod env;
 mod fs_helpers;
@@ -10,6 +10,7 @@ use futures::channel::oneshot;
 use futures::channel::oneshot::Sender as OneShotSender;
 use s3::bucket::Bucket as S3Bucket;
 
+use crate::affinity::pin_auxiliary_thread;
 use crate::deepcopy::DeepCopy;
 use crate::persistence::backends::PersistenceBackend;
 use crate::persistence::Error;
@@ -50,6 +51,7 @@ impl S3KVStorage {
         let uploader_thread = thread::Builder::new()
             .name("pathway:s3_snapshot-bg-writer".to_string())
             .spawn(move || {
+                pin_auxiliary_thread();
                 loop {
                     let event = upload_event_receiver.recv().expect("unexpected termination for s3 objects sender");
                     match event {
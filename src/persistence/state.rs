@@ -122,13 +122,16 @@ impl Display for MetadataKey {
 }
 
 struct VersionInformation {
+    // `None` for the versions written before the number of workers was stored
+    total_workers: Option<usize>,
     worker_finalized_times: Vec<Option<TotalFrontier<Timestamp>>>,
 }
 
 impl VersionInformation {
-    pub fn new(total_workers: usize) -> Self {
+    pub fn new(total_workers: Option<usize>) -> Self {
         Self {
-            worker_finalized_times: vec![None; total_workers],
+            total_workers,
+            worker_finalized_times: vec![None; total_workers.unwrap_or_default()],
         }
     }
 
@@ -139,16 +142,32 @@ impl VersionInformation {
     ) {
         let expected_workers = self.worker_finalized_times.len();
         if worker_id >= expected_workers {
-            error!("Got worker id {worker_id} while only {expected_workers} workers were expected");
-            return;
+            if let Some(total_workers) = self.total_workers {
+                error!(
+                    "Got worker id {worker_id} while only {total_workers} workers were expected"
+                );
+                return;
+            }
+            self.worker_finalized_times.resize(worker_id + 1, None);
         }
         if self.worker_finalized_times[worker_id].map_or(true, |time| time < finalized_time) {
             self.worker_finalized_times[worker_id] = Some(finalized_time);
         }
     }
 
-    pub fn threshold_time(&self) -> Option<TotalFrontier<Timestamp>> {
-        if self.worker_finalized_times.contains(&None) {
+    // If the number of workers wasn't stored, the run could have had as many
+    // workers as the current one, or more if there are blocks of workers with
+    // higher ids.
+    pub fn total_workers(&self, current_total_workers: usize) -> usize {
+        self.total_workers.unwrap_or_else(|| {
+            std::cmp::max(self.worker_finalized_times.len(), current_total_workers)
+        })
+    }
+
+    pub fn threshold_time(&self, current_total_workers: usize) -> Option<TotalFrontier<Timestamp>> {
+        if self.worker_finalized_times.len() < self.total_workers(current_total_workers)
+            || self.worker_finalized_times.contains(&None)
+        {
             // Not all workers reported their threshold times
             None
         } else {
@@ -180,12 +199,18 @@ impl MetadataAccessor {
                     warn!("Failed to retrieve the value for the metadata block {key}. Most likely it was removed as obsolete.");
                     continue;
                 };
-                let block_result = StoredMetadata::parse(&raw_block, total_workers);
+                // The number of workers is left unset for the blocks that don't specify it,
+                // so that it can be inferred from the blocks of the whole version.
+                let block_result = StoredMetadata::parse(&raw_block, 0);
                 match block_result {
                     Ok(block) => {
                         version_information
                             .entry(metadata_key.version)
-                            .or_insert(VersionInformation::new(block.total_workers))
+                            .or_insert_with(|| {
+                                VersionInformation::new(
+                                    (block.total_workers > 0).then_some(block.total_workers),
+                                )
+                            })
                             .update_worker_time(
                                 metadata_key.worker_id,
                                 block.last_advanced_timestamp,
@@ -204,9 +229,10 @@ impl MetadataAccessor {
             }
 
             let mut past_runs_threshold_time = TotalFrontier::At(Timestamp(0));
+            let mut past_runs_total_workers = None;
             let mut latest_stable_version = None;
             for (version_number, version_data) in &version_information {
-                let threshold_time = version_data.threshold_time();
+                let threshold_time = version_data.threshold_time(total_workers);
                 let Some(threshold_time) = threshold_time else {
                     continue;
                 };
@@ -215,6 +241,12 @@ impl MetadataAccessor {
                 {
                     latest_stable_version = Some(*version_number);
                     past_runs_threshold_time = threshold_time;
+                    past_runs_total_workers = Some(version_data.total_workers(total_workers));
+                }
+            }
+            if let Some(past_runs_total_workers) = past_runs_total_workers {
+                if past_runs_total_workers != total_workers && worker_id == 0 {
+                    info!("The persisted state was written by {past_runs_total_workers} workers, re-sharding it across {total_workers} workers");
                 }
             }
 
@@ -84,11 +84,13 @@ use crate::connectors::data_storage::{
 };
 use crate::connectors::scanner::S3Scanner;
 use crate::connectors::{PersistenceMode, SessionType, SnapshotAccess};
+use crate::engine::compact_json::CompactJson;
+use crate::engine::dataflow::operator_metrics::OperatorMetricsRegistry;
 use crate::engine::dataflow::Config;
 use crate::engine::error::{DataError, DynError, DynResult, Trace as EngineTrace};
 use crate::engine::graph::ScopedContext;
 use crate::engine::progress_reporter::MonitoringLevel;
-use crate::engine::reduce::StatefulCombineFn;
+use crate::engine::reduce::{DeduplicateAcceptor, StatefulCombineFn};
 use crate::engine::time::DateTime;
 use crate::engine::Config as EngineTelemetryConfig;
 use crate::engine::Timestamp;
@@ -503,7 +505,7 @@ impl<'py> FromPyObject<'py> for Value {
     }
 }
 
-fn json_to_py_object(py: Python<'_>, json: &JsonValue) -> PyObject {
+fn json_to_py_object(py: Python<'_>, json: &CompactJson) -> PyObject {
     get_convert_python_module(py)
         .call_method1(intern!(py, "_parse_to_json"), (json.to_string(),))
         .unwrap()
@@ -923,6 +925,43 @@ impl<'py> FromPyObject<'py> for ReducerData {
     }
 }
 
+#[pyclass(module = "pathway.engine", frozen, name = "DeduplicateAcceptor")]
+struct PyDeduplicateAcceptor(DeduplicateAcceptor);
+
+#[pymethods]
+impl PyDeduplicateAcceptor {
+    #[staticmethod]
+    fn changed() -> Self {
+        Self(DeduplicateAcceptor::Changed)
+    }
+
+    #[staticmethod]
+    fn absolute_change(threshold: f64) -> Self {
+        Self(DeduplicateAcceptor::AbsoluteChange { threshold })
+    }
+
+    #[staticmethod]
+    fn relative_change(threshold: f64) -> Self {
+        Self(DeduplicateAcceptor::RelativeChange { threshold })
+    }
+
+    #[staticmethod]
+    fn min_interval(interval: Value) -> Self {
+        Self(DeduplicateAcceptor::MinInterval { interval })
+    }
+
+    #[staticmethod]
+    fn increasing() -> Self {
+        Self(DeduplicateAcceptor::Increasing)
+    }
+}
+
+impl<'py> FromPyObject<'py> for DeduplicateAcceptor {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        Ok(ob.extract::<PyRef<PyDeduplicateAcceptor>>()?.0.clone())
+    }
+}
+
 #[derive(Clone, Copy, Debug)]
 pub enum UnaryOperator {
     Inv,
@@ -2364,6 +2403,7 @@ impl Scope {
             properties
                 .commit_duration_ms
                 .map(time::Duration::from_millis),
+            properties.single_logical_time,
             parallel_readers,
             Arc::new(EngineTableProperties::flat(column_properties)),
             persistent_id.as_ref(),
@@ -2517,6 +2557,7 @@ impl Scope {
         Table::new(self_, table_handle)
     }
 
+    #[pyo3(signature = (table, column_paths, expressions, deterministic, shared_expressions = vec![]))]
     pub fn expression_table(
         self_: &Bound<Self>,
         table: &Table,
@@ -2526,10 +2567,18 @@ impl Scope {
             TableProperties,
         )>,
         deterministic: bool,
+        #[pyo3(from_py_with = "from_py_iterable")] shared_expressions: Vec<(
+            usize,
+            PyRef<PyExpression>,
+            TableProperties,
+        )>,
     ) -> PyResult<Py<Table>> {
         let gil = expressions
             .iter()
-            .any(|(expression, _properties)| expression.gil);
+            .any(|(expression, _properties)| expression.gil)
+            || shared_expressions
+                .iter()
+                .any(|(_index, expression, _properties)| expression.gil);
         let wrapper = if gil {
             BatchWrapper::WithGil
         } else {
@@ -2541,10 +2590,20 @@ impl Scope {
                 ExpressionData::new(expression.inner.clone(), properties.0)
             })
             .collect();
+        let shared_expressions = shared_expressions
+            .into_iter()
+            .map(|(index, expression, properties)| {
+                (
+                    index,
+                    ExpressionData::new(expression.inner.clone(), properties.0),
+                )
+            })
+            .collect();
         let table_handle = self_.borrow().graph.expression_table(
             table.handle,
             column_paths,
             expressions,
+            shared_expressions,
             wrapper,
             deterministic,
         )?;
@@ -2816,6 +2875,43 @@ impl Scope {
         Table::new(self_, new_table_handle)
     }
 
+    pub fn rank_table(
+        self_: &Bound<Self>,
+        table: PyRef<Table>,
+        key_column_path: ColumnPath,
+        instance_column_path: ColumnPath,
+        table_properties: TableProperties,
+    ) -> PyResult<Py<Table>> {
+        let new_table_handle = self_.borrow().graph.rank_table(
+            table.handle,
+            key_column_path,
+            instance_column_path,
+            table_properties.0,
+        )?;
+        Table::new(self_, new_table_handle)
+    }
+
+    #[allow(clippy::too_many_arguments)]
+    pub fn limit_table(
+        self_: &Bound<Self>,
+        table: PyRef<Table>,
+        key_column_path: ColumnPath,
+        instance_column_path: ColumnPath,
+        offset: usize,
+        limit: usize,
+        table_properties: TableProperties,
+    ) -> PyResult<Py<Table>> {
+        let new_table_handle = self_.borrow().graph.limit_table(
+            table.handle,
+            key_column_path,
+            instance_column_path,
+            offset,
+            limit,
+            table_properties.0,
+        )?;
+        Table::new(self_, new_table_handle)
+    }
+
     pub fn reindex_table(
         self_: &Bound<Self>,
         table: PyRef<Table>,
@@ -2893,7 +2989,8 @@ impl Scope {
         LegacyTable::new(universe.clone(), columns)
     }
 
-    #[pyo3(signature = (table, grouping_columns_paths, last_column_is_instance, reducers, set_id, table_properties))]
+    #[pyo3(signature = (table, grouping_columns_paths, last_column_is_instance, reducers, set_id, table_properties, skew_split = 1))]
+    #[allow(clippy::too_many_arguments)]
     pub fn group_by_table(
         self_: &Bound<Self>,
         table: PyRef<Table>,
@@ -2902,6 +2999,7 @@ impl Scope {
         #[pyo3(from_py_with = "from_py_iterable")] reducers: Vec<ReducerData>,
         set_id: bool,
         table_properties: TableProperties,
+        skew_split: usize,
     ) -> PyResult<Py<Table>> {
         let table_handle = self_.borrow().graph.group_by_table(
             table.handle,
@@ -2910,6 +3008,7 @@ impl Scope {
             reducers,
             set_id,
             table_properties.0,
+            skew_split,
         )?;
         Table::new(self_, table_handle)
     }
@@ -2924,11 +3023,16 @@ impl Scope {
         persistent_id: Option<ExternalPersistentId>,
         table_properties: TableProperties,
     ) -> PyResult<Py<Table>> {
+        // built-in acceptors are evaluated without calling Python
+        let combine_fn = match combine.extract::<DeduplicateAcceptor>(self_.py()) {
+            Ok(acceptor) => acceptor.into_combine_fn(),
+            Err(_) => wrap_stateful_combine(combine),
+        };
         let table_handle = self_.borrow().graph.deduplicate(
             table.handle,
             grouping_columns_paths,
             reduced_column_paths,
-            wrap_stateful_combine(combine),
+            combine_fn,
             persistent_id.as_ref(),
             table_properties.0,
         )?;
@@ -2955,7 +3059,7 @@ impl Scope {
         Table::new(self_, result_table_handle)
     }
 
-    #[pyo3(signature = (left_table, right_table, left_column_paths, right_column_paths, *, last_column_is_instance, table_properties, assign_id = false, left_ear = false, right_ear = false))]
+    #[pyo3(signature = (left_table, right_table, left_column_paths, right_column_paths, *, last_column_is_instance, table_properties, assign_id = false, left_ear = false, right_ear = false, skew_split = 1))]
     #[allow(clippy::too_many_arguments)]
     #[allow(clippy::fn_params_excessive_bools)]
     pub fn join_tables(
@@ -2969,6 +3073,7 @@ impl Scope {
         assign_id: bool,
         left_ear: bool,
         right_ear: bool,
+        skew_split: usize,
     ) -> PyResult<Py<Table>> {
         let join_type = JoinType::from_assign_left_right(assign_id, left_ear, right_ear)?;
         let table_handle = self_.borrow().graph.join_tables(
@@ -2977,6 +3082,36 @@ impl Scope {
             ShardPolicy::from_last_column_is_instance(last_column_is_instance),
             join_type,
             table_properties.0,
+            skew_split,
+        )?;
+        Table::new(self_, table_handle)
+    }
+
+    #[pyo3(signature = (base_table, base_column_paths, dimension_tables, dimension_column_paths, *, table_properties))]
+    pub fn join_many(
+        self_: &Bound<Self>,
+        base_table: PyRef<Table>,
+        base_column_paths: Vec<Vec<ColumnPath>>,
+        dimension_tables: Vec<PyRef<Table>>,
+        dimension_column_paths: Vec<Vec<ColumnPath>>,
+        table_properties: TableProperties,
+    ) -> PyResult<Py<Table>> {
+        if dimension_tables.len() != dimension_column_paths.len() {
+            return Err(PyValueError::new_err(
+                "dimension_tables and dimension_column_paths should have the same length",
+            ));
+        }
+        let dimensions = dimension_tables
+            .iter()
+            .zip(dimension_column_paths)
+            .map(|(table, column_paths)| JoinData::new(table.handle, column_paths))
+            .collect();
+        let table_handle = self_.borrow().graph.join_many(
+            base_table.handle,
+            base_column_paths,
+            dimensions,
+            ShardPolicy::from_last_column_is_instance(false),
+            table_properties.0,
         )?;
         Table::new(self_, table_handle)
     }
@@ -3126,10 +3261,13 @@ impl Scope {
         Ok(())
     }
 
+    #[pyo3(signature = (operator_id, depends_on_error_log, name, location=None))]
     pub fn set_operator_properties(
         self_: &Bound<Self>,
         operator_id: usize,
         depends_on_error_log: bool,
+        name: String,
+        location: Option<String>,
     ) -> PyResult<()> {
         Ok(self_
             .borrow()
@@ -3137,6 +3275,8 @@ impl Scope {
             .set_operator_properties(OperatorProperties {
                 id: operator_id,
                 depends_on_error_log,
+                name,
+                location,
             })?)
     }
 
@@ -3259,6 +3399,7 @@ pub fn make_captured_table(table_data: Vec<CapturedTableData>) -> PyResult<Vec<D
     trace_parent = None,
     run_id = None,
     terminate_on_error = true,
+    on_operator_metrics = None,
 ))]
 pub fn run_with_new_graph(
     py: Python,
@@ -3274,6 +3415,7 @@ pub fn run_with_new_graph(
     trace_parent: Option<String>,
     run_id: Option<String>,
     terminate_on_error: bool,
+    on_operator_metrics: Option<PyObject>,
 ) -> PyResult<Vec<Vec<DataRow>>> {
     LOGGING_RESET_HANDLE.reset();
     defer! {
@@ -3292,6 +3434,9 @@ pub fn run_with_new_graph(
     let license = License::new(license_key)?;
     let telemetry_config =
         EngineTelemetryConfig::create(&license, run_id, monitoring_server, trace_parent)?;
+    let operator_metrics = on_operator_metrics
+        .is_some()
+        .then(|| Arc::new(OperatorMetricsRegistry::default()));
     let results: Vec<Vec<_>> = run_with_wakeup_receiver(py, |wakeup_receiver| {
         py.allow_threads(|| {
             run_with_new_dataflow_graph(
@@ -3323,9 +3468,13 @@ pub fn run_with_new_graph(
                 &license,
                 telemetry_config,
                 terminate_on_error,
+                operator_metrics.clone(),
             )
         })
     })??;
+    if let (Some(callback), Some(operator_metrics)) = (on_operator_metrics, operator_metrics) {
+        callback.call1(py, (operator_metrics.snapshot(),))?;
+    }
     let mut captured_tables = Vec::new();
     for result in results {
         captured_tables.resize_with(result.len(), Vec::new);
@@ -5045,6 +5194,8 @@ impl TableProperties {
 pub struct ConnectorProperties {
     #[pyo3(get)]
     commit_duration_ms: Option<u64>,
+    #[pyo3(get)]
+    single_logical_time: bool,
     #[allow(unused)]
     #[pyo3(get)]
     unsafe_trusted_ids: bool,
@@ -5058,15 +5209,18 @@ impl ConnectorProperties {
     #[pyo3(signature = (
         commit_duration_ms = None,
         unsafe_trusted_ids = false,
-        column_properties = vec![]
+        column_properties = vec![],
+        single_logical_time = false
     ))]
     fn new(
         commit_duration_ms: Option<u64>,
         unsafe_trusted_ids: bool,
         #[pyo3(from_py_with = "from_py_iterable")] column_properties: Vec<ColumnProperties>,
+        single_logical_time: bool,
     ) -> Self {
         Self {
             commit_duration_ms,
+            single_logical_time,
             unsafe_trusted_ids,
             column_properties,
         }
@@ -5356,6 +5510,7 @@ fn engine(_py: Python<'_>, m: &Bound<PyModule>) -> PyResult<()> {
     m.add_class::<PyObjectWrapper>()?;
     m.add_class::<PyReducer>()?;
     m.add_class::<PyReducerData>()?;
+    m.add_class::<PyDeduplicateAcceptor>()?;
     m.add_class::<PyUnaryOperator>()?;
     m.add_class::<PyBinaryOperator>()?;
     m.add_class::<PyExpression>()?;
@@ -5,7 +5,9 @@ mod operator_test_utils;
 
 mod test_bson;
 mod test_bytes;
+mod test_compact_json;
 mod test_connector_field_defaults;
+mod test_consolidate_locally;
 mod test_dd_distinct_total;
 mod test_debezium;
 mod test_deltalake;
@@ -25,10 +27,14 @@ mod test_prev_next;
 mod test_psql_output;
 mod test_psql_snapshot;
 mod test_seek;
+mod test_skew;
+mod test_spill;
 mod test_sqlite;
 mod test_stream_snapshot;
+mod test_string_interner;
 mod test_time;
 mod test_time_column;
+mod test_transport;
 mod test_types;
 mod test_upsert_session;
 mod test_value_to_sql;
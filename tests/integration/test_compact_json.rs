@@ -0,0 +1,69 @@
+// Copyright © 2024 Pathway
+
+use serde_json::json;
+
+use pathway_engine::engine::compact_json::CompactJson;
+use pathway_engine::engine::Value;
+
+#[test]
+fn test_round_trip() {
+    let json = json!({"b": [1, 2.5, null, {"c": "d"}], "a": true, "e": "f\"g"});
+    let compact = CompactJson::from(&json);
+    assert_eq!(compact.to_json(), json);
+    assert_eq!(compact.to_string(), json.to_string());
+}
+
+#[test]
+fn test_path_access() {
+    let json = json!({"a": [{"x": 1}, {"x": 2}], "b": "c"});
+    let compact = CompactJson::from(&json);
+    let root = compact.root();
+    let item = root.get_key("a").and_then(|a| a.get_index(1)).unwrap();
+    assert_eq!(CompactJson::from(item).to_json(), json!({"x": 2}));
+    assert_eq!(root.get_key("b").and_then(|b| b.as_str()), Some("c"));
+    assert!(root.get_key("x").is_none());
+    assert!(root.get_index(0).is_none());
+}
+
+#[test]
+fn test_same_key_as_tree() {
+    let json = json!({"b": 1, "a": [true, "x"]});
+    assert_eq!(
+        Value::from(json.clone()),
+        Value::from(CompactJson::from(&json))
+    );
+}
+
+#[test]
+fn test_key_order_as_in_tree() {
+    let json: serde_json::Value =
+        serde_json::from_str(r#"{"b": 1, "a": {"z": 2, "y": 3}, "c": null}"#).unwrap();
+    let compact = CompactJson::from(&json);
+
+    let keys: Vec<&str> = compact
+        .root()
+        .entries()
+        .unwrap()
+        .map(|(key, _)| key)
+        .collect();
+    let tree_keys: Vec<&str> = json
+        .as_object()
+        .unwrap()
+        .keys()
+        .map(String::as_str)
+        .collect();
+    assert_eq!(keys, tree_keys);
+
+    let nested = compact.root().get_key("a").unwrap();
+    let nested_keys: Vec<&str> = nested.entries().unwrap().map(|(key, _)| key).collect();
+    let nested_tree_keys: Vec<&str> = json["a"]
+        .as_object()
+        .unwrap()
+        .keys()
+        .map(String::as_str)
+        .collect();
+    assert_eq!(nested_keys, nested_tree_keys);
+
+    assert_eq!(compact.to_string(), json.to_string());
+    assert_eq!(compact.to_json().to_string(), json.to_string());
+}
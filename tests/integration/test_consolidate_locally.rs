@@ -0,0 +1,71 @@
+// Copyright © 2024 Pathway
+
+use std::collections::HashSet;
+use std::sync::{Arc, Mutex};
+
+use differential_dataflow::consolidation::consolidate_updates;
+use differential_dataflow::input::InputSession;
+use timely::dataflow::operators::{Inspect, Probe};
+use timely::Config;
+
+use pathway_engine::engine::dataflow::operators::ConsolidateLocally;
+
+type Update = (u64, u64, isize);
+
+fn worker_updates() -> Vec<Vec<Update>> {
+    // (key, time, diff), with insertions and retractions at the same and at later times
+    vec![
+        vec![
+            (1, 0, 1),
+            (1, 0, 1),
+            (2, 0, 1),
+            (1, 0, -1),
+            (3, 0, 1),
+            (3, 0, -1),
+            (1, 1, 1),
+            (2, 1, -1),
+        ],
+        vec![(1, 0, 1), (2, 0, 2), (2, 0, -1), (1, 1, -1), (4, 1, 5)],
+    ]
+}
+
+#[test]
+fn test_consolidate_locally_matches_plain_consolidation() {
+    let outputs: Arc<Mutex<Vec<(usize, Update)>>> = Arc::new(Mutex::new(Vec::new()));
+    let worker_outputs = outputs.clone();
+    timely::execute(Config::process(2), move |worker| {
+        let index = worker.index();
+        let outputs = worker_outputs.clone();
+        let mut input: InputSession<u64, u64, isize> = InputSession::new();
+        let probe = worker.dataflow(|scope| {
+            input
+                .to_collection(scope)
+                .consolidate_locally_named("test")
+                .inner
+                .inspect(move |update| outputs.lock().unwrap().push((index, *update)))
+                .probe()
+        });
+        for (key, time, diff) in &worker_updates()[index] {
+            input.advance_to(*time);
+            input.update(*key, *diff);
+        }
+        input.advance_to(2);
+        input.flush();
+        worker.step_while(|| probe.less_than(&2));
+    })
+    .expect("computation should finish");
+
+    let outputs = outputs.lock().unwrap();
+    // every worker sends at most one non-zero update per record and time
+    let mut seen = HashSet::new();
+    for (worker, (key, time, diff)) in outputs.iter() {
+        assert_ne!(*diff, 0);
+        assert!(seen.insert((*worker, *key, *time)));
+    }
+
+    let mut expected: Vec<Update> = worker_updates().into_iter().flatten().collect();
+    consolidate_updates(&mut expected);
+    let mut actual: Vec<Update> = outputs.iter().map(|(_worker, update)| *update).collect();
+    consolidate_updates(&mut actual);
+    assert_eq!(actual, expected);
+}
@@ -18,7 +18,7 @@ use pathway_engine::engine::{Type, Value};
 fn check_file_name_in_metadata(data_read: &ParsedEvent, name: &str) {
     if let ParsedEvent::Insert((_, values)) = data_read {
         if let Value::Json(meta) = &values[values.len() - 1] {
-            let path: String = meta["path"].to_string();
+            let path: String = meta.to_json()["path"].to_string();
             assert!(path.ends_with(name), "{data_read:?}");
         } else {
             panic!("wrong type of metadata field");
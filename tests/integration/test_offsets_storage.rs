@@ -360,3 +360,68 @@ fn test_legacy_state_parsing() -> eyre::Result<()> {
     );
     Ok(())
 }
+
+fn write_metadata_block(
+    path: &std::path::Path,
+    worker_id: usize,
+    time: u64,
+    total_workers: Option<usize>,
+) -> eyre::Result<()> {
+    let block = match total_workers {
+        Some(total_workers) => {
+            format!("{{\"last_advanced_timestamp\":{{\"At\":{time}}},\"total_workers\":{total_workers}}}")
+        }
+        None => format!("{{\"last_advanced_timestamp\":{{\"At\":{time}}}}}"),
+    };
+    std::fs::write(path.join(format!("1-{worker_id}-0")), block)?;
+    Ok(())
+}
+
+#[test]
+fn test_metadata_with_fewer_workers() -> eyre::Result<()> {
+    let test_storage = tempdir()?;
+    let test_storage_path = test_storage.path();
+    for (worker_id, time) in [(0, 100), (1, 90), (2, 80), (3, 110)] {
+        write_metadata_block(test_storage_path, worker_id, time, Some(4))?;
+    }
+
+    let ms = MetadataAccessor::new(Box::new(FilesystemKVStorage::new(test_storage_path)?), 0, 2)?;
+    assert_eq!(
+        ms.past_runs_threshold_time(),
+        TotalFrontier::At(Timestamp(80))
+    );
+    Ok(())
+}
+
+#[test]
+fn test_metadata_with_more_workers() -> eyre::Result<()> {
+    let test_storage = tempdir()?;
+    let test_storage_path = test_storage.path();
+    for (worker_id, time) in [(0, 100), (1, 90)] {
+        write_metadata_block(test_storage_path, worker_id, time, Some(2))?;
+    }
+
+    let ms = MetadataAccessor::new(Box::new(FilesystemKVStorage::new(test_storage_path)?), 3, 4)?;
+    assert_eq!(
+        ms.past_runs_threshold_time(),
+        TotalFrontier::At(Timestamp(90))
+    );
+    Ok(())
+}
+
+#[test]
+fn test_legacy_metadata_with_fewer_workers() -> eyre::Result<()> {
+    let test_storage = tempdir()?;
+    let test_storage_path = test_storage.path();
+    for (worker_id, time) in [(0, 100), (1, 90), (2, 80), (3, 110)] {
+        write_metadata_block(test_storage_path, worker_id, time, None)?;
+    }
+
+    // the blocks of the workers that are no longer present still count
+    let ms = MetadataAccessor::new(Box::new(FilesystemKVStorage::new(test_storage_path)?), 0, 2)?;
+    assert_eq!(
+        ms.past_runs_threshold_time(),
+        TotalFrontier::At(Timestamp(80))
+    );
+    Ok(())
+}
@@ -0,0 +1,39 @@
+// Copyright © 2024 Pathway
+
+use std::sync::Arc;
+
+use pathway_engine::engine::dataflow::operator_metrics::OperatorMetricsRegistry;
+use pathway_engine::engine::dataflow::skew::HotKeyDetector;
+use pathway_engine::engine::{Key, Value};
+
+#[test]
+fn test_hot_keys_are_counted_in_operator_metrics() {
+    let registry = Arc::new(OperatorMetricsRegistry::default());
+    let mut detector = HotKeyDetector::new("groupby", 1, Some(registry.hot_key_counter(7, 1)));
+    let hot_key = Key::for_value(&Value::from("hot"));
+    for i in 0..200_000 {
+        if i % 3 != 0 {
+            detector.observe(&hot_key);
+        } else {
+            detector.observe(&Key::for_value(&Value::Int(i)));
+        }
+    }
+
+    // the key is counted once, even though it is hot in every window
+    let snapshot = registry.snapshot();
+    assert_eq!(snapshot[&7].hot_keys, 1);
+    let per_worker = registry.snapshot_per_worker();
+    assert_eq!(per_worker.len(), 1);
+    assert_eq!(per_worker[0].1, 1);
+}
+
+#[test]
+fn test_uniform_keys_are_not_hot() {
+    let registry = Arc::new(OperatorMetricsRegistry::default());
+    let mut detector = HotKeyDetector::new("join", 0, Some(registry.hot_key_counter(3, 0)));
+    for i in 0..200_000 {
+        detector.observe(&Key::for_value(&Value::Int(i % 1000)));
+    }
+
+    assert!(registry.snapshot().is_empty());
+}
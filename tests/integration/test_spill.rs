@@ -0,0 +1,73 @@
+// Copyright © 2024 Pathway
+
+use std::sync::Arc;
+
+use pathway_engine::engine::dataflow::operator_metrics::OperatorMetricsRegistry;
+use pathway_engine::engine::dataflow::spill::{SpillConfig, SpillableMap};
+
+#[test]
+fn test_spillable_map_keeps_values() -> eyre::Result<()> {
+    let directory = tempfile::tempdir()?;
+    let config = SpillConfig::new(directory.path().to_path_buf(), 2);
+    let mut map: SpillableMap<u64, String> = SpillableMap::with_config("test", Some(config));
+    for key in 0..10 {
+        assert!(!map.insert(key, format!("value {key}"))?);
+    }
+    assert_eq!(map.stats().spilled_entries, 8);
+
+    for key in (0..10).rev() {
+        assert_eq!(map.remove(&key)?, Some(format!("value {key}")));
+    }
+    assert_eq!(map.remove(&0)?, None);
+    assert_eq!(map.stats().read_entries, 8);
+    Ok(())
+}
+
+#[test]
+fn test_spillable_map_replaces_spilled_values() -> eyre::Result<()> {
+    let directory = tempfile::tempdir()?;
+    let config = SpillConfig::new(directory.path().to_path_buf(), 1);
+    let mut map: SpillableMap<u64, String> = SpillableMap::with_config("test", Some(config));
+    assert!(!map.insert(1, "old".to_string())?);
+    assert!(!map.insert(2, "other".to_string())?);
+    // the old value was spilled
+    assert!(map.insert(1, "new".to_string())?);
+    assert_eq!(map.remove(&1)?, Some("new".to_string()));
+    assert_eq!(map.remove(&1)?, None);
+    assert_eq!(map.remove(&2)?, Some("other".to_string()));
+    Ok(())
+}
+
+#[test]
+fn test_spillable_map_without_config() -> eyre::Result<()> {
+    let mut map: SpillableMap<u64, String> = SpillableMap::with_config("test", None);
+    assert!(!map.insert(1, "value".to_string())?);
+    assert!(map.insert(1, "value".to_string())?);
+    assert_eq!(map.remove(&1)?, Some("value".to_string()));
+    assert_eq!(map.stats().spilled_entries, 0);
+    Ok(())
+}
+
+#[test]
+fn test_spilled_bytes_are_counted_in_operator_metrics() -> eyre::Result<()> {
+    let directory = tempfile::tempdir()?;
+    let config = SpillConfig::new(directory.path().to_path_buf(), 2);
+    let registry = Arc::new(OperatorMetricsRegistry::default());
+    let mut map: SpillableMap<u64, String> = SpillableMap::with_config("test", Some(config))
+        .with_counter(Some(registry.spill_counter(3, 0)));
+    for key in 0..10 {
+        map.insert(key, format!("value {key}"))?;
+    }
+    for key in 0..5 {
+        map.remove(&key)?;
+    }
+
+    let stats = map.stats();
+    assert!(stats.spilled_bytes > 0);
+    assert!(stats.read_bytes > 0);
+    let metrics = &registry.snapshot()[&3];
+    assert_eq!(metrics.spilled_bytes, stats.spilled_bytes);
+    assert_eq!(metrics.spill_read_bytes, stats.read_bytes);
+    assert_eq!(metrics.spill_compacted_bytes, 0);
+    Ok(())
+}
@@ -0,0 +1,111 @@
+// Copyright © 2024 Pathway
+
+use arcstr::ArcStr;
+
+use pathway_engine::connectors::string_interner::StringInterner;
+use pathway_engine::engine::Value;
+
+fn as_string(value: &Value) -> &ArcStr {
+    match value {
+        Value::String(string) => string,
+        other => panic!("expected a string, got {other:?}"),
+    }
+}
+
+fn read(interner: &mut StringInterner, rows: &[[&str; 2]]) -> Vec<Vec<Value>> {
+    rows.iter()
+        .map(|row| {
+            let mut values: Vec<Value> = row.iter().map(|&s| Value::from(s)).collect();
+            interner.intern(&mut values);
+            values
+        })
+        .collect()
+}
+
+#[test]
+fn test_equal_strings_are_shared() {
+    let rows = [
+        ["paid", "a"],
+        ["new", "b"],
+        ["paid", "c"],
+        ["paid", "a"],
+        ["new", "paid"],
+    ];
+    let mut interner = StringInterner::new(2);
+    let interned = read(&mut interner, &rows);
+
+    // the values are the same as the ones read without interning
+    let plain: Vec<Vec<Value>> = rows
+        .iter()
+        .map(|row| row.iter().map(|&s| Value::from(s)).collect())
+        .collect();
+    assert_eq!(interned, plain);
+
+    assert!(ArcStr::ptr_eq(
+        as_string(&interned[0][0]),
+        as_string(&interned[2][0])
+    ));
+    assert!(ArcStr::ptr_eq(
+        as_string(&interned[0][0]),
+        as_string(&interned[3][0])
+    ));
+    assert!(ArcStr::ptr_eq(
+        as_string(&interned[0][1]),
+        as_string(&interned[3][1])
+    ));
+    // dictionaries are per column, an equal string in another column is not shared
+    assert_eq!(interned[0][0], interned[4][1]);
+    assert!(!ArcStr::ptr_eq(
+        as_string(&interned[0][0]),
+        as_string(&interned[4][1])
+    ));
+}
+
+#[test]
+fn test_deletions_are_interned_like_insertions() {
+    let mut interner = StringInterner::new(1);
+    let mut inserted = vec![Value::from("paid")];
+    interner.intern(&mut inserted);
+    // a retraction carries its own copy of the values
+    let mut deleted = vec![Value::from("paid")];
+    interner.intern(&mut deleted);
+
+    assert_eq!(inserted, deleted);
+    assert!(ArcStr::ptr_eq(
+        as_string(&inserted[0]),
+        as_string(&deleted[0])
+    ));
+}
+
+#[test]
+fn test_high_cardinality_column_is_not_interned() {
+    let mut interner = StringInterner::new(2);
+    for i in 0..2000 {
+        let mut values = vec![Value::from("paid"), Value::from(format!("id-{i}").as_str())];
+        interner.intern(&mut values);
+    }
+
+    let mut first = vec![Value::from("paid"), Value::from("id-1")];
+    let mut second = vec![Value::from("paid"), Value::from("id-1")];
+    interner.intern(&mut first);
+    interner.intern(&mut second);
+
+    assert_eq!(first, second);
+    // the low-cardinality column is still interned
+    assert!(ArcStr::ptr_eq(as_string(&first[0]), as_string(&second[0])));
+    // the dictionary of the other one was dropped
+    assert!(!ArcStr::ptr_eq(as_string(&first[1]), as_string(&second[1])));
+}
+
+#[test]
+fn test_long_strings_are_not_interned() {
+    let long = "x".repeat(1000);
+    let mut interner = StringInterner::new(1);
+    let mut first = vec![Value::from(long.as_str())];
+    let mut second = vec![Value::from(long.as_str())];
+    interner.intern(&mut first);
+    interner.intern(&mut second);
+
+    assert_eq!(first, second);
+    assert!(!ArcStr::ptr_eq(as_string(&first[0]), as_string(&second[0])));
+}
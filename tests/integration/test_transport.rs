@@ -0,0 +1,119 @@
+// Copyright © 2024 Pathway
+
+use std::io::{self, Read, Write};
+use std::os::unix::net::UnixListener;
+use std::path::{Path, PathBuf};
+use std::process::Command;
+use std::thread;
+
+use pathway_engine::engine::dataflow::transport::{create_unix_sockets, Transport};
+
+const CHILD_DIRECTORY_ENV: &str = "PATHWAY_TEST_TRANSPORT_DIRECTORY";
+
+fn socket_paths(directory: &Path, processes: usize) -> Vec<PathBuf> {
+    (0..processes)
+        .map(|id| directory.join(format!("{id}.sock")))
+        .collect()
+}
+
+/// Sends the index of the process to every other process and checks what it receives.
+fn exchange_indices(paths: &[PathBuf], my_index: usize) -> eyre::Result<()> {
+    let mut sockets = create_unix_sockets(paths, my_index)?;
+    assert_eq!(sockets.len(), paths.len());
+    assert!(sockets[my_index].is_none());
+    for (index, socket) in sockets.iter_mut().enumerate() {
+        if let Some(socket) = socket {
+            socket.write_all(&[u8::try_from(my_index)?])?;
+            let mut buffer = [0];
+            socket.read_exact(&mut buffer)?;
+            assert_eq!(usize::from(buffer[0]), index);
+        }
+    }
+    Ok(())
+}
+
+#[test]
+fn test_unix_sockets_connect_all_processes() -> eyre::Result<()> {
+    let directory = tempfile::tempdir()?;
+    let paths = socket_paths(directory.path(), 3);
+    let handles: Vec<_> = (0..3)
+        .map(|my_index| {
+            let paths = paths.clone();
+            thread::spawn(move || exchange_indices(&paths, my_index).unwrap())
+        })
+        .collect();
+    for handle in handles {
+        handle.join().unwrap();
+    }
+    // socket files are removed once all processes are connected
+    for path in &paths {
+        assert!(!path.exists());
+    }
+    Ok(())
+}
+
+#[test]
+#[ignore = "started by test_unix_sockets_between_processes in a separate process"]
+fn unix_sockets_child_process() -> eyre::Result<()> {
+    let directory = PathBuf::from(std::env::var(CHILD_DIRECTORY_ENV)?);
+    exchange_indices(&socket_paths(&directory, 2), 1)
+}
+
+#[test]
+fn test_unix_sockets_between_processes() -> eyre::Result<()> {
+    let directory = tempfile::tempdir()?;
+    let mut child = Command::new(std::env::current_exe()?)
+        .args([
+            "--exact",
+            "test_transport::unix_sockets_child_process",
+            "--ignored",
+            "--quiet",
+        ])
+        .env(CHILD_DIRECTORY_ENV, directory.path())
+        .spawn()?;
+    let result = exchange_indices(&socket_paths(directory.path(), 2), 0);
+    if result.is_err() {
+        child.kill()?;
+    }
+    let status = child.wait()?;
+    result?;
+    assert!(status.success());
+    Ok(())
+}
+
+#[test]
+fn test_unix_socket_in_use() -> eyre::Result<()> {
+    let directory = tempfile::tempdir()?;
+    let paths = socket_paths(directory.path(), 1);
+    let _listener = UnixListener::bind(&paths[0])?;
+    let error = create_unix_sockets(&paths, 0).unwrap_err();
+    assert_eq!(error.kind(), io::ErrorKind::AddrInUse);
+    Ok(())
+}
+
+#[test]
+fn test_unix_socket_left_behind() -> eyre::Result<()> {
+    let directory = tempfile::tempdir()?;
+    let paths = socket_paths(directory.path(), 1);
+    drop(UnixListener::bind(&paths[0])?);
+    assert!(paths[0].exists());
+    let sockets = create_unix_sockets(&paths, 0)?;
+    assert_eq!(sockets.len(), 1);
+    Ok(())
+}
+
+#[test]
+fn test_unix_socket_path_too_long() -> eyre::Result<()> {
+    let directory = tempfile::tempdir()?;
+    let paths = vec![directory.path().join("x".repeat(200))];
+    let error = create_unix_sockets(&paths, 0).unwrap_err();
+    assert_eq!(error.kind(), io::ErrorKind::InvalidInput);
+    Ok(())
+}
+
+#[test]
+fn test_transport_parsing() {
+    assert_eq!("tcp".parse::<Transport>().unwrap(), Transport::Tcp);
+    assert_eq!("Unix".parse::<Transport>().unwrap(), Transport::Unix);
+    assert!("shm".parse::<Transport>().is_err());
+}